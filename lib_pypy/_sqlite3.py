@@ -955,39 +955,45 @@ class Cursor(object):
             self.__row_cast_map.append(converter)
 
     def __fetch_one_row(self):
-        num_cols = _lib.sqlite3_data_count(self.__statement._statement)
+        statement = self.__statement._statement
+        num_cols = _lib.sqlite3_data_count(statement)
         row = newlist_hint(num_cols)
+        if self.__connection._detect_types:
+            row_cast_map = self.__row_cast_map
+        else:
+            row_cast_map = None
+        text_factory = self.__connection.text_factory
         for i in xrange(num_cols):
-            if self.__connection._detect_types:
-                converter = self.__row_cast_map[i]
+            if row_cast_map is not None:
+                converter = row_cast_map[i]
             else:
                 converter = None
 
             if converter is not None:
-                blob = _lib.sqlite3_column_blob(self.__statement._statement, i)
+                blob = _lib.sqlite3_column_blob(statement, i)
                 if not blob:
                     val = None
                 else:
-                    blob_len = _lib.sqlite3_column_bytes(self.__statement._statement, i)
+                    blob_len = _lib.sqlite3_column_bytes(statement, i)
                     val = _ffi.buffer(blob, blob_len)[:]
                     val = converter(val)
             else:
-                typ = _lib.sqlite3_column_type(self.__statement._statement, i)
+                typ = _lib.sqlite3_column_type(statement, i)
                 if typ == _lib.SQLITE_NULL:
                     val = None
                 elif typ == _lib.SQLITE_INTEGER:
-                    val = _lib.sqlite3_column_int64(self.__statement._statement, i)
+                    val = _lib.sqlite3_column_int64(statement, i)
                     val = int(val)
                 elif typ == _lib.SQLITE_FLOAT:
-                    val = _lib.sqlite3_column_double(self.__statement._statement, i)
+                    val = _lib.sqlite3_column_double(statement, i)
                 elif typ == _lib.SQLITE_TEXT:
-                    text = _lib.sqlite3_column_text(self.__statement._statement, i)
-                    text_len = _lib.sqlite3_column_bytes(self.__statement._statement, i)
+                    text = _lib.sqlite3_column_text(statement, i)
+                    text_len = _lib.sqlite3_column_bytes(statement, i)
                     val = _ffi.buffer(text, text_len)[:]
-                    val = self.__connection.text_factory(val)
+                    val = text_factory(val)
                 elif typ == _lib.SQLITE_BLOB:
-                    blob = _lib.sqlite3_column_blob(self.__statement._statement, i)
-                    blob_len = _lib.sqlite3_column_bytes(self.__statement._statement, i)
+                    blob = _lib.sqlite3_column_blob(statement, i)
+                    blob_len = _lib.sqlite3_column_bytes(statement, i)
                     val = _BLOB_TYPE(_ffi.buffer(blob, blob_len)[:])
             row.append(val)
         return tuple(row)
@@ -1009,13 +1015,14 @@ class Cursor(object):
             self.__rowcount = -1
             self.__statement = self.__connection._statement_cache.get(sql)
 
+            is_dml = self.__statement._type in (
+                _STMT_TYPE_UPDATE,
+                _STMT_TYPE_DELETE,
+                _STMT_TYPE_INSERT,
+                _STMT_TYPE_REPLACE
+            )
             if self.__connection._isolation_level is not None:
-                if self.__statement._type in (
-                    _STMT_TYPE_UPDATE,
-                    _STMT_TYPE_DELETE,
-                    _STMT_TYPE_INSERT,
-                    _STMT_TYPE_REPLACE
-                ):
+                if is_dml:
                     if not self.__connection._in_transaction:
                         self.__connection._begin()
                 elif self.__statement._type == _STMT_TYPE_OTHER:
@@ -1026,11 +1033,15 @@ class Cursor(object):
                         raise ProgrammingError("You cannot execute SELECT "
                                                "statements in executemany().")
 
+            # executemany() runs this loop once per row, so look up
+            # everything that does not change between rows only once
+            statement = self.__statement
+            db = self.__connection._db
             for params in many_params:
-                self.__statement._set_params(params)
+                statement._set_params(params)
 
                 # Actually execute the SQL statement
-                ret = _lib.sqlite3_step(self.__statement._statement)
+                ret = _lib.sqlite3_step(statement._statement)
 
                 if ret == _lib.SQLITE_ROW:
                     if multiple:
@@ -1039,28 +1050,23 @@ class Cursor(object):
                     self.__next_row = self.__fetch_one_row()
                 elif ret == _lib.SQLITE_DONE:
                     if not multiple:
-                        self.__statement._reset()
+                        statement._reset()
                 else:
-                    self.__statement._reset()
+                    statement._reset()
                     raise self.__connection._get_exception(ret)
 
-                if self.__statement._type in (
-                    _STMT_TYPE_UPDATE,
-                    _STMT_TYPE_DELETE,
-                    _STMT_TYPE_INSERT,
-                    _STMT_TYPE_REPLACE
-                ):
+                if is_dml:
                     if self.__rowcount == -1:
                         self.__rowcount = 0
-                    self.__rowcount += _lib.sqlite3_changes(self.__connection._db)
+                    self.__rowcount += _lib.sqlite3_changes(db)
 
-                if not multiple and self.__statement._type == _STMT_TYPE_INSERT:
-                    self.__lastrowid = _lib.sqlite3_last_insert_rowid(self.__connection._db)
+                if not multiple and statement._type == _STMT_TYPE_INSERT:
+                    self.__lastrowid = _lib.sqlite3_last_insert_rowid(db)
                 else:
                     self.__lastrowid = None
 
                 if multiple:
-                    self.__statement._reset()
+                    statement._reset()
         finally:
             self.__connection._in_transaction = \
                 not _lib.sqlite3_get_autocommit(self.__connection._db)
@@ -1124,15 +1130,19 @@ class Cursor(object):
         self.__check_reset()
         if not self.__statement:
             raise StopIteration
+        return self.__take_next_row(self.row_factory)
 
+    def __take_next_row(self, row_factory):
+        # Return the row fetched by the previous step, and step the
+        # statement to fetch the following one
         try:
             next_row = self.__next_row
         except AttributeError:
             raise StopIteration
         del self.__next_row
 
-        if self.row_factory is not None:
-            next_row = self.row_factory(self, next_row)
+        if row_factory is not None:
+            next_row = row_factory(self, next_row)
 
         ret = _lib.sqlite3_step(self.__statement._statement)
         if ret == _lib.SQLITE_ROW:
@@ -1150,18 +1160,32 @@ class Cursor(object):
     def fetchone(self):
         return next(self, None)
 
-    def fetchmany(self, size=None):
-        if size is None:
-            size = self.arraysize
+    def __fetch_many(self, size):
+        # Like calling next() up to 'size' times (or until the end if size
+        # is not positive), but with the cursor checks done only once
+        self.__check_cursor()
+        self.__check_reset()
         lst = []
-        for row in self:
-            lst.append(row)
+        if not self.__statement:
+            return lst
+        row_factory = self.row_factory
+        while True:
+            try:
+                next_row = self.__take_next_row(row_factory)
+            except StopIteration:
+                break
+            lst.append(next_row)
             if len(lst) == size:
                 break
         return lst
 
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        return self.__fetch_many(size)
+
     def fetchall(self):
-        return list(self)
+        return self.__fetch_many(-1)
 
     def __get_connection(self):
         return self.__connection
@@ -1243,6 +1267,8 @@ class Statement(object):
         if _check_remaining_sql(tail):
             raise Warning("You can only execute one statement at a time.")
 
+        self._num_params = _lib.sqlite3_bind_parameter_count(self._statement)
+
     def __del__(self):
         if self._statement:
             _lib.sqlite3_finalize(self._statement)
@@ -1272,14 +1298,16 @@ class Statement(object):
                             "just switch your application to Unicode strings.")
 
     def __set_param(self, idx, param):
-        cvt = converters.get(type(param))
-        if cvt is not None:
-            param = cvt(param)
+        if (type(param) not in _PLAIN_PARAM_TYPES or
+                (type(param), PrepareProtocol) in adapters):
+            cvt = converters.get(type(param))
+            if cvt is not None:
+                param = cvt(param)
 
-        try:
-            param = adapt(param)
-        except:
-            pass  # And use previous value
+            try:
+                param = adapt(param)
+            except:
+                pass  # And use previous value
 
         if param is None:
             rc = _lib.sqlite3_bind_null(self._statement, idx)
@@ -1309,7 +1337,7 @@ class Statement(object):
     def _set_params(self, params):
         self._in_use = True
 
-        num_params_needed = _lib.sqlite3_bind_parameter_count(self._statement)
+        num_params_needed = self._num_params
         if isinstance(params, (tuple, list)) or \
                 not isinstance(params, dict) and \
                 hasattr(params, '__getitem__'):
@@ -1500,6 +1528,11 @@ def _function_callback(real_cb, context, nargs, c_params):
 converters = {}
 adapters = {}
 
+# parameters of these exact types never need to be adapted, unless an
+# adapter is registered for them
+_PLAIN_PARAM_TYPES = frozenset([type(None), bool, int, long, float, str,
+                                unicode, buffer])
+
 
 class PrepareProtocol(object):
     pass
@@ -584,9 +584,9 @@ class timedelta(object):
         if isinstance(other, timedelta):
             # for CPython compatibility, we cannot use
             # our __class__ here, but need a real timedelta
-            return timedelta(self._days + other._days,
-                             self._seconds + other._seconds,
-                             self._microseconds + other._microseconds)
+            return _create_timedelta(self._days + other._days,
+                                     self._seconds + other._seconds,
+                                     self._microseconds + other._microseconds)
         return NotImplemented
 
     __radd__ = __add__
@@ -595,9 +595,9 @@ class timedelta(object):
         if isinstance(other, timedelta):
             # for CPython compatibility, we cannot use
             # our __class__ here, but need a real timedelta
-            return timedelta(self._days - other._days,
-                             self._seconds - other._seconds,
-                             self._microseconds - other._microseconds)
+            return _create_timedelta(self._days - other._days,
+                                     self._seconds - other._seconds,
+                                     self._microseconds - other._microseconds)
         return NotImplemented
 
     def __rsub__(self, other):
@@ -608,9 +608,9 @@ class timedelta(object):
     def __neg__(self):
         # for CPython compatibility, we cannot use
         # our __class__ here, but need a real timedelta
-        return timedelta(-self._days,
-                         -self._seconds,
-                         -self._microseconds)
+        return _create_timedelta(-self._days,
+                                 -self._seconds,
+                                 -self._microseconds)
 
     def __pos__(self):
         return self
@@ -709,6 +709,25 @@ timedelta.max = timedelta(days=999999999, hours=23, minutes=59, seconds=59,
                           microseconds=999999)
 timedelta.resolution = timedelta(microseconds=1)
 
+def _create_timedelta(d, s, us):
+    # Fast constructor for the results of timedelta arithmetic: all the
+    # arguments are already ints, so the float handling and the full
+    # normalization done by timedelta.__new__ can be skipped.
+    if not 0 <= us <= 999999:
+        carry, us = divmod(us, 1000000)
+        s += carry
+    if not 0 <= s < 24*3600:
+        carry, s = divmod(s, 24*3600)
+        d += carry
+    if abs(d) > 999999999:
+        raise OverflowError("timedelta # of days is too large: %d" % d)
+    self = object.__new__(timedelta)
+    self._days = d
+    self._seconds = s
+    self._microseconds = us
+    self._hashcode = -1
+    return self
+
 class date(object):
     """Concrete date type.
 
@@ -767,6 +786,8 @@ class date(object):
     def fromtimestamp(cls, t):
         "Construct a date from a POSIX timestamp (like time.time())."
         y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(t)
+        if cls is date and MINYEAR <= y <= MAXYEAR:
+            return _create_date(y, m, d)
         return cls(y, m, d)
 
     @classmethod
@@ -958,8 +979,7 @@ class date(object):
                       self._month,
                       self._day + other.days)
             self._checkOverflow(t.year)
-            result = date(t.year, t.month, t.day)
-            return result
+            return _create_date(t.year, t.month, t.day)
         return NotImplemented
 
     __radd__ = __add__
@@ -971,7 +991,7 @@ class date(object):
         if isinstance(other, date):
             days1 = self.toordinal()
             days2 = other.toordinal()
-            return timedelta(days1 - days2)
+            return _create_timedelta(days1 - days2, 0, 0)
         return NotImplemented
 
     def weekday(self):
@@ -1032,6 +1052,16 @@ date.min = date(1, 1, 1)
 date.max = date(9999, 12, 31)
 date.resolution = timedelta(days=1)
 
+def _create_date(year, month, day):
+    # Fast constructor for already-validated fields; skips the argument
+    # checks of date.__new__.
+    self = object.__new__(date)
+    self._year = year
+    self._month = month
+    self._day = day
+    self._hashcode = -1
+    return self
+
 class tzinfo(object):
     """Abstract base class for time zone info classes.
 
@@ -1519,7 +1549,10 @@ class datetime(date):
             us = 0
         y, m, d, hh, mm, ss, weekday, jday, dst = converter(t)
         ss = min(ss, 59)    # clamp out leap seconds if the platform has them
-        result = cls(y, m, d, hh, mm, ss, us, tz)
+        if cls is datetime and MINYEAR <= y <= MAXYEAR:
+            result = _create_datetime(y, m, d, hh, mm, ss, us, tz)
+        else:
+            result = cls(y, m, d, hh, mm, ss, us, tz)
         if tz is not None:
             result = tz.fromutc(result)
         return result
@@ -1539,6 +1572,8 @@ class datetime(date):
             us = 0
         y, m, d, hh, mm, ss, weekday, jday, dst = _time.gmtime(t)
         ss = min(ss, 59)    # clamp out leap seconds if the platform has them
+        if cls is datetime and MINYEAR <= y <= MAXYEAR:
+            return _create_datetime(y, m, d, hh, mm, ss, us, None)
         return cls(y, m, d, hh, mm, ss, us)
 
     @classmethod
@@ -1588,7 +1623,7 @@ class datetime(date):
 
     def date(self):
         "Return the date part."
-        return date(self._year, self._month, self._day)
+        return _create_date(self._year, self._month, self._day)
 
     def time(self):
         "Return the time part, with tzinfo None."
@@ -1665,6 +1700,16 @@ class datetime(date):
         Optional argument sep specifies the separator between date and
         time, default 'T'.
         """
+        if self._tzinfo is None:
+            # Common case: a naive datetime, formatted in a single step.
+            if self._microsecond:
+                return "%04d-%02d-%02d%c%02d:%02d:%02d.%06d" % (
+                    self._year, self._month, self._day, sep,
+                    self._hour, self._minute, self._second,
+                    self._microsecond)
+            return "%04d-%02d-%02d%c%02d:%02d:%02d" % (
+                self._year, self._month, self._day, sep,
+                self._hour, self._minute, self._second)
         s = ("%04d-%02d-%02d%c" % (self._year, self._month, self._day, sep) +
              _format_time(self._hour, self._minute, self._second,
                           self._microsecond))
@@ -1701,6 +1746,10 @@ class datetime(date):
     @classmethod
     def strptime(cls, date_string, format):
         'string, format -> new datetime parsed from a string (like time.strptime()).'
+        if cls is datetime:
+            result = _strptime_fixed(date_string, format)
+            if result is not None:
+                return result
         from _strptime import _strptime
         # _strptime._strptime returns a two-element tuple.  The first
         # element is a time.struct_time object.  The second is the
@@ -1857,10 +1906,9 @@ class datetime(date):
                   self._second + other.seconds,
                   self._microsecond + other.microseconds)
         self._checkOverflow(t.year)
-        result = datetime(t.year, t.month, t.day,
+        return _create_datetime(t.year, t.month, t.day,
                                 t.hour, t.minute, t.second,
-                                t.microsecond, tzinfo=self._tzinfo)
-        return result
+                                t.microsecond, self._tzinfo)
 
     __radd__ = __add__
 
@@ -1875,9 +1923,9 @@ class datetime(date):
         days2 = other.toordinal()
         secs1 = self._second + self._minute * 60 + self._hour * 3600
         secs2 = other._second + other._minute * 60 + other._hour * 3600
-        base = timedelta(days1 - days2,
-                         secs1 - secs2,
-                         self._microsecond - other._microsecond)
+        base = _create_timedelta(days1 - days2,
+                                 secs1 - secs2,
+                                 self._microsecond - other._microsecond)
         if self._tzinfo is other._tzinfo:
             return base
         myoff = self._utcoffset()
@@ -1933,6 +1981,115 @@ datetime.min = datetime(1, 1, 1)
 datetime.max = datetime(9999, 12, 31, 23, 59, 59, 999999)
 datetime.resolution = timedelta(microseconds=1)
 
+def _create_datetime(year, month, day, hour, minute, second, microsecond,
+                     tzinfo):
+    # Fast constructor for already-validated fields; skips the argument
+    # checks of datetime.__new__.
+    self = object.__new__(datetime)
+    self._year = year
+    self._month = month
+    self._day = day
+    self._hour = hour
+    self._minute = minute
+    self._second = second
+    self._microsecond = microsecond
+    self._tzinfo = tzinfo
+    self._hashcode = -1
+    return self
+
+# Fast path for datetime.strptime() with purely numeric, fixed-width
+# formats such as '%Y-%m-%d %H:%M:%S.%f'.  A format is compiled once into
+# a list of (directive, start, stop) slices plus the literal characters
+# that must appear between them.  Any input that does not match exactly
+# makes the fast path give up, and the general _strptime module is used
+# instead, so that errors are reported in the usual way.
+
+_STRPTIME_FIXED_WIDTHS = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2}
+_strptime_fixed_cache = {}
+
+def _compile_strptime_fixed(format):
+    fields = []
+    literals = []
+    pos = 0
+    i = 0
+    n = len(format)
+    while i < n:
+        c = format[i]
+        if c == '%':
+            if i + 1 >= n:
+                return None
+            directive = format[i + 1]
+            if directive == 'f' and i + 2 == n:
+                # '%f' takes 1 to 6 digits, so only allow it at the end
+                fields.append(('f', pos, -1))
+                break
+            width = _STRPTIME_FIXED_WIDTHS.get(directive, 0)
+            if not width:
+                return None
+            for field in fields:
+                if field[0] == directive:
+                    # _strptime rejects the format: let it raise
+                    return None
+            fields.append((directive, pos, pos + width))
+            pos += width
+            i += 2
+        elif c.isspace() or c.isalnum():
+            # _strptime matches whitespace loosely and letters
+            # case-insensitively; leave these cases to it
+            return None
+        else:
+            literals.append((pos, c))
+            pos += 1
+            i += 1
+    if not fields:
+        return None
+    return fields, literals, pos
+
+def _strptime_fixed(date_string, format):
+    if not isinstance(date_string, str) or not isinstance(format, str):
+        return None
+    try:
+        compiled = _strptime_fixed_cache[format]
+    except KeyError:
+        if len(_strptime_fixed_cache) > 100:
+            _strptime_fixed_cache.clear()
+        compiled = _strptime_fixed_cache[format] = (
+            _compile_strptime_fixed(format))
+    if compiled is None:
+        return None
+    fields, literals, length = compiled
+    n = len(date_string)
+    if n != length and not (fields and fields[-1][2] < 0 and n > length):
+        return None
+    for pos, c in literals:
+        if date_string[pos] != c:
+            return None
+    values = {'Y': 1900, 'm': 1, 'd': 1, 'H': 0, 'M': 0, 'S': 0, 'f': 0}
+    for directive, start, stop in fields:
+        if stop < 0:
+            stop = n
+            if not 1 <= stop - start <= 6:
+                return None
+        digits = date_string[start:stop]
+        for c in digits:
+            if not '0' <= c <= '9':
+                return None
+        value = int(digits)
+        if directive == 'f':
+            value *= 10 ** (6 - len(digits))
+        values[directive] = value
+    year = values['Y']
+    month = values['m']
+    day = values['d']
+    hour = values['H']
+    minute = values['M']
+    second = values['S']
+    if not (1 <= month <= 12 and 1 <= day <= _days_in_month(year, month) and
+            hour <= 23 and minute <= 59 and second <= 59 and year >= MINYEAR):
+        return None
+    return _create_datetime(year, month, day, hour, minute, second,
+                            values['f'], None)
+
 
 def _isoweek1monday(year):
     # Helper to calculate the day number of the Monday starting week 1
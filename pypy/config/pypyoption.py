@@ -35,7 +35,7 @@ working_modules.update([
     "cStringIO", "thread", "itertools", "pyexpat", "_ssl", "cpyext", "array",
     "binascii", "_multiprocessing", '_warnings', "_collections",
     "_multibytecodec", "micronumpy", "_continuation", "_cffi_backend",
-    "_csv", "cppyy", "_pypyjson"
+    "_csv", "cppyy", "_pypyjson", "_bisect", "_heapq"
 ])
 
 translation_modules = default_modules.copy()
@@ -198,6 +198,14 @@ pypy_optiondescription = OptionDescription("objspace", "Object Space Options", [
         BoolOption("withstrbuf", "use strings optimized for addition (ver 2)",
                    default=False),
 
+        BoolOption("withrope", "use ropes for big strings built by addition",
+                   default=False,
+                   requires=[("objspace.std.withstrbuf", False)]),
+
+        BoolOption("withstrslice",
+                   "share the characters of big slices of strings",
+                   default=False),
+
         BoolOption("withprebuiltchar",
                    "use prebuilt single-character string objects",
                    default=False),
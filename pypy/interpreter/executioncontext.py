@@ -2,6 +2,7 @@ import sys
 from pypy.interpreter.error import OperationError, get_cleared_operation_error
 from rpython.rlib.unroll import unrolling_iterable
 from rpython.rlib import jit
+from rpython.rtyper.lltypesystem import llmemory
 
 TICK_COUNTER_STEP = 100
 
@@ -407,6 +408,11 @@ class AbstractActionFlag(object):
             # to run at the next possible bytecode
             self.reset_ticker(-1)
 
+    def get_ticker_address(self):
+        """Return the address of the ticker, if it is a Signed in raw
+        memory that C code can set to -1, or NULL."""
+        return llmemory.NULL
+
     def register_periodic_action(self, action, use_bytecode_counter):
         """NOT_RPYTHON:
         Register the PeriodicAsyncAction action to be called whenever the
@@ -61,6 +61,15 @@ return next yielded value or raise StopIteration."""
         return self.send_ex(w_arg)
 
     def send_ex(self, w_arg, operr=None):
+        w_result = self.resume_ex(w_arg, operr)
+        if w_result is None:
+            space = self.space
+            raise OperationError(space.w_StopIteration, space.w_None)
+        return w_result
+
+    def resume_ex(self, w_arg, operr):
+        """Like send_ex(), but return None instead of raising
+        StopIteration if the generator is finished or returns."""
         pycode = self.pycode
         if jit.we_are_jitted() and should_not_inline(pycode):
             generatorentry_driver.jit_merge_point(gen=self, w_arg=w_arg,
@@ -77,7 +86,7 @@ return next yielded value or raise StopIteration."""
             # xxx a bit ad-hoc, but we don't want to go inside
             # execute_frame() if the frame is actually finished
             if operr is None:
-                operr = OperationError(space.w_StopIteration, space.w_None)
+                return None
             raise operr
 
         last_instr = jit.promote(frame.last_instr)
@@ -99,7 +108,7 @@ return next yielded value or raise StopIteration."""
             # if the frame is now marked as finished, it was RETURNed from
             if frame.frame_finished_execution:
                 self.frame = None
-                raise OperationError(space.w_StopIteration, space.w_None)
+                return None
             else:
                 return w_result     # YIELDed
         finally:
@@ -1094,7 +1094,24 @@ class __extend__(pyframe.PyFrame):
         self.pushvalue(w_iterator)
 
     def FOR_ITER(self, jumpby, next_instr):
+        from pypy.interpreter.generator import GeneratorIterator
         w_iterator = self.peekvalue()
+        if isinstance(w_iterator, GeneratorIterator):
+            # fast path: resume the generator directly, without looking
+            # up 'next' and without a StopIteration at the end
+            try:
+                w_nextitem = w_iterator.resume_ex(self.space.w_None, None)
+            except OperationError, e:
+                if not e.match(self.space, self.space.w_StopIteration):
+                    raise
+                w_nextitem = None
+            if w_nextitem is None:
+                # generator exhausted
+                self.popvalue()
+                next_instr += jumpby
+            else:
+                self.pushvalue(w_nextitem)
+            return next_instr
         try:
             w_nextitem = self.space.next(w_iterator)
         except OperationError, e:
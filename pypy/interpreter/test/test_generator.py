@@ -294,6 +294,31 @@ res = f()
         except TypeError:
             pass
 
+    def test_for_loop_over_generator(self):
+        def f(n):
+            for i in range(n):
+                yield i * 2
+            if n == 3:
+                raise ValueError
+        res = []
+        for x in f(2):
+            res.append(x)
+        assert res == [0, 2]
+        g = f(2)
+        for x in g:
+            pass
+        for x in g:
+            assert False, "the generator is finished"
+        def consume(g):
+            for x in g:
+                pass
+        raises(ValueError, consume, f(3))
+        def me():
+            for x in g:
+                yield x
+        g = me()
+        raises(ValueError, consume, g)
+
 
 def test_should_not_inline(space):
     from pypy.interpreter.generator import should_not_inline
@@ -10,7 +10,7 @@ from pypy.interpreter.gateway import interp2app, unwrap_spec, WrappedDefault
 from pypy.interpreter.typedef import TypeDef
 from rpython.rlib import jit
 from rpython.rlib.objectmodel import specialize
-from rpython.rlib.rarithmetic import r_uint, intmask
+from rpython.rlib.rarithmetic import r_uint, intmask, ovfcheck
 from rpython.rlib.rbigint import rbigint
 
 
@@ -166,6 +166,11 @@ def make_min_max(unroll):
                 msg = "%s() got unexpected keyword argument" % (implementation_of,)
                 raise OperationError(space.w_TypeError, space.wrap(msg))
 
+        if w_key is None and len(args_w) == 1:
+            w_result = min_max_unboxed(space, w_sequence, implementation_of)
+            if w_result is not None:
+                return w_result
+
         w_iter = space.iter(w_sequence)
         w_type = space.type(w_iter)
         has_key = w_key is not None
@@ -198,6 +203,37 @@ def make_min_max(unroll):
         min_max_impl = jit.unroll_safe(min_max_impl)
     return min_max_impl
 
+@specialize.arg(2)
+def min_max_unboxed(space, w_sequence, implementation_of):
+    # fast path for lists, arrays, etc. of unboxed ints or floats.
+    # Returns None if there is no such fast path.
+    intlist = space.listview_int(w_sequence)
+    if intlist is None:
+        intlist = space.unpackiterable_int(w_sequence)
+    if intlist:
+        return space.wrap(_min_max_list(intlist, implementation_of == "max"))
+    floatlist = space.listview_float(w_sequence)
+    if floatlist is None:
+        floatlist = space.unpackiterable_float(w_sequence)
+    if floatlist:
+        return space.wrap(_min_max_list(floatlist, implementation_of == "max"))
+    return None
+
+@specialize.argtype(0)
+def _min_max_list(lst, is_max):
+    # same comparisons as the general case, to get the same result
+    # if there are NaNs
+    result = lst[0]
+    for i in range(1, len(lst)):
+        item = lst[i]
+        if is_max:
+            if item > result:
+                result = item
+        else:
+            if item < result:
+                result = item
+    return result
+
 min_max_unroll = make_min_max(True)
 min_max_normal = make_min_max(False)
 
@@ -228,6 +264,71 @@ def min(space, __args__):
     """
     return min_max(space, __args__, "min")
 
+sum_jitdriver = jit.JitDriver(name='sum', greens=['w_type'], reds='auto')
+
+@unwrap_spec(w_start=WrappedDefault(0))
+def sum(space, w_sequence, w_start):
+    """sum(sequence[, start]) -> value
+
+Returns the sum of a sequence of numbers (NOT strings) plus the value
+of parameter 'start' (which defaults to 0).  When the sequence is
+empty, returns start."""
+    if space.isinstance_w(w_start, space.w_basestring):
+        raise OperationError(space.w_TypeError,
+                             space.wrap("sum() can't sum strings"))
+    w_result = sum_unboxed(space, w_sequence, w_start)
+    if w_result is not None:
+        return w_result
+    w_last = w_start
+    w_iter = space.iter(w_sequence)
+    w_type = space.type(w_iter)
+    while True:
+        sum_jitdriver.jit_merge_point(w_type=w_type)
+        try:
+            w_item = space.next(w_iter)
+        except OperationError, e:
+            if not e.match(space, space.w_StopIteration):
+                raise
+            break
+        # Very intentionally *not* +=, that would have different semantics if
+        # start was a mutable type, such as a list
+        w_last = space.add(w_last, w_item)
+    return w_last
+
+def sum_unboxed(space, w_sequence, w_start):
+    # fast path for lists, arrays, etc. of unboxed ints or floats, if
+    # 'start' is an int or a float.  Returns None if there is no such
+    # fast path.
+    if space.is_w(space.type(w_start), space.w_int):
+        intlist = space.listview_int(w_sequence)
+        if intlist is None:
+            intlist = space.unpackiterable_int(w_sequence)
+        if intlist:
+            return _sum_int_list(space, intlist, space.int_w(w_start))
+    elif not space.is_w(space.type(w_start), space.w_float):
+        return None
+    floatlist = space.listview_float(w_sequence)
+    if floatlist is None:
+        floatlist = space.unpackiterable_float(w_sequence)
+    if floatlist:
+        total = space.float_w(w_start)
+        for item in floatlist:
+            total += item
+        return space.wrap(total)
+    return None
+
+def _sum_int_list(space, intlist, total):
+    for i in range(len(intlist)):
+        try:
+            total = ovfcheck(total + intlist[i])
+        except OverflowError:
+            # continue with longs
+            w_last = space.wrap(total)
+            for j in range(i, len(intlist)):
+                w_last = space.add(w_last, space.wrap(intlist[j]))
+            return w_last
+    return space.wrap(total)
+
 
 class W_Enumerate(W_Root):
     def __init__(self, w_iter, w_start):
@@ -225,6 +225,20 @@ class AppTestBuiltinApp:
                 assert other is None
                 return 42
         assert sum([Foo()], None) == 42
+        raises(TypeError, sum, ['a'], 'b')
+
+    def test_sum_unboxed(self):
+        import sys
+        assert sum([1.5, 2.5]) == 4.0
+        assert sum([1.5, 2.5], 1) == 5.0
+        assert sum([1.5], 0.25) == 1.75
+        assert sum([sys.maxint, 1]) == sys.maxint + 1
+        assert sum([sys.maxint, 1, -5], 3) == sys.maxint - 1
+        assert sum([1, 2], 0.5) == 3.5
+        assert sum([1, 2], True) == 4
+        assert sum(set([10, 20]), 5) == 35
+        assert sum([-0.0]) == 0.0
+        assert sum([[1], [2]], []) == [1, 2]
 
     def test_type_selftest(self):
         assert type(type) is type
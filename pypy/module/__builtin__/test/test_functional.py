@@ -298,3 +298,19 @@ class AppTestMinMax:
         assert max([1, 2, 3]) == 3
         raises(TypeError, max, 1, 2, bar=2)
         raises(TypeError, max, 1, 2, key=lambda x: x, bar=2)
+
+    def test_min_max_unboxed(self):
+        assert min([5, -3, 8]) == -3
+        assert max([5, -3, 8]) == 8
+        assert min([2.5, -0.5]) == -0.5
+        assert max(set([4, 9, 1])) == 9
+        nan = float('nan')
+        l = [1.0, nan, 0.5]
+        assert min(l) == 0.5
+        assert str(max([nan, 1.0])) == 'nan'
+        assert str(min([0.0, -0.0])) == '0.0'
+        raises(ValueError, min, [])
+        class L(list):
+            def __iter__(self):
+                return iter([42])
+        assert max(L([1, 2])) == 42
@@ -0,0 +1,119 @@
+"""
+Interp-level implementation of the bisection algorithms, with the same
+behavior as CPython's _bisect.  If 'a' is exactly a list of ints or floats
+stored unboxed (IntegerListStrategy or FloatListStrategy) and 'x' has the
+same type, the search and the insertion are done on the unboxed items.
+"""
+
+from pypy.interpreter.error import OperationError
+from pypy.interpreter.gateway import unwrap_spec
+from pypy.objspace.std.listobject import (W_ListObject, IntegerListStrategy,
+    FloatListStrategy)
+from pypy.objspace.std.intobject import W_IntObject
+from pypy.objspace.std.floatobject import W_FloatObject
+from rpython.rlib.objectmodel import specialize
+
+
+@specialize.arg(4)
+def _bisect_unboxed(l, x, lo, hi, left):
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if left:
+            smaller = l[mid] < x
+        else:
+            smaller = not x < l[mid]
+        if smaller:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+@specialize.arg(5)
+def _bisect(space, w_a, w_x, lo, hi, left):
+    if lo < 0:
+        raise OperationError(space.w_ValueError,
+                             space.wrap("lo must be non-negative"))
+    if type(w_a) is W_ListObject:
+        # fast paths
+        if w_a.strategy is space.fromcache(IntegerListStrategy):
+            if type(w_x) is W_IntObject:
+                l = w_a.getitems_int()
+                if hi == -1:
+                    hi = len(l)
+                if hi <= len(l):
+                    return _bisect_unboxed(l, space.int_w(w_x), lo, hi, left)
+        elif w_a.strategy is space.fromcache(FloatListStrategy):
+            if type(w_x) is W_FloatObject:
+                f = w_a.getitems_float()
+                if hi == -1:
+                    hi = len(f)
+                if hi <= len(f):
+                    return _bisect_unboxed(f, space.float_w(w_x), lo, hi,
+                                           left)
+    if hi == -1:
+        hi = space.len_w(w_a)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        w_item = space.getitem(w_a, space.wrap(mid))
+        if left:
+            smaller = space.is_true(space.lt(w_item, w_x))
+        else:
+            smaller = not space.is_true(space.lt(w_x, w_item))
+        if smaller:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+@specialize.arg(5)
+def _insort(space, w_a, w_x, lo, hi, left):
+    index = _bisect(space, w_a, w_x, lo, hi, left)
+    if type(w_a) is W_ListObject:
+        w_a.insert(index, w_x)
+    else:
+        space.call_method(w_a, 'insert', space.wrap(index), w_x)
+
+
+@unwrap_spec(lo=int, hi=int)
+def bisect_left(space, w_a, w_x, lo=0, hi=-1):
+    """Return the index where to insert item x in list a, assuming a is sorted.
+
+The return value i is such that all e in a[:i] have e < x, and all e in
+a[i:] have e >= x.  So if x already appears in the list, i points just
+before the leftmost x already there.
+
+Optional args lo (default 0) and hi (default len(a)) bound the
+slice of a to be searched."""
+    return space.wrap(_bisect(space, w_a, w_x, lo, hi, True))
+
+@unwrap_spec(lo=int, hi=int)
+def bisect_right(space, w_a, w_x, lo=0, hi=-1):
+    """Return the index where to insert item x in list a, assuming a is sorted.
+
+The return value i is such that all e in a[:i] have e <= x, and all e in
+a[i:] have e > x.  So if x already appears in the list, i points just
+beyond the rightmost x already there
+
+Optional args lo (default 0) and hi (default len(a)) bound the
+slice of a to be searched."""
+    return space.wrap(_bisect(space, w_a, w_x, lo, hi, False))
+
+@unwrap_spec(lo=int, hi=int)
+def insort_left(space, w_a, w_x, lo=0, hi=-1):
+    """Insert item x in list a, and keep it sorted assuming a is sorted.
+
+If x is already in a, insert it to the left of the leftmost x.
+
+Optional args lo (default 0) and hi (default len(a)) bound the
+slice of a to be searched."""
+    _insort(space, w_a, w_x, lo, hi, True)
+
+@unwrap_spec(lo=int, hi=int)
+def insort_right(space, w_a, w_x, lo=0, hi=-1):
+    """Insert item x in list a, and keep it sorted assuming a is sorted.
+
+If x is already in a, insert it to the right of the rightmost x.
+
+Optional args lo (default 0) and hi (default len(a)) bound the
+slice of a to be searched."""
+    _insort(space, w_a, w_x, lo, hi, False)
@@ -0,0 +1,66 @@
+class AppTestBisect:
+    spaceconfig = {
+        "usemodules": ['_bisect', '__pypy__'],
+    }
+
+    def test_dict(self):
+        import _bisect
+        _bisect.__dict__  # crashes if entries in __init__.py can't be resolved
+
+    def test_bisect(self):
+        from _bisect import bisect, bisect_left, bisect_right
+        for a in [[1, 2, 2, 2, 5, 7], [1.0, 2.0, 2.0, 2.0, 5.0, 7.0],
+                  ['a', 'b', 'b', 'b', 'e', 'g']]:
+            x, y, z = a[0], a[1], a[-1]
+            assert bisect_left(a, y) == 1
+            assert bisect_right(a, y) == 4
+            assert bisect(a, y) == 4
+            assert bisect_left(a, x) == 0
+            assert bisect_right(a, z) == 6
+            assert bisect_left(a, y, 2) == 2
+            assert bisect_right(a, y, 0, 3) == 3
+            assert bisect_right(a, z, 0, -5) == 0
+        # mixed types
+        assert bisect_left([1, 2, 3], 2.5) == 2
+        assert bisect_right([1.5, 2.5], 2) == 1
+
+    def test_errors(self):
+        from _bisect import bisect_left, bisect_right, insort
+        raises(ValueError, bisect_left, [1, 2], 1, -1)
+        raises(IndexError, bisect_right, [1, 2], 1, 0, 5)
+        raises(IndexError, bisect_right, [1.5, 2.5], 1.5, 0, 5)
+        raises(TypeError, bisect_right, 5, 1)
+        raises(ValueError, insort, [1, 2], 1, -1)
+
+    def test_insort(self):
+        import _bisect, __pypy__
+        a = [1, 3, 5]
+        _bisect.insort(a, 4)
+        _bisect.insort_left(a, 0)
+        _bisect.insort_right(a, 5)
+        assert a == [0, 1, 3, 4, 5, 5]
+        assert __pypy__.strategy(a) == "IntegerListStrategy"
+        a = [0.5, 1.5]
+        _bisect.insort(a, 1.0)
+        assert a == [0.5, 1.0, 1.5]
+        assert __pypy__.strategy(a) == "FloatListStrategy"
+        _bisect.insort(a, 1)
+        assert a == [0.5, 1.0, 1, 1.5]
+
+    def test_sequences(self):
+        import _bisect
+        assert _bisect.bisect((1, 2, 3), 2) == 2
+        assert _bisect.bisect_left(xrange(10), 5) == 5
+        class MyList(list):
+            def __getitem__(self, index):
+                return list.__getitem__(self, index) * 2
+            def insert(self, index, item):
+                self.inserted = (index, item)
+        a = MyList([1, 2, 3])
+        assert _bisect.bisect_left(a, 4) == 1
+        _bisect.insort_left(a, 4)
+        assert a.inserted == (1, 4)
+
+    def test_module(self):
+        import _bisect, bisect
+        assert bisect.bisect_left is _bisect.bisect_left
@@ -30,6 +30,10 @@ class LLBuffer(Buffer):
     def get_raw_address(self):
         return self.raw_cdata
 
+    def export_raw_address(self):
+        # the memory of a cdata is never resized or moved
+        return self.raw_cdata
+
     def getslice(self, start, stop, step, size):
         if step == 1:
             return rffi.charpsize2str(rffi.ptradd(self.raw_cdata, start), size)
@@ -6,6 +6,7 @@ from rpython.tool.sourcetools import func_renamer
 from pypy.interpreter.baseobjspace import W_Root
 from rpython.rtyper.lltypesystem import lltype, rffi
 from rpython.rlib import rgc, ropenssl
+from rpython.rlib.buffer import scoped_rawbuffer
 from rpython.rlib.rstring import StringBuilder
 from pypy.module.thread.os_lock import Lock
 
@@ -56,12 +57,12 @@ class W_Hash(W_Root):
         return space.wrap("<%s HASH object at 0x%s>" % (
             self.name, addrstring))
 
-    @unwrap_spec(string='bufferstr')
-    def update(self, space, string):
-        with rffi.scoped_nonmovingbuffer(string) as buf:
+    def update(self, space, w_string):
+        buf = space.getarg_w('s*', w_string)
+        with scoped_rawbuffer(buf) as ptr:
             with self.lock:
                 # XXX try to not release the GIL for small requests
-                ropenssl.EVP_DigestUpdate(self.ctx, buf, len(string))
+                ropenssl.EVP_DigestUpdate(self.ctx, ptr, buf.getlength())
 
     def copy(self, space):
         "Return a copy of the hash object."
@@ -120,18 +121,18 @@ W_Hash.typedef = TypeDef(
 )
 W_Hash.acceptable_as_base_class = False
 
-@unwrap_spec(name=str, string='bufferstr')
-def new(space, name, string=''):
+@unwrap_spec(name=str)
+def new(space, name, w_string=None):
     w_hash = W_Hash(space, name)
-    w_hash.update(space, string)
+    if w_string is not None:
+        w_hash.update(space, w_string)
     return space.wrap(w_hash)
 
 # shortcut functions
 def make_new_hash(name, funcname):
     @func_renamer(funcname)
-    @unwrap_spec(string='bufferstr')
-    def new_hash(space, string=''):
-        return new(space, name, string)
+    def new_hash(space, w_string=None):
+        return new(space, name, w_string)
     return new_hash
 
 for _name in algorithms:
@@ -77,6 +77,11 @@ class AppTestHashlib:
         h.update(b)
         assert h.digest() == _hashlib.openssl_md5('x' * 20).digest()
         _hashlib.openssl_sha1(b).digest()
+        h = _hashlib.openssl_sha1(buffer(array.array('c', 'abcdef'), 2))
+        h.update(memoryview(bytearray('ghi')))
+        h.update(bytearray('jk'))
+        assert h.digest() == _hashlib.openssl_sha1('cdefghijk').digest()
+        raises(TypeError, _hashlib.openssl_sha1, 42)
 
     def test_extra_algorithms(self):
         expected_results = {
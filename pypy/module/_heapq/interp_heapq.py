@@ -0,0 +1,331 @@
+"""
+Interp-level implementation of the heap queue algorithm, with the same
+behavior as CPython's _heapq.  When the heap is a list of ints or floats
+stored unboxed (IntegerListStrategy or FloatListStrategy) and the new
+item, if any, has the same type, we work directly on the unboxed items.
+Otherwise we compare the wrapped items, but without going through
+app-level code for every comparison like heapq.py does.
+"""
+
+from pypy.interpreter.error import OperationError
+from pypy.interpreter.gateway import unwrap_spec
+from pypy.objspace.std.listobject import (W_ListObject, IntegerListStrategy,
+    FloatListStrategy)
+from pypy.objspace.std.intobject import W_IntObject
+from pypy.objspace.std.floatobject import W_FloatObject
+from rpython.rlib.objectmodel import specialize
+
+
+def check_list(space, w_heap):
+    if not isinstance(w_heap, W_ListObject):
+        raise OperationError(space.w_TypeError,
+                             space.wrap("heap argument must be a list"))
+    return w_heap
+
+def index_error(space):
+    return OperationError(space.w_IndexError,
+                          space.wrap("index out of range"))
+
+def int_items(space, w_heap):
+    # the unboxed items of the list, if it uses IntegerListStrategy;
+    # they can be modified in-place
+    if w_heap.strategy is space.fromcache(IntegerListStrategy):
+        return w_heap.getitems_int()
+    return None
+
+def float_items(space, w_heap):
+    if w_heap.strategy is space.fromcache(FloatListStrategy):
+        return w_heap.getitems_float()
+    return None
+
+# ____________________________________________________________
+# on unboxed items
+
+@specialize.argtype(0)
+def _siftdown_unboxed(l, startpos, pos):
+    newitem = l[pos]
+    while pos > startpos:
+        parentpos = (pos - 1) >> 1
+        parent = l[parentpos]
+        if not newitem < parent:
+            break
+        l[pos] = parent
+        pos = parentpos
+    l[pos] = newitem
+
+@specialize.argtype(0)
+def _siftup_unboxed(l, pos):
+    endpos = len(l)
+    startpos = pos
+    newitem = l[pos]
+    # Bubble up the smaller child until hitting a leaf.
+    childpos = 2 * pos + 1
+    while childpos < endpos:
+        rightpos = childpos + 1
+        if rightpos < endpos and not l[childpos] < l[rightpos]:
+            childpos = rightpos
+        l[pos] = l[childpos]
+        pos = childpos
+        childpos = 2 * pos + 1
+    # Put newitem there, and bubble it up to its final resting place.
+    l[pos] = newitem
+    _siftdown_unboxed(l, startpos, pos)
+
+@specialize.argtype(1)
+def _heappop_unboxed(space, l):
+    if len(l) == 0:
+        raise index_error(space)
+    lastelt = l.pop()
+    if len(l) == 0:
+        return lastelt
+    returnitem = l[0]
+    l[0] = lastelt
+    _siftup_unboxed(l, 0)
+    return returnitem
+
+@specialize.argtype(1)
+def _heapreplace_unboxed(space, l, item):
+    if len(l) == 0:
+        raise index_error(space)
+    returnitem = l[0]
+    l[0] = item
+    _siftup_unboxed(l, 0)
+    return returnitem
+
+@specialize.argtype(0)
+def _heapify_unboxed(l):
+    i = len(l) // 2
+    while i > 0:
+        i -= 1
+        _siftup_unboxed(l, i)
+
+# ____________________________________________________________
+# on wrapped items
+
+def cmp_lt(space, w_x, w_y):
+    # Use __lt__ if available; otherwise, try __le__, like heapq.py
+    if space.findattr(w_x, space.wrap('__lt__')) is not None:
+        return space.is_true(space.lt(w_x, w_y))
+    return not space.is_true(space.le(w_y, w_x))
+
+@specialize.arg(3)
+def _lt(space, w_x, w_y, maxheap):
+    if maxheap:
+        return cmp_lt(space, w_y, w_x)
+    return cmp_lt(space, w_x, w_y)
+
+def check_size(space, w_heap, size):
+    # the comparisons may run arbitrary code
+    if w_heap.length() != size:
+        raise OperationError(space.w_RuntimeError,
+                             space.wrap("list changed size during iteration"))
+
+@specialize.arg(4)
+def _siftdown(space, w_heap, startpos, pos, maxheap):
+    size = w_heap.length()
+    if pos >= size:
+        raise index_error(space)
+    # Follow the path to the root, moving parents down until finding
+    # a place newitem fits.
+    w_newitem = w_heap.getitem(pos)
+    while pos > startpos:
+        parentpos = (pos - 1) >> 1
+        lt = _lt(space, w_newitem, w_heap.getitem(parentpos), maxheap)
+        check_size(space, w_heap, size)
+        if not lt:
+            break
+        w_parent = w_heap.getitem(parentpos)
+        w_newitem = w_heap.getitem(pos)
+        w_heap.setitem(parentpos, w_newitem)
+        w_heap.setitem(pos, w_parent)
+        pos = parentpos
+
+@specialize.arg(3)
+def _siftup(space, w_heap, pos, maxheap):
+    endpos = w_heap.length()
+    startpos = pos
+    if pos >= endpos:
+        raise index_error(space)
+    # Bubble up the smaller child until hitting a leaf.
+    limit = endpos >> 1          # smallest pos that has no child
+    while pos < limit:
+        childpos = 2 * pos + 1
+        if childpos + 1 < endpos:
+            if not _lt(space, w_heap.getitem(childpos),
+                       w_heap.getitem(childpos + 1), maxheap):
+                childpos += 1
+            check_size(space, w_heap, endpos)
+        # Move the smaller child up.
+        w_tmp = w_heap.getitem(childpos)
+        w_heap.setitem(childpos, w_heap.getitem(pos))
+        w_heap.setitem(pos, w_tmp)
+        pos = childpos
+    # Bubble it up to its final resting place (by sifting its parents down).
+    _siftdown(space, w_heap, startpos, pos, maxheap)
+
+@specialize.arg(2)
+def _heapify(space, w_heap, maxheap):
+    i = w_heap.length() // 2
+    while i > 0:
+        i -= 1
+        _siftup(space, w_heap, i, maxheap)
+
+# ____________________________________________________________
+
+def heappush(space, w_heap, w_item):
+    """Push item onto heap, maintaining the heap invariant."""
+    w_heap = check_list(space, w_heap)
+    l = int_items(space, w_heap)
+    if l is not None and type(w_item) is W_IntObject:
+        l.append(space.int_w(w_item))
+        _siftdown_unboxed(l, 0, len(l) - 1)
+        return
+    f = float_items(space, w_heap)
+    if f is not None and type(w_item) is W_FloatObject:
+        f.append(space.float_w(w_item))
+        _siftdown_unboxed(f, 0, len(f) - 1)
+        return
+    w_heap.append(w_item)
+    _siftdown(space, w_heap, 0, w_heap.length() - 1, False)
+
+def heappop(space, w_heap):
+    """Pop the smallest item off the heap, maintaining the heap invariant."""
+    w_heap = check_list(space, w_heap)
+    l = int_items(space, w_heap)
+    if l is not None:
+        return space.wrap(_heappop_unboxed(space, l))
+    f = float_items(space, w_heap)
+    if f is not None:
+        return space.wrap(_heappop_unboxed(space, f))
+    size = w_heap.length()
+    if size == 0:
+        raise index_error(space)
+    w_lastelt = w_heap.pop_end()
+    if size == 1:
+        return w_lastelt
+    w_returnitem = w_heap.getitem(0)
+    w_heap.setitem(0, w_lastelt)
+    _siftup(space, w_heap, 0, False)
+    return w_returnitem
+
+def heapreplace(space, w_heap, w_item):
+    """Pop and return the current smallest value, and add the new item.
+
+This is more efficient than heappop() followed by heappush(), and can be
+more appropriate when using a fixed-size heap.  Note that the value
+returned may be larger than item!  That constrains reasonable uses of
+this routine unless written as part of a conditional replacement:
+
+    if item > heap[0]:
+        item = heapreplace(heap, item)
+"""
+    w_heap = check_list(space, w_heap)
+    l = int_items(space, w_heap)
+    if l is not None and type(w_item) is W_IntObject:
+        return space.wrap(_heapreplace_unboxed(space, l, space.int_w(w_item)))
+    f = float_items(space, w_heap)
+    if f is not None and type(w_item) is W_FloatObject:
+        return space.wrap(_heapreplace_unboxed(space, f,
+                                               space.float_w(w_item)))
+    if w_heap.length() == 0:
+        raise index_error(space)
+    w_returnitem = w_heap.getitem(0)
+    w_heap.setitem(0, w_item)
+    _siftup(space, w_heap, 0, False)
+    return w_returnitem
+
+def heappushpop(space, w_heap, w_item):
+    """Push item on the heap, then pop and return the smallest item
+from the heap. The combined action runs more efficiently than
+heappush() followed by a separate call to heappop()."""
+    w_heap = check_list(space, w_heap)
+    l = int_items(space, w_heap)
+    if l is not None and type(w_item) is W_IntObject:
+        item = space.int_w(w_item)
+        if len(l) == 0 or not l[0] < item:
+            return w_item
+        return space.wrap(_heapreplace_unboxed(space, l, item))
+    f = float_items(space, w_heap)
+    if f is not None and type(w_item) is W_FloatObject:
+        floatitem = space.float_w(w_item)
+        if len(f) == 0 or not f[0] < floatitem:
+            return w_item
+        return space.wrap(_heapreplace_unboxed(space, f, floatitem))
+    if w_heap.length() == 0:
+        return w_item
+    if not cmp_lt(space, w_heap.getitem(0), w_item):
+        return w_item
+    if w_heap.length() == 0:
+        raise index_error(space)
+    w_returnitem = w_heap.getitem(0)
+    w_heap.setitem(0, w_item)
+    _siftup(space, w_heap, 0, False)
+    return w_returnitem
+
+def heapify(space, w_heap):
+    """Transform list into a heap, in-place, in O(len(heap)) time."""
+    w_heap = check_list(space, w_heap)
+    l = int_items(space, w_heap)
+    if l is not None:
+        _heapify_unboxed(l)
+        return
+    f = float_items(space, w_heap)
+    if f is not None:
+        _heapify_unboxed(f)
+        return
+    _heapify(space, w_heap, False)
+
+@specialize.arg(3)
+def _nbest(space, n, w_iterable, largest):
+    # keep the 'n' best items in a heap whose root is the worst of them:
+    # a min-heap for nlargest(), a max-heap for nsmallest()
+    w_iter = space.iter(w_iterable)
+    w_heap = space.newlist([])
+    while w_heap.length() < n:
+        w_elem = _next(space, w_iter)
+        if w_elem is None:
+            break
+        w_heap.append(w_elem)
+    if w_heap.length() == n and n > 0:
+        _heapify(space, w_heap, not largest)
+        w_worst = w_heap.getitem(0)
+        while True:
+            w_elem = _next(space, w_iter)
+            if w_elem is None:
+                break
+            if largest:
+                better = cmp_lt(space, w_worst, w_elem)
+            else:
+                better = cmp_lt(space, w_elem, w_worst)
+            if better:
+                w_heap.setitem(0, w_elem)
+                _siftup(space, w_heap, 0, not largest)
+                w_worst = w_heap.getitem(0)
+    space.call_method(w_heap, 'sort')
+    if largest:
+        space.call_method(w_heap, 'reverse')
+    return w_heap
+
+def _next(space, w_iter):
+    try:
+        return space.next(w_iter)
+    except OperationError, e:
+        if not e.match(space, space.w_StopIteration):
+            raise
+        return None
+
+@unwrap_spec(n=int)
+def nlargest(space, n, w_iterable):
+    """Find the n largest elements in a dataset.
+
+Equivalent to:  sorted(iterable, reverse=True)[:n]
+"""
+    return _nbest(space, n, w_iterable, True)
+
+@unwrap_spec(n=int)
+def nsmallest(space, n, w_iterable):
+    """Find the n smallest elements in a dataset.
+
+Equivalent to:  sorted(iterable)[:n]
+"""
+    return _nbest(space, n, w_iterable, False)
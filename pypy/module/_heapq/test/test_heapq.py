@@ -0,0 +1,115 @@
+class AppTestHeapq:
+    spaceconfig = {
+        "usemodules": ['_heapq', '__pypy__'],
+    }
+
+    def test_dict(self):
+        import _heapq
+        _heapq.__dict__  # crashes if entries in __init__.py can't be resolved
+
+    def setup_class(cls):
+        cls.w_check_invariant = cls.space.appexec([], """():
+            def check_invariant(heap):
+                for pos in range(1, len(heap)):
+                    assert heap[(pos - 1) >> 1] <= heap[pos]
+            return check_invariant""")
+
+    def test_push_pop(self):
+        import _heapq, __pypy__
+        for items in [[5, 1, 8, 3, 3, 9, 0, -2],
+                      [5.5, 1.0, 8.25, 3.0, 3.0, -2.5],
+                      [(2, 'b'), (1, 'z'), (2, 'a'), (0, 'c')],
+                      ['x', 'b', 'y', 'a']]:
+            heap = []
+            for item in items:
+                _heapq.heappush(heap, item)
+                self.check_invariant(heap)
+            assert len(heap) == len(items)
+            result = [_heapq.heappop(heap) for i in range(len(items))]
+            assert result == sorted(items)
+            raises(IndexError, _heapq.heappop, heap)
+
+    def test_unboxed(self):
+        import _heapq, __pypy__
+        heap = [9, 3, 7, 1, 8]
+        _heapq.heapify(heap)
+        self.check_invariant(heap)
+        _heapq.heappush(heap, 2)
+        assert _heapq.heapreplace(heap, 10) == 1
+        assert _heapq.heappushpop(heap, 0) == 0
+        assert _heapq.heappushpop(heap, 4) == 2
+        assert __pypy__.strategy(heap) == "IntegerListStrategy"
+        assert sorted(heap) == [3, 4, 7, 8, 9, 10]
+        self.check_invariant(heap)
+        #
+        heap = [9.5, 3.5, 7.0]
+        _heapq.heapify(heap)
+        _heapq.heappush(heap, 1.5)
+        assert _heapq.heappop(heap) == 1.5
+        assert __pypy__.strategy(heap) == "FloatListStrategy"
+        assert _heapq.heapreplace(heap, 0.5) == 3.5
+        assert heap[0] == 0.5
+
+    def test_mixed_types(self):
+        import _heapq, __pypy__
+        heap = [3, 1, 2]
+        _heapq.heapify(heap)
+        _heapq.heappush(heap, 1.5)
+        assert __pypy__.strategy(heap) == "ObjectListStrategy"
+        assert [_heapq.heappop(heap) for i in range(4)] == [1, 1.5, 2, 3]
+        heap = [1.5, 2.5]
+        assert _heapq.heappushpop(heap, 2) == 1.5
+        assert heap == [2, 2.5]
+
+    def test_errors(self):
+        import _heapq
+        raises(TypeError, _heapq.heappush, (), 1)
+        raises(TypeError, _heapq.heapify, None)
+        raises(IndexError, _heapq.heapreplace, [], 1)
+        raises(IndexError, _heapq.heapreplace, [], 1.5)
+        assert _heapq.heappushpop([], 1) == 1
+
+    def test_comparison_operator(self):
+        import _heapq
+        class LT(object):
+            def __init__(self, x):
+                self.x = x
+            def __lt__(self, other):
+                return self.x > other.x
+        class LE:
+            def __init__(self, x):
+                self.x = x
+            def __le__(self, other):
+                return self.x >= other.x
+        for cls in [LT, LE]:
+            heap = [cls(x) for x in [1, 5, 3, 4, 2]]
+            _heapq.heapify(heap)
+            assert [_heapq.heappop(heap).x for i in range(5)] == [5, 4, 3, 2, 1]
+
+    def test_mutating_heap(self):
+        import _heapq
+        class X(object):
+            def __init__(self, heap):
+                self.heap = heap
+            def __lt__(self, other):
+                del self.heap[:]
+                return False
+        heap = []
+        heap.append(X(heap))
+        heap.append(X(heap))
+        raises((IndexError, RuntimeError), _heapq.heappush, heap, X(heap))
+
+    def test_nlargest_nsmallest(self):
+        import _heapq
+        data = [(i * 7) % 23 for i in range(50)]
+        for n in [0, 1, 5, 49, 50, 100]:
+            assert _heapq.nsmallest(n, data) == sorted(data)[:n]
+            assert _heapq.nlargest(n, iter(data)) == sorted(data,
+                                                        reverse=True)[:n]
+        assert _heapq.nlargest(3, []) == []
+
+    def test_module(self):
+        import _heapq, heapq
+        assert heapq.heappush is _heapq.heappush
+        assert heapq._nlargest is _heapq.nlargest
+        assert _heapq.heappush.__module__ == '_heapq'
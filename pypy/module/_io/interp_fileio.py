@@ -2,6 +2,8 @@ from pypy.interpreter.typedef import TypeDef, interp_attrproperty, GetSetPropert
 from pypy.interpreter.gateway import interp2app, unwrap_spec
 from pypy.interpreter.error import OperationError, wrap_oserror, wrap_oserror2
 from rpython.rlib.rarithmetic import r_longlong
+from rpython.rlib.buffer import scoped_rawbuffer
+from rpython.rlib import rposix
 from rpython.rlib.rstring import StringBuilder
 from os import O_RDONLY, O_WRONLY, O_RDWR, O_CREAT, O_TRUNC
 import sys, os, stat, errno
@@ -333,10 +335,11 @@ class W_FileIO(W_RawIOBase):
     def write_w(self, space, w_data):
         self._check_closed(space)
         self._check_writable(space)
-        data = space.getarg_w('s*', w_data).as_str()
+        buf = space.getarg_w('s*', w_data)
 
         try:
-            n = os.write(self.fd, data)
+            with scoped_rawbuffer(buf) as ptr:
+                n = rposix.write_raw(self.fd, ptr, buf.getlength())
         except OSError, e:
             if e.errno == errno.EAGAIN:
                 return space.w_None
@@ -334,6 +334,28 @@ def check_decoded(space, w_decoded):
         raise oefmt(space.w_TypeError, msg, w_decoded)
 
 
+def _is_exact_type(space, w_obj, typedef):
+    return space.type(w_obj) is space.gettypeobject(typedef)
+
+def _get_raw_fileio(space, w_buffer):
+    from pypy.module._io.interp_bufferedio import (
+        W_BufferedRandom, W_BufferedReader, W_BufferedWriter)
+    w_raw = None
+    if isinstance(w_buffer, W_BufferedReader):
+        if _is_exact_type(space, w_buffer, W_BufferedReader.typedef):
+            w_raw = w_buffer.w_raw
+    elif isinstance(w_buffer, W_BufferedWriter):
+        if _is_exact_type(space, w_buffer, W_BufferedWriter.typedef):
+            w_raw = w_buffer.w_raw
+    elif isinstance(w_buffer, W_BufferedRandom):
+        if _is_exact_type(space, w_buffer, W_BufferedRandom.typedef):
+            w_raw = w_buffer.w_raw
+    from pypy.module._io.interp_fileio import W_FileIO
+    if (isinstance(w_raw, W_FileIO) and
+            _is_exact_type(space, w_raw, W_FileIO.typedef)):
+        return w_raw
+    return None
+
 class W_TextIOWrapper(W_TextIOBase):
     def __init__(self, space):
         W_TextIOBase.__init__(self, space)
@@ -355,6 +377,7 @@ class W_TextIOWrapper(W_TextIOBase):
         self.encoding_start_of_stream = False # Whether or not it's the start
                                               # of the stream
         self.snapshot = None
+        self.w_fileio = None   # the raw FileIO, to speed up 'closed' checks
 
     @unwrap_spec(encoding="str_or_None", line_buffering=int)
     def descr_init(self, space, w_buffer, encoding=None,
@@ -410,6 +433,11 @@ class W_TextIOWrapper(W_TextIOBase):
             self.w_encoder = space.call_method(w_codec,
                                                "incrementalencoder", w_errors)
 
+        # Cache the raw FileIO object of the common Buffered*(FileIO)
+        # stacks: checking its file descriptor is much cheaper than going
+        # through the 'closed' attributes of the buffer and the raw stream.
+        self.w_fileio = _get_raw_fileio(space, w_buffer)
+
         self.seekable = space.is_true(space.call_method(w_buffer, "seekable"))
         self.telling = self.seekable
 
@@ -433,6 +461,15 @@ class W_TextIOWrapper(W_TextIOBase):
 
     def _check_closed(self, space, message=None):
         self._check_init(space)
+        if (self.w_fileio is not None and
+                _is_exact_type(space, self, W_TextIOWrapper.typedef)):
+            # Fast path: the 'closed' property of the buffer is the one of
+            # the underlying FileIO
+            if self.w_fileio.fd < 0:
+                if message is None:
+                    message = "I/O operation on closed file"
+                raise OperationError(space.w_ValueError, space.wrap(message))
+            return
         W_TextIOBase._check_closed(self, space, message)
 
     def descr_repr(self, space):
@@ -581,12 +618,19 @@ class W_TextIOWrapper(W_TextIOBase):
 
     def next_w(self, space):
         self.telling = False
-        try:
-            return W_TextIOBase.next_w(self, space)
-        except OperationError, e:
-            if e.match(space, space.w_StopIteration):
-                self.telling = self.seekable
-            raise
+        if not _is_exact_type(space, self, W_TextIOWrapper.typedef):
+            # a subclass may override readline()
+            try:
+                return W_TextIOBase.next_w(self, space)
+            except OperationError, e:
+                if e.match(space, space.w_StopIteration):
+                    self.telling = self.seekable
+                raise
+        w_line = self.readline_w(space)
+        if space.len_w(w_line) == 0:
+            self.telling = self.seekable
+            raise OperationError(space.w_StopIteration, space.w_None)
+        return w_line
 
     def read_w(self, space, w_size=None):
         self._check_closed(space)
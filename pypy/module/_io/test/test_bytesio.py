@@ -127,3 +127,18 @@ class AppTestBytesIO:
         import _io
         f = _io.BytesIO(b'abc')
         assert f.readline(10) == b'abc'
+
+    def test_getvalue_shares_data(self):
+        import _io
+        buf = b'x' * 1000
+        f = _io.BytesIO(buf)
+        assert f.getvalue() is buf
+        assert f.read() is buf
+        f.write(b'y')
+        value = f.getvalue()
+        assert value == buf + b'y'
+        assert f.getvalue() is value
+        f.seek(10)
+        assert f.read(5) == b'xxxxx'
+        f.seek(0)
+        assert f.read() is value
@@ -3,7 +3,8 @@ import os
 
 
 class AppTestFileIO:
-    spaceconfig = dict(usemodules=['_io'] + (['fcntl'] if os.name != 'nt' else []))
+    spaceconfig = dict(usemodules=['_io', 'array'] +
+                            (['fcntl'] if os.name != 'nt' else []))
 
     def setup_class(cls):
         tmpfile = udir.join('tmpfile')
@@ -90,6 +91,23 @@ class AppTestFileIO:
         f.close()
         f2.close()
 
+    def test_write_buffers(self):
+        import _io, array
+        filename = self.tmpfile + '_w'
+        f = _io.FileIO(filename, 'wb')
+        assert f.write(array.array('c', 'hello')) == 5
+        assert f.write(buffer(array.array('c', 'XX world'), 2)) == 6
+        assert f.write(memoryview(bytearray('!!'))[1:]) == 1
+        assert f.write(bytearray('?')) == 1
+        raises(TypeError, f.write, 42)
+        f.close()
+        f = _io.FileIO(filename, 'rb')
+        assert f.read() == "hello world!?"
+        f.close()
+        f = _io.FileIO(filename, 'rb')
+        raises(ValueError, f.write, 'x')
+        f.close()
+
     def test_writelines(self):
         import _io
         filename = self.tmpfile + '_w'
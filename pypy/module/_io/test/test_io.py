@@ -229,6 +229,34 @@ class AppTestOpen:
                 assert g.name == f.fileno()
                 assert g.raw.name == f.fileno()
 
+    def test_text_iteration(self):
+        import _io
+
+        with _io.open(self.tmpfile, "wb") as f:
+            f.write(b"a\nbb\r\nccc\rdddd")
+
+        with _io.open(self.tmpfile, encoding="utf-8") as f:
+            assert list(f) == [u"a\n", u"bb\n", u"ccc\n", u"dddd"]
+            assert f.tell() == 14
+            f.seek(0)
+            assert f.readlines() == [u"a\n", u"bb\n", u"ccc\n", u"dddd"]
+            assert f.tell() == 14
+            f.seek(0)
+            assert f.readlines(3) == [u"a\n", u"bb\n"]
+            assert f.tell() == 6
+        raises(ValueError, iter, f)
+        raises(ValueError, f.readline)
+        raises(ValueError, f.readlines)
+
+        class MyTextIO(_io.TextIOWrapper):
+            def readline(self):
+                return u"x" if not self.buffer.closed else u""
+        f = MyTextIO(_io.open(self.tmpfile, "rb"))
+        it = iter(f)
+        assert next(it) == u"x"
+        f.buffer.close()
+        raises(StopIteration, next, it)
+
     def test_seek_and_tell(self):
         import _io
 
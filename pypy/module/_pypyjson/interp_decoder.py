@@ -2,6 +2,7 @@ import sys
 from rpython.rlib.rstring import StringBuilder
 from rpython.rlib.objectmodel import specialize
 from rpython.rlib import rfloat, runicode
+from rpython.rlib.buffer import StringBuffer
 from rpython.rtyper.lltypesystem import lltype, rffi
 from pypy.interpreter.error import OperationError, oefmt
 from pypy.interpreter import unicodehelper
@@ -19,40 +20,57 @@ def neg_pow_10(x, exp):
         return 0.0
     return x * NEG_POW_10[exp]
 
-def strslice2unicode_latin1(s, start, end):
+def charpslice2unicode_latin1(ll_chars, start, end):
     """
-    Convert s[start:end] to unicode. s is supposed to be an RPython string
-    encoded in latin-1, which means that the numeric value of each char is the
-    same as the corresponding unicode code point.
+    Convert ll_chars[start:end] to unicode. ll_chars is supposed to be a raw
+    char array encoded in latin-1, which means that the numeric value of each
+    char is the same as the corresponding unicode code point.
 
     Internally it's implemented at the level of low-level helpers, to avoid
     the extra copy we would need if we take the actual slice first.
 
     No bound checking is done, use carefully.
     """
-    from rpython.rtyper.annlowlevel import llstr, hlunicode
+    from rpython.rtyper.annlowlevel import hlunicode
     from rpython.rtyper.lltypesystem.rstr import malloc, UNICODE
     from rpython.rtyper.lltypesystem.lltype import cast_primitive, UniChar
     length = end-start
-    ll_s = llstr(s)
     ll_res = malloc(UNICODE, length)
     ll_res.hash = 0
     for i in range(length):
-        ch = ll_s.chars[start+i]
+        ch = ll_chars[start+i]
         ll_res.chars[i] = cast_primitive(UniChar, ch)
     return hlunicode(ll_res)
 
+def buffer2charp(buf):
+    """
+    Copy the content of buf to a newly allocated, NUL-terminated raw char
+    array.  If the buffer exposes its raw memory (e.g. mmap), the data is
+    copied directly from there, without making an intermediate string.
+    """
+    try:
+        ll_src = buf.get_raw_address()
+    except ValueError:
+        return rffi.str2charp(buf.as_str())
+    length = buf.getlength()
+    ll_chars = lltype.malloc(rffi.CCHARP.TO, length + 1, flavor='raw')
+    rffi.c_memcpy(rffi.cast(rffi.VOIDP, ll_chars),
+                  rffi.cast(rffi.VOIDP, ll_src),
+                  rffi.cast(rffi.SIZE_T, length))
+    ll_chars[length] = '\x00'
+    return ll_chars
+
 TYPE_UNKNOWN = 0
 TYPE_STRING = 1
 class JSONDecoder(object):
-    def __init__(self, space, s):
+    def __init__(self, space, buf):
         self.space = space
-        self.s = s
         # we put our string in a raw buffer so:
         # 1) we automatically get the '\0' sentinel at the end of the string,
         #    which means that we never have to check for the "end of string"
         # 2) we can pass the buffer directly to strtod
-        self.ll_chars = rffi.str2charp(s)
+        self.length = buf.getlength()
+        self.ll_chars = buffer2charp(buf)
         self.end_ptr = lltype.malloc(rffi.CCHARPP.TO, 1, flavor='raw')
         self.pos = 0
         self.last_type = TYPE_UNKNOWN
@@ -63,8 +81,9 @@ class JSONDecoder(object):
 
     def getslice(self, start, end):
         assert start >= 0
-        assert end >= 0
-        return self.s[start:end]
+        assert end >= start
+        return rffi.charpsize2str(rffi.ptradd(self.ll_chars, start),
+                                  end - start)
 
     def skip_whitespace(self, i):
         while True:
@@ -303,7 +322,8 @@ class JSONDecoder(object):
                     # ascii only, fast path (ascii is a strict subset of
                     # latin1, and we already checked that all the chars are <
                     # 128)
-                    content_unicode = strslice2unicode_latin1(self.s, start, i-1)
+                    content_unicode = charpslice2unicode_latin1(self.ll_chars,
+                                                                start, i-1)
                 self.last_type = TYPE_STRING
                 self.pos = i
                 return self.space.wrap(content_unicode)
@@ -386,14 +406,23 @@ def loads(space, w_s):
     if space.isinstance_w(w_s, space.w_unicode):
         raise OperationError(space.w_TypeError,
                              space.wrap("Expected utf8-encoded str, got unicode"))
-    s = space.str_w(w_s)
-    decoder = JSONDecoder(space, s)
+    if space.isinstance_w(w_s, space.w_str):
+        buf = StringBuffer(space.str_w(w_s))
+    else:
+        # e.g. mmap, buffer or memoryview: decode without making a string
+        try:
+            buf = space.readbuf_w(w_s)
+        except OperationError, e:
+            if not e.match(space, space.w_TypeError):
+                raise
+            buf = space.buffer_w(w_s, space.BUF_SIMPLE)
+    decoder = JSONDecoder(space, buf)
     try:
         w_res = decoder.decode_any(0)
         i = decoder.skip_whitespace(decoder.pos)
-        if i < len(s):
+        if i < decoder.length:
             start = i
-            end = len(s) - 1
+            end = decoder.length - 1
             raise oefmt(space.w_ValueError,
                         "Extra data: char %d - %d", start, end)
         return w_res
@@ -1,9 +1,10 @@
 # -*- encoding: utf-8 -*-
+from rpython.rlib.buffer import StringBuffer
 from pypy.module._pypyjson.interp_decoder import JSONDecoder
 
 def test_skip_whitespace():
     s = '   hello   '
-    dec = JSONDecoder('fake space', s)
+    dec = JSONDecoder('fake space', StringBuffer(s))
     assert dec.pos == 0
     assert dec.skip_whitespace(0) == 3
     assert dec.skip_whitespace(3) == 3
@@ -20,6 +21,15 @@ class AppTest(object):
         raises(TypeError, _pypyjson.loads, u"42")
 
 
+    def test_decode_buffer(self):
+        import _pypyjson
+        assert _pypyjson.loads(buffer('[1, "a", {"b": 2.5}]')) == [
+            1, u"a", {u"b": 2.5}]
+        assert _pypyjson.loads(bytearray('"\xc3\xa9"')) == u"\xe9"
+        assert _pypyjson.loads(memoryview(' 42 ')) == 42
+        raises(ValueError, _pypyjson.loads, buffer('[1] 2'))
+        raises(TypeError, _pypyjson.loads, 42)
+
     def test_decode_constants(self):
         import _pypyjson
         assert _pypyjson.loads('null') is None
@@ -1,4 +1,5 @@
 from rpython.rlib import rsocket
+from rpython.rlib.buffer import scoped_rawbuffer
 from rpython.rlib.rarithmetic import intmask
 from rpython.rlib.rsocket import (
     RSocket, AF_INET, SOCK_STREAM, SocketError, SocketErrorWithErrno,
@@ -333,22 +334,24 @@ class W_Socket(W_Root):
         except SocketError as e:
             raise converted_error(space, e)
 
-    @unwrap_spec(data='bufferstr', flags=int)
-    def send_w(self, space, data, flags=0):
+    @unwrap_spec(flags=int)
+    def send_w(self, space, w_data, flags=0):
         """send(data[, flags]) -> count
 
         Send a data string to the socket.  For the optional flags
         argument, see the Unix manual.  Return the number of bytes
         sent; this may be less than len(data) if the network is busy.
         """
+        buf = space.getarg_w('s*', w_data)
         try:
-            count = self.sock.send(data, flags)
+            with scoped_rawbuffer(buf) as dataptr:
+                count = self.sock.send_raw(dataptr, buf.getlength(), flags)
         except SocketError as e:
             raise converted_error(space, e)
         return space.wrap(count)
 
-    @unwrap_spec(data='bufferstr', flags=int)
-    def sendall_w(self, space, data, flags=0):
+    @unwrap_spec(flags=int)
+    def sendall_w(self, space, w_data, flags=0):
         """sendall(data[, flags])
 
         Send a data string to the socket.  For the optional flags
@@ -356,14 +359,15 @@ class W_Socket(W_Root):
         until all data is sent.  If an error occurs, it's impossible
         to tell how much data has been sent.
         """
+        buf = space.getarg_w('s*', w_data)
         try:
-            self.sock.sendall(
-                data, flags, space.getexecutioncontext().checksignals)
+            with scoped_rawbuffer(buf) as dataptr:
+                self.sock.sendall_raw(dataptr, buf.getlength(), flags,
+                                      space.getexecutioncontext().checksignals)
         except SocketError as e:
             raise converted_error(space, e)
 
-    @unwrap_spec(data='bufferstr')
-    def sendto_w(self, space, data, w_param2, w_param3=None):
+    def sendto_w(self, space, w_data, w_param2, w_param3=None):
         """sendto(data[, flags], address) -> count
 
         Like send(data, flags) but allows specifying the destination address.
@@ -377,9 +381,12 @@ class W_Socket(W_Root):
             # 3 args version
             flags = space.int_w(w_param2)
             w_addr = w_param3
+        buf = space.getarg_w('s*', w_data)
         try:
             addr = self.addr_from_object(space, w_addr)
-            count = self.sock.sendto(data, flags, addr)
+            with scoped_rawbuffer(buf) as dataptr:
+                count = self.sock.sendto_raw(dataptr, buf.getlength(), flags,
+                                             addr)
         except SocketError as e:
             raise converted_error(space, e)
         return space.wrap(count)
@@ -679,6 +679,27 @@ class AppTestSocketTCP:
         cli.close()
         t.close()
 
+    def test_send_buffers(self):
+        import socket
+        import array
+        cli = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        cli.connect(self.serv.getsockname())
+        conn, addr = self.serv.accept()
+        a = array.array('c', 'hello world')
+        assert cli.send(a) == 11
+        assert conn.recv(11) == 'hello world'
+        cli.sendall(memoryview(bytearray('world'))[1:])
+        assert conn.recv(4) == 'orld'
+        cli.sendall(buffer(a, 2, 3))
+        assert conn.recv(3) == 'llo'
+        cli.sendall(bytearray('xyz'))
+        assert conn.recv(3) == 'xyz'
+        a = array.array('i', [1, 2])
+        cli.sendall(a)
+        assert conn.recv(len(a.tostring())) == a.tostring()
+        cli.close()
+        conn.close()
+
     def test_recv_into(self):
         import socket
         import array
@@ -2,6 +2,7 @@ from rpython.rlib import jit
 from rpython.rlib.buffer import Buffer
 from rpython.rlib.objectmodel import keepalive_until_here
 from rpython.rlib.rarithmetic import ovfcheck, widen
+from rpython.rlib.rrawarray import populate_list_from_raw_array
 from rpython.rlib.unroll import unrolling_iterable
 from rpython.rtyper.annlowlevel import llstr
 from rpython.rtyper.lltypesystem import lltype, rffi
@@ -122,12 +123,21 @@ UNICODE_ARRAY = lltype.Ptr(lltype.Array(lltype.UniChar,
                                         hints={'nolength': True}))
 
 class W_ArrayBase(W_Root):
-    _attrs_ = ('space', 'len', 'allocated', '_lifeline_') # no buffer
+    _attrs_ = ('space', 'len', 'allocated', '_lifeline_',
+               '_raw_exports') # no buffer
 
     def __init__(self, space):
         self.space = space
         self.len = 0
         self.allocated = 0
+        self._raw_exports = 0
+
+    def _check_resizable(self):
+        # the raw address of the buffer is in use, maybe by another
+        # thread: don't free it under its feet
+        if self._raw_exports:
+            raise oefmt(self.space.w_BufferError,
+                        "cannot resize an array that is exporting buffers")
 
     def readbuf_w(self, space):
         return ArrayBuffer(self, True)
@@ -198,11 +208,28 @@ class W_ArrayBase(W_Root):
 
         Convert array to an ordinary list with the same items.
         """
+        # arrays of ints or floats give a list with unboxed items
+        intlist = self.getitems_int()
+        if intlist is not None:
+            return space.newlist_int(intlist)
+        floatlist = self.getitems_float()
+        if floatlist is not None:
+            return space.newlist_float(floatlist)
         w_l = space.newlist([])
         for i in range(self.len):
             w_l.append(self.w_getitem(space, i))
         return w_l
 
+    def getitems_int(self):
+        """Return a new RPython list with the items as ints, or None if
+        the items are not integers that fit in a Signed."""
+        return None
+
+    def getitems_float(self):
+        """Return a new RPython list with the items as floats, or None if
+        the items are not floats."""
+        return None
+
     def descr_fromlist(self, space, w_lst):
         """ fromlist(list)
 
@@ -626,6 +653,14 @@ class ArrayBuffer(Buffer):
     def get_raw_address(self):
         return self.array._charbuf_start()
 
+    def export_raw_address(self):
+        self.array._raw_exports += 1
+        return self.array._charbuf_start()
+
+    def release_raw_address(self):
+        self.array._raw_exports -= 1
+        self.array._charbuf_stop()
+
 
 def make_array(mytype):
     W_ArrayBase = globals()['W_ArrayBase']
@@ -638,7 +673,8 @@ def make_array(mytype):
         itemsize = mytype.bytes
         typecode = mytype.typecode
 
-        _attrs_ = ('space', 'len', 'allocated', '_lifeline_', 'buffer')
+        _attrs_ = ('space', 'len', 'allocated', '_lifeline_', '_raw_exports',
+                   'buffer')
 
         def __init__(self, space):
             W_ArrayBase.__init__(self, space)
@@ -705,6 +741,8 @@ def make_array(mytype):
             self.setlen(0)
 
         def setlen(self, size, zero=False, overallocate=True):
+            if size != self.len:
+                self._check_resizable()
             if size > 0:
                 if size > self.allocated or size < self.allocated / 2:
                     if overallocate:
@@ -724,8 +762,13 @@ def make_array(mytype):
                         new_buffer = lltype.malloc(
                             mytype.arraytype, self.allocated, flavor='raw',
                             add_memory_pressure=True)
-                        for i in range(min(size, self.len)):
-                            new_buffer[i] = self.buffer[i]
+                        keep = min(size, self.len)
+                        if keep:
+                            rffi.c_memcpy(
+                                rffi.cast(rffi.VOIDP, new_buffer),
+                                rffi.cast(rffi.VOIDP, self.buffer),
+                                keep * mytype.bytes
+                            )
                 else:
                     self.len = size
                     return
@@ -807,14 +850,15 @@ def make_array(mytype):
             if isinstance(w_iterable, W_Array):
                 oldlen = self.len
                 new = w_iterable.len
-                self.setlen(self.len + new)
-                i = 0
-                while i < new:
-                    if oldlen + i >= self.len:
-                        self.setlen(oldlen + i + 1)
-                    self.buffer[oldlen + i] = w_iterable.buffer[i]
-                    i += 1
-                self.setlen(oldlen + i)
+                self.setlen(oldlen + new)
+                if new:
+                    # w_iterable may be self, but then the two halves
+                    # of the new buffer don't overlap
+                    rffi.c_memcpy(
+                        rffi.cast(rffi.VOIDP, rffi.ptradd(self.buffer, oldlen)),
+                        rffi.cast(rffi.VOIDP, w_iterable.buffer),
+                        new * mytype.bytes
+                    )
             elif (not accept_different_array
                   and isinstance(w_iterable, W_ArrayBase)):
                 msg = "can only extend with array of same kind"
@@ -839,6 +883,44 @@ def make_array(mytype):
                 item = float(item)
             return space.wrap(item)
 
+        def getitems_int(self):
+            if mytype.unwrap != 'int_w':
+                return None
+            if mytype.itemtype is lltype.Signed:
+                res = []
+                populate_list_from_raw_array(res, self.buffer, self.len)
+                return res
+            res = [0] * self.len
+            buf = self.buffer
+            for i in range(self.len):
+                res[i] = rffi.cast(lltype.Signed, buf[i])
+            return res
+
+        def getitems_float(self):
+            if mytype.unwrap != 'float_w':
+                return None
+            if mytype.itemtype is lltype.Float:
+                res = []
+                populate_list_from_raw_array(res, self.buffer, self.len)
+                return res
+            res = [0.0] * self.len
+            buf = self.buffer
+            for i in range(self.len):
+                res[i] = float(buf[i])
+            return res
+
+        def unpackiterable_int(self, space):
+            # used e.g. by list(array) and min(array); not for subclasses,
+            # which may override __iter__
+            if type(self) is not W_Array:
+                return None
+            return self.getitems_int()
+
+        def unpackiterable_float(self, space):
+            if type(self) is not W_Array:
+                return None
+            return self.getitems_float()
+
         # interface
 
         def descr_append(self, space, w_x):
@@ -876,6 +958,7 @@ def make_array(mytype):
             if i < 0 or i >= self.len:
                 msg = 'pop index out of range'
                 raise OperationError(space.w_IndexError, space.wrap(msg))
+            self._check_resizable()
             w_val = self.w_getitem(space, i)
             while i < self.len - 1:
                 self.buffer[i] = self.buffer[i + 1]
@@ -908,6 +991,14 @@ def make_array(mytype):
             w_a = mytype.w_class(self.space)
             w_a.setlen(size, overallocate=False)
             assert step != 0
+            if step == 1:
+                if size > 0:
+                    rffi.c_memcpy(
+                        rffi.cast(rffi.VOIDP, w_a.buffer),
+                        rffi.cast(rffi.VOIDP, rffi.ptradd(self.buffer, start)),
+                        size * mytype.bytes
+                    )
+                return w_a
             j = 0
             for i in range(start, stop, step):
                 w_a.buffer[j] = self.buffer[i]
@@ -955,6 +1046,7 @@ def make_array(mytype):
                 j = self.len
             if i >= j:
                 return None
+            self._check_resizable()
             oldbuffer = self.buffer
             self.buffer = lltype.malloc(
                 mytype.arraytype, max(self.len - (j - i), 0), flavor='raw',
@@ -1055,9 +1147,13 @@ def make_array(mytype):
             return a
         # </a performance hack>
         a.setlen(newlen, overallocate=False)
-        for r in range(start, repeat):
-            for i in range(oldlen):
-                a.buffer[r * oldlen + i] = self.buffer[i]
+        if oldlen:
+            for r in range(start, repeat):
+                rffi.c_memcpy(
+                    rffi.cast(rffi.VOIDP, rffi.ptradd(a.buffer, r * oldlen)),
+                    rffi.cast(rffi.VOIDP, self.buffer),
+                    oldlen * mytype.bytes
+                )
         return a
 
     mytype.w_class = W_Array
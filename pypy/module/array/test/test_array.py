@@ -1,6 +1,8 @@
 import sys
 import pytest
 
+from pypy.interpreter import gateway
+
 
 class BaseArrayTests:
     def test_ctor(self):
@@ -959,6 +961,33 @@ class AppTestArray(BaseArrayTests):
             str(pytest.ensuretemp('array').join('tmpfile')))
         cls.w_maxint = cls.space.wrap(sys.maxint)
 
+        def with_raw_export(space, w_array, w_func):
+            from rpython.rlib.buffer import scoped_rawbuffer
+            with scoped_rawbuffer(space.readbuf_w(w_array)):
+                space.call_function(w_func)
+        cls.w_with_raw_export = cls.space.wrap(
+            gateway.interp2app(with_raw_export))
+
+    def test_resize_while_exported(self):
+        a = self.array('i', [1, 2, 3])
+        def f():
+            # the raw buffer is in use: it must not be freed
+            raises(BufferError, a.append, 4)
+            raises(BufferError, a.extend, [4, 5])
+            raises(BufferError, a.insert, 0, 4)
+            raises(BufferError, a.pop)
+            raises(BufferError, a.remove, 2)
+            raises(BufferError, "del a[1:]")
+            raises(BufferError, "a *= 2")
+            raises(BufferError, a.fromstring, '\0' * a.itemsize)
+            a[0] = 5
+            a[1:3] = self.array('i', [6, 7])
+        self.with_raw_export(a, f)
+        assert a == self.array('i', [5, 6, 7])
+        a.append(8)
+        del a[0]
+        assert a == self.array('i', [6, 7, 8])
+
     def test_buffer_info(self):
         a = self.array('c', 'Hi!')
         bi = a.buffer_info()
@@ -1021,6 +1050,69 @@ class AppTestArray(BaseArrayTests):
         assert len(b) == 13
         assert str(b[12]) == "-0.0"
 
+    def test_tolist_unboxed(self):
+        from __pypy__ import strategy
+        for tc in 'bBhHil':
+            l = self.array(tc, [1, 2, 3]).tolist()
+            assert l == [1, 2, 3]
+            assert strategy(l) == "IntegerListStrategy"
+        for tc in 'fd':
+            l = self.array(tc, [1.5, -0.0]).tolist()
+            assert l == [1.5, -0.0]
+            assert str(l[1]) == "-0.0"
+            assert strategy(l) == "FloatListStrategy"
+        l = self.array('l', [-self.maxint - 1, self.maxint]).tolist()
+        assert l == [-self.maxint - 1, self.maxint]
+        assert strategy(self.array('c', 'ab').tolist()) == "BytesListStrategy"
+        assert self.array('l').tolist() == []
+
+    def test_list_from_array_unboxed(self):
+        from __pypy__ import strategy
+        l = list(self.array('h', [5, -6]))
+        assert l == [5, -6]
+        assert strategy(l) == "IntegerListStrategy"
+        l = list(self.array('f', [0.5]))
+        assert strategy(l) == "FloatListStrategy"
+        class A(self.array):
+            def __iter__(self):
+                return iter([42])
+        assert list(A('l', [1, 2])) == [42]
+
+    def test_min_max_sum(self):
+        a = self.array('i', [3, -7, 12, 5])
+        assert min(a) == -7
+        assert max(a) == 12
+        assert sum(a) == 13
+        assert sum(a, 7) == 20
+        a = self.array('d', [2.5, -1.5, 8.0])
+        assert min(a) == -1.5
+        assert max(a) == 8.0
+        assert sum(a) == 9.0
+        assert sum(a, 0.5) == 9.5
+        assert type(sum(self.array('d'))) is int
+        raises(ValueError, min, self.array('l'))
+        raises(ValueError, max, self.array('d'))
+        a = self.array('l', [self.maxint, self.maxint])
+        assert sum(a) == 2 * self.maxint
+        assert min(self.array('c', 'hello')) == 'e'
+
+    def test_bulk_copies(self):
+        a = self.array('i', range(20))
+        assert a[3:9] == self.array('i', range(3, 9))
+        assert a[15:30] == self.array('i', range(15, 20))
+        assert a[9:3] == self.array('i')
+        assert a[1:10:3] == self.array('i', [1, 4, 7])
+        a.extend(a)
+        assert a == self.array('i', range(20) * 2)
+        b = self.array('d', [1.0, 2.0])
+        for i in range(10):
+            b.append(3.0 + i)
+        assert b.tolist() == [float(i) for i in range(1, 13)]
+        b = self.array('h', [1, 2, 3]) * 3
+        assert b == self.array('h', [1, 2, 3] * 3)
+        b *= 2
+        assert b == self.array('h', [1, 2, 3] * 6)
+
     def test_getitem_only_ints(self):
         class MyInt(object):
             def __init__(self, x):
@@ -19,6 +19,8 @@ class Module(MixedModule):
                 space.config.translation.gctransformer == "framework"):
             self.appleveldefs.update({
                 'dump_rpy_heap': 'app_referents.dump_rpy_heap',
+                'dump_allocation_samples':
+                    'app_allocsampler.dump_allocation_samples',
                 })
             self.interpleveldefs.update({
                 'get_rpy_roots': 'referents.get_rpy_roots',
@@ -29,8 +31,31 @@ class Module(MixedModule):
                 'get_referents': 'referents.get_referents',
                 'get_referrers': 'referents.get_referrers',
                 '_dump_rpy_heap': 'referents._dump_rpy_heap',
+                '_dump_app_types': 'referents._dump_app_types',
                 'get_typeids_z': 'referents.get_typeids_z',
                 'get_typeids_list': 'referents.get_typeids_list',
                 'GcRef': 'referents.W_GcRef',
+                'start_allocation_sampling':
+                    'allocsampler.start_allocation_sampling',
+                'stop_allocation_sampling':
+                    'allocsampler.stop_allocation_sampling',
+                'get_allocation_samples':
+                    'allocsampler.get_allocation_samples',
                 })
+            # gzip support for dump_rpy_heap(), which needs rzlib
+            if (not space.config.translating or
+                    space.config.objspace.usemodules.zlib):
+                self.interpleveldefs.update({
+                    '_dump_rpy_heap_gz': 'gzipdump._dump_rpy_heap_gz',
+                    '_dump_app_types_gz': 'gzipdump._dump_app_types_gz',
+                    })
+            # attribute the allocation samples to the app-level stack.
+            # With the signal module, the GC sets the C-level ticker to
+            # -1 when it takes a sample; without it, the ticker must be
+            # decremented at every bytecode
+            from pypy.module.gc.allocsampler import AllocSampler
+            sampler = space.fromcache(AllocSampler)
+            has_signal = space.config.objspace.usemodules.signal
+            space.actionflag.register_periodic_action(
+                sampler.action, use_bytecode_counter=not has_signal)
         MixedModule.__init__(self, space, w_name)
@@ -0,0 +1,149 @@
+"""
+Allocation sampling: the GC takes a sample every N bytes allocated (see
+rgc.set_alloc_sampling()), and we attribute the samples to the app-level
+stack at the next check of the periodic actions.  With the signal module,
+the GC sets the ticker to -1 when it takes a sample, so this is the next
+bytecode.  The GC also tells us which of the sampled objects survived
+their first minor collection.
+"""
+
+from rpython.rlib import rgc
+from pypy.interpreter.executioncontext import PeriodicAsyncAction
+from pypy.interpreter.gateway import unwrap_spec
+from pypy.interpreter.error import OperationError
+
+
+class AllocSite(object):
+    def __init__(self, frames):
+        self.frames = frames    # list of (filename, name, lineno)
+        self.count = 0
+        self.size = 0
+        self.survived_count = 0
+        self.survived_size = 0
+
+class PendingSample(object):
+    def __init__(self, site, size):
+        self.site = site
+        self.size = size
+
+
+class AllocSampler(object):
+    def __init__(self, space):
+        "NOT_RPYTHON"
+        self.space = space
+        self.enabled = False
+        self.max_depth = 0
+        self.sites = {}      # {key: AllocSite}
+        self.pending = {}    # {sample_id: PendingSample}
+        self.action = AllocSampleAction(space, self)
+
+    def start(self, interval, max_depth):
+        self.sites = {}
+        self.pending = {}
+        self.max_depth = max_depth
+        self.enabled = True
+        rgc.set_alloc_sampling(interval,
+                               self.space.actionflag.get_ticker_address())
+
+    def stop(self):
+        rgc.set_alloc_sampling(0)
+        self.collect_samples(None)
+        self.enabled = False
+
+    def get_site(self, ec):
+        frames = []
+        key = ''
+        if ec is not None:
+            frame = ec.gettopframe_nohidden()
+            while frame is not None and len(frames) < self.max_depth:
+                code = frame.getcode()
+                lineno = frame.get_last_lineno()
+                frames.append((code.co_filename, code.co_name, lineno))
+                key += '%s:%s:%d\n' % (code.co_filename, code.co_name, lineno)
+                frame = ec.getnextframe_nohidden(frame)
+        try:
+            site = self.sites[key]
+        except KeyError:
+            site = AllocSite(frames)
+            self.sites[key] = site
+        return site
+
+    def collect_samples(self, ec):
+        """Attribute the new samples to the current stack of 'ec', or
+        to an empty stack if 'ec' is None, and record the survivors."""
+        samples = rgc.fetch_alloc_samples()
+        if len(samples) > 0:
+            site = self.get_site(ec)
+            i = 0
+            while i < len(samples):
+                sample_id = samples[i]
+                size = samples[i + 1]
+                site.count += 1
+                site.size += size
+                self.pending[sample_id] = PendingSample(site, size)
+                i += 2
+        for sample_id in rgc.fetch_alloc_sample_results():
+            survived = sample_id > 0
+            if not survived:
+                sample_id = -sample_id
+            pending = self.pending.pop(sample_id, None)
+            if pending is not None and survived:
+                pending.site.survived_count += 1
+                pending.site.survived_size += pending.size
+
+
+class AllocSampleAction(PeriodicAsyncAction):
+    """Attribute the allocation samples to the app-level stack.  This
+    runs whenever the ticker becomes < 0.  If the ticker has an address
+    (see get_ticker_address()), the GC sets it to -1 after taking a
+    sample, like the C signal handler; otherwise this only runs every
+    sys.getcheckinterval() bytecodes.
+    """
+    def __init__(self, space, sampler):
+        "NOT_RPYTHON"
+        PeriodicAsyncAction.__init__(self, space)
+        self.sampler = sampler
+
+    def perform(self, executioncontext, frame):
+        if self.sampler.enabled:
+            self.sampler.collect_samples(executioncontext)
+
+# ____________________________________________________________
+
+@unwrap_spec(interval=int, max_depth=int)
+def start_allocation_sampling(space, interval=256*1024, max_depth=32):
+    """Start recording a sample every 'interval' bytes allocated, with
+    the app-level stack (up to 'max_depth' frames) that allocated it and
+    whether the object survived its first minor collection.  Clears the
+    results of the previous sampling."""
+    if interval <= 0 or max_depth < 0:
+        raise OperationError(space.w_ValueError,
+                             space.wrap("interval must be > 0 and "
+                                        "max_depth must be >= 0"))
+    space.fromcache(AllocSampler).start(interval, max_depth)
+
+def stop_allocation_sampling(space):
+    """Stop recording allocation samples.  The results are kept."""
+    sampler = space.fromcache(AllocSampler)
+    if sampler.enabled:
+        sampler.stop()
+
+def get_allocation_samples(space):
+    """Return a list of tuples (stack, count, size, survived_count,
+    survived_size), one per allocation site.  'stack' is a list of
+    (filename, name, lineno), innermost frame first.  The sizes are the
+    total sizes of the sampled objects, in bytes."""
+    sampler = space.fromcache(AllocSampler)
+    if sampler.enabled:
+        sampler.collect_samples(None)
+    result_w = []
+    for site in sampler.sites.values():
+        frames_w = [space.newtuple([space.wrap(filename), space.wrap(name),
+                                    space.wrap(lineno)])
+                    for (filename, name, lineno) in site.frames]
+        result_w.append(space.newtuple([space.newlist(frames_w),
+                                        space.wrap(site.count),
+                                        space.wrap(site.size),
+                                        space.wrap(site.survived_count),
+                                        space.wrap(site.survived_size)]))
+    return space.newlist(result_w)
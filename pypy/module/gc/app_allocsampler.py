@@ -0,0 +1,25 @@
+# NOT_RPYTHON
+
+import gc
+
+def dump_allocation_samples(file, limit=20):
+    """Write to the given file object a report of the 'limit' allocation
+    sites that allocated the most bytes, as recorded since
+    start_allocation_sampling().  Note that the stack is the one seen
+    at the next bytecode after the allocation.  Without the signal
+    module, it is only seen every sys.getcheckinterval() bytecodes, so
+    the stacks are approximate.
+    """
+    samples = gc.get_allocation_samples()
+    samples.sort(key=lambda sample: sample[2], reverse=True)
+    if limit is not None:
+        samples = samples[:limit]
+    for stack, count, size, survived_count, survived_size in samples:
+        file.write('%d bytes in %d samples, %d bytes in %d samples '
+                   'survived\n' % (size, count, survived_size,
+                                   survived_count))
+        if not stack:
+            file.write('  (unknown)\n')
+        for filename, name, lineno in stack:
+            file.write('  File "%s", line %d, in %s\n' % (filename, lineno,
+                                                          name))
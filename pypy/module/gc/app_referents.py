@@ -15,14 +15,29 @@ def dump_rpy_heap(file):
     points to.  The full dump is a list of such objects, with a marker
     [0][0][0][-1] inserted after all GC roots, before all non-roots.
 
+    If the argument is a filename, we also write 'FILENAME.apptypes',
+    with a line '[addr] [module.classname]' for each instance of an
+    app-level class.  If the filename ends with '.gz', both files are
+    compressed while being written (this needs the 'zlib' module), and
+    the second one is called 'FILENAME-WITHOUT-GZ.apptypes.gz'.  See pypy/tool/gcdump.py.
+
     If the argument is a filename and the 'zlib' module is available,
     we also write 'typeids.txt' and 'typeids.lst' in the same directory,
     if they don't already exist.
     """
     if isinstance(file, str):
-        f = open(file, 'wb')
-        gc._dump_rpy_heap(f.fileno())
-        f.close()
+        gc.collect()     # from now on, the objects in the dump don't move
+        _write_to_file(file, '_dump_rpy_heap')
+        if file.endswith('.gz'):
+            apptypes_file = file[:-3] + '.apptypes.gz'
+        else:
+            apptypes_file = file + '.apptypes'
+        try:
+            _write_to_file(apptypes_file, '_dump_app_types')
+        except NotImplementedError:
+            import os
+            if os.path.exists(apptypes_file):
+                os.unlink(apptypes_file)
         try:
             import zlib, os
         except ImportError:
@@ -48,3 +63,18 @@ def dump_rpy_heap(file):
                 file.flush()
             fd = file.fileno()
         gc._dump_rpy_heap(fd)
+
+def _write_to_file(filename, dumpname):
+    # Call gc.<dumpname>(fd) to write the file.  If it is a '.gz', call
+    # the variant that compresses the data while writing it instead.
+    if filename.endswith('.gz'):
+        dumpname += '_gz'
+        if not hasattr(gc, dumpname):
+            raise ImportError("writing a '.gz' file requires the 'zlib' "
+                              "module")
+    dump = getattr(gc, dumpname)
+    f = open(filename, 'wb')
+    try:
+        dump(f.fileno())
+    finally:
+        f.close()
@@ -0,0 +1,117 @@
+"""
+Write the output of gc._dump_rpy_heap() and gc._dump_app_types() in
+gzip format, compressing it while it is written.  Only available if the
+'zlib' module is enabled.
+"""
+
+import errno
+from rpython.rlib import rgc, rposix, rzlib
+from rpython.rtyper.annlowlevel import llhelper
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
+from rpython.memory.gc.inspector import raw_os_write
+from pypy.interpreter.gateway import unwrap_spec
+from pypy.interpreter.error import wrap_oserror, OperationError
+from pypy.module.gc.referents import missing_operation, write_app_types
+
+
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+class GzipState(object):
+    # there is only one dump at a time, and _write_heap_gz() must not
+    # allocate GC objects, so the deflate stream is in a global
+    stream = rzlib.null_stream
+    outbuf = lltype.nullptr(rffi.CCHARP.TO)
+
+_state = GzipState()
+
+
+def _deflate_and_write(fd, inbuf, length, flush):
+    """Compress the 'length' bytes at 'inbuf' and write the output to
+    'fd'.  Only uses raw memory, so that the GC can call it in the middle
+    of dump_rpy_heap().  Returns 0 or an errno value."""
+    stream = _state.stream
+    outbuf = _state.outbuf
+    stream.c_next_in = rffi.cast(rzlib.Bytefp, inbuf)
+    rffi.setintfield(stream, 'c_avail_in', length)
+    while True:
+        stream.c_next_out = rffi.cast(rzlib.Bytefp, outbuf)
+        rffi.setintfield(stream, 'c_avail_out', OUTPUT_BUFFER_SIZE)
+        err = rzlib._deflate(stream, flush)
+        if err != rzlib.Z_OK and err != rzlib.Z_STREAM_END:
+            return errno.EIO
+        avail_out = rffi.getintfield(stream, 'c_avail_out')
+        count = OUTPUT_BUFFER_SIZE - avail_out
+        if count > 0:
+            written = raw_os_write(rffi.cast(rffi.INT, fd),
+                                   rffi.cast(llmemory.Address, outbuf),
+                                   rffi.cast(rffi.SIZE_T, count))
+            if rffi.cast(lltype.Signed, written) != count:
+                return rffi.cast(lltype.Signed, rposix._get_errno())
+        if flush == rzlib.Z_FINISH:
+            if err == rzlib.Z_STREAM_END:
+                return 0
+        elif avail_out > 0:
+            return 0    # all the input was consumed
+
+def _write_heap_gz(fd, buf, length):
+    return _deflate_and_write(fd, rffi.cast(rffi.CCHARP, buf), length,
+                              rzlib.Z_NO_FLUSH)
+
+def _write_chunk_gz(fd, data):
+    with rffi.scoped_nonmovingbuffer(data) as inbuf:
+        err = _deflate_and_write(fd, inbuf, len(data), rzlib.Z_NO_FLUSH)
+    if err != 0:
+        raise OSError(err, "write failed")
+
+def _start_gzip(space):
+    try:
+        # wbits > MAX_WBITS: write a gzip header and trailer
+        stream = rzlib.deflateInit(rzlib.Z_DEFAULT_COMPRESSION,
+                                   rzlib.Z_DEFLATED, 16 + rzlib.MAX_WBITS)
+    except rzlib.RZlibError, e:
+        raise OperationError(space.w_IOError, space.wrap(e.msg))
+    _state.stream = stream
+    _state.outbuf = lltype.malloc(rffi.CCHARP.TO, OUTPUT_BUFFER_SIZE,
+                                  flavor='raw')
+
+def _finish_gzip(fd):
+    err = _deflate_and_write(fd, lltype.nullptr(rffi.CCHARP.TO), 0,
+                             rzlib.Z_FINISH)
+    if err != 0:
+        raise OSError(err, "write failed")
+
+def _end_gzip():
+    rzlib.deflateEnd(_state.stream)
+    _state.stream = rzlib.null_stream
+    lltype.free(_state.outbuf, flavor='raw')
+    _state.outbuf = lltype.nullptr(rffi.CCHARP.TO)
+
+@unwrap_spec(fd=int)
+def _dump_rpy_heap_gz(space, fd):
+    """Like _dump_rpy_heap(), but writes the dump in gzip format."""
+    _start_gzip(space)
+    try:
+        try:
+            ok = rgc.dump_rpy_heap(fd, llhelper(rgc.DUMP_WRITE_FUNC,
+                                                _write_heap_gz))
+            if ok:
+                _finish_gzip(fd)
+        except OSError, e:
+            raise wrap_oserror(space, e)
+    finally:
+        _end_gzip()
+    if not ok:
+        raise missing_operation(space)
+
+@unwrap_spec(fd=int)
+def _dump_app_types_gz(space, fd):
+    """Like _dump_app_types(), but writes the lines in gzip format."""
+    _start_gzip(space)
+    try:
+        write_app_types(space, fd, _write_chunk_gz)
+        try:
+            _finish_gzip(fd)
+        except OSError, e:
+            raise wrap_oserror(space, e)
+    finally:
+        _end_gzip()
@@ -1,3 +1,4 @@
+import os
 from rpython.rlib import rgc
 from pypy.interpreter.baseobjspace import W_Root
 from pypy.interpreter.typedef import TypeDef
@@ -224,6 +225,67 @@ def _dump_rpy_heap(space, fd):
     if not ok:
         raise missing_operation(space)
 
+@unwrap_spec(fd=int)
+def _dump_app_types(space, fd):
+    """Write a line 'address typename' for every object that is an
+    instance of an app-level class, for pypy/tool/gcdump.py.  The
+    addresses are the ones of gc.dump_rpy_heap(), if it is called
+    just before (and after a full collection, so that the objects don't
+    move in-between)."""
+    write_app_types(space, fd, _write_chunk)
+
+def _write_chunk(fd, data):
+    os.write(fd, data)
+
+def write_app_types(space, fd, write_chunk):
+    # the lines are passed to write_chunk(fd, data) by chunks of ~64KB
+    if not rgc.has_gcflag_extra():
+        raise missing_operation(space)
+    names = {}      # {w_type: name}
+    lines = []
+    size = 0
+    roots = [gcref for gcref in rgc.get_rpy_roots() if gcref]
+    pending = roots[:]
+    try:
+        while pending:
+            gcref = pending.pop()
+            if rgc.get_gcflag_extra(gcref):
+                continue
+            rgc.toggle_gcflag_extra(gcref)
+            pending.extend(rgc.get_rpy_referents(gcref))
+            w_obj = try_cast_gcref_to_w_root(gcref)
+            if w_obj is None:
+                continue
+            w_type = space.type(w_obj)
+            if not w_type.is_heaptype():
+                continue
+            try:
+                name = names[w_type]
+            except KeyError:
+                name = _get_app_type_name(space, w_type)
+                names[w_type] = name
+            addr = rgc.cast_gcref_to_int(rgc.cast_instance_to_gcref(w_obj))
+            line = '%d %s\n' % (addr, name)
+            lines.append(line)
+            size += len(line)
+            if size > 65536:
+                write_chunk(fd, ''.join(lines))
+                lines = []
+                size = 0
+        write_chunk(fd, ''.join(lines))
+    except OSError, e:
+        raise wrap_oserror(space, e)
+    finally:
+        clear_gcflag_extra(roots)
+    rgc.assert_no_more_gcflags()
+
+def _get_app_type_name(space, w_type):
+    name = w_type.getname(space)
+    w_module = w_type.get_module()
+    if w_module is not None and space.isinstance_w(w_module, space.w_str):
+        name = '%s.%s' % (space.str_w(w_module), name)
+    return name
+
 def get_typeids_z(space):
     a = rgc.get_typeids_z()
     s = ''.join([a[i] for i in range(len(a))])
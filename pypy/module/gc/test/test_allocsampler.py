@@ -0,0 +1,131 @@
+from pypy.interpreter.gateway import interp2app
+
+
+class AppTestAllocSampler(object):
+
+    def setup_class(cls):
+        from rpython.rlib import rgc
+        from rpython.rtyper.lltypesystem import llmemory
+        from pypy.module.gc.allocsampler import AllocSampler
+        cls._backup = [rgc.set_alloc_sampling, rgc.fetch_alloc_samples,
+                       rgc.fetch_alloc_sample_results]
+        space = cls.space
+        fake = cls.fake = {'interval': 0, 'samples': [], 'results': []}
+        def set_alloc_sampling(interval, ticker=llmemory.NULL):
+            fake['interval'] = interval
+            fake['ticker'] = ticker
+        def fetch(key):
+            result = fake[key]
+            fake[key] = []
+            return result
+        rgc.set_alloc_sampling = set_alloc_sampling
+        rgc.fetch_alloc_samples = lambda: fetch('samples')
+        rgc.fetch_alloc_sample_results = lambda: fetch('results')
+        #
+        def feed(space, w_samples, w_results, w_fire=None):
+            # pretend that the GC took samples, which sets the ticker to
+            # -1 if it has an address.  Also trigger the action unless
+            # 'fire' is False
+            fake['samples'] += [space.int_w(w_x)
+                                for w_x in space.listview(w_samples)]
+            fake['results'] += [space.int_w(w_x)
+                                for w_x in space.listview(w_results)]
+            if fake['ticker']:
+                # this is what the GC writes at the address 'ticker'
+                space.actionflag.reset_ticker(-1)
+            if w_fire is None or space.is_true(w_fire):
+                space.fromcache(AllocSampler).action.fire()
+        cls.w_feed = space.wrap(interp2app(feed))
+        def get_interval(space):
+            return space.wrap(fake['interval'])
+        cls.w_get_interval = space.wrap(interp2app(get_interval))
+
+    def teardown_class(cls):
+        from rpython.rlib import rgc
+        (rgc.set_alloc_sampling, rgc.fetch_alloc_samples,
+         rgc.fetch_alloc_sample_results) = cls._backup
+
+    def test_start_stop(self):
+        import gc
+        gc.start_allocation_sampling(1000)
+        assert self.get_interval() == 1000
+        gc.stop_allocation_sampling()
+        assert self.get_interval() == 0
+        assert gc.get_allocation_samples() == []
+        raises(ValueError, gc.start_allocation_sampling, 0)
+
+    def test_samples_attributed_to_stack(self):
+        import gc
+        gc.start_allocation_sampling(max_depth=2)
+        def allocating_function():
+            self.feed([1, 100, 2, 50], [])
+            x = 1     # the action runs here
+            return x
+        allocating_function()
+        self.feed([3, 8], [1, -2, -3])
+        gc.stop_allocation_sampling()
+        samples = gc.get_allocation_samples()
+        assert len(samples) == 2
+        samples.sort(key=lambda sample: sample[2], reverse=True)
+        stack, count, size, survived_count, survived_size = samples[0]
+        assert (count, size, survived_count, survived_size) == (2, 150, 1, 100)
+        assert len(stack) == 2
+        filename, name, lineno = stack[0]
+        assert name == 'allocating_function'
+        assert stack[1][1] == 'test_samples_attributed_to_stack'
+        assert samples[1][1:] == (1, 8, 0, 0)
+        #
+        import StringIO
+        f = StringIO.StringIO()
+        gc.dump_allocation_samples(f)
+        lines = f.getvalue().splitlines()
+        assert lines[0] == ('150 bytes in 2 samples, 100 bytes in 1 samples '
+                            'survived')
+        assert lines[1].endswith(', in allocating_function')
+        #
+        gc.start_allocation_sampling()
+        assert gc.get_allocation_samples() == []
+        gc.stop_allocation_sampling()
+
+    def test_samples_attributed_periodically(self):
+        # without the signal module, the GC does not fire the action,
+        # it must run by itself
+        import gc, sys
+        gc.start_allocation_sampling(max_depth=1)
+        old_interval = sys.getcheckinterval()
+        sys.setcheckinterval(10)
+        try:
+            def allocating_function():
+                self.feed([1, 100], [], False)
+                for i in range(100):
+                    pass
+            allocating_function()
+        finally:
+            sys.setcheckinterval(old_interval)
+        samples = gc.get_allocation_samples()
+        gc.stop_allocation_sampling()
+        assert len(samples) == 1
+        stack, count, size, survived_count, survived_size = samples[0]
+        assert (count, size) == (1, 100)
+        assert len(stack) == 1
+        assert stack[0][1] == 'allocating_function'
+
+
+class AppTestAllocSamplerSignal(AppTestAllocSampler):
+    spaceconfig = dict(usemodules=['signal'])
+
+    def test_samples_attributed_at_next_bytecode(self):
+        # the GC sets the ticker to -1 when it takes a sample
+        import gc
+        gc.start_allocation_sampling(max_depth=1)
+        def allocating_function():
+            self.feed([1, 100], [], False)
+            x = 1     # the action runs here
+            return x
+        allocating_function()
+        samples = gc.get_allocation_samples()
+        gc.stop_allocation_sampling()
+        assert len(samples) == 1
+        stack, count, size, survived_count, survived_size = samples[0]
+        assert (count, size) == (1, 100)
+        assert stack[0][1] == 'allocating_function'
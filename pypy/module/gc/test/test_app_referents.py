@@ -37,3 +37,39 @@ def test_interface_to_dump_rpy_heap_fd(space):
             gc.dump_rpy_heap(fd)""")
     except NotImplementedError:
         pass
+
+def test_interface_to_dump_rpy_heap_gz(monkeypatch):
+    import gzip, zlib
+    from rpython.rlib import rgc
+    from pypy.tool.pytest.objspace import gettestobjspace
+    from rpython.rtyper.lltypesystem import llmemory, rffi
+    def fake_dump_rpy_heap(fd, write_func):
+        # like the GC, call write_func() with raw buffers
+        data = 'heap dump' * 100000
+        for i in range(0, len(data), 65536):
+            buf = rffi.str2charp(data[i:i + 65536])
+            try:
+                err = write_func(fd, rffi.cast(llmemory.Address, buf),
+                                 len(data[i:i + 65536]))
+            finally:
+                rffi.free_charp(buf)
+            assert err == 0
+        return True
+    monkeypatch.setattr(rgc, 'dump_rpy_heap', fake_dump_rpy_heap)
+    monkeypatch.setattr(rgc, 'has_gcflag_extra', lambda: False)
+    monkeypatch.setattr(rgc, 'get_typeids_z',
+                        lambda: zlib.compress('typeids\n'))
+    monkeypatch.setattr(rgc, 'get_typeids_list', lambda: [0, 1])
+    space = gettestobjspace(usemodules=['zlib'])
+    dirname = udir.join('dump_rpy_heap_gz')
+    dirname.ensure(dir=1)
+    filename = str(dirname.join('dump_rpy_heap.gz'))
+    space.appexec([space.wrap(filename)], """(filename):
+        import gc
+        gc.dump_rpy_heap(filename)""")
+    f = gzip.open(filename)
+    assert f.read() == 'heap dump' * 100000
+    f.close()
+    # no '.apptypes.gz' with this GC, and no temporary file
+    assert sorted(os.listdir(str(dirname))) == [
+        'dump_rpy_heap.gz', 'typeids.lst', 'typeids.txt']
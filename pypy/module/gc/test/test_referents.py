@@ -116,3 +116,37 @@ class AppTestReferents(object):
                 break   # found
         else:
             assert 0, "the tuple (7,) is not found as gc.get_referrers(7)"
+
+
+class AppTestDumpAppTypes(object):
+
+    def setup_class(cls):
+        from rpython.rlib import rgc
+        cls._backup = [rgc.get_rpy_roots]
+        w_root = cls.space.appexec([], """():
+            class Foo(object):
+                pass
+            class Bar(object):
+                pass
+            foo = Foo()
+            foo.bars = [Bar(), Bar()]
+            return [foo, 42]""")
+        rgc.get_rpy_roots = lambda: [rgc._GcRef(w_root), rgc.NULL_GCREF]
+
+    def teardown_class(cls):
+        from rpython.rlib import rgc
+        rgc.get_rpy_roots = cls._backup[0]
+
+    def test_dump_app_types(self):
+        import gc, os
+        r, w = os.pipe()
+        gc._dump_app_types(w)
+        os.close(w)
+        data = os.read(r, 65536)
+        os.close(r)
+        names = []
+        for line in data.splitlines():
+            addr, name = line.split(' ')
+            assert int(addr)
+            names.append(name.split('.')[-1])
+        assert sorted(names) == ['Bar', 'Bar', 'Foo']
@@ -22,6 +22,13 @@ class W_MMap(W_Root):
         self.check_valid()
         return MMapBuffer(self.space, self.mmap, True)
 
+    def buffer_w(self, space, flags):
+        # memoryviews (and their slices) share the mapped memory
+        self.check_valid()
+        readonly = self.mmap.access == rmmap.ACCESS_READ
+        space.check_buf_flags(flags, readonly)
+        return MMapBuffer(self.space, self.mmap, readonly)
+
     def close(self):
         self.mmap.close()
 
@@ -3,7 +3,7 @@ from rpython.tool.udir import udir
 import os
 
 class AppTestMMap:
-    spaceconfig = dict(usemodules=('mmap',))
+    spaceconfig = dict(usemodules=('mmap', 'struct'))
 
     def setup_class(cls):
         cls.w_tmpname = cls.space.wrap(str(udir.join('mmap-')))
@@ -580,8 +580,31 @@ class AppTestMMap:
         f.flush()
         m = mmap(f.fileno(), 6)
         m[5] = '?'
-        exc = raises(TypeError, memoryview, m)
-        assert 'buffer interface' in str(exc.value)
+        v = memoryview(m)
+        assert v.readonly is False
+        w = v[1:4]
+        assert w.tobytes() == "oob"
+        w[0] = 'O'
+        assert m[:] == "fOoba?"
+        m[2] = 'x'
+        assert w.tobytes() == "Oxb"
+        m.close()
+        raises(ValueError, v.tobytes)
+        f.close()
+
+    def test_memoryview_readonly(self):
+        from mmap import mmap, ACCESS_READ
+        import struct, re
+        f = open(self.tmpname + "y", "w+")
+        f.write("foo\x01\x02bar")
+        f.flush()
+        m = mmap(f.fileno(), 8, access=ACCESS_READ)
+        v = memoryview(m)
+        assert v.readonly is True
+        raises(TypeError, "v[0] = 'x'")
+        assert struct.unpack_from("BB", m, 3) == (1, 2)
+        assert struct.unpack_from("BB", v[3:]) == (1, 2)
+        assert re.search("b.r", m).group() == "bar"
         m.close()
         f.close()
 
@@ -13,6 +13,7 @@ from rpython.rlib.nonconst import NonConstant
 from rpython.rlib import jit_hooks
 from rpython.rlib.jit import Counters
 from rpython.rlib.objectmodel import compute_unique_id
+from rpython.rlib.rarithmetic import r_uint
 from pypy.module.pypyjit.interp_jit import pypyjitdriver
 
 class Cache(object):
@@ -363,10 +364,13 @@ W_JitLoopInfo.acceptable_as_base_class = False
 
 
 class W_JitInfoSnapshot(W_Root):
-    def __init__(self, space, w_times, w_counters, w_counter_times):
+    def __init__(self, space, w_times, w_counters, w_counter_times,
+                 w_loop_entries, w_guard_failures):
         self.w_loop_run_times = w_times
         self.w_counters = w_counters
         self.w_counter_times = w_counter_times
+        self.w_loop_entries = w_loop_entries
+        self.w_guard_failures = w_guard_failures
 
 W_JitInfoSnapshot.typedef = TypeDef(
     "JitInfoSnapshot",
@@ -377,7 +381,16 @@ W_JitInfoSnapshot.typedef = TypeDef(
                                        doc="various JIT counters"),
     counter_times = interp_attrproperty_w("w_counter_times",
                                             cls=W_JitInfoSnapshot,
-                                            doc="various JIT timers")
+                                            doc="various JIT timers"),
+    loop_entries = interp_attrproperty_w("w_loop_entries",
+                                         cls=W_JitInfoSnapshot,
+                                         doc="{loop number: (location, "
+                                             "number of entries)}"),
+    guard_failures = interp_attrproperty_w("w_guard_failures",
+                                           cls=W_JitInfoSnapshot,
+                                           doc="{guard id: (loop number, "
+                                               "location, number of "
+                                               "failures)}"),
 )
 W_JitInfoSnapshot.acceptable_as_base_class = False
 
@@ -385,6 +398,9 @@ def get_stats_snapshot(space):
     """ Get the jit status in the specific moment in time. Note that this
     is eager - the attribute access is not lazy, if you need new stats
     you need to call this function again.
+
+    Unlike loop_run_times, the loop_entries and guard_failures attributes
+    don't need enable_debug().
     """
     ll_times = jit_hooks.stats_get_loop_run_times(None)
     w_times = space.newdict()
@@ -402,8 +418,25 @@ def get_stats_snapshot(space):
     space.setitem_str(w_counter_times, 'TRACING', space.wrap(tr_time))
     b_time = jit_hooks.stats_get_times_value(None, Counters.BACKEND)
     space.setitem_str(w_counter_times, 'BACKEND', space.wrap(b_time))
+    ll_entries = jit_hooks.stats_get_loop_entries(None)
+    w_loop_entries = space.newdict()
+    for i in range(len(ll_entries)):
+        w_value = space.newtuple([space.wrap(hlstr(ll_entries[i].location)),
+                                  space.wrap(ll_entries[i].counter)])
+        space.setitem(w_loop_entries, space.wrap(ll_entries[i].number),
+                      w_value)
+    ll_failures = jit_hooks.stats_get_guard_failures(None)
+    w_guard_failures = space.newdict()
+    for i in range(len(ll_failures)):
+        # same format as the <Guard0x...> in the logs
+        guard = "0x%x" % r_uint(ll_failures[i].guard)
+        w_value = space.newtuple([space.wrap(ll_failures[i].number),
+                                  space.wrap(hlstr(ll_failures[i].location)),
+                                  space.wrap(ll_failures[i].counter)])
+        space.setitem_str(w_guard_failures, guard, w_value)
     return space.wrap(W_JitInfoSnapshot(space, w_times, w_counters,
-                                        w_counter_times))
+                                        w_counter_times, w_loop_entries,
+                                        w_guard_failures))
 
 def enable_debug(space):
     """ Set the jit debugging - completely necessary for some stats to work,
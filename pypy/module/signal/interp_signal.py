@@ -14,7 +14,7 @@ from rpython.rlib import jit, rposix, rgc
 from rpython.rlib.objectmodel import we_are_translated
 from rpython.rlib.rarithmetic import intmask
 from rpython.rlib.rsignal import *
-from rpython.rtyper.lltypesystem import lltype, rffi
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
 
 
 WIN32 = sys.platform == 'win32'
@@ -38,6 +38,9 @@ class SignalActionFlag(AbstractActionFlag):
         p = pypysig_getaddr_occurred()
         p.c_value = -1
 
+    def get_ticker_address(self):
+        return llmemory.cast_ptr_to_adr(pypysig_getaddr_occurred())
+
     def decrement_ticker(self, by):
         p = pypysig_getaddr_occurred()
         value = p.c_value
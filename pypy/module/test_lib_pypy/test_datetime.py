@@ -55,6 +55,60 @@ class BaseTestDatetime:
         got = datetime.datetime.strptime(string, format)
         assert expected == got
 
+    def test_strptime_fixed_width(self):
+        dt = datetime.datetime.strptime('2004-12-01T13:02:47.123',
+                                        '%Y-%m-%dT%H:%M:%S.%f')
+        assert dt == datetime.datetime(2004, 12, 1, 13, 2, 47, 123000)
+        dt = datetime.datetime.strptime('20041201', '%Y%m%d')
+        assert dt == datetime.datetime(2004, 12, 1)
+        # not fixed-width, handled by the general _strptime code
+        dt = datetime.datetime.strptime('2004-1-5 3:02:47',
+                                        '%Y-%m-%d %H:%M:%S')
+        assert dt == datetime.datetime(2004, 1, 5, 3, 2, 47)
+        for string in ['2004-02-30', '2004-13-01', '2004-12-01x',
+                       '2004/12/01', '2004-12-0a', '0000-12-01']:
+            raises(ValueError, datetime.datetime.strptime, string, '%Y-%m-%d')
+        raises(ValueError, datetime.datetime.strptime,
+               '2004-12-01 13:02:47.1234567', '%Y-%m-%d %H:%M:%S.%f')
+        # a repeated directive is rejected by the general code
+        import re
+        raises(re.error, datetime.datetime.strptime, '20042005', '%Y%Y')
+        raises(re.error, datetime.datetime.strptime, '12-2004-11',
+               '%m-%Y-%m')
+
+        class sub(datetime.datetime):
+            pass
+        dt = sub.strptime('2004-12-01', '%Y-%m-%d')
+        assert type(dt) is sub
+
+    def test_fast_constructors_types(self):
+        td = datetime.timedelta(1, 2, 3)
+        assert type(td + td) is datetime.timedelta
+        assert -td == datetime.timedelta(-2, 86397, 999997)
+        assert td - td == datetime.timedelta(0)
+        raises(OverflowError, "datetime.timedelta.max + td")
+        dt = datetime.datetime(2010, 12, 31, 23, 59, 59, 999999)
+        assert dt + datetime.timedelta(microseconds=1) == datetime.datetime(
+            2011, 1, 1)
+        assert dt - datetime.datetime(2010, 12, 31) == datetime.timedelta(
+            0, 86399, 999999)
+        assert type(dt.date()) is datetime.date
+        assert (datetime.date(2011, 1, 1) - datetime.date(2010, 12, 31) ==
+                datetime.timedelta(1))
+
+        class sub(datetime.datetime):
+            pass
+        assert type(sub.utcfromtimestamp(0)) is sub
+        assert type(sub.fromtimestamp(0)) is sub
+        assert type(sub(2010, 1, 1) + td) is datetime.datetime
+
+    def test_isoformat(self):
+        dt = datetime.datetime(2004, 12, 1, 13, 2, 47)
+        assert dt.isoformat() == '2004-12-01T13:02:47'
+        assert str(dt) == '2004-12-01 13:02:47'
+        dt = datetime.datetime(2004, 12, 1, 13, 2, 47, 12)
+        assert dt.isoformat('_') == '2004-12-01_13:02:47.000012'
+
     def test_datetime_rounding(self):
         b = 0.0000001
         a = 0.9999994
@@ -229,6 +229,48 @@ class BaseTestSQLite:
         cur.executemany("insert into test values (?)", [[1], [2], [3]])
         assert cur.lastrowid is None
 
+    def test_executemany_rowcount_and_types(self, con):
+        cur = con.cursor()
+        cur.execute("create table test(a, b, c, d)")
+        rows = [(i, i * 0.5, u"x%d" % i, None) for i in range(100)]
+        cur.executemany("insert into test values (?, ?, ?, ?)", rows)
+        assert cur.rowcount == 100
+        cur.execute("select * from test order by a")
+        assert cur.fetchall() == rows
+
+    def test_executemany_adapter(self, con):
+        _sqlite3.register_adapter(int, lambda x: x * 2)
+        try:
+            cur = con.cursor()
+            cur.execute("create table test(a)")
+            cur.executemany("insert into test values (?)", [(1,), (2,)])
+        finally:
+            del _sqlite3.adapters[(int, _sqlite3.PrepareProtocol)]
+        cur.execute("select a from test order by a")
+        assert cur.fetchall() == [(2,), (4,)]
+
+    def test_fetchmany(self, con):
+        cur = con.cursor()
+        assert cur.fetchmany() == []
+        cur.execute("create table test(a)")
+        cur.executemany("insert into test values (?)", [(i,) for i in range(10)])
+        cur.execute("select a from test order by a")
+        assert cur.fetchmany() == [(0,)]
+        cur.arraysize = 2
+        assert cur.fetchmany() == [(1,), (2,)]
+        assert cur.fetchmany(3) == [(3,), (4,), (5,)]
+        assert cur.fetchone() == (6,)
+        assert cur.fetchmany(0) == [(7,), (8,), (9,)]
+        assert cur.fetchmany(5) == []
+        assert cur.fetchall() == []
+        cur.row_factory = lambda cur, row: row[0]
+        cur.execute("select a from test order by a")
+        assert cur.fetchmany(4) == [0, 1, 2, 3]
+        assert cur.fetchall() == [4, 5, 6, 7, 8, 9]
+        cur.close()
+        pytest.raises(_sqlite3.ProgrammingError, cur.fetchmany)
+        pytest.raises(_sqlite3.ProgrammingError, cur.fetchall)
+
     def test_authorizer_bad_value(self, con):
         def authorizer_cb(action, arg1, arg2, dbname, source):
             return 42
@@ -5,6 +5,7 @@ from pypy.interpreter.typedef import TypeDef, interp_attrproperty
 from pypy.interpreter.error import OperationError, oefmt
 from rpython.rlib.rarithmetic import intmask, r_uint
 from rpython.rlib.objectmodel import keepalive_until_here
+from rpython.rlib.buffer import StringBuffer, scoped_rawbuffer
 
 from rpython.rlib import rzlib
 
@@ -20,8 +21,8 @@ else:
         return intmask((x ^ SIGN_EXTEND2) - SIGN_EXTEND2)
 
 
-@unwrap_spec(string='bufferstr', start='truncatedint_w')
-def crc32(space, string, start = rzlib.CRC32_DEFAULT_START):
+@unwrap_spec(start='truncatedint_w')
+def crc32(space, w_string, start = rzlib.CRC32_DEFAULT_START):
     """
     crc32(string[, start]) -- Compute a CRC-32 checksum of string.
 
@@ -29,7 +30,9 @@ def crc32(space, string, start = rzlib.CRC32_DEFAULT_START):
     an integer.
     """
     ustart = r_uint(start)
-    checksum = rzlib.crc32(string, ustart)
+    buf = space.getarg_w('s*', w_string)
+    with scoped_rawbuffer(buf) as ptr:
+        checksum = rzlib.crc32_raw(ptr, buf.getlength(), ustart)
 
     # This is, perhaps, a little stupid.  zlib returns the checksum unsigned.
     # CPython exposes it as a signed value, though. -exarkun
@@ -41,8 +44,8 @@ def crc32(space, string, start = rzlib.CRC32_DEFAULT_START):
     return space.wrap(checksum)
 
 
-@unwrap_spec(string='bufferstr', start='truncatedint_w')
-def adler32(space, string, start=rzlib.ADLER32_DEFAULT_START):
+@unwrap_spec(start='truncatedint_w')
+def adler32(space, w_string, start=rzlib.ADLER32_DEFAULT_START):
     """
     adler32(string[, start]) -- Compute an Adler-32 checksum of string.
 
@@ -50,7 +53,9 @@ def adler32(space, string, start=rzlib.ADLER32_DEFAULT_START):
     an integer.
     """
     ustart = r_uint(start)
-    checksum = rzlib.adler32(string, ustart)
+    buf = space.getarg_w('s*', w_string)
+    with scoped_rawbuffer(buf) as ptr:
+        checksum = rzlib.adler32_raw(ptr, buf.getlength(), ustart)
     # See comments in crc32() for the following line
     checksum = unsigned_to_signed_32bit(checksum)
 
@@ -66,20 +71,23 @@ def zlib_error(space, msg):
     return OperationError(w_error, space.wrap(msg))
 
 
-@unwrap_spec(string='bufferstr', level=int)
-def compress(space, string, level=rzlib.Z_DEFAULT_COMPRESSION):
+@unwrap_spec(level=int)
+def compress(space, w_string, level=rzlib.Z_DEFAULT_COMPRESSION):
     """
     compress(string[, level]) -- Returned compressed string.
 
     Optional arg level is the compression level, in 1-9.
     """
+    buf = space.getarg_w('s*', w_string)
     try:
         try:
             stream = rzlib.deflateInit(level)
         except ValueError:
             raise zlib_error(space, "Bad compression level")
         try:
-            result = rzlib.compress(stream, string, rzlib.Z_FINISH)
+            with scoped_rawbuffer(buf) as ptr:
+                result = rzlib.compress_raw(stream, ptr, buf.getlength(),
+                                            rzlib.Z_FINISH)
         finally:
             rzlib.deflateEnd(stream)
     except rzlib.RZlibError, e:
@@ -87,21 +95,25 @@ def compress(space, string, level=rzlib.Z_DEFAULT_COMPRESSION):
     return space.wrap(result)
 
 
-@unwrap_spec(string='bufferstr', wbits="c_int", bufsize=int)
-def decompress(space, string, wbits=rzlib.MAX_WBITS, bufsize=0):
+@unwrap_spec(wbits="c_int", bufsize=int)
+def decompress(space, w_string, wbits=rzlib.MAX_WBITS, bufsize=0):
     """
     decompress(string[, wbits[, bufsize]]) -- Return decompressed string.
 
     Optional arg wbits is the window buffer size.  Optional arg bufsize is
     only for compatibility with CPython and is ignored.
     """
+    buf = space.getarg_w('s*', w_string)
     try:
         try:
             stream = rzlib.inflateInit(wbits)
         except ValueError:
             raise zlib_error(space, "Bad window buffer size")
         try:
-            result, _, _ = rzlib.decompress(stream, string, rzlib.Z_FINISH)
+            with scoped_rawbuffer(buf) as ptr:
+                result, _, _ = rzlib.decompress_raw(stream, ptr,
+                                                    buf.getlength(),
+                                                    rzlib.Z_FINISH)
         finally:
             rzlib.inflateEnd(stream)
     except rzlib.RZlibError, e:
@@ -156,8 +168,7 @@ class Compress(ZLibObject):
             rzlib.deflateEnd(self.stream)
             self.stream = rzlib.null_stream
 
-    @unwrap_spec(data='bufferstr')
-    def compress(self, space, data):
+    def compress(self, space, w_data):
         """
         compress(data) -- Return a string containing data compressed.
 
@@ -166,13 +177,16 @@ class Compress(ZLibObject):
 
         Call the flush() method to clear these buffers.
         """
+        buf = space.getarg_w('s*', w_data)
         try:
             self.lock()
             try:
                 if not self.stream:
                     raise zlib_error(space,
                                      "compressor object already flushed")
-                result = rzlib.compress(self.stream, data)
+                with scoped_rawbuffer(buf) as ptr:
+                    result = rzlib.compress_raw(self.stream, ptr,
+                                                buf.getlength())
             finally:
                 self.unlock()
         except rzlib.RZlibError, e:
@@ -267,18 +281,19 @@ class Decompress(ZLibObject):
             rzlib.inflateEnd(self.stream)
             self.stream = rzlib.null_stream
 
-    def _save_unconsumed_input(self, data, finished, unused_len):
-        unused_start = len(data) - unused_len
+    def _save_unconsumed_input(self, buf, finished, unused_len):
+        length = buf.getlength()
+        unused_start = length - unused_len
         assert unused_start >= 0
-        tail = data[unused_start:]
+        tail = buf.getslice(unused_start, length, 1, unused_len)
         if finished:
             self.unconsumed_tail = ''
             self.unused_data += tail
         else:
             self.unconsumed_tail = tail
 
-    @unwrap_spec(data='bufferstr', max_length="c_int")
-    def decompress(self, space, data, max_length=0):
+    @unwrap_spec(max_length="c_int")
+    def decompress(self, space, w_data, max_length=0):
         """
         decompress(data[, max_length]) -- Return a string containing the
         decompressed version of the data.
@@ -292,17 +307,21 @@ class Decompress(ZLibObject):
         elif max_length < 0:
             raise oefmt(space.w_ValueError,
                         "max_length must be greater than zero")
+        buf = space.getarg_w('s*', w_data)
         try:
             self.lock()
             try:
-                result = rzlib.decompress(self.stream, data, max_length=max_length)
+                with scoped_rawbuffer(buf) as ptr:
+                    result = rzlib.decompress_raw(self.stream, ptr,
+                                                  buf.getlength(),
+                                                  max_length=max_length)
             finally:
                 self.unlock()
         except rzlib.RZlibError, e:
             raise zlib_error(space, e.msg)
 
         string, finished, unused_len = result
-        self._save_unconsumed_input(data, finished, unused_len)
+        self._save_unconsumed_input(buf, finished, unused_len)
         return space.wrap(string)
 
     def flush(self, space, w_length=None):
@@ -327,7 +346,8 @@ class Decompress(ZLibObject):
             string = ""
         else:
             string, finished, unused_len = result
-            self._save_unconsumed_input(data, finished, unused_len)
+            self._save_unconsumed_input(StringBuffer(data), finished,
+                                        unused_len)
         return space.wrap(string)
 
 
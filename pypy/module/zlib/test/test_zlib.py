@@ -19,7 +19,7 @@ def test_unsigned_to_signed_32bit():
 
 
 class AppTestZlib(object):
-    spaceconfig = dict(usemodules=['zlib'])
+    spaceconfig = dict(usemodules=['zlib', 'array'])
 
     def setup_class(cls):
         """
@@ -253,6 +253,29 @@ class AppTestZlib(object):
         bytes = self.zlib.decompress(buffer(self.compressed))
         assert bytes == self.expanded
 
+    def test_raw_buffers(self):
+        # array.array exposes its raw memory, which is used directly
+        import array
+        zlib = self.zlib
+        a = array.array('c', self.expanded)
+        assert zlib.compress(a) == self.compressed
+        assert zlib.crc32(a) == zlib.crc32(self.expanded)
+        assert zlib.adler32(a, 5) == zlib.adler32(self.expanded, 5)
+        assert zlib.decompress(array.array('c', self.compressed)) == (
+            self.expanded)
+        co = zlib.compressobj()
+        data = co.compress(buffer(a, 5)) + co.flush()
+        assert zlib.decompress(data) == self.expanded[5:]
+        dco = zlib.decompressobj()
+        a = array.array('c', self.compressed + 'tail')
+        assert dco.decompress(a) == self.expanded
+        assert dco.unused_data == 'tail'
+        dco = zlib.decompressobj()
+        assert dco.decompress(memoryview(bytearray(self.compressed)), 5) == (
+            self.expanded[:5])
+        assert dco.unconsumed_tail
+        assert dco.decompress(dco.unconsumed_tail) == self.expanded[5:]
+
     def test_flush_with_freed_input(self):
         # Issue #16411: decompressor accesses input to last decompress() call
         # in flush(), even if this object has been freed in the meanwhile.
@@ -72,6 +72,9 @@ class W_MyType(W_MyObject):
     def get_module(self):
         return w_some_obj()
 
+    def is_heaptype(self):
+        return NonConstant(False)
+
 def w_some_obj():
     if NonConstant(False):
         return W_Root()
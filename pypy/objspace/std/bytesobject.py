@@ -483,7 +483,7 @@ class W_BytesObject(W_AbstractBytesObject):
     @staticmethod
     def _use_rstr_ops(space, w_other):
         from pypy.objspace.std.unicodeobject import W_UnicodeObject
-        return (isinstance(w_other, W_BytesObject) or
+        return (isinstance(w_other, W_AbstractBytesObject) or
                 isinstance(w_other, W_UnicodeObject))
 
     @staticmethod
@@ -589,55 +589,49 @@ class W_BytesObject(W_AbstractBytesObject):
         return mod_format(space, self, w_values, do_unicode=False)
 
     def descr_eq(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value == w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value == other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value == w_other._value)
 
     def descr_ne(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value != w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value != other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value != w_other._value)
 
     def descr_lt(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value < w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value < other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value < w_other._value)
 
     def descr_le(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value <= w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value <= other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value <= w_other._value)
 
     def descr_gt(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value > w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value > other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value > w_other._value)
 
     def descr_ge(self, space, w_other):
-        if space.config.objspace.std.withstrbuf:
-            from pypy.objspace.std.strbufobject import W_StringBufferObject
-            if isinstance(w_other, W_StringBufferObject):
-                return space.newbool(self._value >= w_other.force())
+        other = _forced_value(space, w_other)
+        if other is not None:
+            return space.newbool(self._value >= other)
         if not isinstance(w_other, W_BytesObject):
             return space.w_NotImplemented
         return space.newbool(self._value >= w_other._value)
@@ -655,6 +649,11 @@ class W_BytesObject(W_AbstractBytesObject):
             from .bytearrayobject import W_BytearrayObject, _make_data
             self_as_bytearray = W_BytearrayObject(_make_data(self._value))
             return space.add(self_as_bytearray, w_other)
+        if space.config.objspace.std.withrope:
+            from pypy.objspace.std.ropeobject import rope_concat
+            w_result = rope_concat(space, self, w_other)
+            if w_result is not None:
+                return w_result
         if space.config.objspace.std.withstrbuf:
             from pypy.objspace.std.strbufobject import W_StringBufferObject
             try:
@@ -669,6 +668,18 @@ class W_BytesObject(W_AbstractBytesObject):
             return W_StringBufferObject(builder)
         return self._StringMethods_descr_add(space, w_other)
 
+    _StringMethods__sliced = _sliced
+    def _sliced(self, space, s, start, stop, orig_obj):
+        if space.config.objspace.std.withstrslice:
+            if start == 0 and stop == len(s):
+                # nothing to cut, so nothing to share either
+                if space.is_w(space.type(orig_obj), space.w_str):
+                    return orig_obj
+                return W_BytesObject(s)
+            from pypy.objspace.std.strsliceobject import wrap_slice
+            return wrap_slice(space, s, start, stop)
+        return self._StringMethods__sliced(space, s, start, stop, orig_obj)
+
     _StringMethods__startswith = _startswith
     def _startswith(self, space, value, w_prefix, start, end):
         if space.isinstance_w(w_prefix, space.w_unicode):
@@ -725,6 +736,13 @@ class W_BytesObject(W_AbstractBytesObject):
         if w_sep is not None and space.isinstance_w(w_sep, space.w_unicode):
             self_as_uni = unicode_from_encoded_object(space, self, None, None)
             return self_as_uni.descr_split(space, w_sep, maxsplit)
+        if (space.config.objspace.std.withstrslice and
+                isinstance(w_sep, W_BytesObject) and w_sep._value):
+            from pypy.objspace.std.strsliceobject import split_to_slices
+            w_list = split_to_slices(space, self, w_sep._value, maxsplit,
+                                     False)
+            if w_list is not None:
+                return w_list
         return self._StringMethods_descr_split(space, w_sep, maxsplit)
 
     _StringMethods_descr_rsplit = descr_rsplit
@@ -733,6 +751,13 @@ class W_BytesObject(W_AbstractBytesObject):
         if w_sep is not None and space.isinstance_w(w_sep, space.w_unicode):
             self_as_uni = unicode_from_encoded_object(space, self, None, None)
             return self_as_uni.descr_rsplit(space, w_sep, maxsplit)
+        if (space.config.objspace.std.withstrslice and
+                isinstance(w_sep, W_BytesObject) and w_sep._value):
+            from pypy.objspace.std.strsliceobject import split_to_slices
+            w_list = split_to_slices(space, self, w_sep._value, maxsplit,
+                                     True)
+            if w_list is not None:
+                return w_list
         return self._StringMethods_descr_rsplit(space, w_sep, maxsplit)
 
     _StringMethods_descr_strip = descr_strip
@@ -840,6 +865,24 @@ class W_BytesObject(W_AbstractBytesObject):
         return tformat.formatter_field_name_split()
 
 
+def _forced_value(space, w_other):
+    # the value of a string buffer, rope or str slice object, or None if
+    # w_other is not one of them
+    if space.config.objspace.std.withstrbuf:
+        from pypy.objspace.std.strbufobject import W_StringBufferObject
+        if isinstance(w_other, W_StringBufferObject):
+            return w_other.force()
+    if space.config.objspace.std.withrope:
+        from pypy.objspace.std.ropeobject import W_RopeBytesObject
+        if isinstance(w_other, W_RopeBytesObject):
+            return w_other.force()
+    if space.config.objspace.std.withstrslice:
+        from pypy.objspace.std.strsliceobject import W_StrSliceObject
+        if isinstance(w_other, W_StrSliceObject):
+            return w_other.force()
+    return None
+
+
 def _create_list_from_bytes(value):
     # need this helper function to allow the jit to look inside and inline
     # listview_bytes
@@ -80,7 +80,9 @@ class StdObjSpace(ObjSpace):
             W_TypeObject.typedef: W_TypeObject,
             W_UnicodeObject.typedef: W_UnicodeObject,
         }
-        if self.config.objspace.std.withstrbuf:
+        if (self.config.objspace.std.withstrbuf or
+                self.config.objspace.std.withrope or
+                self.config.objspace.std.withstrslice):
             builtin_type_classes[W_BytesObject.typedef] = W_AbstractBytesObject
 
         self.builtin_types = {}
@@ -291,6 +293,9 @@ class StdObjSpace(ObjSpace):
     def newlist_int(self, list_i):
         return W_ListObject.newlist_int(self, list_i)
 
+    def newlist_float(self, list_f):
+        return W_ListObject.newlist_float(self, list_f)
+
     def newdict(self, module=False, instance=False, kwargs=False,
                 strdict=False):
         return W_DictMultiObject.allocate_and_init_instance(
@@ -0,0 +1,147 @@
+"""Big str objects represented as ropes, enabled with the 'withrope'
+option.  Adding two strings whose total length is at least
+ROPE_MIN_LENGTH gives a W_RopeBytesObject.  Adding to it, slicing it
+and multiplying it build new rope nodes that share the characters of
+their operands, instead of copying them.  Any other operation flattens
+the rope into a regular W_BytesObject first (only once).
+"""
+
+from rpython.rlib import rope
+
+from pypy.objspace.std.bytesobject import (W_AbstractBytesObject,
+    W_BytesObject, StringBuffer)
+from pypy.objspace.std.sliceobject import W_SliceObject, normalize_simple_slice
+from pypy.objspace.std.strbufobject import delegate_to_str
+from pypy.interpreter.error import OperationError, oefmt
+
+
+ROPE_MIN_LENGTH = 4096
+
+
+class W_RopeBytesObject(W_AbstractBytesObject):
+    w_str = None
+
+    def __init__(self, node):
+        self.node = node                   # rope.StringNode
+
+    def force(self):
+        if self.w_str is None:
+            s = self.node.flatten_string()
+            self.w_str = W_BytesObject(s)
+            # the rope nodes are not needed any more
+            self.node = rope.LiteralStringNode(s)
+            return s
+        else:
+            return self.w_str._value
+
+    def __repr__(w_self):
+        """ representation for debugging purposes """
+        return "%s(%r)" % (w_self.__class__.__name__, w_self.node)
+
+    def unwrap(self, space):
+        return self.force()
+
+    def str_w(self, space):
+        return self.force()
+
+    charbuf_w = str_w
+
+    def buffer_w(self, space, flags):
+        space.check_buf_flags(flags, True)
+        return StringBuffer(self.force())
+
+    def readbuf_w(self, space):
+        return StringBuffer(self.force())
+
+    def ord(self, space):
+        self.force()
+        return self.w_str.ord(space)
+
+    def descr_len(self, space):
+        return space.wrap(self.node.length())
+
+    def descr_add(self, space, w_other):
+        w_result = rope_concat(space, self, w_other)
+        if w_result is not None:
+            return w_result
+        self.force()
+        return self.w_str.descr_add(space, w_other)
+
+    def _slice(self, space, start, stop):
+        if stop - start < ROPE_MIN_LENGTH:
+            node = rope.getslice_one(self.node, start, stop)
+            return W_BytesObject(node.flatten_string())
+        return W_RopeBytesObject(rope.getslice_one(self.node, start, stop))
+
+    def descr_getitem(self, space, w_index):
+        if isinstance(w_index, W_SliceObject):
+            start, stop, step, sl = w_index.indices4(space,
+                                                     self.node.length())
+            if sl == 0:
+                return W_BytesObject.EMPTY
+            if step == 1:
+                assert start >= 0 and stop >= 0
+                return self._slice(space, start, stop)
+        self.force()
+        return self.w_str.descr_getitem(space, w_index)
+
+    def descr_getslice(self, space, w_start, w_stop):
+        start, stop = normalize_simple_slice(space, self.node.length(),
+                                             w_start, w_stop)
+        if start == stop:
+            return W_BytesObject.EMPTY
+        return self._slice(space, start, stop)
+
+    def descr_mul(self, space, w_times):
+        try:
+            times = space.getindex_w(w_times, space.w_OverflowError)
+        except OperationError as e:
+            if e.match(space, space.w_TypeError):
+                return space.w_NotImplemented
+            raise
+        if times <= 0:
+            return W_BytesObject.EMPTY
+        try:
+            node = rope.multiply(self.node, times)
+        except OverflowError:
+            raise oefmt(space.w_OverflowError, "repeated string is too long")
+        return W_RopeBytesObject(node)
+
+    descr_rmul = descr_mul
+
+    def descr_str(self, space):
+        # you cannot get subclasses of W_RopeBytesObject here
+        assert type(self) is W_RopeBytesObject
+        return self
+
+delegate_to_str(W_RopeBytesObject, ('__len__', '__add__', '__getitem__',
+                                    '__getslice__', '__mul__', '__rmul__',
+                                    '__str__'))
+
+
+def _rope_node(w_str):
+    if isinstance(w_str, W_RopeBytesObject):
+        return w_str.node
+    assert isinstance(w_str, W_BytesObject)
+    return rope.LiteralStringNode(w_str._value)
+
+def rope_concat(space, w_left, w_right):
+    """Return a rope for w_left + w_right, if both are strs and at least
+    one is a rope or the result would be at least ROPE_MIN_LENGTH long.
+    Otherwise return None."""
+    if isinstance(w_left, W_BytesObject):
+        if isinstance(w_right, W_BytesObject):
+            if len(w_left._value) + len(w_right._value) < ROPE_MIN_LENGTH:
+                return None
+        elif not isinstance(w_right, W_RopeBytesObject):
+            return None
+    elif not isinstance(w_left, W_RopeBytesObject):
+        return None
+    elif not (isinstance(w_right, W_BytesObject) or
+              isinstance(w_right, W_RopeBytesObject)):
+        return None
+    try:
+        node = rope.concatenate(_rope_node(w_left), _rope_node(w_right))
+    except OverflowError:
+        raise oefmt(space.w_OverflowError, "string is too long")
+    return W_RopeBytesObject(node)
@@ -67,33 +67,38 @@ class W_StringBufferObject(W_AbstractBytesObject):
         return self
 
 
-delegation_dict = {}
-for key, value in W_BytesObject.typedef.rawdict.iteritems():
-    if not isinstance(value, interp2app):
-        continue
-    if key in ('__len__', '__add__', '__str__'):
-        continue
-
-    func = value._code._bltin
-    args = inspect.getargs(func.func_code)
-    if args.varargs or args.keywords:
-        raise TypeError("Varargs and keywords not supported in unwrap_spec")
-    argspec = ', '.join([arg for arg in args.args[1:]])
-    func_code = py.code.Source("""
-    def f(self, %(args)s):
-        self.force()
-        return self.w_str.%(func_name)s(%(args)s)
-    """ % {'args': argspec, 'func_name': func.func_name})
-    d = {}
-    exec func_code.compile() in d
-    f = d['f']
-    f.func_defaults = func.func_defaults
-    f.__module__ = func.__module__
-    # necessary for unique identifiers for pickling
-    f.func_name = func.func_name
-    unwrap_spec_ = getattr(func, 'unwrap_spec', None)
-    if unwrap_spec_ is not None:
-        f = unwrap_spec(**unwrap_spec_)(f)
-    setattr(W_StringBufferObject, func.func_name, f)
-
-W_StringBufferObject.typedef = W_BytesObject.typedef
+def delegate_to_str(cls, exclude):
+    """Give 'cls' all the methods of the str typedef not listed in
+    'exclude'.  They call self.force() and then the same method on the
+    resulting W_BytesObject, which must be stored as self.w_str."""
+    for key, value in W_BytesObject.typedef.rawdict.iteritems():
+        if not isinstance(value, interp2app):
+            continue
+        if key in exclude:
+            continue
+
+        func = value._code._bltin
+        args = inspect.getargs(func.func_code)
+        if args.varargs or args.keywords:
+            raise TypeError("Varargs and keywords not supported in "
+                            "unwrap_spec")
+        argspec = ', '.join([arg for arg in args.args[1:]])
+        func_code = py.code.Source("""
+        def f(self, %(args)s):
+            self.force()
+            return self.w_str.%(func_name)s(%(args)s)
+        """ % {'args': argspec, 'func_name': func.func_name})
+        d = {}
+        exec func_code.compile() in d
+        f = d['f']
+        f.func_defaults = func.func_defaults
+        f.__module__ = func.__module__
+        # necessary for unique identifiers for pickling
+        f.func_name = func.func_name
+        unwrap_spec_ = getattr(func, 'unwrap_spec', None)
+        if unwrap_spec_ is not None:
+            f = unwrap_spec(**unwrap_spec_)(f)
+        setattr(cls, func.func_name, f)
+    cls.typedef = W_BytesObject.typedef
+
+delegate_to_str(W_StringBufferObject, ('__len__', '__add__', '__str__'))
@@ -0,0 +1,157 @@
+"""Big substrs that share the characters of the str they come from,
+enabled with the 'withstrslice' option.  Slicing, stripping,
+partitioning or splitting a str can give a W_StrSliceObject, which
+only stores the original string and the bounds of the slice.  Asking
+for its length or for single characters, and slicing it again, does not
+copy the characters; any other operation copies them into a regular
+W_BytesObject first (only once), after which the original string is no
+longer kept alive.
+"""
+
+from rpython.rlib.buffer import SubBuffer
+from rpython.rlib.rstring import split, rsplit
+
+from pypy.objspace.std.bytesobject import (W_AbstractBytesObject,
+    W_BytesObject, StringBuffer)
+from pypy.objspace.std.sliceobject import W_SliceObject, normalize_simple_slice
+from pypy.objspace.std.strbufobject import delegate_to_str
+from pypy.interpreter.error import oefmt
+
+
+# only share substrings at least that long...
+STRSLICE_MIN_LENGTH = 4096
+# ...and that are at least 1/STRSLICE_MAX_WASTE of the original string,
+# to avoid keeping alive a big string for a small part of it
+STRSLICE_MAX_WASTE = 16
+
+
+class W_StrSliceObject(W_AbstractBytesObject):
+    w_str = None
+
+    def __init__(self, value, start, stop):
+        assert 0 <= start <= stop <= len(value)
+        self.value = value
+        self.start = start
+        self.stop = stop
+
+    def force(self):
+        if self.w_str is None:
+            start = self.start
+            stop = self.stop
+            assert start >= 0 and stop >= 0
+            s = self.value[start:stop]
+            self.w_str = W_BytesObject(s)
+            # don't keep the original string alive any more
+            self.value = s
+            self.start = 0
+            self.stop = len(s)
+            return s
+        else:
+            return self.w_str._value
+
+    def __repr__(w_self):
+        """ representation for debugging purposes """
+        return "%s(%d:%d of %d chars)" % (
+            w_self.__class__.__name__, w_self.start, w_self.stop,
+            len(w_self.value))
+
+    def unwrap(self, space):
+        return self.force()
+
+    def str_w(self, space):
+        return self.force()
+
+    charbuf_w = str_w
+
+    def _buffer(self):
+        # reading parts of it does not copy the characters, but asking
+        # for all of them, e.g. to write them to a file, still does
+        return SubBuffer(StringBuffer(self.value), self.start,
+                         self.stop - self.start)
+
+    def buffer_w(self, space, flags):
+        space.check_buf_flags(flags, True)
+        return self._buffer()
+
+    def readbuf_w(self, space):
+        return self._buffer()
+
+    def ord(self, space):
+        self.force()
+        return self.w_str.ord(space)
+
+    def descr_len(self, space):
+        return space.wrap(self.stop - self.start)
+
+    def descr_getitem(self, space, w_index):
+        length = self.stop - self.start
+        if isinstance(w_index, W_SliceObject):
+            start, stop, step, sl = w_index.indices4(space, length)
+            if sl == 0:
+                return W_BytesObject.EMPTY
+            if step == 1:
+                assert start >= 0 and stop >= 0
+                return wrap_slice(space, self.value, self.start + start,
+                                  self.start + stop)
+            self.force()
+            return self.w_str.descr_getitem(space, w_index)
+        index = space.getindex_w(w_index, space.w_IndexError, "string index")
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise oefmt(space.w_IndexError, "string index out of range")
+        return space.wrap(self.value[self.start + index])
+
+    def descr_getslice(self, space, w_start, w_stop):
+        start, stop = normalize_simple_slice(space, self.stop - self.start,
+                                             w_start, w_stop)
+        if start == stop:
+            return W_BytesObject.EMPTY
+        return wrap_slice(space, self.value, self.start + start,
+                          self.start + stop)
+
+    def descr_str(self, space):
+        # you cannot get subclasses of W_StrSliceObject here
+        assert type(self) is W_StrSliceObject
+        return self
+
+delegate_to_str(W_StrSliceObject, ('__len__', '__getitem__', '__getslice__',
+                                   '__str__'))
+
+
+def wrap_slice(space, value, start, stop):
+    """Return the str value[start:stop], sharing the characters of 'value'
+    if the slice is big enough."""
+    assert start >= 0 and stop >= start
+    if start == 0 and stop == len(value):
+        return W_BytesObject(value)
+    if _can_share(stop - start, len(value)):
+        return W_StrSliceObject(value, start, stop)
+    return W_BytesObject(value[start:stop])
+
+def _can_share(length, total):
+    return (length >= STRSLICE_MIN_LENGTH and
+            length * STRSLICE_MAX_WASTE >= total)
+
+
+class SliceFactory(object):
+    def __init__(self, space):
+        self.space = space
+
+    def piece(self, value, start, stop):
+        return wrap_slice(self.space, value, start, stop)
+
+def split_to_slices(space, w_str, by, maxsplit, from_right):
+    """Like str.split(by, maxsplit) or str.rsplit(by, maxsplit), but
+    the big pieces share the characters of 'w_str'.  Return None if
+    'w_str' is too small for any piece to be shared."""
+    value = w_str._value
+    if len(value) < STRSLICE_MIN_LENGTH:
+        return None
+    factory = SliceFactory(space)
+    if from_right:
+        pieces_w = rsplit(value, by, maxsplit, factory)
+    else:
+        pieces_w = split(value, by, maxsplit, factory)
+    # if no piece is shared, this still gives a list of unwrapped strings
+    return space.newlist(pieces_w)
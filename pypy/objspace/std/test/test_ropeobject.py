@@ -0,0 +1,91 @@
+from pypy.objspace.std.test import test_bytesobject
+
+class AppTestRopeObject(test_bytesobject.AppTestBytesObject):
+    spaceconfig = {"objspace.std.withrope": True}
+
+    def test_basic(self):
+        import __pypy__
+        s = "a".__add__("b")
+        assert 'W_BytesObject' in __pypy__.internal_repr(s)
+        s = ("a" * 3000).__add__("b" * 3000)
+        assert type(s) is str
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(s)
+        assert len(s) == 6000
+        assert s == "a" * 3000 + "b" * 3000
+
+    def test_add(self):
+        import __pypy__
+        pieces = [str(i) * 100 for i in range(100)]
+        all = ""
+        for piece in pieces:
+            all += piece
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(all)
+        all2 = ""
+        for piece in pieces:
+            all2 = piece + all2
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(all2)
+        assert len(all) == len(all2) == sum(map(len, pieces))
+        assert all == "".join(pieces)
+        assert all2 == "".join(pieces[::-1])
+
+    def test_add_shared(self):
+        x = "x" * 5000
+        s = x + "a"
+        t = s + "b"
+        u = s + "c"
+        assert t == x + "ab"
+        assert u == x + "ac"
+        assert s == x + "a"
+        assert "0" + s == "0" + x + "a"
+
+    def test_slice(self):
+        import __pypy__
+        s = "abcd" * 1000 + "efgh" * 2000
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(s)
+        t = s[3000:10000]
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(t)
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(s)
+        assert t == ("abcd" * 1000 + "efgh" * 2000)[3000:10000]
+        u = s[3998:4002]
+        assert 'W_BytesObject' in __pypy__.internal_repr(u)
+        assert u == "cdef"
+        assert s[5:5] == ""
+        assert s[-3:] == "fgh"
+        assert s[::4000] == "aee"
+        assert s.__getslice__(4000, 4004) == "efgh"
+
+    def test_mul(self):
+        import __pypy__
+        s = "a" * 3000 + "b" * 3000
+        t = s * 100
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(t)
+        assert len(t) == 600000
+        assert t[5999:6001] == "ba"
+        assert 3 * s == s + s + s
+        assert s * 0 == ""
+        raises(TypeError, "s * 'x'")
+
+    def test_flatten(self):
+        import __pypy__
+        s = "a" * 3000 + "b" * 3000
+        assert s[0] == "a"
+        assert 'W_RopeBytesObject' in __pypy__.internal_repr(s)
+        assert s.count("b") == 3000
+        assert hash(s) == hash("a" * 3000 + "b" * 3000)
+        assert s.startswith("aaa")
+        assert s > "a" and "a" < s
+        assert s != "a" * 6000
+        assert "%s%s" % (s, "c") == s + "c"
+
+    def test_add_other_types(self):
+        s = "a" * 3000 + "b" * 3000
+        t = s + u"c"
+        assert type(t) is unicode and t == u"a" * 3000 + u"b" * 3000 + u"c"
+        t = s + bytearray("c")
+        assert type(t) is bytearray
+        raises(TypeError, "s + 5")
+
+    def test_buffer(self):
+        s = "a" * 3000 + "b" * 3000
+        assert buffer(s) == buffer("a" * 3000 + "b" * 3000)
+        assert memoryview(s) == "a" * 3000 + "b" * 3000
@@ -0,0 +1,101 @@
+from pypy.objspace.std.test import test_bytesobject
+
+class AppTestStrSliceObject(test_bytesobject.AppTestBytesObject):
+    spaceconfig = {"objspace.std.withstrslice": True}
+
+    def test_slice(self):
+        import __pypy__
+        s = "abcd" * 2000
+        t = s[1:7000]
+        assert type(t) is str
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(t)
+        assert len(t) == 6999
+        assert t == ("abcd" * 2000)[1:7000]
+        assert 'W_BytesObject' in __pypy__.internal_repr(s[1:100])
+        assert s[1:100] == "bcda" * 24 + "bcd"
+        t = s.__getslice__(3, 7000)
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(t)
+        assert t == ("abcd" * 2000)[3:7000]
+        assert 'W_BytesObject' in __pypy__.internal_repr(s[::2])
+        assert s[::2] == "ac" * 2000
+
+    def test_slice_of_slice(self):
+        import __pypy__
+        s = "0123456789" * 1000
+        t = s[1000:]
+        u = t[10:8000]
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(u)
+        assert u == s[1010:9000]
+        assert t[-5:] == "56789"
+        assert t[5:5] == ""
+        assert t[3] == "3" and t[-1] == "9"
+        raises(IndexError, "t[9000]")
+        raises(IndexError, "t[-9001]")
+
+    def test_waste(self):
+        import __pypy__
+        s = "x" * 100000
+        assert 'W_BytesObject' in __pypy__.internal_repr(s[:5000])
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(s[:50000])
+
+    def test_force(self):
+        import __pypy__
+        s = "a" * 5000 + "b" * 5000
+        t = s[2000:]
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(t)
+        assert t.count("b") == 5000
+        assert hash(t) == hash("a" * 3000 + "b" * 5000)
+        assert t.upper() == "A" * 3000 + "B" * 5000
+        assert t + "c" == "a" * 3000 + "b" * 5000 + "c"
+        assert "c" + t == "c" + "a" * 3000 + "b" * 5000
+        assert t > "a" and "a" < t and t != s
+        assert {t: 1}["a" * 3000 + "b" * 5000] == 1
+
+    def test_strip_partition(self):
+        import __pypy__
+        s = "  " + "x" * 5000 + "  "
+        t = s.strip()
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(t)
+        assert t == "x" * 5000
+        a, sep, b = ("y" * 5000 + ":" + "z" * 5000).partition(":")
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(a)
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(b)
+        assert (a, sep, b) == ("y" * 5000, ":", "z" * 5000)
+
+    def test_split(self):
+        import __pypy__
+        line = "\t".join(["a" * 5000, "b", "c" * 6000, ""])
+        cols = line.split("\t")
+        assert cols == ["a" * 5000, "b", "c" * 6000, ""]
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(cols[0])
+        assert 'W_StrSliceObject' in __pypy__.internal_repr(cols[2])
+        assert line.split("\t", 1) == ["a" * 5000, "b\t" + "c" * 6000 + "\t"]
+        assert line.rsplit("\t") == cols
+        assert line.rsplit("\t", 2) == ["a" * 5000 + "\tb", "c" * 6000, ""]
+        lines = ("abc\n" * 2000).split("\n")
+        assert lines == ["abc"] * 2000 + [""]
+        assert 'W_BytesObject' in __pypy__.internal_repr(lines[0])
+        assert __pypy__.strategy(lines) == "BytesListStrategy"
+        raises(ValueError, line.split, "")
+
+    def test_full_range(self):
+        import __pypy__
+        s = "x" * 5000
+        assert s.strip() is s
+        assert s[:] is s
+        assert s.partition(":")[0] is s
+        assert s.split(":") == [s]
+        assert 'W_BytesObject' in __pypy__.internal_repr(s.split(":")[0])
+        assert 'W_BytesObject' in __pypy__.internal_repr(s.rsplit(":")[0])
+        class S(str):
+            pass
+        t = S(s).strip()
+        assert type(t) is str
+        assert t == s
+        assert 'W_BytesObject' in __pypy__.internal_repr(t)
+
+    def test_buffer(self):
+        s = ("abcd" * 2000)[1:7000]
+        assert buffer(s) == buffer(("abcd" * 2000)[1:7000])
+        assert memoryview(s)[:3] == "bcd"
+        assert memoryview(s).tobytes() == ("abcd" * 2000)[1:7000]
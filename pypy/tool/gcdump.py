@@ -3,22 +3,36 @@
 Prints a human-readable total out of a dumpfile produced
 by gc.dump_rpy_heap(), and optionally a typeids.txt.
 
-Syntax:  dump.py  <dumpfile>  [<typeids.txt>]
+Syntax:  gcdump.py  [--retained]  <dumpfile>  [<typeids.txt>]
+         gcdump.py  --diff  <olddumpfile>  <newdumpfile>  [<typeids.txt>]
 
-By default, typeids.txt is loaded from the same dir as dumpfile.
+By default, typeids.txt is loaded from the same dir as dumpfile.  The
+dumpfile can be compressed ('.gz').  If there is a '.apptypes' file next
+to it, as written by gc.dump_rpy_heap(), the instances of app-level
+classes are reported under the name of their class.
+
+--retained  also computes the dominator tree of the heap, and reports
+            for each type the total size of the objects that are kept
+            alive only by the instances of that type, and the objects
+            that retain the most memory.
+
+--diff      compares the totals of two dumps, showing the types whose
+            total size grew the most first.
 """
-import sys, array, struct, os
+import sys, array, struct, os, gzip
 
 
 class Stat(object):
     summary = {}
     typeids = {0: '<GCROOT>'}
+    apptypes = {}
 
     def summarize(self, filename):
         a = self.load_dump_file(filename)
-        self.summary = {}     # {typenum: [count, totalsize]}
+        self.summary = {}     # {typename: [count, totalsize]}
         for obj in self.walk(a):
-            self.add_object_summary(obj[2], obj[3])
+            self.add_object_summary(self.get_object_type_name(obj[1], obj[2]),
+                                    obj[3])
 
     def load_typeids(self, filename_or_iter):
         self.typeids = Stat.typeids.copy()
@@ -38,34 +52,56 @@ class Stat(object):
                 del words[0]
             self.typeids[num] = ' '.join(words)
 
+    def load_apptypes(self, filename):
+        # lines 'address typename', see gc.dump_rpy_heap()
+        self.apptypes = {}
+        f = open_maybe_compressed(filename)
+        for line in f:
+            words = line.split(None, 1)
+            if len(words) == 2:
+                self.apptypes[int(words[0])] = words[1].strip()
+        f.close()
+
     def get_type_name(self, num):
         return self.typeids.get(num, '<typenum %d>' % num)
 
+    def get_object_type_name(self, addr, typenum):
+        try:
+            return self.apptypes[addr]
+        except KeyError:
+            return self.get_type_name(typenum)
+
     def print_summary(self):
         items = self.summary.items()
-        items.sort(key=lambda (typenum, stat): stat[1])    # sort by totalsize
+        items.sort(key=lambda (typename, stat): stat[1])    # sort by totalsize
         totalsize = 0
-        for typenum, stat in items:
+        for typename, stat in items:
             totalsize += stat[1]
             print '%8d %8.2fM  %s' % (stat[0], stat[1] / (1024.0*1024.0),
-                                      self.get_type_name(typenum))
+                                      typename)
         print 'total %.1fM' % (totalsize / (1024.0*1024.0),)
 
     def load_dump_file(self, filename):
-        f = open(filename, 'rb')
-        f.seek(0, 2)
-        end = f.tell()
-        f.seek(0)
+        # read by chunks, to avoid having the whole (uncompressed)
+        # file in memory twice
+        f = open_maybe_compressed(filename)
         a = array.array('l')
-        a.fromfile(f, end / struct.calcsize('l'))
+        wordsize = struct.calcsize('l')
+        while True:
+            data = f.read(1024 * 1024 * wordsize)
+            if not data:
+                break
+            assert len(data) % wordsize == 0, (
+                "invalid or truncated dump file (or 32/64-bit mix)")
+            a.fromstring(data)
         f.close()
         return a
 
-    def add_object_summary(self, typenum, sizeobj):
+    def add_object_summary(self, typename, sizeobj):
         try:
-            stat = self.summary[typenum]
+            stat = self.summary[typename]
         except KeyError:
-            stat = self.summary[typenum] = [0, 0]
+            stat = self.summary[typename] = [0, 0]
         stat[0] += 1
         stat[1] += sizeobj
 
@@ -85,21 +121,241 @@ class Stat(object):
         print >> sys.stderr, 'done'
 
 
-if __name__ == '__main__':
-    if len(sys.argv) <= 1:
-        print >> sys.stderr, __doc__
-        sys.exit(2)
+class HeapGraph(object):
+    """The objects of a dump, numbered from 0 to 'count' - 1, with the
+    references between them.  The number 'count' stands for the GC roots,
+    which refer to all the objects that appear before the marker in the
+    dump file."""
+
+    def __init__(self, stat, a):
+        self.stat = stat
+        self.addrs = array.array('l')
+        self.typenums = array.array('l')
+        self.sizes = array.array('l')
+        index = {}
+        root_count = -1
+        for obj in stat.walk(a):
+            if obj[1] == 0 and obj[2] == 0 and obj[3] == 0:
+                root_count = len(self.addrs)     # the marker
+                continue
+            index[obj[1]] = len(self.addrs)
+            self.addrs.append(obj[1])
+            self.typenums.append(obj[2])
+            self.sizes.append(obj[3])
+        assert root_count >= 0, "no marker after the GC roots in the dump"
+        self.count = count = len(self.addrs)
+        self.root = count
+        # the references, as lists of object numbers in 'refs', with
+        # the ones of object 'n' between 'ref_starts[n:n+2]'
+        self.ref_starts = array.array('l', [0])
+        self.refs = array.array('l')
+        for obj in stat.walk(a):
+            if obj[1] in index:
+                for addr in obj[4]:
+                    try:
+                        self.refs.append(index[addr])
+                    except KeyError:
+                        pass       # NULL, or not a GC object
+                self.ref_starts.append(len(self.refs))
+        self.refs.extend(xrange(root_count))
+        self.ref_starts.append(len(self.refs))
+
+    def referents(self, n):
+        return self.refs[self.ref_starts[n]:self.ref_starts[n+1]]
+
+    def type_name(self, n):
+        if n == self.root:
+            return '<GCROOT>'
+        return self.stat.get_object_type_name(self.addrs[n], self.typenums[n])
+
+    def compute_dominators(self):
+        """Compute 'self.idom', the immediate dominator of every object,
+        and 'self.retained', the total size of the objects that would be
+        freed if that object was freed.  Uses the iterative algorithm of
+        Cooper, Harvey and Kennedy, which is fast in practice."""
+        count = self.count
+        # depth-first numbering in postorder, from the roots
+        postorder = array.array('l', [-1] * (count + 1))
+        order = array.array('l')
+        stack = [(self.root, self.ref_starts[self.root])]
+        postorder[self.root] = -2      # visited
+        while stack:
+            n, i = stack[-1]
+            if i < self.ref_starts[n+1]:
+                stack[-1] = (n, i + 1)
+                m = self.refs[i]
+                if postorder[m] == -1:
+                    postorder[m] = -2
+                    stack.append((m, self.ref_starts[m]))
+            else:
+                stack.pop()
+                postorder[n] = len(order)
+                order.append(n)
+        # the referrers of every object reachable from the roots
+        referrers = [[] for n in xrange(count + 1)]
+        for n in order:
+            for m in self.referents(n):
+                referrers[m].append(n)
+        #
+        idom = array.array('l', [-1] * (count + 1))
+        idom[self.root] = self.root
+        changed = True
+        while changed:
+            changed = False
+            for k in xrange(len(order) - 2, -1, -1):   # reverse postorder
+                n = order[k]
+                new_idom = -1
+                for p in referrers[n]:
+                    if idom[p] == -1:
+                        continue
+                    if new_idom == -1:
+                        new_idom = p
+                        continue
+                    # intersect
+                    while p != new_idom:
+                        while postorder[p] < postorder[new_idom]:
+                            p = idom[p]
+                        while postorder[new_idom] < postorder[p]:
+                            new_idom = idom[new_idom]
+                if idom[n] != new_idom:
+                    idom[n] = new_idom
+                    changed = True
+        # the dominator of an object comes after it in postorder
+        retained = array.array('l', [0] * (count + 1))
+        for n in order:
+            if n != self.root:
+                retained[n] += self.sizes[n]
+                retained[idom[n]] += retained[n]
+        self.idom = idom
+        self.retained = retained
+
+    def retained_by_type(self):
+        """Return {typename: [count, totalsize, retainedsize]}.  The
+        retained size of a type only counts the objects that are not
+        themselves retained by another object of the same type, directly
+        or not, e.g. only the head of a linked list."""
+        result = {}
+        children = [[] for n in xrange(self.count + 1)]
+        for n in xrange(self.count):
+            typename = self.type_name(n)
+            try:
+                stat = result[typename]
+            except KeyError:
+                stat = result[typename] = [0, 0, 0]
+            stat[0] += 1
+            stat[1] += self.sizes[n]
+            d = self.idom[n]
+            if d != -1:          # else, unreachable from the roots
+                children[d].append(n)
+        # walk the dominator tree, counting how many objects of each
+        # type are on the path from the root to the current object
+        on_path = dict.fromkeys(result, 0)
+        stack = list(children[self.root])
+        while stack:
+            n = stack.pop()
+            if n < 0:            # leaving the object ~n
+                on_path[self.type_name(~n)] -= 1
+                continue
+            typename = self.type_name(n)
+            if on_path[typename] == 0:
+                result[typename][2] += self.retained[n]
+            on_path[typename] += 1
+            stack.append(~n)
+            stack.extend(children[n])
+        return result
+
+    def print_retained(self, limit=20):
+        items = self.retained_by_type().items()
+        items.sort(key=lambda (typename, stat): stat[2])
+        print '   count     size  retained'
+        for typename, stat in items:
+            print '%8d %8.2fM %8.2fM  %s' % (stat[0], stat[1] / (1024.0*1024.0),
+                                             stat[2] / (1024.0*1024.0),
+                                             typename)
+        print 'total %.1fM' % (self.retained[self.root] / (1024.0*1024.0),)
+        print
+        print 'objects that retain the most memory:'
+        biggest = range(self.count)
+        biggest.sort(key=lambda n: self.retained[n], reverse=True)
+        for n in biggest[:limit]:
+            chain = []
+            d = self.idom[n]
+            while d != self.root and d != -1 and len(chain) < 5:
+                chain.append(self.type_name(d))
+                d = self.idom[d]
+            print '%8.2fM  %s at 0x%x' % (self.retained[n] / (1024.0*1024.0),
+                                          self.type_name(n), self.addrs[n])
+            if chain:
+                print '           retained by: %s' % (' <- '.join(chain),)
+
+
+def open_maybe_compressed(filename):
+    if filename.endswith('.gz'):
+        return gzip.open(filename, 'rb')
+    return open(filename, 'rb')
+
+def find_apptypes_file(filename):
+    # 'x.dump' => 'x.dump.apptypes', 'x.dump.gz' => 'x.dump.apptypes.gz'
+    if filename.endswith('.gz'):
+        return filename[:-3] + '.apptypes.gz'
+    return filename + '.apptypes'
+
+def load_stat(filename, typeid_name=None):
     stat = Stat()
-    stat.summarize(sys.argv[1])
-    #
-    if len(sys.argv) > 2:
-        typeid_name = sys.argv[2]
-    else:
-        typeid_name = os.path.join(os.path.dirname(sys.argv[1]), 'typeids.txt')
+    if typeid_name is None:
+        typeid_name = os.path.join(os.path.dirname(filename), 'typeids.txt')
     if os.path.isfile(typeid_name):
         stat.load_typeids(typeid_name)
     else:
         import zlib, gc
         stat.load_typeids(zlib.decompress(gc.get_typeids_z()).split("\n"))
-    #
-    stat.print_summary()
+    apptypes_name = find_apptypes_file(filename)
+    if os.path.isfile(apptypes_name):
+        stat.load_apptypes(apptypes_name)
+    return stat
+
+def print_diff(stat1, stat2):
+    # the addresses are not comparable between two dumps, so we
+    # compare the totals per type
+    names = set(stat1.summary) | set(stat2.summary)
+    items = []
+    for typename in names:
+        count1, size1 = stat1.summary.get(typename, (0, 0))
+        count2, size2 = stat2.summary.get(typename, (0, 0))
+        if (count1, size1) != (count2, size2):
+            items.append((size2 - size1, count2 - count1, typename))
+    items.sort(reverse=True)      # the types that grew the most first
+    totalsize = 0
+    for sizediff, countdiff, typename in items:
+        totalsize += sizediff
+        print '%+8d %+8.2fM  %s' % (countdiff, sizediff / (1024.0*1024.0),
+                                    typename)
+    print 'total %+.1fM' % (totalsize / (1024.0*1024.0),)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    retained = '--retained' in args
+    diff = '--diff' in args
+    args = [arg for arg in args if arg not in ('--retained', '--diff')]
+    if len(args) < 1 + diff or (retained and diff):
+        print >> sys.stderr, __doc__
+        sys.exit(2)
+    if diff:
+        typeid_name = args[2] if len(args) > 2 else None
+        stat1 = load_stat(args[0], typeid_name)
+        stat1.summarize(args[0])
+        stat2 = load_stat(args[1], typeid_name)
+        stat2.summarize(args[1])
+        print_diff(stat1, stat2)
+    else:
+        typeid_name = args[1] if len(args) > 1 else None
+        stat = load_stat(args[0], typeid_name)
+        if retained:
+            print >> sys.stderr, 'computing the dominator tree...'
+            graph = HeapGraph(stat, stat.load_dump_file(args[0]))
+            graph.compute_dominators()
+            graph.print_retained()
+        else:
+            stat.summarize(args[0])
+            stat.print_summary()
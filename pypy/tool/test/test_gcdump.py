@@ -0,0 +1,120 @@
+import array, gzip
+from rpython.tool.udir import udir
+from pypy.tool import gcdump
+
+#    root -> A -> B -> D -> E
+#            A -> C -> D
+WORDS = [100, 1, 10, 200, 300, -1,
+         0, 0, 0, -1,
+         200, 2, 20, 400, -1,
+         300, 2, 30, 400, -1,
+         400, 3, 40, 500, -1,
+         500, 3, 50, -1]
+TYPEIDS = ['header', 'GcStruct A', 'GcStruct B', 'member0 GcStruct D']
+
+
+def write_dump(name, words, compress=False):
+    filename = str(udir.join(name))
+    if compress:
+        f = gzip.open(filename, 'wb')
+    else:
+        f = open(filename, 'wb')
+    f.write(array.array('l', words).tostring())
+    f.close()
+    return filename
+
+def make_stat(filename):
+    stat = gcdump.Stat()
+    stat.load_typeids(TYPEIDS)
+    stat.summarize(filename)
+    return stat
+
+def test_summarize():
+    stat = make_stat(write_dump('gcdump1', WORDS))
+    assert stat.summary == {'<GCROOT>': [1, 0], 'A': [1, 10], 'B': [2, 50],
+                            'D': [2, 90]}
+
+def test_compressed_and_apptypes():
+    filename = write_dump('gcdump2.gz', WORDS, compress=True)
+    apptypes = gcdump.find_apptypes_file(filename)
+    assert apptypes == str(udir.join('gcdump2.apptypes.gz'))
+    f = gzip.open(apptypes, 'wb')
+    f.write('300 mymod.Foo\n')
+    f.close()
+    typeid_name = str(udir.join('gcdump2.typeids.txt'))
+    f = open(typeid_name, 'w')
+    f.write('\n'.join(TYPEIDS))
+    f.close()
+    stat = gcdump.load_stat(filename, typeid_name)
+    stat.summarize(filename)
+    assert stat.summary['B'] == [1, 20]
+    assert stat.summary['mymod.Foo'] == [1, 30]
+
+def test_dominators():
+    filename = write_dump('gcdump3', WORDS)
+    stat = gcdump.Stat()
+    stat.load_typeids(TYPEIDS)
+    graph = gcdump.HeapGraph(stat, stat.load_dump_file(filename))
+    assert graph.count == 5
+    graph.compute_dominators()
+    a, b, c, d, e = range(5)
+    assert list(graph.idom[:5]) == [graph.root, a, a, a, d]
+    assert list(graph.retained) == [150, 20, 30, 90, 50, 150]
+    # E is retained by another D, so it is only counted once for 'D'
+    assert graph.retained_by_type() == {'A': [1, 10, 150], 'B': [2, 50, 50],
+                                        'D': [2, 90, 90]}
+
+def test_retained_by_type_nested():
+    #    root -> A -> B -> D -> E
+    #            A -> C -> D
+    #                      E -> A2 -> B2
+    words = WORDS[:-1] + [600, -1,
+                          600, 1, 60, 700, -1,
+                          700, 2, 70, -1]
+    stat = gcdump.Stat()
+    stat.load_typeids(TYPEIDS)
+    graph = gcdump.HeapGraph(stat, stat.load_dump_file(
+        write_dump('gcdump9', words)))
+    graph.compute_dominators()
+    assert list(graph.retained) == [280, 20, 30, 220, 180, 130, 70, 280]
+    # A2 is retained by A through D and E: it is not counted a second
+    # time for 'A'
+    assert graph.retained_by_type() == {'A': [2, 70, 280],
+                                        'B': [3, 120, 120],
+                                        'D': [2, 90, 220]}
+
+def test_unreachable_objects():
+    # an object that is in the dump but not reachable from the roots
+    words = WORDS + [600, 1, 60, 100, -1]
+    stat = gcdump.Stat()
+    stat.load_typeids(TYPEIDS)
+    graph = gcdump.HeapGraph(stat, stat.load_dump_file(
+        write_dump('gcdump4', words)))
+    graph.compute_dominators()
+    assert graph.idom[5] == -1
+    assert graph.retained[graph.root] == 150
+    assert graph.retained_by_type()['A'] == [2, 70, 150]
+
+def test_diff(capsys):
+    stat1 = make_stat(write_dump('gcdump5', WORDS))
+    words = WORDS[:-1] + [600, -1, 600, 3, 45, -1]
+    stat2 = make_stat(write_dump('gcdump6', words))
+    capsys.readouterr()
+    gcdump.print_diff(stat1, stat2)
+    out, err = capsys.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert lines[0].split() == ['+1', '+0.00M', 'D']
+    assert lines[1] == 'total +0.0M'
+
+def test_diff_order(capsys):
+    stat1 = make_stat(write_dump('gcdump7', WORDS))
+    stat2 = make_stat(write_dump('gcdump8', WORDS))
+    stat2.summary = {'<GCROOT>': [1, 0], 'A': [1, 10], 'B': [1, 20],
+                     'D': [3, 3*1024*1024]}
+    stat1.summary['C'] = [10, 1024*1024]
+    capsys.readouterr()
+    gcdump.print_diff(stat1, stat2)
+    out, err = capsys.readouterr()
+    names = [line.split()[-1] for line in out.splitlines()[:-1]]
+    assert names == ['D', 'B', 'C']
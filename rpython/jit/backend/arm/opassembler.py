@@ -314,6 +314,9 @@ class ResOpAssembler(BaseAssembler):
             else:
                 self.mc.CMP_rr(r.ip.value, typeid.value, cond=fcond)
 
+    def emit_op_guard_always_fails(self, op, locs, regalloc, fcond):
+        return self._emit_guard(op, locs, c.AL, save_exc=False)
+
     def emit_op_guard_not_invalidated(self, op, locs, regalloc, fcond):
         return self._emit_guard(op, locs, fcond, save_exc=False,
                                             is_guard_not_invalidated=True)
@@ -2264,6 +2264,9 @@ class CompiledBlockASMJS(object):
         test = js.NotEqual(exctyp, js.zero)
         self._genop_guard_failure(test, op)
 
+    def genop_guard_always_fails(self, op):
+        self._genop_guard_failure(js.true, op)
+
     def genop_guard_not_invalidated(self, op):
         translate_support_code = self.cpu.translate_support_code
         offset, size = symbolic.get_field_token(INVALIDATION,
@@ -267,6 +267,7 @@ class GcLLDescr_boehm(GcLLDescription):
     str_type_id           = 0
     unicode_type_id       = 0
     get_malloc_slowpath_addr = None
+    can_pretenure         = False
 
     def is_shadow_stack(self):
         return False
@@ -431,6 +432,7 @@ class GcLLDescr_framework(GcLLDescription):
     DEBUG = False    # forced to True by x86/test/test_zrpy_gc.py
     kind = 'framework'
     round_up = True
+    can_pretenure = False
 
     def is_shadow_stack(self):
         return self.gcrootmap.is_shadow_stack
@@ -499,6 +501,7 @@ class GcLLDescr_framework(GcLLDescription):
         self.gcheaderbuilder = GCHeaderBuilder(self.HDRPTR.TO)
         self.max_size_of_young_obj = self.GCClass.JIT_max_size_of_young_obj()
         self.minimal_size_in_nursery=self.GCClass.JIT_minimal_size_in_nursery()
+        self.can_pretenure = self.GCClass.can_pretenure
 
         # for the fast path of mallocs, the following must be true, at least
         assert self.GCClass.inline_simple_malloc
@@ -603,6 +606,26 @@ class GcLLDescr_framework(GcLLDescription):
         self.generate_function('malloc_big_fixedsize', malloc_big_fixedsize,
                                [lltype.Signed] * 2)
 
+        # allocate a fixed-size object directly as an old object, for the
+        # types that the GC says survive nearly always (see
+        # should_pretenure()).  Not zero-filled, like the nursery.
+        def malloc_fixedsize_old(size, tid):
+            if self.DEBUG:
+                self._random_usage_of_xmm_registers()
+            type_id = llop.extract_ushort(llgroup.HALFWORD, tid)
+            check_typeid(type_id)
+            return llop1.do_malloc_fixedsize_old(llmemory.GCREF,
+                                                 type_id, size)
+        self.generate_function('malloc_fixedsize_old', malloc_fixedsize_old,
+                               [lltype.Signed] * 2)
+
+    def should_pretenure(self, sizedescr):
+        """Should the NEWs of this SizeDescr be compiled to calls to
+        malloc_fixedsize_old()?  Only if 'can_pretenure'.  The GC's answer
+        changes over time; it is asked again for every new loop."""
+        type_id = llop.extract_ushort(llgroup.HALFWORD, sizedescr.tid)
+        return self.llop1.gc_should_pretenure(lltype.Bool, type_id)
+
     def _bh_malloc(self, sizedescr):
         from rpython.memory.gctypelayout import check_typeid
         llop1 = self.llop1
@@ -1,4 +1,5 @@
 import os
+import sys
 from rpython.jit.metainterp.history import Const, Box, REF, JitCellToken
 from rpython.rlib.objectmodel import we_are_translated, specialize
 from rpython.jit.metainterp.resoperation import rop
@@ -274,6 +275,8 @@ class RegisterManager(object):
     no_lower_byte_regs    = []
     save_around_call_regs = []
     frame_reg             = None
+    real_usages           = None       # see set_lifetime_info()
+    call_positions        = None
 
     def __init__(self, longevity, frame_manager=None, assembler=None):
         self.free_regs = self.all_regs[:]
@@ -299,6 +302,34 @@ class RegisterManager(object):
         # Return False if the last usage is before or at position.
         return self.longevity[v][1] > self.position
 
+    def set_lifetime_info(self, real_usages, call_positions):
+        """ Give the result of compute_real_usages().  With it, spill
+        victims are chosen by their next real usage instead of by the end
+        of their live range, and variables that live across a call are
+        kept in callee-saved registers when possible.
+        """
+        self.real_usages = real_usages
+        self.call_positions = call_positions
+
+    def next_real_usage(self, v):
+        """ Return the position of the next operation, starting at the
+        current one, that really needs 'v' (not only as a fail argument
+        or a jump argument), or -1 if there is none.
+        """
+        usages = self.real_usages.get(v, None)
+        if usages is None:
+            return -1
+        i = _bisect_left(usages, self.position)
+        if i == len(usages):
+            return -1
+        return usages[i]
+
+    def _crosses_call(self, v):
+        # does 'v' stay alive across a call after the current position?
+        calls = self.call_positions
+        i = _bisect_left(calls, self.position + 1)
+        return i < len(calls) and calls[i] < self.longevity[v][1]
+
     def next_instruction(self, incr=1):
         self.position += incr
 
@@ -392,10 +423,25 @@ class RegisterManager(object):
             return self.reg_bindings[v]
         except KeyError:
             if self.free_regs:
-                loc = self.free_regs.pop()
+                if self.call_positions is not None and v in self.longevity:
+                    loc = self._pick_free_reg(v)
+                else:
+                    loc = self.free_regs.pop()
                 self.reg_bindings[v] = loc
                 return loc
 
+    def _pick_free_reg(self, v):
+        # variables that live across a call go preferably into a
+        # callee-saved register, and the other ones into a register that
+        # is clobbered by calls anyway
+        want_saved = self._crosses_call(v)
+        for i in range(len(self.free_regs) - 1, -1, -1):
+            reg = self.free_regs[i]
+            if (reg in self.save_around_call_regs) != want_saved:
+                del self.free_regs[i]
+                return reg
+        return self.free_regs.pop()
+
     def _spill_var(self, v, forbidden_vars, selected_reg,
                    need_lower_byte=False):
         v_to_spill = self._pick_variable_to_spill(v, forbidden_vars,
@@ -411,6 +457,9 @@ class RegisterManager(object):
                                 need_lower_byte=False):
         """ Slightly less silly algorithm.
         """
+        if self.real_usages is not None and selected_reg is None:
+            return self._pick_variable_to_spill_by_usage(forbidden_vars,
+                                                         need_lower_byte)
         cur_max_age = -1
         candidate = None
         for next in self.reg_bindings:
@@ -432,6 +481,32 @@ class RegisterManager(object):
             raise NoVariableToSpill
         return candidate
 
+    def _pick_variable_to_spill_by_usage(self, forbidden_vars,
+                                         need_lower_byte):
+        # spill the variable whose next real usage is the furthest away;
+        # a variable that is only needed by guards or by the final jump
+        # from now on is the best candidate, as it can stay in the frame.
+        # Among those, prefer one that is already stored in the frame.
+        cur_max_usage = -1
+        candidate = None
+        for next in self.reg_bindings:
+            if next in forbidden_vars:
+                continue
+            reg = self.reg_bindings[next]
+            if need_lower_byte and reg in self.no_lower_byte_regs:
+                continue
+            usage = self.next_real_usage(next)
+            if usage < 0:
+                usage = sys.maxint - 1
+                if self.frame_manager.get(next) is not None:
+                    usage = sys.maxint
+            if cur_max_usage < usage:
+                cur_max_usage = usage
+                candidate = next
+        if candidate is None:
+            raise NoVariableToSpill
+        return candidate
+
     def force_allocate_reg(self, v, forbidden_vars=[], selected_reg=None,
                            need_lower_byte=False):
         """ Forcibly allocate a register for the new variable v.
@@ -573,13 +648,19 @@ class RegisterManager(object):
             self.assembler.regalloc_mov(reg, to)
         # otherwise it's clean
 
-    def before_call(self, force_store=[], save_all_regs=0):
+    def before_call(self, force_store=[], save_all_regs=0, arglocs=[]):
         """ Spill registers before a call, as described by
         'self.save_around_call_regs'.  Registers are not spilled if
         they don't survive past the current operation, unless they
         are listed in 'force_store'.  'save_all_regs' can be 0 (default),
-        1 (save all), or 2 (save default+PTRs).
+        1 (save all), or 2 (save default+PTRs).  'arglocs' are the
+        locations of the arguments of the call, which must not be
+        overwritten.
         """
+        # only the registers that are free now can receive a variable
+        # that survives the call: the ones freed below may still contain
+        # an argument of the call
+        free_regs = [reg for reg in self.free_regs if reg not in arglocs]
         for v, reg in self.reg_bindings.items():
             if v not in force_store and self.longevity[v][1] <= self.position:
                 # variable dies
@@ -591,10 +672,32 @@ class RegisterManager(object):
                     continue    # we don't have to
                 if v.type != REF:
                     continue    # only save GC pointers
+            if (save_all_regs != 1 and v not in force_store and
+                    self.call_positions is not None and
+                    (save_all_regs == 0 or v.type != REF) and
+                    self._move_to_callee_saved_reg(v, reg, free_regs)):
+                continue
             self._sync_var(v)
             del self.reg_bindings[v]
             self.free_regs.append(reg)
 
+    def _move_to_callee_saved_reg(self, v, reg, free_regs):
+        # instead of spilling 'v' around the call and reloading it later,
+        # move it into a callee-saved register taken from 'free_regs' if
+        # it is needed again
+        if self.next_real_usage(v) <= self.position:
+            return False
+        for i in range(len(free_regs)):
+            newreg = free_regs[i]
+            if newreg not in self.save_around_call_regs:
+                self.assembler.regalloc_mov(reg, newreg)
+                del free_regs[i]
+                self.free_regs.remove(newreg)
+                self.free_regs.append(reg)
+                self.reg_bindings[v] = newreg
+                return True
+        return False
+
     def after_call(self, v):
         """ Adjust registers according to the result of the call,
         which is in variable v.
@@ -727,6 +830,42 @@ def compute_vars_longevity(inputargs, operations):
     assert len(last_used) == 0
     return longevity, last_real_usage
 
+def compute_real_usages(operations):
+    # compute a dictionary that maps variables to the sorted list of
+    # indexes in operations where they are really used, i.e. ignoring
+    # fail arguments and the arguments of JUMP and LABEL; and the sorted
+    # list of indexes of the operations that are calls
+    real_usages = {}
+    call_positions = []
+    for i in range(len(operations)):
+        op = operations[i]
+        opnum = op.getopnum()
+        if op.is_call():
+            call_positions.append(i)
+        if opnum == rop.JUMP or opnum == rop.LABEL:
+            continue
+        for j in range(op.numargs()):
+            arg = op.getarg(j)
+            if not isinstance(arg, Box):
+                continue
+            usages = real_usages.get(arg, None)
+            if usages is None:
+                real_usages[arg] = [i]
+            elif usages[-1] != i:
+                usages.append(i)
+    return real_usages, call_positions
+
+def _bisect_left(lst, value):
+    lo = 0
+    hi = len(lst)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if lst[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 def is_comparison_or_ovf_op(opnum):
     from rpython.jit.metainterp.resoperation import opclasses
     cls = opclasses[opnum]
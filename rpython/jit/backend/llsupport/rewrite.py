@@ -199,7 +199,10 @@ class GcRewriterAssembler(object):
     def handle_new_fixedsize(self, descr, op):
         assert isinstance(descr, SizeDescr)
         size = descr.size
-        if self.gen_malloc_nursery(size, op.result):
+        if (self.gc_ll_descr.can_pretenure and
+                self.gc_ll_descr.should_pretenure(descr)):
+            self.gen_malloc_fixedsize_old(size, descr.tid, op.result)
+        elif self.gen_malloc_nursery(size, op.result):
             self.gen_initialize_tid(op.result, descr.tid)
         else:
             self.gen_malloc_fixedsize(size, descr.tid, op.result)
@@ -407,6 +410,19 @@ class GcRewriterAssembler(object):
         # (this is always true because it's a fixed-size object)
         self.write_barrier_applied[v_result] = None
 
+    def gen_malloc_fixedsize_old(self, size, typeid, v_result):
+        """Generate a CALL_MALLOC_GC(malloc_fixedsize_old_fn, ...), for
+        the objects that the GC wants us to allocate directly as old
+        objects.
+        """
+        addr = self.gc_ll_descr.get_malloc_fn_addr('malloc_fixedsize_old')
+        args = [ConstInt(addr), ConstInt(size), ConstInt(typeid)]
+        descr = self.gc_ll_descr.malloc_fixedsize_old_descr
+        self._gen_call_malloc_gc(args, v_result, descr)
+        # the GC returns the object as if the write barrier had already
+        # been called on it
+        self.write_barrier_applied[v_result] = None
+
     def gen_boehm_malloc_array(self, arraydescr, v_num_elem, v_result):
         """Generate a CALL_MALLOC_GC(malloc_array_fn, ...) for Boehm."""
         addr = self.gc_ll_descr.get_malloc_fn_addr('malloc_array')
@@ -2,6 +2,7 @@ import py
 from rpython.jit.metainterp.history import BoxInt, ConstInt, BoxFloat, INT, FLOAT,\
      BoxPtr
 from rpython.jit.backend.llsupport.regalloc import FrameManager, LinkedList
+from rpython.jit.backend.llsupport.regalloc import compute_real_usages
 from rpython.jit.backend.llsupport.regalloc import RegisterManager as BaseRegMan
 
 def newboxes(*values):
@@ -378,6 +379,134 @@ class TestRegalloc(object):
         rm._check_invariants()
 
 
+    def test_compute_real_usages(self):
+        from rpython.jit.tool.oparser import parse
+        loop = parse('''
+        [i0, i1]
+        i2 = int_add(i0, i0)
+        guard_true(i2) [i0, i1]
+        i3 = call(123, i2, descr=calldescr)
+        i4 = int_sub(i3, i0)
+        jump(i4, i1)
+        ''', namespace={'calldescr': None})
+        i0, i1 = loop.inputargs
+        i2 = loop.operations[0].result
+        i3 = loop.operations[2].result
+        real_usages, call_positions = compute_real_usages(loop.operations)
+        assert real_usages[i0] == [0, 3]
+        assert real_usages[i2] == [1, 2]
+        assert real_usages[i3] == [3]
+        assert i1 not in real_usages     # only in failargs and in the jump
+        assert call_positions == [2]
+
+    def test_spilling_by_next_usage(self):
+        b0, b1, b2, b3, b4 = newboxes(0, 1, 2, 3, 4)
+        longevity = {b0: (0, 8), b1: (0, 5), b2: (0, 6), b3: (0, 7),
+                     b4: (1, 3)}
+        # b0 is only needed by a guard or a jump at position 8, so it
+        # is spilled first even though it lives the longest
+        real_usages = {b1: [5], b2: [6], b3: [2, 7], b4: [3]}
+        fm = TFrameManager()
+        asm = MockAsm()
+        rm = RegisterManager(longevity, frame_manager=fm, assembler=asm)
+        rm.set_lifetime_info(real_usages, [])
+        rm.next_instruction()
+        for b in b0, b1, b2, b3:
+            rm.force_allocate_reg(b)
+        loc0 = rm.loc(b0)
+        rm.next_instruction()
+        assert rm.next_real_usage(b3) == 2
+        assert rm.next_real_usage(b0) == -1
+        assert rm.force_allocate_reg(b4) is loc0
+        assert rm.loc(b0) == fm.loc(b0)
+        # next, b2 is spilled: b1 and b3 are needed sooner
+        loc2 = rm.loc(b2)
+        b5, = newboxes(5)
+        longevity[b5] = (1, 3)
+        assert rm.force_allocate_reg(b5, [b4]) is loc2
+        rm._check_invariants()
+
+    def test_call_crossing_registers(self):
+        class XRegisterManager(RegisterManager):
+            save_around_call_regs = [r0, r1]
+
+            def call_result_location(self, v):
+                return r0
+
+        b0, b1, b2 = newboxes(0, 1, 2)
+        longevity = {b0: (0, 3), b1: (0, 1), b2: (2, 4)}
+        real_usages = {b0: [3], b1: [1], b2: [4]}
+        fm = TFrameManager()
+        asm = MockAsm()
+        rm = XRegisterManager(longevity, frame_manager=fm, assembler=asm)
+        rm.set_lifetime_info(real_usages, [2])
+        rm.next_instruction()
+        # b0 lives across the call at position 2, but b1 does not
+        assert rm.force_allocate_reg(b0) in (r2, r3)
+        assert rm.force_allocate_reg(b1) in (r0, r1)
+        rm._check_invariants()
+
+    def test_call_moves_to_callee_saved_reg(self):
+        class XRegisterManager(RegisterManager):
+            save_around_call_regs = [r0, r1]
+
+            def call_result_location(self, v):
+                return r0
+
+        b0, b1, b2, b3 = newboxes(0, 1, 2, 3)
+        longevity = {b0: (0, 3), b1: (0, 3), b2: (0, 4), b3: (1, 2)}
+        real_usages = {b0: [3], b2: [4]}
+        fm = TFrameManager()
+        asm = MockAsm()
+        rm = XRegisterManager(longevity, frame_manager=fm, assembler=asm)
+        rm.next_instruction()
+        rm.force_allocate_reg(b0, selected_reg=r0)
+        rm.force_allocate_reg(b1, selected_reg=r1)
+        rm.force_allocate_reg(b2, selected_reg=r2)
+        rm.set_lifetime_info(real_usages, [1])
+        rm.next_instruction()
+        rm.before_call()
+        # b0 is needed after the call: moved to the free callee-saved r3.
+        # b1 is only needed by a guard or a jump: stored in the frame.
+        assert rm.reg_bindings[b0] is r3
+        assert asm.moves == [(r0, r3), (r1, fm.loc(b1))]
+        assert b1 not in rm.reg_bindings
+        assert rm.reg_bindings[b2] is r2
+        rm._check_invariants()
+        rm.after_call(b3)
+        assert rm.reg_bindings[b3] is r0
+        rm._check_invariants()
+
+    def test_call_does_not_reuse_reg_of_dying_argument(self):
+        class XRegisterManager(RegisterManager):
+            save_around_call_regs = [r0, r1]
+
+            def call_result_location(self, v):
+                return r0
+
+        b0, b1, b2, b3, b4 = newboxes(0, 1, 2, 3, 4)
+        # b1 is an argument of the call at position 1 and dies there;
+        # b0 is needed after the call, and r2 is free but holds the
+        # value of an argument too
+        longevity = {b0: (0, 3), b1: (0, 1), b3: (0, 3), b4: (1, 2)}
+        real_usages = {b0: [3], b1: [1], b3: [3]}
+        fm = TFrameManager()
+        asm = MockAsm()
+        rm = XRegisterManager(longevity, frame_manager=fm, assembler=asm)
+        rm.next_instruction()
+        rm.force_allocate_reg(b0, selected_reg=r0)
+        rm.force_allocate_reg(b1, selected_reg=r3)
+        rm.force_allocate_reg(b3, selected_reg=r1)
+        rm.set_lifetime_info(real_usages, [1])
+        rm.next_instruction()
+        rm.before_call(arglocs=[r3, r2])
+        # neither r3 nor r2 may receive b0 or b3: they are stored in the
+        # frame instead
+        assert sorted(asm.moves) == sorted([(r0, fm.loc(b0)),
+                                            (r1, fm.loc(b3))])
+        assert not rm.reg_bindings
+        rm._check_invariants()
+
     def test_hint_frame_locations_1(self):
         for hint_value in range(11):
             b0, = newboxes(0)
@@ -547,6 +547,26 @@ class TestFramework(RewriteTests):
             jump()
         """)
 
+    def test_new_pretenured(self):
+        self.gc_ll_descr.can_pretenure = True
+        self.gc_ll_descr.should_pretenure = lambda descr: descr.tid == 5678
+        self.check_rewrite("""
+            [p1]
+            p0 = new(descr=tdescr)
+            setfield_gc(p0, p1, descr=tzdescr)
+            p2 = new(descr=sdescr)
+            jump()
+        """, """
+            [p1]
+            p0 = call_malloc_gc(ConstClass(malloc_fixedsize_old), \
+                                %(tdescr.size)d, 5678,            \
+                                descr=malloc_fixedsize_old_descr)
+            setfield_gc(p0, p1, descr=tzdescr)
+            p2 = call_malloc_nursery(%(sdescr.size)d)
+            setfield_gc(p2, 1234, descr=tiddescr)
+            jump()
+        """)
+
     def test_rewrite_assembler_newstr_newunicode(self):
         self.check_rewrite("""
             [i2]
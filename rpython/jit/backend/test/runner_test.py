@@ -3281,6 +3281,36 @@ class LLtypeBackendTest(BaseBackendTest):
         print 'step 4 ok'
         print '-'*79
 
+    def test_guard_always_fails(self):
+        i0 = BoxInt()
+        i1 = BoxInt()
+        faildescr = BasicFailDescr(1)
+        ops = [
+            ResOperation(rop.INT_ADD, [i0, ConstInt(1)], i1),
+            ResOperation(rop.GUARD_ALWAYS_FAILS, [], None, descr=faildescr),
+            ResOperation(rop.FINISH, [i0], None, descr=BasicFinalDescr(0))
+        ]
+        ops[1].setfailargs([i1])
+        looptoken = JitCellToken()
+        self.cpu.compile_loop([i0], ops, looptoken)
+
+        deadframe = self.cpu.execute_token(looptoken, 41)
+        fail = self.cpu.get_latest_descr(deadframe)
+        assert fail is faildescr
+        assert self.cpu.get_int_value(deadframe, 0) == 42
+
+        # attach a bridge
+        i2 = BoxInt()
+        ops = [
+            ResOperation(rop.FINISH, [i2], None, descr=BasicFinalDescr(3))
+        ]
+        self.cpu.compile_bridge(faildescr, [i2], ops, looptoken)
+
+        deadframe = self.cpu.execute_token(looptoken, 41)
+        fail = self.cpu.get_latest_descr(deadframe)
+        assert fail.identifier == 3
+        assert self.cpu.get_int_value(deadframe, 0) == 42
+
     def test_guard_not_invalidated_and_label(self):
         # test that the guard_not_invalidated reserves enough room before
         # the label.  If it doesn't, then in this example after we invalidate
@@ -1609,6 +1609,10 @@ class Assembler386(BaseAssembler):
         self.mc.CMP(heap(self.cpu.pos_exception()), imm0)
         self.implement_guard(guard_token, 'NZ')
 
+    def genop_guard_guard_always_fails(self, ign_1, guard_op, guard_token,
+                                       locs, ign_2):
+        self.implement_guard(guard_token)
+
     def genop_guard_guard_not_invalidated(self, ign_1, guard_op, guard_token,
                                      locs, ign_2):
         pos = self.mc.get_relative_pos() + 1 # after potential jmp
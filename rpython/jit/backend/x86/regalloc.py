@@ -8,8 +8,8 @@ from rpython.jit.backend.llsupport.descr import (ArrayDescr, CallDescr,
     unpack_arraydescr, unpack_fielddescr, unpack_interiorfielddescr)
 from rpython.jit.backend.llsupport.gcmap import allocate_gcmap
 from rpython.jit.backend.llsupport.regalloc import (FrameManager, BaseRegalloc,
-     RegisterManager, TempBox, compute_vars_longevity, is_comparison_or_ovf_op,
-     valid_addressing_size)
+     RegisterManager, TempBox, compute_vars_longevity, compute_real_usages,
+     is_comparison_or_ovf_op, valid_addressing_size)
 from rpython.jit.backend.x86 import rx86
 from rpython.jit.backend.x86.arch import (WORD, JITFRAME_FIXED_SIZE, IS_X86_32,
     IS_X86_64)
@@ -148,6 +148,11 @@ class RegAlloc(BaseRegalloc):
                                   assembler = self.assembler)
         self.xrm = xmm_reg_mgr_cls(self.longevity, frame_manager = self.fm,
                                    assembler = self.assembler)
+        # next-use positions, to pick spill victims and to keep variables
+        # that live across calls in callee-saved registers
+        real_usages, call_positions = compute_real_usages(operations)
+        self.rm.set_lifetime_info(real_usages, call_positions)
+        self.xrm.set_lifetime_info(real_usages, call_positions)
         return operations
 
     def prepare_loop(self, inputargs, operations, looptoken, allgcrefs):
@@ -407,6 +412,7 @@ class RegAlloc(BaseRegalloc):
 
     consider_guard_no_overflow = consider_guard_no_exception
     consider_guard_overflow    = consider_guard_no_exception
+    consider_guard_always_fails = consider_guard_no_exception
 
     def consider_guard_value(self, op):
         x = self.make_sure_var_in_reg(op.getarg(0))
@@ -724,7 +730,8 @@ class RegAlloc(BaseRegalloc):
         #    callee-saved registers.
         #
         save_all_regs = guard_not_forced_op is not None
-        self.xrm.before_call(force_store, save_all_regs=save_all_regs)
+        self.xrm.before_call(force_store, save_all_regs=save_all_regs,
+                             arglocs=arglocs)
         if not save_all_regs:
             gcrootmap = self.assembler.cpu.gc_ll_descr.gcrootmap
             # we save all the registers for shadowstack and asmgcc for now
@@ -733,7 +740,8 @@ class RegAlloc(BaseRegalloc):
             # more for now.
             if gcrootmap: # and gcrootmap.is_shadow_stack:
                 save_all_regs = 2
-        self.rm.before_call(force_store, save_all_regs=save_all_regs)
+        self.rm.before_call(force_store, save_all_regs=save_all_regs,
+                            arglocs=arglocs)
         if op.result is not None:
             if op.result.type == FLOAT:
                 resloc = self.xrm.after_call(op.result)
@@ -1173,8 +1181,9 @@ class RegAlloc(BaseRegalloc):
             length_box = bytes_box
             length_loc = bytes_loc
         # call memcpy()
-        self.rm.before_call()
-        self.xrm.before_call()
+        arglocs = [dstaddr_loc, srcaddr_loc, length_loc]
+        self.rm.before_call(arglocs=arglocs)
+        self.xrm.before_call(arglocs=arglocs)
         self.assembler.simple_call_no_collect(imm(self.assembler.memcpy_addr),
                                         [dstaddr_loc, srcaddr_loc, length_loc])
         self.rm.possibly_free_var(length_box)
@@ -1430,8 +1439,9 @@ class RegAlloc(BaseRegalloc):
                     length_loc = bytes_loc
             #
             # call memset()
-            self.rm.before_call()
-            self.xrm.before_call()
+            arglocs = [dstaddr_loc, imm0, length_loc]
+            self.rm.before_call(arglocs=arglocs)
+            self.xrm.before_call(arglocs=arglocs)
             self.assembler.simple_call_no_collect(
                 imm(self.assembler.memset_addr),
                 [dstaddr_loc, imm0, length_loc])
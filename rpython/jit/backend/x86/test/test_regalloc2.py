@@ -611,3 +611,54 @@ def test_bug_2():
     cpu.compile_bridge(faildescr10, inputargs, operations, looptoken)
     frame = cpu.execute_token(looptoken, *loop_args)
     #assert cpu.get_int_value(frame, 0) == 10
+
+def test_call_argument_dies_next_to_live_caller_saved_var():
+    # At the second call, the argument 'i8' is in a callee-saved register
+    # (because it lives across the first call) and dies there, while 'i7', 'i21' and 'i24' to 'i26' live across the call
+    # and don't all fit in the other callee-saved registers.  Moving one of them to the
+    # callee-saved register of 'i8' would overwrite the argument.
+    def f1(x):
+        return x + 1
+    F1PTR = lltype.Ptr(lltype.FuncType([lltype.Signed], lltype.Signed))
+    f1ptr = llhelper(F1PTR, f1)
+    cpu = CPU(None, None)
+    cpu.setup_once()
+    f1_calldescr = cpu.calldescrof(F1PTR.TO, F1PTR.TO.ARGS, F1PTR.TO.RESULT,
+                                   EffectInfo.MOST_GENERAL)
+    # the result depends on the order in which before_call() sees the
+    # variables, so try several times with new boxes
+    for i in range(10):
+        loop = parse('''
+        [i0, i1, i2, i3, i4]
+        i10 = int_add(i0, 1)
+        i11 = int_add(i1, 1)
+        i12 = int_add(i2, 1)
+        i13 = int_add(i3, 1)
+        i8 = int_xor(i4, 3)
+        i6 = call(ConstClass(f1ptr), i10, descr=f1_calldescr)
+        i7 = int_add(i6, 1)
+        i21 = int_add(i6, 2)
+        i24 = int_add(i6, 3)
+        i25 = int_add(i6, 4)
+        i26 = int_add(i6, 5)
+        i9 = call(ConstClass(f1ptr), i8, descr=f1_calldescr)
+        i14 = int_mul(i7, 1000)
+        i15 = int_add(i14, i9)
+        i16 = int_add(i10, i11)
+        i17 = int_add(i12, i13)
+        i18 = int_add(i16, i17)
+        i19 = int_mul(i18, 1000000)
+        i20 = int_add(i15, i19)
+        i22 = int_mul(i21, 1000000000)
+        i23 = int_add(i20, i22)
+        i27 = int_add(i24, i25)
+        i28 = int_add(i27, i26)
+        i29 = int_mul(i28, 1000000000000)
+        i30 = int_add(i23, i29)
+        finish(i30)
+        ''', cpu, namespace={'f1ptr': f1ptr, 'f1_calldescr': f1_calldescr})
+        looptoken = JitCellToken()
+        cpu.compile_loop(loop.inputargs, loop.operations, looptoken)
+        frame = cpu.execute_token(looptoken, 10, 20, 30, 40, 50)
+        # i28 == 48, i21 == 14, i18 == 104, i7 == 13, i9 == 50
+        assert cpu.get_int_value(frame, 0) == 48014104013050
@@ -1482,7 +1482,7 @@ class BlackholeInterpreter(object):
     def _prepare_resume_from_failure(self, opnum, deadframe):
         from rpython.jit.metainterp.resoperation import rop
         #
-        if opnum == rop.GUARD_FUTURE_CONDITION:
+        if opnum == rop.GUARD_FUTURE_CONDITION or opnum == rop.GUARD_ALWAYS_FAILS:
             pass
         elif opnum == rop.GUARD_TRUE:
             # Produced directly by some goto_if_not_xxx() opcode that did not
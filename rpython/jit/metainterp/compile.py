@@ -1,3 +1,4 @@
+import sys
 import weakref
 from rpython.rtyper.lltypesystem import lltype, llmemory
 from rpython.rtyper.annlowlevel import cast_instance_to_gcref
@@ -187,6 +188,48 @@ def compile_loop(metainterp, greenkey, start,
     record_loop_or_bridge(metainterp_sd, loop)
     return all_target_tokens[0]
 
+def compile_segment(metainterp, greenkey, start, inputargs):
+    """Compile the history, which ends in a GUARD_ALWAYS_FAILS followed by
+    a FINISH, as the first segment of a loop that is too long to be traced
+    in one go.  It gets a LABEL at the start but is not unrolled, so that
+    the bridges traced from the guard can later jump back to it.
+    """
+    from rpython.jit.metainterp.optimizeopt import optimize_trace
+
+    metainterp_sd = metainterp.staticdata
+    jitdriver_sd = metainterp.jitdriver_sd
+    history = metainterp.history
+
+    enable_opts = jitdriver_sd.warmstate.enable_opts
+    if 'unroll' in enable_opts:
+        enable_opts = enable_opts.copy()
+        del enable_opts['unroll']
+
+    jitcell_token = make_jitcell_token(jitdriver_sd)
+    # never retrace: bridges that reach the loop header again jump
+    # directly to the start of the segment (see unroll.py)
+    jitcell_token.retraced_count = sys.maxint
+    loop = create_empty_loop(metainterp)
+    loop.inputargs = inputargs[:]
+    target_token = TargetToken(jitcell_token)
+    label = ResOperation(rop.LABEL, inputargs, None, descr=target_token)
+    loop.operations = [label] + history.operations[start:]
+    try:
+        optimize_trace(metainterp_sd, jitdriver_sd, loop, enable_opts)
+    except InvalidLoop:
+        return None
+    assert loop.operations[-1].getopnum() == rop.FINISH
+
+    for box in loop.inputargs:
+        assert isinstance(box, Box)
+    loop.original_jitcell_token = jitcell_token
+    jitcell_token.target_tokens = [target_token]
+    propagate_original_jitcell_token(loop)
+    send_loop_to_backend(greenkey, jitdriver_sd, metainterp_sd, loop,
+                         "segment")
+    record_loop_or_bridge(metainterp_sd, loop)
+    return target_token
+
 def compile_retrace(metainterp, greenkey, start,
                     inputargs, jumpargs,
                     partial_trace, resumekey, start_state):
@@ -326,6 +369,7 @@ def send_loop_to_backend(greenkey, jitdriver_sd, metainterp_sd, loop, type):
 
     original_jitcell_token = loop.original_jitcell_token
     loopname = jitdriver_sd.warmstate.get_location_str(greenkey)
+    original_jitcell_token.location = loopname
     globaldata = metainterp_sd.globaldata
     original_jitcell_token.number = n = globaldata.loopnumbering
     globaldata.loopnumbering += 1
@@ -370,7 +414,15 @@ def send_loop_to_backend(greenkey, jitdriver_sd, metainterp_sd, loop, type):
                                       name=loopname)
     #
     if metainterp_sd.warmrunnerdesc is not None:    # for tests
-        metainterp_sd.warmrunnerdesc.memory_manager.keep_loop_alive(original_jitcell_token)
+        memmgr = metainterp_sd.warmrunnerdesc.memory_manager
+        memmgr.keep_loop_alive(original_jitcell_token)
+        memmgr.record_code_size(original_jitcell_token, _get_asmlen(asminfo),
+                                len(operations))
+
+def _get_asmlen(asminfo):
+    if asminfo is None:
+        return 0
+    return asminfo.asmlen
 
 def send_bridge_to_backend(jitdriver_sd, metainterp_sd, faildescr, inputargs,
                            operations, original_loop_token):
@@ -414,6 +466,10 @@ def send_bridge_to_backend(jitdriver_sd, metainterp_sd, faildescr, inputargs,
     #if metainterp_sd.warmrunnerdesc is not None:    # for tests
     #    metainterp_sd.warmrunnerdesc.memory_manager.keep_loop_alive(
     #        original_loop_token)
+    if metainterp_sd.warmrunnerdesc is not None:    # for tests
+        memmgr = metainterp_sd.warmrunnerdesc.memory_manager
+        memmgr.record_code_size(original_loop_token, _get_asmlen(asminfo),
+                                len(operations))
 
 # ____________________________________________________________
 
@@ -484,12 +540,22 @@ def make_done_loop_tokens():
     d.update(locals())
     return d
 
+# how much faster the jitcounter of a guard ticks, per extra frame or
+# virtual that a failure has to rebuild, and the upper bound for it.
+# The resulting increment is kept below RESUME_COST_MAX_INCREMENT: the
+# first failure of a guard is never enough to compile a bridge just
+# because it is expensive.
+RESUME_COST_WEIGHT = 0.25
+RESUME_COST_MAX_FACTOR = 4.0
+RESUME_COST_MAX_INCREMENT = 0.5
+
 class ResumeDescr(AbstractFailDescr):
     _attrs_ = ()
 
 class ResumeGuardDescr(ResumeDescr):
     _attrs_ = ('rd_numb', 'rd_count', 'rd_consts', 'rd_virtuals',
-               'rd_frame_info_list', 'rd_pendingfields', 'status')
+               'rd_frame_info_list', 'rd_pendingfields', 'status',
+               'fail_count')
     
     rd_numb = lltype.nullptr(NUMBERING)
     rd_count = 0
@@ -499,6 +565,7 @@ class ResumeGuardDescr(ResumeDescr):
     rd_pendingfields = lltype.nullptr(PENDINGFIELDSP.TO)
 
     status = r_uint(0)
+    fail_count = 0
 
     def copy_all_attributes_from(self, other):
         assert isinstance(other, ResumeGuardDescr)
@@ -508,7 +575,7 @@ class ResumeGuardDescr(ResumeDescr):
         self.rd_pendingfields = other.rd_pendingfields
         self.rd_virtuals = other.rd_virtuals
         self.rd_numb = other.rd_numb
-        # we don't copy status
+        # we don't copy status and fail_count
 
     ST_BUSY_FLAG    = 0x01     # if set, busy tracing from the guard
     ST_TYPE_MASK    = 0x06     # mask for the type (TY_xxx)
@@ -531,6 +598,7 @@ class ResumeGuardDescr(ResumeDescr):
             self.status = hash & self.ST_SHIFT_MASK
 
     def handle_fail(self, deadframe, metainterp_sd, jitdriver_sd):
+        self.count_failure(metainterp_sd)
         if self.must_compile(deadframe, metainterp_sd, jitdriver_sd):
             self.start_compiling()
             try:
@@ -543,6 +611,22 @@ class ResumeGuardDescr(ResumeDescr):
             resume_in_blackhole(metainterp_sd, jitdriver_sd, self, deadframe)
         assert 0, "unreachable"
 
+    def count_failure(self, metainterp_sd):
+        # count the failures that don't go to a bridge, i.e. the ones
+        # that are handled by tracing or by the blackhole interpreter
+        if self.fail_count == 0:
+            if metainterp_sd.warmrunnerdesc is not None:    # for tests
+                memmgr = metainterp_sd.warmrunnerdesc.memory_manager
+                memmgr.record_guard_failure(self)
+        self.fail_count += 1
+
+    def get_jitcell_token(self):
+        # the JitCellToken of the loop this guard is in, or None
+        clt = self.rd_loop_token
+        if clt is None or clt.loop_token_wref is None:
+            return None
+        return clt.loop_token_wref()
+
     def _trace_and_compile_from_bridge(self, deadframe, metainterp_sd,
                                        jitdriver_sd):
         # 'jitdriver_sd' corresponds to the outermost one, i.e. the one
@@ -597,8 +681,33 @@ class ResumeGuardDescr(ResumeDescr):
                           intval * 1442968193)
         #
         increment = jitdriver_sd.warmstate.increment_trace_eagerness
+        if increment < RESUME_COST_MAX_INCREMENT:
+            increment *= self._compute_resume_cost_factor()
+            if increment > RESUME_COST_MAX_INCREMENT:
+                increment = RESUME_COST_MAX_INCREMENT
         return jitcounter.tick(hash, increment)
 
+    def _compute_resume_cost_factor(self):
+        # Failing guards that don't have a bridge yet are resumed by
+        # decoding the resume data and running the blackhole interpreter,
+        # whose cost grows with the number of frames and virtuals to
+        # rebuild.  Make the jitcounter tick faster for such guards, so
+        # that they get a bridge sooner.  This is only called when such
+        # a guard fails, so it is not worth storing the result.
+        cost = 0
+        frame_info = self.rd_frame_info_list
+        while frame_info is not None:
+            cost += 1
+            frame_info = frame_info.prev
+        if self.rd_virtuals is not None:
+            cost += len(self.rd_virtuals)
+        if cost <= 1:
+            return 1.0
+        factor = 1.0 + (cost - 1) * RESUME_COST_WEIGHT
+        if factor > RESUME_COST_MAX_FACTOR:
+            factor = RESUME_COST_MAX_FACTOR
+        return factor
+
     def get_index_of_guard_value(self):
         if (self.status & self.ST_TYPE_MASK) == 0:
             return -1
@@ -685,6 +794,9 @@ class ResumeGuardNotInvalidated(ResumeGuardDescr):
 class ResumeAtPositionDescr(ResumeGuardDescr):
     guard_opnum = rop.GUARD_FUTURE_CONDITION
 
+class ResumeGuardAlwaysFailsDescr(ResumeGuardDescr):
+    guard_opnum = rop.GUARD_ALWAYS_FAILS
+
 class AllVirtuals:
     llopaque = True
     cache = None
@@ -717,6 +829,7 @@ class ResumeGuardForcedDescr(ResumeGuardDescr):
         # the virtualrefs and virtualizable have been forced by
         # handle_async_forcing() just a moment ago.
         from rpython.jit.metainterp.blackhole import resume_in_blackhole
+        self.count_failure(metainterp_sd)
         hidden_all_virtuals = metainterp_sd.cpu.get_savedata_ref(deadframe)
         obj = AllVirtuals.show(metainterp_sd.cpu, hidden_all_virtuals)
         all_virtuals = obj.cache
@@ -776,6 +889,8 @@ def invent_fail_descr_for_op(opnum, optimizer):
         resumedescr = ResumeGuardNotInvalidated()
     elif opnum == rop.GUARD_FUTURE_CONDITION:
         resumedescr = ResumeAtPositionDescr()
+    elif opnum == rop.GUARD_ALWAYS_FAILS:
+        resumedescr = ResumeGuardAlwaysFailsDescr()
     elif opnum == rop.GUARD_VALUE:
         resumedescr = ResumeGuardValueDescr()
     elif opnum == rop.GUARD_NONNULL:
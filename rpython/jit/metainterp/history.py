@@ -150,6 +150,7 @@ class AbstractDescr(AbstractValue):
 class AbstractFailDescr(AbstractDescr):
     index = -1
     final_descr = False
+    rd_loop_token = None
 
     _attrs_ = ('adr_jump_offset', 'rd_locs', 'rd_loop_token',
                '_asmjs_block', '_asmjs_faillocs', '_asmjs_failkinds',
@@ -568,6 +569,10 @@ class JitCellToken(AbstractDescr):
     # and more data specified by the backend when the loop is compiled
     number = -1
     generation = r_int64(0)
+    code_size = 0     # estimated, see memmgr.py
+    dying_loop = None # see memmgr.py
+    entry_count = 0   # number of times we entered it from the interpreter
+    location = ''     # printable location of the greenkey
     # one purpose of LoopToken is to keep alive the CompiledLoopToken
     # returned by the backend.  When the LoopToken goes away, the
     # CompiledLoopToken has its __del__ called, which frees the assembler
@@ -11,7 +11,7 @@ from rpython.rlib.jit import Counters
 
 JITPROF_LINES = Counters.ncounters + 1 + 1
 # one for TOTAL, 1 for calls, update if needed
-_CPU_LINES = 4       # the last 4 lines are stored on the cpu
+_CPU_LINES = 6       # the last 6 lines are stored on the cpu and memmgr
 
 class BaseProfiler(object):
     pass
@@ -56,6 +56,7 @@ class Profiler(BaseProfiler):
     calls = 0
     current = None
     cpu = None
+    memmgr = None
 
     def start(self):
         self.starttime = self.timer()
@@ -107,6 +108,10 @@ class Profiler(BaseProfiler):
             return self.cpu.tracker.total_freed_loops
         elif num == Counters.TOTAL_FREED_BRIDGES:
             return self.cpu.tracker.total_freed_bridges
+        elif num == Counters.ALIVE_CODE_SIZE:
+            return self.memmgr.alive_code_size
+        elif num == Counters.TOTAL_EVICTED_LOOPS:
+            return self.memmgr.total_evicted_loops
         return self.counters[num]
 
     def count_ops(self, opnum, kind=Counters.OPS):
@@ -145,9 +150,13 @@ class Profiler(BaseProfiler):
         self._print_intline("abort: bad loop", cnt[Counters.ABORT_BAD_LOOP])
         self._print_intline("abort: force quasi-immut",
                             cnt[Counters.ABORT_FORCE_QUASIIMMUT])
+        self._print_intline("abort: segmented trace",
+                            cnt[Counters.ABORT_SEGMENTED_TRACE])
         self._print_intline("nvirtuals", cnt[Counters.NVIRTUALS])
         self._print_intline("nvholes", cnt[Counters.NVHOLES])
         self._print_intline("nvreused", cnt[Counters.NVREUSED])
+        self._print_intline("resume nums", cnt[Counters.NRESUMENUMS])
+        self._print_intline("resume shared", cnt[Counters.NRESUMESHARED])
         cpu = self.cpu
         if cpu is not None:   # for some tests
             self._print_intline("Total # of loops",
@@ -158,6 +167,11 @@ class Profiler(BaseProfiler):
                                 cpu.tracker.total_freed_loops)
             self._print_intline("Freed # of bridges",
                                 cpu.tracker.total_freed_bridges)
+        memmgr = self.memmgr
+        if memmgr is not None:   # for some tests
+            self._print_intline("Alive code size", memmgr.alive_code_size)
+            self._print_intline("Evicted # of loops",
+                                memmgr.total_evicted_loops)
 
     def _print_line_time(self, string, i, tim):
         final = "%s:%s\t%d\t%f" % (string, " " * max(0, 13-len(string)), i, tim)
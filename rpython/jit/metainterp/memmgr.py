@@ -1,7 +1,8 @@
-import math
+import math, weakref
 from rpython.rlib.rarithmetic import r_int64
 from rpython.rlib.debug import debug_start, debug_print, debug_stop
 from rpython.rlib.objectmodel import we_are_translated
+from rpython.rlib.listsort import make_timsort_class
 
 #
 # Logic to decide which loops are old and not used any more.
@@ -19,6 +20,35 @@ from rpython.rlib.objectmodel import we_are_translated
 # 'generation' field is much smaller than the current generation, and
 # removed from the set.
 #
+# In addition, we keep track of the (estimated) size of the machine code
+# and metadata of all the loops that are not freed yet.  A loop removed
+# from 'alive_loops' may still be referenced from elsewhere, e.g. from a
+# running frame or from another loop that jumps to it; so its size is
+# only subtracted when its LoopToken really goes away, which we see
+# with a weakref in 'dying_loops'.  If a maximum code size is set and
+# the loops in 'alive_loops' grow above it, the ones that were least
+# recently entered (i.e. with the smallest 'generation') are removed
+# from the set, until we are back to 3/4 of the maximum.
+#
+
+# a rough estimate of the metadata (descrs, resume data) kept per
+# operation; this is also all we count with backends that don't report
+# the size of the machine code, like the llgraph backend
+OP_METADATA_SIZE = 16
+
+_BaseGenerationSort = make_timsort_class()
+class GenerationSort(_BaseGenerationSort):
+    def lt(self, a, b):
+        return a.generation < b.generation
+
+
+class DyingLoop(object):
+    # a loop removed from 'alive_loops', whose code is not freed yet
+    def __init__(self, looptoken):
+        self.looptoken_wref = weakref.ref(looptoken)
+        self.code_size = looptoken.code_size
+        self.revived = False
+
 
 class MemoryManager(object):
 
@@ -38,6 +68,14 @@ class MemoryManager(object):
         self.current_generation = r_int64(1)
         self.next_check = r_int64(-1)
         self.alive_loops = {}
+        self.max_code_size = 0
+        self.alive_code_size = 0     # including the dying loops
+        self.dying_loops = []
+        self.dying_code_size = 0
+        self.total_evicted_loops = 0
+        # weakrefs to the guard descrs that failed at least once
+        self.failing_guards = []
+        self.failing_guards_limit = 100
 
     def set_max_age(self, max_age, check_frequency=0):
         if max_age <= 0:
@@ -55,10 +93,88 @@ class MemoryManager(object):
             self._kill_old_loops_now()
             self.next_check = self.current_generation + self.check_frequency
 
+    def set_max_code_size(self, max_code_size):
+        if max_code_size <= 0:
+            self.max_code_size = 0
+        else:
+            self.max_code_size = max_code_size
+            self._check_code_size(None)
+
     def keep_loop_alive(self, looptoken):
+        # check this first: _evict_loops_now() can evict a loop that was
+        # already entered in the current generation
+        if looptoken not in self.alive_loops:
+            dying = looptoken.dying_loop
+            if dying is not None:
+                # its code was not freed, and is still counted
+                looptoken.dying_loop = None
+                dying.revived = True
+                self.dying_code_size -= dying.code_size
+            else:
+                self.alive_code_size += looptoken.code_size
+            self.alive_loops[looptoken] = None
         if looptoken.generation != self.current_generation:
             looptoken.generation = self.current_generation
-            self.alive_loops[looptoken] = None
+
+    def record_code_size(self, looptoken, asmlen, num_ops):
+        # called after a loop or a bridge was compiled for 'looptoken'
+        size = asmlen + num_ops * OP_METADATA_SIZE
+        looptoken.code_size += size
+        self.alive_code_size += size
+        if self.dying_loops:
+            self._free_dead_loops()
+        if looptoken in self.alive_loops:
+            self._check_code_size(looptoken)
+        elif looptoken.dying_loop is not None:
+            looptoken.dying_loop.code_size += size
+            self.dying_code_size += size
+        else:
+            self._add_dying_loop(looptoken)
+
+    def _check_code_size(self, keep):
+        # the dying loops can't be evicted again: only look at the others
+        if (0 < self.max_code_size <
+                self.alive_code_size - self.dying_code_size):
+            self._evict_loops_now(keep)
+
+    def record_guard_failure(self, descr):
+        # called the first time that 'descr' fails
+        if len(self.failing_guards) >= self.failing_guards_limit:
+            self.failing_guards = [wref for wref in self.failing_guards
+                                        if wref() is not None]
+            self.failing_guards_limit = max(100, 2 * len(self.failing_guards))
+        self.failing_guards.append(weakref.ref(descr))
+
+    def get_failing_guards(self):
+        result = []
+        for wref in self.failing_guards:
+            descr = wref()
+            if descr is not None:
+                result.append(descr)
+        return result
+
+    def _forget_loop(self, looptoken):
+        del self.alive_loops[looptoken]
+        self._add_dying_loop(looptoken)
+
+    def _add_dying_loop(self, looptoken):
+        dying = DyingLoop(looptoken)
+        looptoken.dying_loop = dying
+        self.dying_loops.append(dying)
+        self.dying_code_size += dying.code_size
+
+    def _free_dead_loops(self):
+        # subtract the size of the dying loops that really went away
+        dying_loops = []
+        for dying in self.dying_loops:
+            if dying.revived:
+                continue
+            if dying.looptoken_wref() is None:
+                self.alive_code_size -= dying.code_size
+                self.dying_code_size -= dying.code_size
+            else:
+                dying_loops.append(dying)
+        self.dying_loops = dying_loops
 
     def _kill_old_loops_now(self):
         debug_start("jit-mem-collect")
@@ -70,14 +186,43 @@ class MemoryManager(object):
         for looptoken in self.alive_loops.keys():
             if (0 <= looptoken.generation < max_generation or
                 looptoken.invalidated):
-                del self.alive_loops[looptoken]
+                self._forget_loop(looptoken)
         newtotal = len(self.alive_loops)
         debug_print("Loop tokens freed: ", oldtotal - newtotal)
         debug_print("Loop tokens left:  ", newtotal)
         #print self.alive_loops.keys()
         if not we_are_translated() and oldtotal != newtotal:
             looptoken = None
-            from rpython.rlib import rgc
-            # a single one is not enough for all tests :-(
-            rgc.collect(); rgc.collect(); rgc.collect()
+            self._collect_for_tests()
+        self._free_dead_loops()
         debug_stop("jit-mem-collect")
+
+    def _evict_loops_now(self, keep):
+        debug_start("jit-mem-evict")
+        debug_print("Code size before:", self.alive_code_size)
+        target = self.max_code_size // 4 * 3
+        looptokens = self.alive_loops.keys()
+        GenerationSort(looptokens).sort()
+        count = 0
+        for looptoken in looptokens:
+            if self.alive_code_size - self.dying_code_size <= target:
+                break
+            if looptoken is not keep:
+                self._forget_loop(looptoken)
+                count += 1
+        self.total_evicted_loops += count
+        debug_print("Loop tokens evicted:", count)
+        if not we_are_translated() and count > 0:
+            looptokens = None
+            looptoken = None
+            self._collect_for_tests()
+        self._free_dead_loops()
+        debug_print("Code size after: ", self.alive_code_size)
+        debug_print("Code size of evicted loops not freed yet:",
+                    self.dying_code_size)
+        debug_stop("jit-mem-evict")
+
+    def _collect_for_tests(self):
+        from rpython.rlib import rgc
+        # a single one is not enough for all tests :-(
+        rgc.collect(); rgc.collect(); rgc.collect()
@@ -1114,6 +1114,13 @@ class MIFrame(object):
                                self.metainterp.call_ids[-1],
                                greenboxes)
 
+        if (self.metainterp.segment_trace_pending and
+                not self.metainterp.portal_call_depth):
+            # the trace is too long: cut it here, resuming at the
+            # jit_merge_point itself
+            self.pc = orgpc
+            self.metainterp.compile_trace_segment()
+
         if self.metainterp.seen_loop_header_for_jdindex < 0:
             if not any_operation:
                 return
@@ -1570,6 +1577,7 @@ class MetaInterpStaticData(object):
         self.profiler.cpu = cpu
         self.warmrunnerdesc = warmrunnerdesc
         if warmrunnerdesc:
+            self.profiler.memmgr = warmrunnerdesc.memory_manager
             self.config = warmrunnerdesc.translator.config
         else:
             from rpython.config.translationoption import get_combined_translation_config
@@ -1752,6 +1760,7 @@ class MetaInterp(object):
         self.forced_virtualizable = None
         self.partial_trace = None
         self.retracing_from = -1
+        self.segment_trace_pending = False
         self.call_pure_results = args_dict()
         self.heapcache = HeapCache()
 
@@ -2074,7 +2083,28 @@ class MetaInterp(object):
     def blackhole_if_trace_too_long(self):
         warmrunnerstate = self.jitdriver_sd.warmstate
         if len(self.history.operations) > warmrunnerstate.trace_limit:
-            greenkey_of_huge_function = self.find_biggest_function()
+            if self.segment_trace_pending:
+                # we are looking for a jit_merge_point where to cut the
+                # trace (see compile_trace_segment()); give up if there
+                # is none coming soon
+                if (len(self.history.operations) <=
+                        2 * warmrunnerstate.trace_limit):
+                    return
+                greenkey_of_huge_function = None
+            else:
+                greenkey_of_huge_function = self.find_biggest_function()
+                if (greenkey_of_huge_function is not None and
+                    not warmrunnerstate.can_inline_callable(
+                        greenkey_of_huge_function)):
+                    # already disabled, typically because it is the
+                    # function containing the loop itself
+                    greenkey_of_huge_function = None
+                if (greenkey_of_huge_function is None and
+                        self.partial_trace is None):
+                    # nothing left to blame: instead of aborting, compile
+                    # the trace in segments
+                    self.segment_trace_pending = True
+                    return
             self.staticdata.stats.record_aborted(greenkey_of_huge_function)
             self.portal_trace_positions = None
             if greenkey_of_huge_function is not None:
@@ -2086,6 +2116,41 @@ class MetaInterp(object):
                     warmrunnerstate.JitCell.trace_next_iteration(greenkey)
             raise SwitchToBlackhole(Counters.ABORT_TOO_LONG)
 
+    def compile_trace_segment(self):
+        """Called at a jit_merge_point of the outermost frame once the
+        trace got longer than trace_limit without anything that can be
+        blamed for it.  Instead of throwing the trace away, we end it with
+        a guard that always fails, resuming at this jit_merge_point, and
+        compile it.  The rest of the code is then traced as a bridge from
+        that guard, so that very long loops and functions are compiled as
+        a chain of segments.  The last segment can jump back to the first
+        one if it reaches the loop header again.
+        """
+        self.segment_trace_pending = False
+        debug_start('jit-trace-segment')
+        debug_print('trace too long, compiling it as a segment')
+        debug_stop('jit-trace-segment')
+        self.generate_guard(rop.GUARD_ALWAYS_FAILS)
+        # the FINISH is never reached, it just terminates the trace
+        sd = self.staticdata
+        token = sd.loop_tokens_done_with_this_frame_void[0].finishdescr
+        self.history.record(rop.FINISH, [], None, descr=token)
+        if isinstance(self.resumekey, compile.ResumeFromInterpDescr):
+            num_green_args = self.jitdriver_sd.num_green_args
+            original_boxes, start = self.current_merge_points[0]
+            greenkey = original_boxes[:num_green_args]
+            target_token = compile.compile_segment(
+                self, greenkey, start, original_boxes[num_green_args:])
+            if target_token is not None:
+                jitcell_token = target_token.targeting_jitcell_token
+                self.jitdriver_sd.warmstate.attach_procedure_to_interp(
+                    greenkey, jitcell_token)
+                sd.stats.add_jitcell_token(jitcell_token)
+        else:
+            compile.compile_trace(self, self.resumekey)
+        # continue in the blackhole interpreter from the jit_merge_point
+        raise SwitchToBlackhole(Counters.ABORT_SEGMENTED_TRACE)
+
     def _interpret(self):
         # Execute the frames forward until we raise a DoneWithThisFrame,
         # a ExitFrameWithException, or a ContinueRunningNormally exception.
@@ -2312,6 +2377,8 @@ class MetaInterp(object):
         frame = self.framestack[-1]
         if opnum == rop.GUARD_FUTURE_CONDITION:
             pass
+        elif opnum == rop.GUARD_ALWAYS_FAILS:
+            pass        # the pc is at the jit_merge_point ending the segment
         elif opnum == rop.GUARD_TRUE:     # a goto_if_not that jumps only now
             frame.pc = frame.jitcode.follow_jump(frame.pc)
         elif opnum == rop.GUARD_FALSE:     # a goto_if_not that stops jumping;
@@ -127,6 +127,20 @@ def tagged_list_eq(tl1, tl2):
             return False
     return True
 
+def tagged_list_hash(tl):
+    x = len(tl)
+    for i in range(len(tl)):
+        x = rarithmetic.intmask((1000003 * x) ^ rarithmetic.widen(tl[i]))
+    return x
+
+def numbering_eq(numb, prev, tl):
+    if numb.prev != prev or len(numb.nums) != len(tl):
+        return False
+    for i in range(len(tl)):
+        if not tagged_eq(numb.nums[i], tl[i]):
+            return False
+    return True
+
 TAGCONST    = 0
 TAGINT      = 1
 TAGBOX      = 2
@@ -147,12 +161,16 @@ class ResumeDataLoopMemo(object):
         self.large_ints = {}
         self.refs = self.cpu.ts.new_ref_dict_2()
         self.numberings = {}
+        self.shared_numberings = {}
+        self.shared_vinfos = {}
         self.cached_boxes = {}
         self.cached_virtuals = {}
 
         self.nvirtuals = 0
         self.nvholes = 0
         self.nvreused = 0
+        self.nnumbitems = 0
+        self.nnumbshared = 0
 
     def getconst(self, const):
         if const.type == INT:
@@ -200,7 +218,7 @@ class ResumeDataLoopMemo(object):
         n = len(liveboxes) - v
         boxes = snapshot.boxes
         length = len(boxes)
-        numb = lltype.malloc(NUMBERING, length)
+        nums = [UNASSIGNED] * length
         for i in range(length):
             box = boxes[i]
             value = optimizer.getvalue(box)
@@ -218,17 +236,60 @@ class ResumeDataLoopMemo(object):
                     tagged = tag(n, TAGBOX)
                     n += 1
                 liveboxes[box] = tagged
-            numb.nums[i] = tagged
+            nums[i] = tagged
         #
-        numb.prev = numb1
+        numb = self.get_shared_numbering(numb1, nums)
         self.numberings[snapshot] = numb, liveboxes, v
         return numb, liveboxes.copy(), v
 
+    def get_shared_numbering(self, prev, nums):
+        # Guards in the same loop very often end up with exactly the same
+        # tagged numbers for a frame even though their snapshots are
+        # different objects (e.g. every guard in a loop body records its
+        # own top frame).  The NUMBERING objects are never modified once
+        # built, so we can share them; as the 'prev' pointer is part of
+        # the comparison, this also shares the whole chain of parent
+        # frames.
+        key = tagged_list_hash(nums)
+        candidates = self.shared_numberings.get(key, None)
+        if candidates is None:
+            candidates = []
+            self.shared_numberings[key] = candidates
+        else:
+            for numb in candidates:
+                if numbering_eq(numb, prev, nums):
+                    self.nnumbshared += len(nums)
+                    return numb
+        length = len(nums)
+        numb = lltype.malloc(NUMBERING, length)
+        for i in range(length):
+            numb.nums[i] = nums[i]
+        numb.prev = prev
+        candidates.append(numb)
+        self.nnumbitems += length
+        return numb
+
     def forget_numberings(self, virtualbox):
         # XXX ideally clear only the affected numberings
+        # (self.shared_numberings is keyed by content, so it stays valid)
         self.numberings.clear()
         self.clear_box_virtual_numbers()
 
+    def get_shared_vinfo(self, vinfo):
+        # two different virtuals with the same shape and the same tagged
+        # fields can be described by the same (immutable) vinfo
+        key = tagged_list_hash(vinfo.fieldnums)
+        candidates = self.shared_vinfos.get(key, None)
+        if candidates is None:
+            candidates = []
+            self.shared_vinfos[key] = candidates
+        else:
+            for other in candidates:
+                if other.same_shape(vinfo) and other.equals(vinfo.fieldnums):
+                    return other
+        candidates.append(vinfo)
+        return vinfo
+
     # caching for virtuals and boxes inside them
 
     def num_cached_boxes(self):
@@ -264,6 +325,8 @@ class ResumeDataLoopMemo(object):
         profiler.count(jitprof.Counters.NVIRTUALS, self.nvirtuals)
         profiler.count(jitprof.Counters.NVHOLES, self.nvholes)
         profiler.count(jitprof.Counters.NVREUSED, self.nvreused)
+        profiler.count(jitprof.Counters.NRESUMENUMS, self.nnumbitems)
+        profiler.count(jitprof.Counters.NRESUMESHARED, self.nnumbshared)
 
 _frame_info_placeholder = (None, 0, 0)
 
@@ -284,6 +347,7 @@ class ResumeDataVirtualAdder(VirtualVisitor):
             return vinfo
         vinfo = value.visitor_dispatch_virtual_type(self)
         vinfo.set_content(fieldnums)
+        vinfo = self.memo.get_shared_vinfo(vinfo)
         value._cached_vinfo = vinfo
         return vinfo
 
@@ -496,6 +560,11 @@ class AbstractVirtualInfo(object):
     def set_content(self, fieldnums):
         self.fieldnums = fieldnums
 
+    def same_shape(self, other):
+        # overridden in the common subclasses; returning False here just
+        # means that such vinfos are never shared between virtuals
+        return False
+
     def debug_prints(self):
         raise NotImplementedError
 
@@ -524,6 +593,11 @@ class VirtualInfo(AbstractVirtualStructInfo):
         AbstractVirtualStructInfo.__init__(self, fielddescrs)
         self.known_class = known_class
 
+    def same_shape(self, other):
+        return (isinstance(other, VirtualInfo) and
+                self.known_class.same_constant(other.known_class) and
+                self.fielddescrs == other.fielddescrs)
+
     @specialize.argtype(1)
     def allocate(self, decoder, index):
         struct = decoder.allocate_with_vtable(self.known_class)
@@ -540,6 +614,11 @@ class VStructInfo(AbstractVirtualStructInfo):
         AbstractVirtualStructInfo.__init__(self, fielddescrs)
         self.typedescr = typedescr
 
+    def same_shape(self, other):
+        return (isinstance(other, VStructInfo) and
+                self.typedescr is other.typedescr and
+                self.fielddescrs == other.fielddescrs)
+
     @specialize.argtype(1)
     def allocate(self, decoder, index):
         struct = decoder.allocate_struct(self.typedescr)
@@ -589,9 +668,17 @@ class AbstractVArrayInfo(AbstractVirtualInfo):
 class VArrayInfoClear(AbstractVArrayInfo):
     clear = True
 
+    def same_shape(self, other):
+        return (isinstance(other, VArrayInfoClear) and
+                self.arraydescr is other.arraydescr)
+
 class VArrayInfoNotClear(AbstractVArrayInfo):
     clear = False
 
+    def same_shape(self, other):
+        return (isinstance(other, VArrayInfoNotClear) and
+                self.arraydescr is other.arraydescr)
+
 
 class VAbstractRawInfo(AbstractVirtualInfo):
     kind = INT
@@ -158,3 +158,59 @@ def test_compile_tmp_callback():
         assert lltype.cast_opaque_ptr(lltype.Ptr(EXC), e.value) == llexc
     else:
         assert 0, "should have raised"
+
+def test_resume_cost_factor():
+    from rpython.jit.metainterp.resume import FrameInfo
+    def factor(frame_info_list, virtuals):
+        descr = compile.ResumeGuardDescr()
+        descr.rd_frame_info_list = frame_info_list
+        descr.rd_virtuals = virtuals
+        return descr._compute_resume_cost_factor()
+    frame_info_list = FrameInfo(None, "jitcode", 5)
+    assert factor(None, None) == 1.0
+    assert factor(frame_info_list, None) == 1.0
+    frame_info_list = FrameInfo(frame_info_list, "jitcode", 7)
+    assert factor(frame_info_list, None) == 1.25
+    assert factor(frame_info_list, [None, None]) == 1.75
+    assert factor(frame_info_list, [None] * 100) == (
+        compile.RESUME_COST_MAX_FACTOR)
+
+def test_must_compile_uses_resume_cost():
+    from rpython.jit.metainterp.resume import FrameInfo
+    class FakeJitCounter:
+        def tick(self, hash, increment):
+            self.seen = (hash, increment)
+            return False
+    class FakeWarmRunnerDesc:
+        jitcounter = FakeJitCounter()
+    class FakeStaticData:
+        warmrunnerdesc = FakeWarmRunnerDesc()
+    class FakeJitDriverSD:
+        class warmstate:
+            increment_trace_eagerness = 0.1
+    jitcounter = FakeWarmRunnerDesc.jitcounter
+    descr = compile.ResumeGuardDescr()
+    descr.status = 128
+    assert not descr.must_compile(None, FakeStaticData(), FakeJitDriverSD())
+    assert jitcounter.seen == (128, 0.1)
+    descr = compile.ResumeGuardDescr()
+    descr.status = 128
+    descr.rd_frame_info_list = FrameInfo(FrameInfo(None, "jitcode", 5),
+                                         "jitcode", 7)
+    descr.rd_virtuals = [None]
+    descr.must_compile(None, FakeStaticData(), FakeJitDriverSD())
+    assert jitcounter.seen == (128, 0.1 * 1.5)
+    # the first failure is never enough to compile a bridge
+    descr = compile.ResumeGuardDescr()
+    descr.status = 128
+    descr.rd_virtuals = [None] * 100
+    FakeJitDriverSD.warmstate.increment_trace_eagerness = 0.2
+    descr.must_compile(None, FakeStaticData(), FakeJitDriverSD())
+    assert jitcounter.seen == (128, compile.RESUME_COST_MAX_INCREMENT)
+    FakeJitDriverSD.warmstate.increment_trace_eagerness = 1.0
+    descr.must_compile(None, FakeStaticData(), FakeJitDriverSD())
+    assert jitcounter.seen == (128, 1.0)
+    # an increment of 0.0 still means "never compile a bridge"
+    FakeJitDriverSD.warmstate.increment_trace_eagerness = 0.0
+    descr.must_compile(None, FakeStaticData(), FakeJitDriverSD())
+    assert jitcounter.seen == (128, 0.0)
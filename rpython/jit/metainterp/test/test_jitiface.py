@@ -178,6 +178,44 @@ class JitHookInterfaceTests(object):
 
         self.meta_interp(main, [], ProfilerClass=Profiler)
 
+    def test_get_loop_entries_and_guard_failures(self):
+        def get_printable_location(c):
+            return 'loop %d' % c
+        driver = JitDriver(greens = ['c'], reds = ['i', 's'],
+                           get_printable_location=get_printable_location)
+
+        def loop(c, i):
+            s = 0
+            while i > 0:
+                driver.jit_merge_point(c=c, i=i, s=s)
+                if i % 2:
+                    s += 1
+                i -= 1
+                s+= 2
+            return s
+
+        def main(c):
+            for j in range(3):
+                loop(c, 30)
+            l = jit_hooks.stats_get_loop_entries(None)
+            assert len(l) == 1
+            assert hlstr(l[0].location) == 'loop 7'
+            assert l[0].number == 0
+            # at least once per call to loop(), plus once more after
+            # each guard failure that went back to the interpreter
+            assert l[0].counter >= 3
+            l = jit_hooks.stats_get_guard_failures(None)
+            # e.g. the guard that fails every other iteration, until we
+            # have a bridge, and the final guard_false(i > 0)
+            assert len(l) >= 2
+            for i in range(len(l)):
+                assert l[i].guard != 0
+                assert hlstr(l[i].location) == 'loop 7'
+                assert l[i].number == 0
+                assert l[i].counter >= 1
+
+        self.meta_interp(main, [7])
+
 class LLJitHookInterfaceTests(JitHookInterfaceTests):
     # use this for any backend, instead of the super class
     
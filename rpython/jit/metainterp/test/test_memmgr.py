@@ -10,8 +10,8 @@ if len(sys.argv) >= 4 and sys.argv[1] == '--sub':
     rpython.conftest.option = opt()
     rpython.conftest.option.__dict__.update(eval(sys.argv[3]))
 
-import py
-from rpython.jit.metainterp.memmgr import MemoryManager
+import py, weakref
+from rpython.jit.metainterp.memmgr import MemoryManager, OP_METADATA_SIZE
 from rpython.jit.metainterp.test.support import LLJitMixin
 from rpython.rlib.jit import JitDriver, dont_look_inside
 from rpython.jit.metainterp.warmspot import get_stats
@@ -21,6 +21,8 @@ from rpython.rlib import rgc
 class FakeLoopToken:
     generation = 0
     invalidated = False
+    code_size = 0
+    dying_loop = None
 
 
 class _TestMemoryManager:
@@ -78,6 +80,121 @@ class _TestMemoryManager:
             else:
                 assert tokens[i] in memmgr.alive_loops
 
+    def test_code_size(self):
+        memmgr = MemoryManager()
+        token = FakeLoopToken()
+        memmgr.keep_loop_alive(token)
+        memmgr.record_code_size(token, 100, 2)
+        assert token.code_size == 100 + 2 * OP_METADATA_SIZE
+        assert memmgr.alive_code_size == token.code_size
+        # a loop that is not in 'alive_loops' counts until it is freed
+        other = FakeLoopToken()
+        memmgr.record_code_size(other, 1000, 0)
+        assert memmgr.alive_code_size == token.code_size + 1000
+        del other
+        memmgr.record_code_size(token, 10, 0)
+        assert memmgr.alive_code_size == token.code_size
+        memmgr.set_max_age(1, 1)
+        memmgr.next_generation()
+        memmgr.next_generation()
+        assert memmgr.alive_loops == {}
+        # still referenced from here, so not freed
+        assert memmgr.alive_code_size == token.code_size
+        del token
+        memmgr.next_generation()
+        assert memmgr.alive_code_size == 0
+
+    def test_max_code_size(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_code_size(1000)
+        first = FakeLoopToken()
+        wrefs = []
+        for i in range(10):
+            if i == 0:
+                token = first
+            else:
+                token = FakeLoopToken()
+            wrefs.append(weakref.ref(token))
+            memmgr.keep_loop_alive(token)
+            memmgr.record_code_size(token, 200, 0)
+            memmgr.next_generation()
+            # the first token is entered again all the time
+            memmgr.keep_loop_alive(first)
+        del token
+        # we stay below the limit by evicting the least recently
+        # entered loops
+        assert memmgr.alive_code_size <= 1000
+        assert first in memmgr.alive_loops
+        assert wrefs[-1]() in memmgr.alive_loops
+        assert wrefs[1]() is None
+        assert memmgr.total_evicted_loops == (10 - len(memmgr.alive_loops))
+        assert memmgr.alive_code_size == 200 * len(memmgr.alive_loops)
+        assert memmgr.dying_code_size == 0
+
+    def test_max_code_size_not_freed(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_code_size(1000)
+        tokens = [FakeLoopToken() for i in range(10)]
+        for token in tokens:
+            memmgr.keep_loop_alive(token)
+            memmgr.record_code_size(token, 200, 0)
+            memmgr.next_generation()
+        # the evicted loops are still referenced from 'tokens': their
+        # code is not freed, and is still counted
+        alive = [token for token in tokens if token in memmgr.alive_loops]
+        evicted = [token for token in tokens if token not in alive]
+        assert 200 * len(alive) <= 1000
+        assert memmgr.total_evicted_loops == len(evicted)
+        assert memmgr.alive_code_size == 2000
+        assert memmgr.dying_code_size == 200 * len(evicted)
+        # entering an evicted loop again does not count it twice
+        revived = evicted.pop()
+        memmgr.keep_loop_alive(revived)
+        alive.append(revived)
+        assert memmgr.alive_code_size == 2000
+        assert memmgr.dying_code_size == 200 * len(evicted)
+        # the others are freed now
+        del tokens, token, evicted
+        memmgr.record_code_size(revived, 0, 0)
+        assert memmgr.dying_code_size == 0
+        assert memmgr.alive_code_size == 200 * len(memmgr.alive_loops)
+        assert memmgr.alive_code_size <= 1000
+
+    def test_max_code_size_revived_same_generation(self):
+        memmgr = MemoryManager()
+        memmgr.set_max_code_size(1000)
+        first = FakeLoopToken()
+        memmgr.keep_loop_alive(first)
+        memmgr.record_code_size(first, 600, 0)
+        # in the same generation, a new loop makes 'first' evicted
+        second = FakeLoopToken()
+        memmgr.keep_loop_alive(second)
+        memmgr.record_code_size(second, 600, 0)
+        assert memmgr.alive_loops == {second: None}
+        assert memmgr.dying_code_size == 600
+        # entering 'first' again, still in the same generation, revives it
+        memmgr.keep_loop_alive(first)
+        assert memmgr.alive_loops == {first: None, second: None}
+        assert first.dying_loop is None
+        assert memmgr.alive_code_size == 1200
+        assert memmgr.dying_code_size == 0
+
+    def test_max_code_size_lowered(self):
+        memmgr = MemoryManager()
+        tokens = [FakeLoopToken() for i in range(4)]
+        for token in tokens:
+            memmgr.keep_loop_alive(token)
+            memmgr.record_code_size(token, 100, 0)
+            memmgr.next_generation()
+        del token
+        assert len(memmgr.alive_loops) == 4
+        wrefs = [weakref.ref(token) for token in tokens]
+        del tokens
+        memmgr.set_max_code_size(300)
+        assert memmgr.alive_loops == dict.fromkeys([wrefs[2](), wrefs[3]()])
+        assert memmgr.alive_code_size == 200
+        assert memmgr.total_evicted_loops == 2
+
 
 class _TestIntegration(LLJitMixin):
     # See comments in TestMemoryManager.  To get temporarily the normal
@@ -185,6 +302,41 @@ class _TestIntegration(LLJitMixin):
         assert res == 42
         self.check_enter_count(2 + 10*4)
 
+    def test_max_code_size(self):
+        from rpython.jit.metainterp import pyjitpl
+        myjitdriver = JitDriver(greens=['m'], reds=['n'])
+        def g(m):
+            n = 10
+            while n > 0:
+                myjitdriver.can_enter_jit(n=n, m=m)
+                myjitdriver.jit_merge_point(n=n, m=m)
+                n = n - 1
+            return 21
+        def f():
+            for i in range(10):
+                g(1)
+                g(2)
+                g(3)
+            return 42
+
+        # without a maximum, each loop is compiled once
+        res = self.meta_interp(f, [], loop_longevity=0)
+        assert res == 42
+        self.check_enter_count(6)     # 3 loops and their entry bridges
+        memmgr = pyjitpl._warmrunnerdesc.memory_manager
+        assert memmgr.total_evicted_loops == 0
+        max_code_size = memmgr.alive_code_size * 2 // 3
+
+        # with room for only two loops, they keep evicting each other
+        # and need to be compiled again
+        res = self.meta_interp(f, [], loop_longevity=0,
+                               max_code_size=max_code_size)
+        assert res == 42
+        assert get_stats().enter_count > 6
+        memmgr = pyjitpl._warmrunnerdesc.memory_manager
+        assert memmgr.total_evicted_loops > 0
+        assert memmgr.alive_code_size <= max_code_size
+
     def test_call_assembler_keep_alive(self):
         myjitdriver1 = JitDriver(greens=['m'], reds=['n'])
         myjitdriver2 = JitDriver(greens=['m'], reds=['n', 'rec'])
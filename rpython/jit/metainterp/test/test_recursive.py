@@ -7,6 +7,7 @@ from rpython.jit.metainterp.test.support import LLJitMixin
 from rpython.jit.codewriter.policy import StopAtXPolicy
 from rpython.rtyper.annlowlevel import hlstr
 from rpython.jit.metainterp.warmspot import get_stats
+from rpython.jit.metainterp.resoperation import rop
 
 class RecursiveTests:
 
@@ -340,7 +341,10 @@ class RecursiveTests:
         TRACE_LIMIT = 66
         res = self.meta_interp(loop, [100], enable_opts='', inline=True, trace_limit=TRACE_LIMIT)
         assert res == 0
-        self.check_max_trace_length(TRACE_LIMIT)
+        # traces that are still too long once 'recursive' is no longer
+        # inlined are cut into segments, which end at the next
+        # jit_merge_point after the limit is reached
+        self.check_max_trace_length(2 * TRACE_LIMIT)
         self.check_enter_count_at_most(10) # maybe
         self.check_aborted_count(6)
 
@@ -364,7 +368,7 @@ class RecursiveTests:
             return n
         TRACE_LIMIT = 20
         res = self.meta_interp(loop, [100], enable_opts='', inline=True, trace_limit=TRACE_LIMIT)
-        self.check_max_trace_length(TRACE_LIMIT)
+        self.check_max_trace_length(2 * TRACE_LIMIT)
         self.check_aborted_count(8)
         self.check_enter_count_at_most(30)
 
@@ -395,6 +399,51 @@ class RecursiveTests:
         res = self.meta_interp(loop, [100], trace_limit=TRACE_LIMIT)
         assert res == 80
 
+    def test_trace_limit_segments(self):
+        myjitdriver = JitDriver(greens=['pc'], reds=['n', 'x'])
+        code = 'abcd' * 20 + 'j'
+        def interpret(n):
+            set_param(None, "threshold", 3)
+            set_param(None, "trace_eagerness", 2)
+            pc = 0
+            x = 0
+            while True:
+                myjitdriver.jit_merge_point(pc=pc, n=n, x=x)
+                op = code[pc]
+                if op == 'a':
+                    x += pc
+                elif op == 'b':
+                    x ^= n
+                elif op == 'c':
+                    x = (x * 3) & 0xffff
+                elif op == 'd':
+                    x -= 7
+                elif op == 'j':
+                    n -= 1
+                    if n <= 0:
+                        break
+                    pc = 0
+                    myjitdriver.can_enter_jit(pc=pc, n=n, x=x)
+                    continue
+                pc += 1
+            return x
+        TRACE_LIMIT = 60
+        res = self.meta_interp(interpret, [60], trace_limit=TRACE_LIMIT)
+        assert res == interpret(60)
+        self.check_max_trace_length(2 * TRACE_LIMIT)
+        # the body of the loop is much longer than TRACE_LIMIT, but it
+        # still gets compiled: the first segment is a loop, the next ones
+        # are bridges, and the last one jumps back to the first one
+        loops = get_stats().loops
+        assert len(loops) == 1
+        assert loops[0].operations[-1].getopnum() == rop.FINISH
+        ops = loops[0].operations
+        while ops[-1].getopnum() != rop.JUMP:
+            guard = ops[-2]
+            assert guard.getopnum() == rop.GUARD_ALWAYS_FAILS
+            ops = guard.getdescr()._debug_suboperations
+        self.check_enter_count_at_most(5)
+
     def test_max_failure_args(self):
         FAILARGS_LIMIT = 10
         jitdriver = JitDriver(greens = [], reds = ['i', 'n', 'o'])
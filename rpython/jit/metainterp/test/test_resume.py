@@ -114,16 +114,21 @@ def test_vinfo():
     assert v1.equals([1, 2, 4])
     assert not v1.equals([1, 2, 6])
 
+class FakeVInfo(object):
+    def set_content(self, fieldnums):
+        self.fieldnums = fieldnums
+    def equals(self, fieldnums):
+        return self.fieldnums == fieldnums
+    def same_shape(self, other):
+        return isinstance(other, FakeVInfo)
+
+class FakeVirtualValue(AbstractVirtualValue):
+    def visitor_dispatch_virtual_type(self, *args):
+        return FakeVInfo()
+
 def test_reuse_vinfo():
-    class FakeVInfo(object):
-        def set_content(self, fieldnums):
-            self.fieldnums = fieldnums
-        def equals(self, fieldnums):
-            return self.fieldnums == fieldnums
-    class FakeVirtualValue(AbstractVirtualValue):
-        def visitor_dispatch_virtual_type(self, *args):
-            return FakeVInfo()
-    modifier = ResumeDataVirtualAdder(None, None, None)
+    memo = ResumeDataLoopMemo(FakeMetaInterpStaticData())
+    modifier = ResumeDataVirtualAdder(None, None, memo)
     v1 = FakeVirtualValue(None, None)
     vinfo1 = modifier.make_virtual_info(v1, [1, 2, 4])
     vinfo2 = modifier.make_virtual_info(v1, [1, 2, 4])
@@ -133,6 +138,37 @@ def test_reuse_vinfo():
     vinfo4 = modifier.make_virtual_info(v1, [1, 2, 6])
     assert vinfo3 is vinfo4
 
+def test_share_vinfo_between_virtuals():
+    memo = ResumeDataLoopMemo(FakeMetaInterpStaticData())
+    modifier = ResumeDataVirtualAdder(None, None, memo)
+    v1 = FakeVirtualValue(None, None)
+    v2 = FakeVirtualValue(None, None)
+    vinfo1 = modifier.make_virtual_info(v1, [1, 2, 4])
+    vinfo2 = modifier.make_virtual_info(v2, [1, 2, 4])
+    assert vinfo1 is vinfo2
+    vinfo3 = modifier.make_virtual_info(v2, [1, 2, 6])
+    assert vinfo3 is not vinfo1
+
+def test_vinfo_same_shape():
+    descr1 = AbstractDescr()
+    descr2 = AbstractDescr()
+    cls1 = ConstInt(123)
+    assert VirtualInfo(cls1, [descr1]).same_shape(
+        VirtualInfo(ConstInt(123), [descr1]))
+    assert not VirtualInfo(cls1, [descr1]).same_shape(
+        VirtualInfo(ConstInt(124), [descr1]))
+    assert not VirtualInfo(cls1, [descr1]).same_shape(
+        VirtualInfo(cls1, [descr2]))
+    assert not VirtualInfo(cls1, [descr1]).same_shape(
+        VStructInfo(descr1, [descr1]))
+    assert VStructInfo(descr1, [descr2]).same_shape(
+        VStructInfo(descr1, [descr2]))
+    assert not VStructInfo(descr1, [descr2]).same_shape(
+        VStructInfo(descr2, [descr2]))
+    assert VArrayInfoClear(descr1).same_shape(VArrayInfoClear(descr1))
+    assert not VArrayInfoClear(descr1).same_shape(VArrayInfoNotClear(descr1))
+    assert not VStrPlainInfo().same_shape(VStrPlainInfo())
+
 
 class MyMetaInterp:
     _already_allocated_resume_virtuals = None
@@ -969,6 +1005,37 @@ def test_ResumeDataLoopMemo_number():
                                                 tag(1, TAGVIRTUAL)]
     assert numb5.prev == numb4
 
+def test_ResumeDataLoopMemo_number_shared():
+    b1, b2, b3 = [BoxInt(), BoxInt(), BoxInt()]
+    c1 = ConstInt(1)
+    snap = Snapshot(None, [b1, c1, b2])
+    snap1 = Snapshot(snap, [b3, b1])
+    snap2 = Snapshot(snap, [b3, b1])      # same content, other snapshot
+    snap3 = Snapshot(Snapshot(None, [b1, c1, b2]), [b3, b1])
+
+    memo = ResumeDataLoopMemo(FakeMetaInterpStaticData())
+    numb1, _, _ = memo.number(FakeOptimizer({}), snap1)
+    assert memo.nnumbitems == 5
+    assert memo.nnumbshared == 0
+    numb2, liveboxes2, _ = memo.number(FakeOptimizer({}), snap2)
+    assert numb2 == numb1
+    assert liveboxes2 == {b1: tag(0, TAGBOX), b2: tag(1, TAGBOX),
+                          b3: tag(2, TAGBOX)}
+    assert memo.nnumbitems == 5
+    assert memo.nnumbshared == 2
+    # the whole chain of frames is shared, even across forget_numberings()
+    memo.forget_numberings(None)
+    numb3, _, _ = memo.number(FakeOptimizer({}), snap3)
+    assert numb3 == numb1
+    assert memo.nnumbitems == 5
+    assert memo.nnumbshared == 7
+    # a different prev is never shared
+    snap4 = Snapshot(Snapshot(None, [b1, c1, b2, c1]), [b3, b1])
+    numb4, _, _ = memo.number(FakeOptimizer({}), snap4)
+    assert numb4 != numb1
+    assert list(numb4.nums) == list(numb1.nums)
+    assert memo.nnumbitems == 11
+
 def test_ResumeDataLoopMemo_number_boxes():
     memo = ResumeDataLoopMemo(FakeMetaInterpStaticData())
     b1, b2 = [BoxInt(), BoxInt()]
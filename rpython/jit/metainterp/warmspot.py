@@ -67,7 +67,8 @@ def ll_meta_interp(function, args, backendopt=False, type_system='lltype',
 
 def jittify_and_run(interp, graph, args, repeat=1, graph_and_interp_only=False,
                     backendopt=False, trace_limit=sys.maxint,
-                    inline=False, loop_longevity=0, retrace_limit=5,
+                    inline=False, loop_longevity=0, max_code_size=0,
+                    retrace_limit=5,
                     function_threshold=4,
                     enable_opts=ALL_OPTS_NAMES, max_retrace_guards=15, 
                     max_unroll_recursion=7, **kwds):
@@ -89,6 +90,7 @@ def jittify_and_run(interp, graph, args, repeat=1, graph_and_interp_only=False,
         jd.warmstate.set_param_trace_limit(trace_limit)
         jd.warmstate.set_param_inlining(inline)
         jd.warmstate.set_param_loop_longevity(loop_longevity)
+        jd.warmstate.set_param_max_code_size(max_code_size)
         jd.warmstate.set_param_retrace_limit(retrace_limit)
         jd.warmstate.set_param_max_retrace_guards(max_retrace_guards)
         jd.warmstate.set_param_enable_opts(enable_opts)
@@ -170,7 +172,15 @@ def reset_stats():
 def reset_jit():
     """Helper for some tests (see micronumpy/test/test_zjit.py)"""
     reset_stats()
-    pyjitpl._warmrunnerdesc.memory_manager.alive_loops.clear()
+    memmgr = pyjitpl._warmrunnerdesc.memory_manager
+    memmgr.alive_loops.clear()
+    memmgr.alive_code_size = 0
+    for dying in memmgr.dying_loops:
+        looptoken = dying.looptoken_wref()
+        if looptoken is not None:
+            looptoken.dying_loop = None
+    memmgr.dying_loops = []
+    memmgr.dying_code_size = 0
     pyjitpl._warmrunnerdesc.jitcounter._clear_all()
 
 def get_translator():
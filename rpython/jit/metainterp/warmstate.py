@@ -276,6 +276,12 @@ class WarmEnterState(object):
             self.warmrunnerdesc.memory_manager is not None):   # all for tests
             self.warmrunnerdesc.memory_manager.set_max_age(value)
 
+    def set_param_max_code_size(self, value):
+        # note: it's a global parameter, not a per-jitdriver one
+        if (self.warmrunnerdesc is not None and
+            self.warmrunnerdesc.memory_manager is not None):   # all for tests
+            self.warmrunnerdesc.memory_manager.set_max_code_size(value)
+
     def set_param_retrace_limit(self, value):
         if self.warmrunnerdesc:
             if self.warmrunnerdesc.memory_manager:
@@ -364,6 +370,7 @@ class WarmEnterState(object):
             # Record in the memmgr that we just ran this loop,
             # so that it will keep it alive for a longer time
             warmrunnerdesc.memory_manager.keep_loop_alive(loop_token)
+            loop_token.entry_count += 1
             #
             # Handle the failure
             fail_descr = cpu.get_latest_descr(deadframe)
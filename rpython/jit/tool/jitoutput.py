@@ -23,13 +23,18 @@ REGEXES = [
     (('abort.vable_escape',), '^abort: vable escape:\s+(\d+)$'),
     (('abort.bad_loop',), '^abort: bad loop:\s+(\d+)$'),
     (('abort.force_quasiimmut',), '^abort: force quasi-immut:\s+(\d+)$'),
+    (('abort.segmented_trace',), '^abort: segmented trace:\s+(\d+)$'),
     (('nvirtuals',), '^nvirtuals:\s+(\d+)$'),
     (('nvholes',), '^nvholes:\s+(\d+)$'),
     (('nvreused',), '^nvreused:\s+(\d+)$'),
+    (('resume_nums',), '^resume nums:\s+(\d+)$'),
+    (('resume_shared',), '^resume shared:\s+(\d+)$'),
     (('total_compiled_loops',),   '^Total # of loops:\s+(\d+)$'),
     (('total_compiled_bridges',), '^Total # of bridges:\s+(\d+)$'),
     (('total_freed_loops',),      '^Freed # of loops:\s+(\d+)$'),
     (('total_freed_bridges',),    '^Freed # of bridges:\s+(\d+)$'),
+    (('alive_code_size',),        '^Alive code size:\s+(\d+)$'),
+    (('total_evicted_loops',),    '^Evicted # of loops:\s+(\d+)$'),
     ]
 
 class Ops(object):
@@ -57,6 +62,8 @@ class OutputInfo(object):
     nvirtuals = 0
     nvholes = 0
     nvreused = 0
+    resume_nums = 0
+    resume_shared = 0
 
     def __init__(self):
         self.ops = Ops()
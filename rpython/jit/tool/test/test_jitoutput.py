@@ -58,13 +58,18 @@ abort: compiling:       11
 abort: vable escape:    12
 abort: bad loop:        135
 abort: force quasi-immut: 3
+abort: segmented trace: 4
 nvirtuals:              13
 nvholes:                14
 nvreused:               15
+resume nums:            16
+resume shared:          17
 Total # of loops:       100
 Total # of bridges:     300
 Freed # of loops:       99
 Freed # of bridges:     299
+Alive code size:        4096
+Evicted # of loops:     7
 '''
 
 def test_parse():
@@ -85,6 +90,11 @@ def test_parse():
     assert info.abort.vable_escape == 12
     assert info.abort.bad_loop == 135
     assert info.abort.force_quasiimmut == 3
+    assert info.abort.segmented_trace == 4
     assert info.nvirtuals == 13
     assert info.nvholes == 14
     assert info.nvreused == 15
+    assert info.resume_nums == 16
+    assert info.resume_shared == 17
+    assert info.alive_code_size == 4096
+    assert info.total_evicted_loops == 7
@@ -50,10 +50,12 @@ def read_float_from_env(varname):
 
 
 # ____________________________________________________________
-# Get the total amount of RAM installed in a system.
+# Get the total amount of RAM installed in a system, or the memory limit
+# of the cgroup we run in if it is lower.
 # On 32-bit systems, it will try to return at most the addressable size.
 # If unknown, it will just return the addressable size, which
 # will be huge on 64-bit systems.
+# get_memory_limit() returns only the cgroup limit, or -1.0 if none.
 
 if sys.maxint == 2147483647:    # 32-bit
     if sys.platform.startswith('linux'):
@@ -96,6 +98,94 @@ def get_total_memory_linux(filename):
     return result
 get_total_memory_linux2 = get_total_memory_linux3 = get_total_memory_linux
 
+# Inside containers, the memory limit of the cgroup is usually much lower
+# than the RAM of the host.  /proc/self/cgroup tells in which cgroup we
+# are: a line '0::PATH' for cgroup v2, and a line 'ID:...,memory,...:PATH'
+# for the memory controller of cgroup v1.  The limit is then in the file
+# 'memory.max' (which contains 'max' if there is no limit) for v2, or
+# 'memory.limit_in_bytes' (which contains a huge number if there is no
+# limit) for v1, in the directory PATH of the mounted hierarchy.  The
+# limits of the parent cgroups apply too.  Inside a container, PATH may
+# be the one seen from the host, which does not exist in the container's
+# mount; then we only find the limit of its root, which is the container's.
+CGROUP_PROC_FILE = '/proc/self/cgroup'
+CGROUP_V2_ROOT = '/sys/fs/cgroup'
+CGROUP_V1_MEMORY_ROOT = '/sys/fs/cgroup/memory'
+CGROUP_NO_LIMIT = float(2**60)
+
+def _read_small_file(filename):
+    try:
+        fd = os.open(filename, os.O_RDONLY, 0644)
+        try:
+            return os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+
+def _parse_proc_self_cgroup(buf):
+    # returns the cgroup v2 path and the cgroup v1 memory path, or None
+    v2_path = None
+    v1_path = None
+    for line in buf.split('\n'):
+        parts = line.split(':', 2)
+        if len(parts) != 3:
+            continue
+        if parts[0] == '0' and parts[1] == '':
+            v2_path = parts[2]
+        elif 'memory' in parts[1].split(','):
+            v1_path = parts[2]
+    return v2_path, v1_path
+
+def _get_cgroup_limit_in(root, path, filename):
+    # the lowest limit in the cgroup 'path' and its parents, or -1.0
+    result = -1.0
+    path = path.rstrip('/')
+    while True:
+        buf = _read_small_file(root + path + '/' + filename)
+        if buf is not None:
+            stop = 0
+            while stop < len(buf) and buf[stop].isdigit():
+                stop += 1
+            if stop > 0:
+                value = float(buf[:stop])
+                if value < CGROUP_NO_LIMIT and (result < 0.0 or
+                                                value < result):
+                    result = value
+        i = path.rfind('/')
+        if i < 0:
+            break
+        path = path[:i]
+    return result
+
+def get_cgroup_memory_limit_linux(proc_file, v2_root, v1_root):
+    debug_start("gc-hardware")
+    result = -1.0
+    buf = _read_small_file(proc_file)
+    if buf is not None:
+        v2_path, v1_path = _parse_proc_self_cgroup(buf)
+        if v2_path is not None:
+            result = _get_cgroup_limit_in(v2_root, v2_path, 'memory.max')
+        if result < 0.0 and v1_path is not None:
+            result = _get_cgroup_limit_in(v1_root, v1_path,
+                                          'memory.limit_in_bytes')
+    if result < 0.0:
+        debug_print("no cgroup memory limit")
+    else:
+        debug_print("cgroup memory limit =", result)
+    debug_stop("gc-hardware")
+    return result
+
+class CachedMemoryLimit(object):
+    # both get_total_memory() and the GC ask for the memory limit:
+    # read the files and print the debug section only once
+    value = 0.0      # not read yet
+
+    def _cleanup_(self):
+        self.value = 0.0    # not the one of the machine that translates
+
+_cached_memory_limit = CachedMemoryLimit()
+
 def get_total_memory_darwin(result):
     debug_start("gc-hardware")
     if result <= 0:
@@ -110,18 +200,37 @@ def get_total_memory_darwin(result):
 
 
 if sys.platform.startswith('linux'):
+    def get_memory_limit():
+        if _cached_memory_limit.value == 0.0:
+            _cached_memory_limit.value = get_cgroup_memory_limit_linux(
+                CGROUP_PROC_FILE, CGROUP_V2_ROOT, CGROUP_V1_MEMORY_ROOT)
+        return _cached_memory_limit.value
+
     def get_total_memory():
-        return get_total_memory_linux2('/proc/meminfo')
+        result = get_total_memory_linux2('/proc/meminfo')
+        limit = get_memory_limit()
+        if limit > 0.0 and limit < result:
+            result = limit
+        return result
 
 elif sys.platform == 'darwin':
+    def get_memory_limit():
+        return -1.0
+
     def get_total_memory():
         return get_total_memory_darwin(get_darwin_sysctl_signed('hw.memsize'))
 
 elif 'freebsd' in sys.platform:
+    def get_memory_limit():
+        return -1.0
+
     def get_total_memory():
         return get_total_memory_darwin(get_darwin_sysctl_signed('hw.usermem'))
 
 else:
+    def get_memory_limit():
+        return -1.0
+
     def get_total_memory():
         return addressable_size       # XXX implement me for other platforms
 
@@ -6,6 +6,17 @@ Environment variables can be used to fine-tune the following parameters:
                          '4M'.  Small values
                          (like 1 or 1KB) are useful for debugging.
 
+ PYPY_GC_MAX_PAUSE       Target maximum duration of a minor collection, in
+                         milliseconds (e.g. '2.5').  If set, the nursery is
+                         resized after every minor collection: made smaller
+                         if the collection took longer than that, and
+                         bigger if it was much faster and few objects
+                         survived.  Off by default.
+
+ PYPY_GC_NURSERY_MAX     With PYPY_GC_MAX_PAUSE, the upper bound of the
+                         nursery size.  Defaults to 8 times the initial
+                         nursery size.
+
  PYPY_GC_NURSERY_DEBUG   If set to non-zero, will fill nursery with garbage,
                          to help debugging.
 
@@ -36,7 +47,14 @@ Environment variables can be used to fine-tune the following parameters:
                          to more than PYPY_GC_MAX_DELTA the amount really
                          used after a collection.  Defaults to 1/8th of the
                          total RAM size (which is constrained to be at most
-                         2/3/4GB on 32-bit systems).  Try values like '200MB'.
+                         2/3/4GB on 32-bit systems, and by the memory limit
+                         of the cgroup if there is one).  Try values like
+                         '200MB'.
+
+ If PYPY_GC_MAX is not set but we run in a cgroup with a memory limit
+ (e.g. in a container), the major collection threshold is softly bounded
+ by 80% of that limit: past it, major collections are done as soon as
+ the heap grew by 10%, but no MemoryError is raised.
 
  PYPY_GC_MIN             Don't collect while the memory size is below this
                          limit.  Useful to avoid spending all the time in
@@ -52,13 +70,14 @@ Environment variables can be used to fine-tune the following parameters:
 # XXX total addressable size.  Maybe by keeping some minimarkpage arenas
 # XXX pre-reserved, enough for a few nursery collections?  What about
 # XXX raw-malloced memory?
-import sys
+import sys, time
 from rpython.rtyper.lltypesystem import lltype, llmemory, llarena, llgroup
 from rpython.rtyper.lltypesystem.lloperation import llop
 from rpython.rtyper.lltypesystem.llmemory import raw_malloc_usage
 from rpython.memory.gc.base import GCBase, MovingGCBase
 from rpython.memory.gc import env
 from rpython.memory.support import mangle_hash
+from rpython.memory.support import int_as_address, address_as_int
 from rpython.rlib.rarithmetic import ovfcheck, LONG_BIT, intmask, r_uint
 from rpython.rlib.rarithmetic import LONG_BIT_SHIFT
 from rpython.rlib.debug import ll_assert, debug_print, debug_start, debug_stop
@@ -173,6 +192,26 @@ FORWARDSTUB = lltype.GcStruct('forwarding_stub',
 FORWARDSTUBPTR = lltype.Ptr(FORWARDSTUB)
 NURSARRAY = lltype.Array(llmemory.Address)
 
+# soft bound on the major collection threshold, as a fraction of the
+# memory limit of the cgroup, and the growth allowed once past it
+SOFT_MAX_HEAP_FRACTION = 0.8
+SOFT_MAX_HEAP_GROWTH = 1.1
+
+# pretenuring: a type is allocated directly as old objects by the JIT if
+# at least 7/8th of its sampled objects survived their first minor
+# collection, out of at least PRETENURE_MIN_SAMPLES.  The counters are
+# halved when they reach PRETENURE_MAX_SAMPLES, to follow changes; the
+# sampled objects of a pretenured type are still allocated young.
+PRETENURE_MIN_SAMPLES = 16
+PRETENURE_MAX_SAMPLES = 256
+PRETENURE_STATS = lltype.Array(lltype.Signed, hints={'nolength': True})
+
+# adaptive nursery size (PYPY_GC_MAX_PAUSE): when shrinking, aim a bit
+# below the target pause; only grow if less than this fraction of the
+# nursery survived the last minor collection.
+NURSERY_SHRINK_MARGIN = 0.8
+NURSERY_GROW_MAX_SURVIVAL = 0.1
+
 # ____________________________________________________________
 
 class IncrementalMiniMarkGC(MovingGCBase):
@@ -184,6 +223,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
     can_usually_pin_objects = True
     malloc_zero_filled = False
     gcflag_extra = GCFLAG_EXTRA
+    can_sample_allocations = True
+    can_pretenure = True
 
     # All objects start with a HDR, i.e. with a field 'tid' which contains
     # a word.  This word is divided in two halves: the lower half contains
@@ -256,6 +297,19 @@ class IncrementalMiniMarkGC(MovingGCBase):
         # minimal allocated size of the nursery is 2x the following
         # number (by default, at least 132KB on 32-bit and 264KB on 64-bit).
         "large_object": (16384+512)*WORD,
+
+        # When not sampling allocations for the user, take an allocation
+        # sample every so many bytes anyway, to find the types whose
+        # objects nearly always survive minor collections.  The JIT then
+        # allocates them directly as old objects.  0 disables this.
+        "pretenure_sample_interval": 64*1024,
+
+        # If > 0.0, resize the nursery after every minor collection to
+        # try to keep minor collections shorter than this many seconds.
+        # The nursery is then allocated with 'max_nursery_size' bytes,
+        # of which only 'nursery_size' are used.  Set PYPY_GC_MAX_PAUSE.
+        "minor_pause_target": 0.0,
+        "max_nursery_size": 0,
         }
 
     def __init__(self, config,
@@ -269,6 +323,9 @@ class IncrementalMiniMarkGC(MovingGCBase):
                  growth_rate_max=2.5,   # for tests
                  card_page_indices=0,
                  large_object=8*WORD,
+                 pretenure_sample_interval=0,
+                 minor_pause_target=0.0,
+                 max_nursery_size=0,
                  ArenaCollectionClass=None,
                  **kwds):
         MovingGCBase.__init__(self, config, **kwds)
@@ -283,6 +340,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
         self.min_heap_size = 0.0
         self.max_heap_size = 0.0
         self.max_heap_size_already_raised = False
+        self.soft_max_heap_size = 0.0
         self.max_delta = float(r_uint(-1))
         self.max_number_of_pinned_objects = 0      # computed later
         #
@@ -296,6 +354,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
         # it gives a lower bound on the allowed size of the nursery.
         self.nonlarge_max = large_object - 1
         #
+        self.pretenure_sample_interval = pretenure_sample_interval
+        self.minor_pause_target = minor_pause_target
+        self.max_nursery_size = max_nursery_size
+        self.min_nursery_size = 0
+        #
         self.nursery      = llmemory.NULL
         self.nursery_free = llmemory.NULL
         self.nursery_top  = llmemory.NULL
@@ -381,11 +444,36 @@ class IncrementalMiniMarkGC(MovingGCBase):
         self.old_objects_pointing_to_pinned = self.AddressStack()
         self.updated_old_objects_pointing_to_pinned = False
         #
+        # Allocation sampling, started at the end of setup().  See
+        # set_alloc_sampling().
+        self.alloc_sample_interval = 0
+        self.alloc_sample_countdown = 0
+        self.alloc_samples_reported = False
+        self.alloc_sample_ticker = llmemory.NULL
+        self.alloc_sample_armed = False
+        self.alloc_sample_start = llmemory.NULL
+        self.alloc_sample_saved_top = llmemory.NULL
+        self.alloc_samples_taken = 0
+        self.new_alloc_samples = self.AddressStack()
+        self.young_alloc_samples = self.AddressStack()
+        self.alloc_sample_results = self.AddressStack()
+        #
+        # Pretenuring: for each type, indexed by member index, the number
+        # of young samples and the number of them that survived.  Grown
+        # as needed.  See should_pretenure().
+        self.pretenure_stats = lltype.nullptr(PRETENURE_STATS)
+        self.pretenure_stats_length = 0
+        self.pretenured_size = 0
+        #
         # Allocate a nursery.  In case of auto_nursery_size, start by
         # allocating a very small nursery, enough to do things like look
         # up the env var, which requires the GC; and then really
         # allocate the nursery of the final size.
+        # 'gc_increment_step' follows the nursery size, unless it is
+        # given explicitly with PYPY_GC_INCREMENT_STEP
+        self.gc_increment_step_fixed = False
         if not self.read_from_env:
+            self.setup_adaptive_nursery()
             self.allocate_nursery()
             self.gc_increment_step = self.nursery_size * 4
             self.gc_nursery_debug = False
@@ -432,6 +520,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
             max_heap_size = env.read_uint_from_env('PYPY_GC_MAX')
             if max_heap_size > 0:
                 self.max_heap_size = float(max_heap_size)
+            else:
+                memory_limit = env.get_memory_limit()
+                if memory_limit > 0.0:
+                    self.soft_max_heap_size = (memory_limit *
+                                               SOFT_MAX_HEAP_FRACTION)
             #
             max_delta = env.read_uint_from_env('PYPY_GC_MAX_DELTA')
             if max_delta > 0:
@@ -442,6 +535,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
             gc_increment_step = env.read_uint_from_env('PYPY_GC_INCREMENT_STEP')
             if gc_increment_step > 0:
                 self.gc_increment_step = gc_increment_step
+                self.gc_increment_step_fixed = True
             else:
                 self.gc_increment_step = newsize * 4
             #
@@ -450,18 +544,40 @@ class IncrementalMiniMarkGC(MovingGCBase):
                 self.gc_nursery_debug = True
             else:
                 self.gc_nursery_debug = False
+            #
+            max_pause = env.read_float_from_env('PYPY_GC_MAX_PAUSE')
+            if max_pause > 0.0:
+                self.minor_pause_target = max_pause / 1000.0
+                self.max_nursery_size = env.read_from_env('PYPY_GC_NURSERY_MAX')
             self.minor_collection()    # to empty the nursery
             llarena.arena_free(self.nursery)
             self.nursery_size = newsize
+            self.setup_adaptive_nursery()
             self.allocate_nursery()
         #
         # Estimate this number conservatively
         bigobj = self.nonlarge_max + 1
         self.max_number_of_pinned_objects = self.nursery_size / (bigobj * 2)
+        #
+        # Start the sampling for pretenuring, if enabled
+        self.set_alloc_sampling(0)
+
+    def setup_adaptive_nursery(self):
+        # Called just before allocating the final nursery.  If the nursery
+        # size is adaptive, we allocate it with 'max_nursery_size' bytes
+        # once and for all, and only change 'nursery_size' afterwards.
+        if self.minor_pause_target > 0.0 and self.debug_tiny_nursery < 0:
+            self.min_nursery_size = 2 * (self.nonlarge_max + 1)
+            if self.max_nursery_size < self.nursery_size:
+                self.max_nursery_size = self.nursery_size * 8
+            self.max_nursery_size &= ~(WORD-1)
+        else:
+            self.minor_pause_target = 0.0
+            self.max_nursery_size = self.nursery_size
 
     def _nursery_memory_size(self):
         extra = self.nonlarge_max + 1
-        return self.nursery_size + extra
+        return max(self.nursery_size, self.max_nursery_size) + extra
 
     def _alloc_nursery(self):
         # the start of the nursery: we actually allocate a bit more for
@@ -495,6 +611,19 @@ class IncrementalMiniMarkGC(MovingGCBase):
         debug_stop("gc-set-nursery-size")
 
 
+    def next_major_threshold_for(self, total_memory_used):
+        # Compute the threshold for the next major collection from the
+        # memory used after this one.
+        threshold = min(total_memory_used * self.major_collection_threshold,
+                        total_memory_used + self.max_delta)
+        soft_max = self.soft_max_heap_size
+        if soft_max > 0.0 and threshold > soft_max:
+            # near the memory limit of the cgroup: collect more often,
+            # but still let the heap grow a bit above the soft limit
+            threshold = min(threshold, max(soft_max, total_memory_used *
+                                                     SOFT_MAX_HEAP_GROWTH))
+        return threshold
+
     def set_major_threshold_from(self, threshold, reserving_size=0):
         # Set the next_major_collection_threshold.
         threshold_max = (self.next_major_collection_initial *
@@ -689,6 +818,19 @@ class IncrementalMiniMarkGC(MovingGCBase):
         now-empty nursery.
         """
 
+        if self.alloc_sample_armed:
+            # Undo the reservation done by the caller, and restore the
+            # real nursery_top.
+            self.nursery_free = self.nursery_free - totalsize
+            self.disarm_alloc_sampler()
+            result = self.nursery_free
+            if result + totalsize <= self.nursery_top:
+                # We only got here because nursery_top was lowered to the
+                # next allocation sample point.
+                self.nursery_free = result + totalsize
+                self.alloc_sample_reserved(result, totalsize)
+                return result
+        #
         minor_collection_count = 0
         while True:
             self.nursery_free = llmemory.NULL      # debug: don't use me
@@ -717,6 +859,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
                         # The nursery might not be empty now, because of
                         # execute_finalizers().  If it is almost full again,
                         # we need to fix it with another call to minor_collection().
+                        self.disarm_alloc_sampler()
                         if self.nursery_free + totalsize > self.nursery_top:
                             self.minor_collection()
                     #
@@ -725,6 +868,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
                             "Seeing minor_collection() at least twice."
                             "Too many pinned objects?")
             #
+            # minor_collection() re-arms the allocation sampler
+            self.disarm_alloc_sampler()
             result = self.nursery_free
             if self.nursery_free + totalsize <= self.nursery_top:
                 self.nursery_free = result + totalsize
@@ -736,9 +881,232 @@ class IncrementalMiniMarkGC(MovingGCBase):
             if self.nursery_top - self.nursery_free > self.debug_tiny_nursery:
                 self.nursery_free = self.nursery_top - self.debug_tiny_nursery
         #
+        if self.alloc_sample_interval > 0:
+            self.alloc_sample_reserved(result, totalsize)
         return result
     collect_and_reserve._dont_inline_ = True
 
+    # ----------
+    # Allocation sampling
+
+    def set_alloc_sampling(self, interval, ticker=llmemory.NULL):
+        """Take an allocation sample every 'interval' bytes allocated,
+        or stop sampling if 'interval' is 0.  Each reported sample also
+        writes -1 at the address 'ticker', if not NULL.  While sampling, nursery_top
+        is lowered to the next sample point, so that the allocation that
+        crosses it goes to collect_and_reserve() and not only the fast
+        path.  The samples are reported by fetch_alloc_samples() in
+        inspector.py.  When they are not reported, we still sample every
+        'pretenure_sample_interval' bytes for should_pretenure().
+        """
+        self.disarm_alloc_sampler()
+        if interval > 0:
+            self.alloc_samples_reported = True
+            self.alloc_sample_ticker = ticker
+        else:
+            self.alloc_samples_reported = False
+            self.alloc_sample_ticker = llmemory.NULL
+            interval = self.pretenure_sample_interval
+        self.alloc_sample_interval = interval
+        self.alloc_sample_countdown = interval
+        self.arm_alloc_sampler()
+
+    def arm_alloc_sampler(self):
+        if self.alloc_sample_interval > 0:
+            ll_assert(not self.alloc_sample_armed, "sampler already armed")
+            self.alloc_sample_armed = True
+            self.alloc_sample_start = self.nursery_free
+            countdown = self.alloc_sample_countdown
+            if countdown <= self.nursery_top - self.nursery_free:
+                # the allocation that reaches the sample point must not
+                # fit, hence the '- 1'
+                if countdown < 1:
+                    countdown = 1
+                self.alloc_sample_saved_top = self.nursery_top
+                self.nursery_top = self.nursery_free + (countdown - 1)
+
+    def disarm_alloc_sampler(self):
+        # Restore the real nursery_top, and count the bytes allocated
+        # in the nursery since arm_alloc_sampler().
+        if self.alloc_sample_armed:
+            if self.alloc_sample_saved_top:
+                self.nursery_top = self.alloc_sample_saved_top
+                self.alloc_sample_saved_top = llmemory.NULL
+            self.alloc_sample_countdown -= (self.nursery_free -
+                                            self.alloc_sample_start)
+            self.alloc_sample_armed = False
+
+    def alloc_sample_reserved(self, result, totalsize):
+        # 'totalsize' bytes were just reserved at 'result' by
+        # collect_and_reserve().  Count them, maybe take a sample, and
+        # re-arm the sampler.
+        self.alloc_sample_countdown -= raw_malloc_usage(totalsize)
+        if self.alloc_sample_countdown <= 0:
+            size_gc_header = self.gcheaderbuilder.size_gc_header
+            self.take_alloc_sample(result + size_gc_header, totalsize, True)
+        self.arm_alloc_sampler()
+
+    def take_alloc_sample(self, obj, totalsize, young):
+        # Note that 'obj' is not initialized yet if it is in the nursery.
+        self.alloc_sample_countdown = self.alloc_sample_interval
+        self.alloc_samples_taken += 1
+        sample_id = self.alloc_samples_taken
+        if self.alloc_samples_reported:
+            self.new_alloc_samples.append(int_as_address(sample_id))
+            self.new_alloc_samples.append(
+                int_as_address(raw_malloc_usage(totalsize)))
+            if self.alloc_sample_ticker:
+                # like a signal: run the periodic actions at the next
+                # bytecode, which fetch the sample with the right stack
+                self.alloc_sample_ticker.signed[0] = -1
+        if young:
+            self.young_alloc_samples.append(obj)
+            self.young_alloc_samples.append(int_as_address(sample_id))
+        elif self.alloc_samples_reported:
+            # allocated directly as an old object
+            self.alloc_sample_results.append(int_as_address(sample_id))
+
+    def record_young_alloc_samples(self):
+        # Called by minor_collection() when all surviving young objects
+        # have been found.  The result of a sample is 'sample_id' if the
+        # object survived, and '-sample_id' if it died.
+        while self.young_alloc_samples.non_empty():
+            sample_id = address_as_int(self.young_alloc_samples.pop())
+            obj = self.young_alloc_samples.pop()
+            if self.is_in_nursery(obj):
+                # moved out, or pinned and still alive
+                survived = (self.is_forwarded(obj) or
+                            self.header(obj).tid & GCFLAG_VISITED != 0)
+            else:
+                survived = self.header(obj).tid & GCFLAG_VISITED_RMY != 0
+            self.record_pretenure_sample(
+                self.get_possibly_forwarded_type_id(obj), survived)
+            if self.alloc_samples_reported:
+                if not survived:
+                    sample_id = -sample_id
+                self.alloc_sample_results.append(int_as_address(sample_id))
+
+    # ----------
+    # Pretenuring
+
+    def record_pretenure_sample(self, typeid, survived):
+        index = self.get_member_index(typeid) * 2
+        if index >= self.pretenure_stats_length:
+            self._grow_pretenure_stats(index + 2)
+        stats = self.pretenure_stats
+        stats[index] += 1
+        if survived:
+            stats[index + 1] += 1
+        if stats[index] >= PRETENURE_MAX_SAMPLES:
+            stats[index] >>= 1
+            stats[index + 1] >>= 1
+
+    def _grow_pretenure_stats(self, minlength):
+        newlength = self.pretenure_stats_length * 2
+        if newlength < minlength:
+            newlength = minlength
+        newstats = lltype.malloc(PRETENURE_STATS, newlength, flavor='raw',
+                                 zero=True, track_allocation=False)
+        i = 0
+        while i < self.pretenure_stats_length:
+            newstats[i] = self.pretenure_stats[i]
+            i += 1
+        if self.pretenure_stats:
+            lltype.free(self.pretenure_stats, flavor='raw',
+                        track_allocation=False)
+        self.pretenure_stats = newstats
+        self.pretenure_stats_length = newlength
+
+    def should_pretenure(self, typeid):
+        """Should objects of this fixed-size type rather be allocated with
+        malloc_fixedsize_old()?  Yes if nearly all the sampled ones
+        survived their first minor collection.  Called by the JIT when
+        compiling an allocation.
+        """
+        totalsize = self.gcheaderbuilder.size_gc_header + self.fixed_size(
+            typeid)
+        if (raw_malloc_usage(totalsize) > self.small_request_threshold or
+                self.is_varsize(typeid) or
+                self.getfinalizer(typeid) or
+                self.getlightfinalizer(typeid) or
+                self.weakpointer_offset(typeid) >= 0):
+            return False
+        index = self.get_member_index(typeid) * 2
+        if index >= self.pretenure_stats_length:
+            return False
+        count = self.pretenure_stats[index]
+        survived = self.pretenure_stats[index + 1]
+        return count >= PRETENURE_MIN_SAMPLES and survived * 8 >= count * 7
+
+    def malloc_fixedsize_old(self, typeid, size):
+        """Allocate a fixed-size object directly as an old object, for
+        the types selected by should_pretenure().  It is not zero-filled.
+        It is returned already in 'old_objects_pointing_to_young' if it
+        contains gc pointers, as if the write barrier was called: young
+        pointers can be written into it without write barrier until the
+        next collection.  The objects on which allocation samples are
+        taken are still allocated in the nursery, so that we keep
+        seeing if the objects of this type survive.
+        """
+        size_gc_header = self.gcheaderbuilder.size_gc_header
+        totalsize = size_gc_header + size
+        rawtotalsize = raw_malloc_usage(totalsize)
+        ll_assert(rawtotalsize <= self.small_request_threshold,
+                  "malloc_fixedsize_old: object too large")
+        #
+        if self.alloc_sample_interval > 0:
+            self.disarm_alloc_sampler()
+            if self.alloc_sample_countdown <= rawtotalsize:
+                return self._malloc_young_sample(typeid, totalsize)
+            self.alloc_sample_countdown -= rawtotalsize
+            self.arm_alloc_sampler()
+        #
+        # Count these objects as if they were allocated in the nursery.
+        # Otherwise, a program allocating mostly such objects would not
+        # do any minor collection, and thus no major collection step.
+        self.pretenured_size += rawtotalsize
+        if self.pretenured_size > self.nursery_size:
+            self.minor_collection()
+            if (self.gc_state != STATE_SCANNING or
+                    self.get_total_memory_used() >
+                    self.next_major_collection_threshold):
+                self.major_collection_step()
+        #
+        # Same check as in external_malloc()
+        if self.get_total_memory_free() < rawtotalsize:
+            self.minor_collection()
+            if self.get_total_memory_free() < (rawtotalsize +
+                                               self.nursery_size // 2):
+                self.gc_step_until(STATE_SWEEPING)
+                self.gc_step_until(STATE_FINALIZING, rawtotalsize)
+        #
+        totalsize = llarena.round_up_for_allocation(totalsize)
+        result = self.ac.malloc(totalsize)
+        self.init_gc_object(result, typeid, 0)
+        obj = result + size_gc_header
+        if self.has_gcptr(typeid):
+            self.old_objects_pointing_to_young.append(obj)
+        return llmemory.cast_adr_to_ptr(obj, llmemory.GCREF)
+
+    def _malloc_young_sample(self, typeid, totalsize):
+        # Allocate in the nursery the object on which the next allocation
+        # sample is taken.  Its survival goes into the statistics of
+        # should_pretenure(), which can thus change its mind if the
+        # objects of this type stop surviving.  The sampler is disarmed.
+        min_size = raw_malloc_usage(self.minimal_size_in_nursery)
+        if raw_malloc_usage(totalsize) < min_size:
+            totalsize = min_size
+        result = self.nursery_free
+        if result + totalsize > self.nursery_top:
+            result = self.collect_and_reserve(totalsize)
+        else:
+            self.nursery_free = result + totalsize
+            self.alloc_sample_reserved(result, totalsize)
+        llarena.arena_reserve(result, totalsize)
+        self.init_gc_object(result, typeid, flags=0)
+        obj = result + self.gcheaderbuilder.size_gc_header
+        return llmemory.cast_adr_to_ptr(obj, llmemory.GCREF)
+
 
     def external_malloc(self, typeid, length, can_make_young=True):
         """Allocate a large object using the ArenaCollection or
@@ -876,6 +1244,16 @@ class IncrementalMiniMarkGC(MovingGCBase):
         if self.is_varsize(typeid):
             offset_to_length = self.varsize_offset_to_length(typeid)
             (result + size_gc_header + offset_to_length).signed[0] = length
+        #
+        if self.alloc_sample_interval > 0:
+            self.alloc_sample_countdown -= raw_malloc_usage(totalsize)
+            if self.alloc_sample_countdown <= 0:
+                # the object is young only if it is in the dict
+                young = (bool(self.young_rawmalloced_objects) and
+                         self.young_rawmalloced_objects.contains(
+                             result + size_gc_header))
+                self.take_alloc_sample(result + size_gc_header, totalsize,
+                                       young)
         return result + size_gc_header
 
 
@@ -898,6 +1276,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
         if self.next_major_collection_threshold < 0:
             # cannot trigger a full collection now, but we can ensure
             # that one will occur very soon
+            self.disarm_alloc_sampler()
             self.nursery_free = self.nursery_top
 
     def can_optimize_clean_setarrayitems(self):
@@ -1472,11 +1851,50 @@ class IncrementalMiniMarkGC(MovingGCBase):
     # ----------
     # Nursery collection
 
+    def adapt_nursery_size(self, pause):
+        """Called at the end of a minor collection that took 'pause'
+        seconds, if the nursery is now empty.  For a given survival rate,
+        the pause is roughly proportional to the nursery size: shrink
+        the nursery if we are above 'minor_pause_target', and double it
+        if we are well below and few objects survived, because then a
+        bigger nursery gives more time to the objects to die.
+        """
+        size = self.nursery_size
+        if pause > self.minor_pause_target:
+            newsize = int(size * (self.minor_pause_target / pause) *
+                          NURSERY_SHRINK_MARGIN)
+        elif (pause * 4.0 < self.minor_pause_target and
+              self.nursery_surviving_size <
+                  int(size * NURSERY_GROW_MAX_SURVIVAL)):
+            newsize = size * 2
+        else:
+            return
+        if newsize < self.min_nursery_size:
+            newsize = self.min_nursery_size
+        if newsize > self.max_nursery_size:
+            newsize = self.max_nursery_size
+        newsize &= ~(WORD-1)
+        if newsize != size:
+            self.nursery_size = newsize
+            bigobj = self.nonlarge_max + 1
+            self.max_number_of_pinned_objects = newsize / (bigobj * 2)
+            if not self.gc_increment_step_fixed:
+                self.gc_increment_step = newsize * 4
+            debug_print("new nursery size:", newsize, "after a pause of",
+                        pause)
+
     def minor_collection(self):
         """Perform a minor collection: find the objects from the nursery
         that remain alive and move them out."""
         #
         debug_start("gc-minor")
+        if self.minor_pause_target > 0.0:
+            start_time = time.time()
+        else:
+            start_time = 0.0
+        #
+        # Restore the real nursery_top if the allocation sampler lowered it.
+        self.disarm_alloc_sampler()
         #
         # All nursery barriers are invalid from this point on.  They
         # are evaluated anew as part of the minor collection.
@@ -1573,6 +1991,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
             else:
                 self.nursery_objects_shadows.clear()
         #
+        # Record which of the sampled young objects survived.  This must
+        # be done before the young raw-malloced objects are freed.
+        if self.young_alloc_samples.non_empty():
+            self.record_young_alloc_samples()
+        #
         # Walk the list of young raw-malloced objects, and either free
         # them or make them old.
         if self.young_rawmalloced_objects:
@@ -1619,6 +2042,11 @@ class IncrementalMiniMarkGC(MovingGCBase):
         else:
             llarena.arena_reset(prev, self.nursery + self.nursery_size - prev, 0)
         #
+        # the nursery is now empty, unless there are pinned objects:
+        # resize it if needed
+        if self.minor_pause_target > 0.0 and self.pinned_objects_in_nursery == 0:
+            self.adapt_nursery_size(time.time() - start_time)
+        #
         nursery_barriers.append(self.nursery + self.nursery_size)
         self.nursery_barriers = nursery_barriers
         self.surviving_pinned_objects.delete()
@@ -1626,6 +2054,8 @@ class IncrementalMiniMarkGC(MovingGCBase):
         # XXX gc-minimark-pinning does a debug_rotate_nursery() here (groggi)
         self.nursery_free = self.nursery
         self.nursery_top = self.nursery_barriers.popleft()
+        self.arm_alloc_sampler()
+        self.pretenured_size = 0
         #
         # clear GCFLAG_PINNED_OBJECT_PARENT_KNOWN from all parents in the list.
         self.old_objects_pointing_to_pinned.foreach(
@@ -2085,23 +2515,27 @@ class IncrementalMiniMarkGC(MovingGCBase):
             #END MARKING
         elif self.gc_state == STATE_SWEEPING:
             #
+            # Ask the ArenaCollection to visit a fraction of the objects.
+            # Free the ones that have not been visited above, and reset
+            # GCFLAG_VISITED on the others.  Visit at most '3 *
+            # nursery_size' bytes.
+            page_limit = 3 * self.nursery_size // self.ac.page_size
             if self.raw_malloc_might_sweep.non_empty():
-                # Walk all rawmalloced objects and free the ones that don't
-                # have the GCFLAG_VISITED flag.  Visit at most 'limit' objects.
-                # This limit is conservatively high enough to guarantee that
-                # a total object size of at least '3 * nursery_size' bytes
-                # is processed.
+                # First walk all rawmalloced objects and free the ones that
+                # don't have the GCFLAG_VISITED flag.  Visit at most 'limit'
+                # objects.  This limit is conservatively high enough to
+                # guarantee that a total object size of at least
+                # '3 * nursery_size' bytes is processed.  If we finish them
+                # before reaching the limit, use the rest of this step to
+                # start on the arenas, instead of waiting for the next step.
                 limit = 3 * self.nursery_size // self.small_request_threshold
-                self.free_unvisited_rawmalloc_objects_step(limit)
-                done = False    # the 2nd half below must still be done
-            else:
-                # Ask the ArenaCollection to visit a fraction of the objects.
-                # Free the ones that have not been visited above, and reset
-                # GCFLAG_VISITED on the others.  Visit at most '3 *
-                # nursery_size' bytes.
-                limit = 3 * self.nursery_size // self.ac.page_size
+                remaining = self.free_unvisited_rawmalloc_objects_step(limit)
+                page_limit = page_limit * remaining // limit
+            if page_limit > 0 and not self.raw_malloc_might_sweep.non_empty():
                 done = self.ac.mass_free_incremental(self._free_if_unvisited,
-                                                     limit)
+                                                     page_limit)
+            else:
+                done = False    # the arenas must still be swept
             # XXX tweak the limits above
             #
             if done:
@@ -2116,8 +2550,7 @@ class IncrementalMiniMarkGC(MovingGCBase):
                 # we currently have.
                 total_memory_used = float(self.get_total_memory_used())
                 bounded = self.set_major_threshold_from(
-                    min(total_memory_used * self.major_collection_threshold,
-                        total_memory_used + self.max_delta),
+                    self.next_major_threshold_for(total_memory_used),
                     reserving_size)
                 #
                 # Max heap size: gives an upper bound on the threshold.  If we
@@ -2256,7 +2689,13 @@ class IncrementalMiniMarkGC(MovingGCBase):
             self.objects_to_trace.append(obj)
 
     def _collect_ref_rec(self, root, ignored):
-        self.objects_to_trace.append(root.address[0])
+        obj = root.address[0]
+        # Don't push the objects that visit() would ignore anyway.  On
+        # a large heap, many references go to objects already visited,
+        # and this saves pushing and popping them again.
+        if not (self.header(obj).tid &
+                (GCFLAG_VISITED | GCFLAG_NO_HEAP_PTRS | GCFLAG_PINNED)):
+            self.objects_to_trace.append(obj)
 
     def visit_all_objects(self):
         while self.objects_to_trace.non_empty():
@@ -7,6 +7,7 @@ from rpython.rtyper.module.ll_os import UNDERSCORE_ON_WIN32
 from rpython.rlib import rposix, rgc, jit
 
 from rpython.memory.support import AddressDict, get_address_stack
+from rpython.memory.support import address_as_int
 
 
 # ---------- implementation of rpython.rlib.rgc.get_rpy_roots() ----------
@@ -105,10 +106,11 @@ class HeapDumper(object):
     _alloc_flavor_ = "raw"
     BUFSIZE = 8192     # words
 
-    def __init__(self, gc, fd):
+    def __init__(self, gc, fd, write_func):
         self.gc = gc
         self.gcflag = gc.gcflag_extra
         self.fd = rffi.cast(rffi.INT, fd)
+        self.write_func = write_func
         self.writebuffer = lltype.malloc(rffi.SIGNEDP.TO, self.BUFSIZE,
                                          flavor='raw')
         self.buf_count = 0
@@ -127,12 +129,22 @@ class HeapDumper(object):
     def flush(self):
         if self.buf_count > 0:
             bytes = self.buf_count * rffi.sizeof(rffi.LONG)
-            count = raw_os_write(self.fd,
-                                 rffi.cast(llmemory.Address, self.writebuffer),
-                                 rffi.cast(rffi.SIZE_T, bytes))
-            if rffi.cast(lltype.Signed, count) != bytes:
-                raise OSError(rffi.cast(lltype.Signed, rposix._get_errno()),
-                              "raw_os_write failed")
+            if self.write_func:
+                err = self.write_func(rffi.cast(lltype.Signed, self.fd),
+                                      llmemory.cast_ptr_to_adr(
+                                          self.writebuffer),
+                                      bytes)
+                if err != 0:
+                    raise OSError(err, "dump_rpy_heap write_func failed")
+            else:
+                count = raw_os_write(self.fd,
+                                     rffi.cast(llmemory.Address,
+                                               self.writebuffer),
+                                     rffi.cast(rffi.SIZE_T, bytes))
+                if rffi.cast(lltype.Signed, count) != bytes:
+                    raise OSError(rffi.cast(lltype.Signed,
+                                            rposix._get_errno()),
+                                  "raw_os_write failed")
             self.buf_count = 0
     flush._dont_inline_ = True
 
@@ -226,8 +238,8 @@ def _hd_add_root(obj, heap_dumper):
 def _hd_unadd_root(obj, heap_dumper):
     heap_dumper.unadd(obj)
 
-def dump_rpy_heap(gc, fd):
-    heapdumper = HeapDumper(gc, fd)
+def dump_rpy_heap(gc, fd, write_func=lltype.nullptr(rgc.DUMP_WRITE_FUNC.TO)):
+    heapdumper = HeapDumper(gc, fd, write_func)
     heapdumper.add_roots()
     heapdumper.walk(heapdumper.pending)
     heapdumper.flush()
@@ -245,3 +257,30 @@ def get_typeids_list(gc):
     srcaddress = gc.root_walker.gcdata.typeids_list
     return llmemory.cast_adr_to_ptr(srcaddress, lltype.Ptr(ARRAY_OF_HALFWORDS))
 ARRAY_OF_HALFWORDS = lltype.Array(llgroup.HALFWORD)
+
+# ---------- implementation of rpython.rlib.rgc.set_alloc_sampling() ----------
+
+def set_alloc_sampling(gc, interval, ticker):
+    if gc.can_sample_allocations:
+        gc.set_alloc_sampling(interval, ticker)
+
+def _pop_all_ints(stack):
+    # Allocating the list may add more items to 'stack'; they are
+    # left there for the next call.
+    count = stack.length()
+    result = [0] * count
+    i = count
+    while i > 0:
+        i -= 1
+        result[i] = address_as_int(stack.pop())
+    return result
+
+def fetch_alloc_samples(gc):
+    if not gc.can_sample_allocations:
+        return []
+    return _pop_all_ints(gc.new_alloc_samples)
+
+def fetch_alloc_sample_results(gc):
+    if not gc.can_sample_allocations:
+        return []
+    return _pop_all_ints(gc.alloc_sample_results)
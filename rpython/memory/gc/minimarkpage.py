@@ -25,6 +25,10 @@ ARENA = lltype.Struct('ArenaReference',
     ('totalpages', lltype.Signed),
     # -- A chained list of free pages in the arena.  Ends with NULL.
     ('freepages', llmemory.Address),
+    # -- The free pages whose memory was returned to the OS, which are
+    #    not in the 'freepages' list.  See release_free_pages().
+    ('releasedpages', lltype.Signed),
+    ('releasedlist', rffi.CArrayPtr(llmemory.Address)),
     # -- A linked list of arenas.  See below.
     ('nextarena', ARENA_PTR),
     )
@@ -40,6 +44,12 @@ ARENA_NULL = lltype.nullptr(ARENA)
 # arenas that have 'nfreepages == i'.  We allocate pages out of the
 # arena in 'current_arena'; when it is exhausted we pick another arena
 # with the smallest value for nfreepages (but > 0).
+#
+# After a major collection, the memory of the free pages of arenas that
+# are not entirely free is returned to the OS with arena_release().  As
+# this includes the link of 'freepages' at the start of each page, these
+# pages are moved from 'freepages' to the array 'releasedlist' first.
+# 'nfreepages' counts the pages in both.
 
 # ____________________________________________________________
 #
@@ -201,7 +211,7 @@ class ArenaCollection(object):
         # The result is simply 'current_arena.freepages'.
         arena = self.current_arena
         result = arena.freepages
-        if arena.nfreepages > 0:
+        if arena.nfreepages > arena.releasedpages:
             #
             # The 'result' was part of the chained list; read the next.
             arena.nfreepages -= 1
@@ -210,6 +220,14 @@ class ArenaCollection(object):
                                 llmemory.sizeof(llmemory.Address),
                                 0)
             #
+        elif arena.releasedpages > 0:
+            #
+            # Take a page whose memory was returned to the OS.
+            arena.nfreepages -= 1
+            arena.releasedpages -= 1
+            freepages = result
+            result = arena.releasedlist[arena.releasedpages]
+            #
         else:
             # The 'result' is part of the uninitialized pages.
             ll_assert(self.num_uninitialized_pages > 0,
@@ -221,11 +239,9 @@ class ArenaCollection(object):
                 freepages = NULL
         #
         arena.freepages = freepages
-        if freepages == NULL:
+        if freepages == NULL and arena.nfreepages == 0:
             # This was the last page, so put the arena away into
             # arenas_lists[0].
-            ll_assert(arena.nfreepages == 0, 
-                      "freepages == NULL but nfreepages > 0")
             arena.nextarena = self.arenas_lists[0]
             self.arenas_lists[0] = arena
             self.current_arena = ARENA_NULL
@@ -307,6 +323,10 @@ class ArenaCollection(object):
         arena = lltype.malloc(ARENA, flavor='raw', track_allocation=False)
         arena.base = arena_base
         arena.nfreepages = 0        # they are all uninitialized pages
+        arena.releasedpages = 0
+        arena.releasedlist = lltype.malloc(rffi.CArray(llmemory.Address),
+                                           npages, flavor='raw',
+                                           track_allocation=False)
         arena.totalpages = npages
         arena.freepages = firstpage
         self.num_uninitialized_pages = npages
@@ -359,6 +379,7 @@ class ArenaCollection(object):
         #
         if size_class >= 0:
             self._rehash_arenas_lists()
+            self.release_free_pages()
             self.size_class_with_old_pages = -1
         #
         return True
@@ -396,6 +417,8 @@ class ArenaCollection(object):
                     #
                     # The whole arena is empty.  Free it.
                     llarena.arena_free(arena.base)
+                    lltype.free(arena.releasedlist, flavor='raw',
+                                track_allocation=False)
                     lltype.free(arena, flavor='raw', track_allocation=False)
                     #
                 else:
@@ -412,6 +435,36 @@ class ArenaCollection(object):
         self.min_empty_nfreepages = 1
 
 
+    def release_free_pages(self):
+        """Return to the OS the memory of the free pages that are not
+        released yet, in the arenas that still contain objects.
+        """
+        if self.current_arena != ARENA_NULL:
+            self._release_free_pages_in(self.current_arena)
+        i = 1
+        while i < self.max_pages_per_arena:
+            arena = self.arenas_lists[i]
+            while arena != ARENA_NULL:
+                self._release_free_pages_in(arena)
+                arena = arena.nextarena
+            i += 1
+
+    def _release_free_pages_in(self, arena):
+        # the 'nfreepages - releasedpages' pages of the 'freepages' list
+        # are not released yet.  Move them to 'releasedlist', which lets
+        # us release the whole pages, including their link.
+        n = arena.nfreepages - arena.releasedpages
+        pageaddr = arena.freepages
+        while n > 0:
+            nextpage = pageaddr.address[0]
+            llarena.arena_release(pageaddr, self.page_size)
+            arena.releasedlist[arena.releasedpages] = pageaddr
+            arena.releasedpages += 1
+            pageaddr = nextpage
+            n -= 1
+        arena.freepages = pageaddr
+
+
     def mass_free_in_pages(self, size_class, ok_to_free_func, max_pages):
         nblocks = self.nblocks_for_size[size_class]
         block_size = size_class * WORD
@@ -505,6 +558,11 @@ class ArenaCollection(object):
         obj += self.hdrsize
         surviving = 0    # initially
         skip_free_blocks = page.nfree
+        # 'nfree' is kept in a local variable and only written back at
+        # the end: the writes done on the free blocks below would
+        # otherwise force the C compiler to update 'page.nfree' in memory
+        # for every freed object.
+        nfree = skip_free_blocks
         #
         while True:
             #
@@ -540,7 +598,7 @@ class ArenaCollection(object):
                     obj.address[0] = freeblock
                     #
                     # Update the number of free objects in the page.
-                    page.nfree += 1
+                    nfree += 1
                     #
                 else:
                     # The object survives.
@@ -548,6 +606,8 @@ class ArenaCollection(object):
             #
             obj += block_size
         #
+        page.nfree = nfree
+        #
         # Update the global total size of objects.
         self.total_memory_used += r_uint(surviving * block_size)
         #
@@ -7,7 +7,7 @@ see as the list of roots (stack and prebuilt objects).
 # XXX VERY INCOMPLETE, low coverage
 
 import py
-from rpython.rtyper.lltypesystem import lltype, llmemory
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
 from rpython.memory.gctypelayout import TypeLayoutBuilder
 from rpython.rlib.rarithmetic import LONG_BIT, is_valid_int
 from rpython.memory.gc import minimark, incminimark
@@ -667,6 +667,248 @@ class TestIncrementalMiniMarkGCSimple(TestMiniMarkGCSimple):
         self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
         assert self.stackroots[1].x == 13
 
+    def test_alloc_sampling_every_allocation(self):
+        from rpython.memory.gc import inspector
+        self.gc.set_alloc_sampling(1)
+        for i in range(10):
+            p = self.malloc(S)
+            p.x = i
+            if i % 3 == 0:
+                self.stackroots.append(p)
+        samples = inspector.fetch_alloc_samples(self.gc)
+        assert samples[0::2] == range(1, 11)
+        size = samples[1]
+        assert size > 0 and samples[1::2] == [size] * 10
+        assert inspector.fetch_alloc_samples(self.gc) == []
+        self.gc.collect(0)
+        results = inspector.fetch_alloc_sample_results(self.gc)
+        assert sorted(results) == [-9, -8, -6, -5, -3, -2, 1, 4, 7, 10]
+        assert [p.x for p in self.stackroots] == [0, 3, 6, 9]
+        #
+        self.gc.set_alloc_sampling(0)
+        assert not self.gc.alloc_sample_saved_top
+        self.malloc(S)
+        assert inspector.fetch_alloc_samples(self.gc) == []
+
+    def test_alloc_sampling_interval(self):
+        from rpython.memory.gc import inspector
+        self.gc.set_alloc_sampling(1)
+        self.malloc(S)
+        size = inspector.fetch_alloc_samples(self.gc)[1]
+        self.gc.set_alloc_sampling(10 * size)
+        for i in range(200):
+            self.malloc(S)
+        samples = inspector.fetch_alloc_samples(self.gc)
+        assert len(samples) // 2 == 20
+
+    def test_alloc_sampling_ticker(self):
+        from rpython.memory.gc import inspector
+        ticker = lltype.malloc(rffi.CArray(lltype.Signed), 1, flavor='raw')
+        ticker[0] = 1000
+        self.gc.set_alloc_sampling(1, llmemory.cast_ptr_to_adr(ticker))
+        self.malloc(S)
+        assert ticker[0] == -1
+        assert len(inspector.fetch_alloc_samples(self.gc)) == 2
+        self.gc.set_alloc_sampling(0, llmemory.cast_ptr_to_adr(ticker))
+        ticker[0] = 1000
+        taken = self.gc.alloc_samples_taken
+        self.malloc(S)
+        assert self.gc.alloc_samples_taken == taken + 1
+        assert ticker[0] == 1000     # not written for unreported samples
+        lltype.free(ticker, flavor='raw')
+    test_alloc_sampling_ticker.GC_PARAMS = {'pretenure_sample_interval': 1}
+
+    def test_alloc_sampling_large_object(self):
+        from rpython.memory.gc import inspector
+        self.gc.set_alloc_sampling(1)
+        largeobj_size = self.gc.nonlarge_max + 1
+        self.stackroots.append(self.malloc(VAR, largeobj_size))
+        self.malloc(VAR, largeobj_size)
+        samples = inspector.fetch_alloc_samples(self.gc)
+        assert samples[0::2] == [1, 2]
+        assert samples[1] > largeobj_size
+        self.gc.collect(0)
+        results = inspector.fetch_alloc_sample_results(self.gc)
+        assert sorted(results) == [-2, 1]
+
+    def test_pretenure_stats(self):
+        typeid_s = self.get_type_id(S)
+        typeid_node = self.get_type_id(VARNODE)
+        typeid_var = self.get_type_id(VAR)
+        for i in range(incminimark.PRETENURE_MIN_SAMPLES):
+            self.stackroots.append(self.malloc(S))
+            self.stackroots.append(self.malloc(VAR, 1))
+            self.malloc(VARNODE)
+        self.gc.collect(0)
+        assert self.gc.should_pretenure(typeid_s)
+        assert not self.gc.should_pretenure(typeid_node)
+        assert not self.gc.should_pretenure(typeid_var)   # not fixed-size
+        # the samples were not reported
+        from rpython.memory.gc import inspector
+        assert inspector.fetch_alloc_samples(self.gc) == []
+        assert inspector.fetch_alloc_sample_results(self.gc) == []
+    test_pretenure_stats.GC_PARAMS = {'pretenure_sample_interval': 1}
+
+    def malloc_old(self, TYPE):
+        typeid = self.get_type_id(TYPE)
+        gcref = self.gc.malloc_fixedsize_old(typeid, self.gc.fixed_size(typeid))
+        p = lltype.cast_opaque_ptr(lltype.Ptr(TYPE), gcref)
+        zero_gc_pointers_inside(p, TYPE)
+        return p
+
+    def test_malloc_fixedsize_old(self):
+        p = self.malloc_old(S)
+        addr = llmemory.cast_ptr_to_adr(p)
+        assert not self.gc.is_in_nursery(addr)
+        self.stackroots.append(p)
+        # no write barrier needed before the next collection
+        p.next = self.malloc(S)
+        p.next.x = 42
+        self.gc.collect(0)
+        p = self.stackroots[0]
+        assert llmemory.cast_ptr_to_adr(p) == addr
+        assert not self.gc.is_in_nursery(llmemory.cast_ptr_to_adr(p.next))
+        assert p.next.x == 42
+        assert self.gc.header(addr).tid & incminimark.GCFLAG_TRACK_YOUNG_PTRS
+        self.gc.collect()
+        assert self.stackroots[0].next.x == 42
+
+    def test_malloc_fixedsize_old_does_minor_collections(self):
+        self.stackroots.append(self.malloc(S))
+        for i in range(2 * self.gc.nursery_size // (4 * WORD)):
+            self.malloc_old(S)
+            if not self.gc.is_in_nursery(
+                    llmemory.cast_ptr_to_adr(self.stackroots[0])):
+                break
+        else:
+            raise AssertionError("no minor collection")
+
+    def test_malloc_fixedsize_old_memory_pressure(self):
+        self.stackroots.append(self.malloc(S))
+        self.gc.get_total_memory_free = lambda: 0
+        self.malloc_old(S)
+        # like external_malloc(), this does a minor collection and then
+        # finishes the marking of a major collection
+        assert not self.gc.is_in_nursery(
+            llmemory.cast_ptr_to_adr(self.stackroots[0]))
+        assert self.gc.gc_state == incminimark.STATE_FINALIZING
+
+    def test_pretenure_samples_in_nursery(self):
+        typeid_s = self.get_type_id(S)
+        for i in range(incminimark.PRETENURE_MIN_SAMPLES):
+            self.stackroots.append(self.malloc(S))
+        self.gc.collect(0)
+        assert self.gc.should_pretenure(typeid_s)
+        # the samples taken in malloc_fixedsize_old() are young objects
+        p = self.malloc_old(S)
+        assert self.gc.is_in_nursery(llmemory.cast_ptr_to_adr(p))
+        # so if the objects stop surviving, the decision changes
+        for i in range(incminimark.PRETENURE_MIN_SAMPLES):
+            self.malloc_old(S)
+        self.gc.collect(0)
+        assert not self.gc.should_pretenure(typeid_s)
+    test_pretenure_samples_in_nursery.GC_PARAMS = {
+        'pretenure_sample_interval': 1}
+
+    def test_adapt_nursery_size(self):
+        gc = self.gc
+        assert gc.max_nursery_size == 128*WORD
+        assert gc.min_nursery_size == 16*WORD
+        assert gc.nursery_size == 32*WORD
+        # fast minor collection with few survivors: grow
+        gc.nursery_surviving_size = 0
+        assert gc.gc_increment_step == 32*WORD * 4
+        gc.adapt_nursery_size(0.0001)
+        assert gc.nursery_size == 64*WORD
+        assert gc.gc_increment_step == 64*WORD * 4
+        gc.adapt_nursery_size(0.0001)
+        gc.adapt_nursery_size(0.0001)
+        assert gc.nursery_size == 128*WORD       # clamped
+        # fast, but many survivors: don't grow
+        gc.nursery_size = 32*WORD
+        gc.nursery_surviving_size = 16*WORD
+        gc.adapt_nursery_size(0.0001)
+        assert gc.nursery_size == 32*WORD
+        # not fast enough to double: keep the size
+        gc.nursery_surviving_size = 0
+        gc.adapt_nursery_size(0.0005)
+        assert gc.nursery_size == 32*WORD
+        # too slow: shrink
+        gc.nursery_size = 128*WORD
+        gc.adapt_nursery_size(0.002)
+        expected = int(128*WORD * 0.5 * incminimark.NURSERY_SHRINK_MARGIN)
+        assert gc.nursery_size == expected & ~(WORD-1)
+        gc.adapt_nursery_size(1.0)
+        assert gc.nursery_size == 16*WORD        # clamped
+        assert gc.max_number_of_pinned_objects == 1
+        assert gc.gc_increment_step == 16*WORD * 4
+        # unless it was given explicitly
+        gc.gc_increment_step_fixed = True
+        gc.gc_increment_step = 12345
+        gc.nursery_surviving_size = 0
+        gc.adapt_nursery_size(0.0001)
+        assert gc.nursery_size == 32*WORD
+        assert gc.gc_increment_step == 12345
+    test_adapt_nursery_size.GC_PARAMS = {'minor_pause_target': 0.001,
+                                         'max_nursery_size': 128*WORD}
+
+    def test_adaptive_nursery(self):
+        # the nursery is allocated with the max size; the objects of all
+        # the nursery sizes survive the collections
+        gc = self.gc
+        gc.minor_pause_target = 1000.0
+        for i in range(40):
+            p = self.malloc(S)
+            p.x = i
+            self.stackroots.append(p)
+            for j in range(10):
+                self.malloc(S)
+        assert gc.nursery_size == 128*WORD
+        assert gc.is_in_nursery(gc.nursery + 127*WORD)
+        gc.minor_pause_target = 0.000000001
+        self.gc.collect(0)
+        assert gc.nursery_size == 16*WORD
+        assert not gc.is_in_nursery(gc.nursery + 16*WORD)
+        for i in range(40):
+            self.malloc(S)
+        assert [p.x for p in self.stackroots] == range(40)
+    test_adaptive_nursery.GC_PARAMS = {'minor_pause_target': 0.001,
+                                       'max_nursery_size': 128*WORD}
+
+    def test_adaptive_nursery_disabled(self):
+        assert self.gc.minor_pause_target == 0.0
+        assert self.gc.max_nursery_size == self.gc.nursery_size
+
+    def test_sweeping_rawmalloced_and_arenas_in_one_step(self):
+        # a few rawmalloced objects, and a few small ones
+        for i in range(3):
+            self.stackroots.append(self.malloc(VAR, 1000))
+            self.stackroots.append(self.malloc(S))
+        self.gc.debug_gc_step_until(incminimark.STATE_SWEEPING)
+        assert self.gc.raw_malloc_might_sweep.non_empty()
+        # the rawmalloced objects are done quickly, and the rest of the
+        # step is enough to sweep the arenas too
+        self.gc.debug_gc_step(1)
+        assert self.gc.gc_state == incminimark.STATE_FINALIZING
+
+    def test_marking_skips_visited_objects(self):
+        obj0 = self.malloc(S)
+        obj0.next = self.malloc(S)
+        obj0.next.next = obj0
+        self.stackroots.append(obj0)
+        self.gc.debug_gc_step_until(incminimark.STATE_MARKING)
+        obj0 = self.stackroots[-1]
+        assert self.gc.objects_to_trace.tolist() == [
+            llmemory.cast_ptr_to_adr(obj0)]
+        self.gc.visit_all_objects_step(1)
+        assert self.gc.objects_to_trace.tolist() == [
+            llmemory.cast_ptr_to_adr(obj0.next)]
+        # obj0 is already visited, so it is not pushed again
+        self.gc.visit_all_objects_step(1)
+        assert not self.gc.objects_to_trace.non_empty()
+        self.gc.debug_gc_step_until(incminimark.STATE_SCANNING)
+        assert self.stackroots[-1].next.next == self.stackroots[-1]
+
 class TestIncrementalMiniMarkGCFull(DirectGCTest):
     from rpython.memory.gc.incminimark import IncrementalMiniMarkGC as GCClass
     def test_malloc_fixedsize_no_cleanup(self):
@@ -1,4 +1,4 @@
-import os, py
+import os, sys, py
 from rpython.memory.gc import env
 from rpython.rlib.rarithmetic import r_uint
 from rpython.tool.udir import udir
@@ -114,6 +114,72 @@ etc.
     finally:
         env.addressable_size = saved
 
+def test_get_cgroup_memory_limit_linux():
+    proc = udir.join('cgroup_proc')
+    v2 = udir.ensure('cgroup_v2', dir=True)
+    v1 = udir.ensure('cgroup_v1', dir=True)
+    def get_limit():
+        return env.get_cgroup_memory_limit_linux(str(proc), str(v2), str(v1))
+    # cgroup v2: the limit of our cgroup, or of a parent if it is lower
+    proc.write("0::/user.slice/app.scope\n")
+    v2.ensure('user.slice', 'app.scope', dir=True)
+    v2.join('user.slice', 'app.scope', 'memory.max').write("536870912\n")
+    v2.join('user.slice', 'memory.max').write("max\n")
+    check_equal(get_limit(), 536870912.0)
+    v2.join('user.slice', 'memory.max').write("268435456\n")
+    check_equal(get_limit(), 268435456.0)
+    # a path that is not in our mount (e.g. from inside a container):
+    # only the root counts
+    proc.write("0::/docker/0123abc\n")
+    check_equal(get_limit(), -1.0)
+    v2.join('memory.max').write("134217728\n")
+    check_equal(get_limit(), 134217728.0)
+    proc.write("0::/\n")
+    check_equal(get_limit(), 134217728.0)
+    # cgroup v1: only the memory controller matters
+    proc.write("12:cpu,cpuacct:/other\n"
+               "4:memory:/user.slice\n"
+               "1:name=systemd:/user.slice\n")
+    v1.ensure('other', dir=True)
+    v1.join('other', 'memory.limit_in_bytes').write("1024\n")
+    v1.ensure('user.slice', dir=True)
+    v1.join('user.slice', 'memory.limit_in_bytes').write("67108864\n")
+    v1.join('memory.limit_in_bytes').write("9223372036854771712\n")
+    check_equal(get_limit(), 67108864.0)
+    # hybrid: cgroup v2 without the memory controller, and v1 with it
+    proc.write("4:memory:/user.slice\n0::/user.slice/app.scope\n")
+    v2.join('memory.max').remove()
+    v2.join('user.slice', 'memory.max').remove()
+    v2.join('user.slice', 'app.scope', 'memory.max').remove()
+    check_equal(get_limit(), 67108864.0)
+    # no limit
+    v1.join('user.slice', 'memory.limit_in_bytes').write(
+        "9223372036854771712\n")
+    check_equal(get_limit(), -1.0)
+    proc.write("")
+    check_equal(get_limit(), -1.0)
+    check_equal(env.get_cgroup_memory_limit_linux(
+        str(udir.join('cgroup_missing')), str(v2), str(v1)), -1.0)
+
+def test_get_memory_limit_read_once():
+    if not sys.platform.startswith('linux'):
+        py.test.skip("linux only")
+    calls = []
+    def fake(proc_file, v2_root, v1_root):
+        calls.append(proc_file)
+        return 12345678.0
+    saved = env.get_cgroup_memory_limit_linux, env._cached_memory_limit.value
+    env.get_cgroup_memory_limit_linux = fake
+    env._cached_memory_limit.value = 0.0
+    try:
+        check_equal(env.get_memory_limit(), 12345678.0)
+        check_equal(env.get_memory_limit(), 12345678.0)
+        env.get_total_memory()
+        assert calls == [env.CGROUP_PROC_FILE]
+    finally:
+        env.get_cgroup_memory_limit_linux, env._cached_memory_limit.value = (
+            saved)
+
 def test_estimate_best_nursery_size_linux2():
     filepath = udir.join('estimate_best_nursery_size_linux2')
     filepath.write("""\
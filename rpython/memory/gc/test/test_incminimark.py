@@ -68,3 +68,14 @@ def test_set_major_threshold():
     b = gc.set_major_threshold_from(42.7)
     assert b is False
     assert gc.next_major_collection_threshold == 100.0
+
+def test_next_major_threshold_soft_max():
+    gc = IncrementalMiniMarkGC(None, major_collection_threshold=2.0)
+    gc.max_delta = 1000.0
+    assert gc.next_major_threshold_for(100.0) == 200.0
+    assert gc.next_major_threshold_for(2000.0) == 3000.0
+    gc.soft_max_heap_size = 500.0
+    assert gc.next_major_threshold_for(100.0) == 200.0
+    assert gc.next_major_threshold_for(300.0) == 500.0
+    # past the soft limit, the heap can only grow by 10%
+    assert gc.next_major_threshold_for(2000.0) == 2000.0 * 1.1
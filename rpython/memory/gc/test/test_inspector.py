@@ -1,8 +1,10 @@
-import os
+import os, py
 from rpython.tool.udir import udir
 from rpython.memory.gc.test.test_direct import BaseDirectGCTest, S
 from rpython.memory.gc import inspector
-from rpython.rtyper.lltypesystem import llmemory
+from rpython.rtyper.lltypesystem import lltype, llmemory, rffi
+from rpython.rtyper.annlowlevel import llhelper
+from rpython.rlib import rgc
 
 
 class InspectorTest(BaseDirectGCTest):
@@ -37,6 +39,29 @@ class InspectorTest(BaseDirectGCTest):
                     adr_q, 1, ASize(), -1]
         assert expected == seen
 
+    def test_dump_rpy_heap_write_func(self):
+        p = self.malloc(S)
+        p.x = 5
+        self.stackroots.append(p)
+        seen = []
+        def write_func(fd, buf, length):
+            assert fd == -123456
+            words = llmemory.cast_adr_to_ptr(buf, rffi.SIGNEDP)
+            for i in range(length // rffi.sizeof(rffi.LONG)):
+                seen.append(words[i])
+            return 0
+        write_func_ptr = llhelper(rgc.DUMP_WRITE_FUNC, write_func)
+        inspector.dump_rpy_heap(self.gc, -123456, write_func_ptr)
+        assert len(seen) == 8
+        assert seen[1] == 1 and seen[3:] == [-1, 0, 0, 0, -1]
+        #
+        def failing_write_func(fd, buf, length):
+            return 28
+        write_func_ptr = llhelper(rgc.DUMP_WRITE_FUNC, failing_write_func)
+        e = py.test.raises(OSError, inspector.dump_rpy_heap, self.gc,
+                           -123456, write_func_ptr)
+        assert e.value.errno == 28
+
 
 class TestHybridGC(InspectorTest):
     from rpython.memory.gc.hybrid import HybridGC as GCClass
@@ -1,7 +1,7 @@
 import py
 from rpython.memory.gc.minimarkpage import ArenaCollection
 from rpython.memory.gc.minimarkpage import PAGE_HEADER, PAGE_PTR
-from rpython.memory.gc.minimarkpage import PAGE_NULL, WORD
+from rpython.memory.gc.minimarkpage import PAGE_NULL, WORD, ARENA
 from rpython.memory.gc.minimarkpage import _dummy_size
 from rpython.rtyper.lltypesystem import lltype, llmemory, llarena
 from rpython.rtyper.lltypesystem.llmemory import cast_ptr_to_adr
@@ -298,9 +298,11 @@ def test_mass_free_emptied_page():
     ac.mass_free(ok_to_free)
     assert ok_to_free.seen == {hdrsize + 0*WORD: True,
                                hdrsize + 2*WORD: True}
-    pageaddr = pagenum(ac, 0)
-    assert pageaddr == freepages(ac)
-    assert pageaddr.address[0] == NULL
+    # the free page was released to the OS at the end
+    assert freepages(ac) == NULL
+    assert ac.current_arena.nfreepages == 1
+    assert ac.current_arena.releasedpages == 1
+    assert ac.current_arena.releasedlist[0] == pagenum(ac, 0)
     assert ac.page_for_size[2] == PAGE_NULL
 
 def test_mass_free_full_remains_full():
@@ -400,6 +402,66 @@ def test_mass_free_half_page_becomes_more_free():
     assert freepages(ac) == NULL
     assert ac.full_page_for_size[2] == PAGE_NULL
 
+def test_release_free_pages(monkeypatch):
+    released = []
+    arena_release = llarena.arena_release
+    def fake_arena_release(addr, size):
+        released.append((addr, size))
+        arena_release(addr, size)
+    monkeypatch.setattr(llarena, 'arena_release', fake_arena_release)
+    pagesize = hdrsize + 7*WORD
+    ac = arena_collection_for_test(pagesize, "#.#.#2")
+    arena = ac.current_arena
+    assert arena.nfreepages == 2 and arena.releasedpages == 0
+    ac.release_free_pages()
+    # the whole pages are released, including their link
+    assert released == [(pagenum(ac, 1), pagesize),
+                        (pagenum(ac, 3), pagesize)]
+    assert arena.nfreepages == 2 and arena.releasedpages == 2
+    assert freepages(ac) == NULL
+    # pages already released are not released again
+    del released[:]
+    ac.release_free_pages()
+    assert released == []
+    # reusing a page, then freeing another one
+    page = ac.allocate_new_page(1); checkpage(ac, page, 3)
+    assert arena.nfreepages == 1 and arena.releasedpages == 1
+    ac.free_page(getpage(ac, 0))
+    assert arena.nfreepages == 2 and arena.releasedpages == 1
+    assert freepages(ac) == pagenum(ac, 0)
+    ac.release_free_pages()
+    assert released == [(pagenum(ac, 0), pagesize)]
+    assert arena.releasedpages == 2
+    # allocating all the free pages
+    page = ac.allocate_new_page(3); checkpage(ac, page, 0)
+    page = ac.allocate_new_page(4); checkpage(ac, page, 1)
+    assert ac.current_arena == lltype.nullptr(ARENA)
+
+def test_release_free_pages_then_uninitialized():
+    pagesize = hdrsize + 7*WORD
+    ac = arena_collection_for_test(pagesize, "#.#  ")
+    arena = ac.current_arena
+    ac.release_free_pages()
+    assert arena.nfreepages == arena.releasedpages == 1
+    assert freepages(ac) == pagenum(ac, 3)
+    page = ac.allocate_new_page(1); checkpage(ac, page, 1)
+    page = ac.allocate_new_page(2); checkpage(ac, page, 3)
+    page = ac.allocate_new_page(3); checkpage(ac, page, 4)
+    assert ac.current_arena == lltype.nullptr(ARENA)
+
+def test_mass_free_releases_free_pages(monkeypatch):
+    released = []
+    arena_release = llarena.arena_release
+    def fake_arena_release(addr, size):
+        released.append(addr)
+        arena_release(addr, size)
+    monkeypatch.setattr(llarena, 'arena_release', fake_arena_release)
+    pagesize = hdrsize + 7*WORD
+    ac = arena_collection_for_test(pagesize, "2#", fill_with_objects=2)
+    ac.mass_free(OkToFree(ac, lambda obj: obj - pagenum(ac, 0) < pagesize))
+    # page 0 is now free, but page 1 is still in use
+    assert released == [pagenum(ac, 0)]
+
 # ____________________________________________________________
 
 def test_random(incremental=False):
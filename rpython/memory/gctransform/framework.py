@@ -326,6 +326,15 @@ class BaseFrameworkGCTransformer(GCTransformer):
         else:
             self.shrink_array_ptr = None
 
+        if GCClass.can_pretenure:
+            self.malloc_fixedsize_old_ptr = getfn(
+                GCClass.malloc_fixedsize_old.im_func,
+                [s_gc, s_typeid16, annmodel.SomeInteger(nonneg=True)],
+                s_gcref, inline=False)
+            self.should_pretenure_ptr = getfn(
+                GCClass.should_pretenure.im_func,
+                [s_gc, s_typeid16], annmodel.SomeBool())
+
         if hasattr(GCClass, 'heap_stats'):
             self.heap_stats_ptr = getfn(GCClass.heap_stats.im_func,
                     [s_gc], SomePtr(lltype.Ptr(ARRAY_TYPEID_MAP)),
@@ -450,7 +459,8 @@ class BaseFrameworkGCTransformer(GCTransformer):
                                          annmodel.SomeBool(),
                                          minimal_transform=False)
         self.dump_rpy_heap_ptr = getfn(inspector.dump_rpy_heap,
-                                       [s_gc, annmodel.SomeInteger()],
+                                       [s_gc, annmodel.SomeInteger(),
+                                        SomePtr(rgc.DUMP_WRITE_FUNC)],
                                        annmodel.s_Bool,
                                        minimal_transform=False)
         self.get_typeids_z_ptr = getfn(inspector.get_typeids_z,
@@ -462,6 +472,20 @@ class BaseFrameworkGCTransformer(GCTransformer):
                                        SomePtr(lltype.Ptr(
                                            lltype.Array(llgroup.HALFWORD))),
                                        minimal_transform=False)
+        self.set_alloc_sampling_ptr = getfn(inspector.set_alloc_sampling,
+                                            [s_gc, annmodel.SomeInteger(),
+                                             SomeAddress()],
+                                            annmodel.s_None,
+                                            minimal_transform=False)
+        self.fetch_alloc_samples_ptr = getfn(inspector.fetch_alloc_samples,
+                                             [s_gc],
+                                             rgc.s_list_of_ints(),
+                                             minimal_transform=False)
+        self.fetch_alloc_sample_results_ptr = getfn(
+            inspector.fetch_alloc_sample_results,
+            [s_gc],
+            rgc.s_list_of_ints(),
+            minimal_transform=False)
 
         self.set_max_heap_size_ptr = getfn(GCClass.set_max_heap_size.im_func,
                                            [s_gc,
@@ -913,6 +937,25 @@ class BaseFrameworkGCTransformer(GCTransformer):
             self.emit_raw_memclear(hop.llops, v_clear_size, None,
                                    c_after_header, v_a)
 
+    def gct_do_malloc_fixedsize_old(self, hop):
+        # used by the JIT (see rpython.jit.backend.llsupport.gc)
+        op = hop.spaceop
+        [v_typeid, v_size] = op.args
+        livevars = self.push_roots(hop)
+        hop.genop("direct_call",
+                  [self.malloc_fixedsize_old_ptr, self.c_const_gc,
+                   v_typeid, v_size],
+                  resultvar=op.result)
+        self.pop_roots(hop, livevars)
+
+    def gct_gc_should_pretenure(self, hop):
+        # used by the JIT (see rpython.jit.backend.llsupport.gc)
+        op = hop.spaceop
+        [v_typeid] = op.args
+        hop.genop("direct_call",
+                  [self.should_pretenure_ptr, self.c_const_gc, v_typeid],
+                  resultvar=op.result)
+
     def gct_do_malloc_varsize(self, hop):
         # used by the JIT (see rpython.jit.backend.llsupport.gc)
         op = hop.spaceop
@@ -1187,9 +1230,10 @@ class BaseFrameworkGCTransformer(GCTransformer):
 
     def gct_gc_dump_rpy_heap(self, hop):
         livevars = self.push_roots(hop)
-        [v_fd] = hop.spaceop.args
+        [v_fd, v_write_func] = hop.spaceop.args
         hop.genop("direct_call",
-                  [self.dump_rpy_heap_ptr, self.c_const_gc, v_fd],
+                  [self.dump_rpy_heap_ptr, self.c_const_gc, v_fd,
+                   v_write_func],
                   resultvar=hop.spaceop.result)
         self.pop_roots(hop, livevars)
 
@@ -1207,6 +1251,28 @@ class BaseFrameworkGCTransformer(GCTransformer):
                   resultvar=hop.spaceop.result)
         self.pop_roots(hop, livevars)
 
+    def gct_gc_set_alloc_sampling(self, hop):
+        livevars = self.push_roots(hop)
+        [v_interval, v_ticker] = hop.spaceop.args
+        hop.genop("direct_call",
+                  [self.set_alloc_sampling_ptr, self.c_const_gc, v_interval,
+                   v_ticker])
+        self.pop_roots(hop, livevars)
+
+    def gct_gc_fetch_alloc_samples(self, hop):
+        livevars = self.push_roots(hop)
+        hop.genop("direct_call",
+                  [self.fetch_alloc_samples_ptr, self.c_const_gc],
+                  resultvar=hop.spaceop.result)
+        self.pop_roots(hop, livevars)
+
+    def gct_gc_fetch_alloc_sample_results(self, hop):
+        livevars = self.push_roots(hop)
+        hop.genop("direct_call",
+                  [self.fetch_alloc_sample_results_ptr, self.c_const_gc],
+                  resultvar=hop.spaceop.result)
+        self.pop_roots(hop, livevars)
+
     def _set_into_gc_array_part(self, op):
         if op.opname == 'setarrayitem':
             return op.args[1]
@@ -10,6 +10,15 @@ def mangle_hash(i):
     # formula to avoid the trailing bits being always 0.
     return i ^ (i >> 4)
 
+def int_as_address(i):
+    # To store an integer in an AddressStack or AddressDeque.  Only odd
+    # numbers can be cast to addresses, to make lltype and llmemory happy.
+    return llmemory.cast_int_to_adr(i * 2 + 1)
+
+def address_as_int(addr):
+    # The reverse of int_as_address().
+    return llmemory.cast_adr_to_int(addr) >> 1
+
 # ____________________________________________________________
 
 DEFAULT_CHUNK_SIZE = 1019
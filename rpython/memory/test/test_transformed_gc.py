@@ -9,6 +9,8 @@ from rpython.rtyper.lltypesystem import lltype, llmemory, rffi, llgroup
 from rpython.memory.gctransform import framework, shadowstack
 from rpython.rtyper.lltypesystem.lloperation import llop, void
 from rpython.rlib.objectmodel import compute_unique_id, we_are_translated
+from rpython.rlib.objectmodel import keepalive_until_here
+from rpython.rtyper.annlowlevel import llhelper
 from rpython.rlib.debug import ll_assert
 from rpython.rlib import rgc
 from rpython.conftest import option
@@ -1225,6 +1227,31 @@ class TestMiniMarkGC(TestHybridGC):
         res = run([])
         assert res == 123
     
+    def define_dump_rpy_heap_write_func(cls):
+        S = lltype.GcStruct('S', ('x', lltype.Signed))
+        class State:
+            total = 0
+        state = State()
+        def write_func(fd, buf, length):
+            # called by the GC: must not allocate
+            state.total += length
+            return 0
+        def f():
+            s = lltype.malloc(S)
+            ok = rgc.dump_rpy_heap(-1, llhelper(rgc.DUMP_WRITE_FUNC,
+                                                write_func))
+            keepalive_until_here(s)
+            if not ok:
+                return -1
+            return state.total
+        return f
+
+    def test_dump_rpy_heap_write_func(self):
+        run = self.runner("dump_rpy_heap_write_func")
+        res = run([])
+        # the roots marker and at least one object, 4 words each
+        assert res >= 8 * WORD
+
     def define_nursery_hash_base(cls):
         class A:
             pass
@@ -1297,6 +1324,101 @@ class TestIncrementalMiniMarkGC(TestMiniMarkGC):
         res = run([])
         assert res
 
+    def define_alloc_sampling(cls):
+        S = lltype.GcStruct('S', ('x', lltype.Signed))
+        TICKER = rffi.CArray(lltype.Signed)
+        def f():
+            ticker = lltype.malloc(TICKER, 1, flavor='raw')
+            ticker[0] = 1000
+            rgc.set_alloc_sampling(1, llmemory.cast_ptr_to_adr(ticker))
+            keep = [lltype.nullptr(S)] * 5
+            for i in range(10):
+                s = lltype.malloc(S)
+                if i % 2 == 0:
+                    keep[i // 2] = s
+            llop.gc__collect(lltype.Void, 0)
+            rgc.set_alloc_sampling(0)
+            ticked = ticker[0] == -1
+            lltype.free(ticker, flavor='raw')
+            if not ticked:
+                return -3
+            samples = rgc.fetch_alloc_samples()
+            results = rgc.fetch_alloc_sample_results()
+            if len(samples) != 2 * len(results):
+                return -1
+            survived = 0
+            for sample_id in results:
+                if sample_id > 0:
+                    survived += 1
+            for s in keep:
+                if not s:
+                    return -2
+            return survived * 100 + len(results)
+        return f
+
+    def test_alloc_sampling(self):
+        run = self.runner("alloc_sampling")
+        res = run([])
+        assert res > 0
+        survived, total = divmod(res, 100)
+        assert total >= 11          # 'keep' and the 10 structs
+        assert survived >= 6        # 'keep' and 5 of the structs
+        assert total - survived >= 5
+
+    def define_pretenuring_operations(cls):
+        P = lltype.GcStruct('P', ('x', lltype.Signed))
+        def should_pretenure():
+            return llop.gc_should_pretenure(lltype.Bool)   # placeholder
+        def malloc_old():
+            p = llop.do_malloc_fixedsize_old(llmemory.GCREF)  # placeholder
+            p = lltype.cast_opaque_ptr(lltype.Ptr(P), p)
+            p.x = 1
+            return p.x
+        def f():
+            if should_pretenure():
+                return -1
+            rgc.set_alloc_sampling(1)
+            keep = [lltype.nullptr(P)] * 20
+            for i in range(20):
+                keep[i] = lltype.malloc(P)
+            llop.gc__collect(lltype.Void, 0)
+            rgc.set_alloc_sampling(0)
+            if not should_pretenure():
+                return -2
+            total = 0
+            for i in range(40):
+                total += malloc_old()
+            return total
+
+        marker = cls.marker
+        def cleanup():
+            marker[0] = 0
+
+        def fix_graphs(translator):
+            from rpython.translator.translator import graphof
+            from rpython.flowspace.model import Constant
+            layoutbuilder = cls.ensure_layoutbuilder(translator)
+            type_id = layoutbuilder.get_type_id(P)
+            c_type_id = Constant(type_id, llgroup.HALFWORD)
+            for func, opname, args in [
+                    (should_pretenure, 'gc_should_pretenure', [c_type_id]),
+                    (malloc_old, 'do_malloc_fixedsize_old',
+                     [c_type_id, Constant(llmemory.sizeof(P),
+                                          lltype.Signed)])]:
+                graph = graphof(translator, func)
+                for op in graph.startblock.operations:
+                    if op.opname == opname:
+                        op.args = args
+                        break
+                else:
+                    assert 0, "oups, not found"
+        return f, cleanup, fix_graphs
+
+    def test_pretenuring_operations(self):
+        run = self.runner("pretenuring_operations")
+        res = run([])
+        assert res == 40
+
 # ________________________________________________________________
 # tagged pointers
 
@@ -2,6 +2,7 @@
 Buffer protocol support.
 """
 from rpython.rlib import jit
+from rpython.rlib.objectmodel import keepalive_until_here
 
 
 class Buffer(object):
@@ -51,6 +52,51 @@ class Buffer(object):
     def get_raw_address(self):
         raise ValueError("no raw buffer")
 
+    def export_raw_address(self):
+        """Like get_raw_address(), but the address must stay valid until
+        the matching release_raw_address(), even if arbitrary code runs
+        in-between (e.g. other threads, while the GIL is released).
+        Only buffers whose memory cannot be freed or moved in the meantime,
+        or that prevent it until released, should override this."""
+        raise ValueError("no exportable raw buffer")
+
+    def release_raw_address(self):
+        pass
+
+
+class scoped_rawbuffer:
+    """Gives a CCHARP to the content of a Buffer, for the duration of
+    the 'with' block, which may release the GIL.  If the buffer can
+    export its raw memory (see export_raw_address()), this is its raw
+    address and nothing is copied; otherwise it is a nonmoving version
+    of buf.as_str().  Use buf.getlength() to know the length of the
+    data."""
+    def __init__(self, buf):
+        self.buf = buf
+        self.data = None
+    def __enter__(self):
+        from rpython.rtyper.lltypesystem import rffi
+        try:
+            self.raw = self.buf.export_raw_address()
+        except ValueError:
+            data = self.buf.as_str()
+            self.raw, self.pinned, self.is_raw = rffi.get_nonmovingbuffer(
+                data)
+            self.data = data
+        return self.raw
+    def __exit__(self, *args):
+        from rpython.rtyper.lltypesystem import rffi
+        data = self.data
+        if data is not None:
+            rffi.free_nonmovingbuffer(data, self.raw, self.pinned,
+                                      self.is_raw)
+        else:
+            self.buf.release_raw_address()
+        keepalive_until_here(self.buf)
+    __init__._always_inline_ = 'try'
+    __enter__._always_inline_ = 'try'
+    __exit__._always_inline_ = 'try'
+
 
 class StringBuffer(Buffer):
     __slots__ = ['value']
@@ -120,3 +166,11 @@ class SubBuffer(Buffer):
         from rpython.rtyper.lltypesystem import rffi
         ptr = self.buffer.get_raw_address()
         return rffi.ptradd(ptr, self.offset)
+
+    def export_raw_address(self):
+        from rpython.rtyper.lltypesystem import rffi
+        ptr = self.buffer.export_raw_address()
+        return rffi.ptradd(ptr, self.offset)
+
+    def release_raw_address(self):
+        self.buffer.release_raw_address()
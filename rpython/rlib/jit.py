@@ -455,9 +455,10 @@ PARAMETER_DOCS = {
     'function_threshold': 'number of times a function must run for it to become traced from start',
     'trace_eagerness': 'number of times a guard has to fail before we start compiling a bridge',
     'decay': 'amount to regularly decay counters by (0=none, 1000=max)',
-    'trace_limit': 'number of recorded operations before we abort tracing with ABORT_TOO_LONG',
+    'trace_limit': 'number of recorded operations before we abort tracing with ABORT_TOO_LONG, or compile the trace so far as a segment',
     'inlining': 'inline python functions or not (1/0)',
     'loop_longevity': 'a parameter controlling how long loops will be kept before being freed, an estimate',
+    'max_code_size': 'maximum size in bytes of the machine code and metadata of all compiled loops, an estimate (0=no limit); when exceeded, the least recently entered loops are freed',
     'retrace_limit': 'how many times we can try retracing before giving up',
     'max_retrace_guards': 'number of extra guards a retrace can cause',
     'max_unroll_loops': 'number of extra unrollings a loop can cause',
@@ -473,6 +474,7 @@ PARAMETERS = {'threshold': 1039, # just above 1024, prime
               'trace_limit': 6000,
               'inlining': 1,
               'loop_longevity': 1000,
+              'max_code_size': 0,
               'retrace_limit': 5,
               'max_retrace_guards': 15,
               'max_unroll_loops': 0,
@@ -1057,13 +1059,18 @@ class Counters(object):
     ABORT_BAD_LOOP
     ABORT_ESCAPE
     ABORT_FORCE_QUASIIMMUT
+    ABORT_SEGMENTED_TRACE
     NVIRTUALS
     NVHOLES
     NVREUSED
+    NRESUMENUMS
+    NRESUMESHARED
     TOTAL_COMPILED_LOOPS
     TOTAL_COMPILED_BRIDGES
     TOTAL_FREED_LOOPS
     TOTAL_FREED_BRIDGES
+    ALIVE_CODE_SIZE
+    TOTAL_EVICTED_LOOPS
     """
 
     counter_names = []
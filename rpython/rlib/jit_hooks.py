@@ -1,10 +1,10 @@
 from rpython.annotator import model as annmodel
 from rpython.rtyper.llannotation import SomePtr, lltype_to_annotation
-from rpython.rlib.objectmodel import specialize
+from rpython.rlib.objectmodel import specialize, compute_unique_id
 from rpython.rtyper.annlowlevel import (cast_instance_to_base_ptr,
     cast_base_ptr_to_instance, llstr)
 from rpython.rtyper.extregistry import ExtRegistryEntry
-from rpython.rtyper.lltypesystem import llmemory, lltype
+from rpython.rtyper.lltypesystem import llmemory, lltype, rstr
 from rpython.rtyper import rclass
 
 
@@ -140,3 +140,51 @@ LOOP_RUN_CONTAINER = lltype.GcArray(lltype.Struct('elem',
 @register_helper(lltype.Ptr(LOOP_RUN_CONTAINER))
 def stats_get_loop_run_times(warmrunnerdesc):
     return warmrunnerdesc.metainterp_sd.cpu.get_all_loop_runs()
+
+LOOP_ENTRY_CONTAINER = lltype.GcArray(lltype.Struct('elem',
+                                      ('number', lltype.Signed),
+                                      ('counter', lltype.Signed),
+                                      ('location', lltype.Ptr(rstr.STR))))
+
+@register_helper(lltype.Ptr(LOOP_ENTRY_CONTAINER))
+def stats_get_loop_entries(warmrunnerdesc):
+    """ Return how many times each of the loops that are still alive
+    was entered from the interpreter.  Always available.
+    """
+    looptokens = warmrunnerdesc.memory_manager.alive_loops.keys()
+    l = lltype.malloc(LOOP_ENTRY_CONTAINER, len(looptokens))
+    for i in range(len(looptokens)):
+        looptoken = looptokens[i]
+        l[i].number = looptoken.number
+        l[i].counter = looptoken.entry_count
+        l[i].location = llstr(looptoken.location)
+    return l
+
+GUARD_FAILURE_CONTAINER = lltype.GcArray(lltype.Struct('elem',
+                                         ('guard', lltype.Signed),
+                                         ('number', lltype.Signed),
+                                         ('counter', lltype.Signed),
+                                         ('location', lltype.Ptr(rstr.STR))))
+
+@register_helper(lltype.Ptr(GUARD_FAILURE_CONTAINER))
+def stats_get_guard_failures(warmrunnerdesc):
+    """ Return how many times each guard failed without going to a
+    bridge, i.e. fell back to tracing or to the blackhole interpreter.
+    'guard' is the number printed as <Guard0x...> in the logs, and
+    'number' and 'location' are about the loop containing the guard.
+    Always available.
+    """
+    descrs = warmrunnerdesc.memory_manager.get_failing_guards()
+    l = lltype.malloc(GUARD_FAILURE_CONTAINER, len(descrs))
+    for i in range(len(descrs)):
+        descr = descrs[i]
+        l[i].guard = compute_unique_id(descr)
+        l[i].counter = descr.fail_count
+        looptoken = descr.get_jitcell_token()
+        if looptoken is not None:
+            l[i].number = looptoken.number
+            l[i].location = llstr(looptoken.location)
+        else:
+            l[i].number = -1
+            l[i].location = llstr('')
+    return l
@@ -13,16 +13,23 @@ class RStringIO(object):
 
     def init(self):
         # The real content is the join of the following data:
-        #  * the list of characters self.__bigbuffer;
+        #  * either the list of characters self.__bigbuffer, or the
+        #    immutable string self.__string (never both);
         #  * each of the strings in self.__strings.
         #
+        # self.__string lets us hand out the same string object from
+        # getvalue() and from full reads without copying it, as long as
+        # nobody overwrites the data in the middle.
+        #
         self.__closed = False
+        self.__string = None
         self.__strings = None
         self.__bigbuffer = None
         self.__pos = AT_END
 
     def close(self):
         self.__closed = True
+        self.__string = None
         self.__strings = None
         self.__bigbuffer = None
         self.__pos = AT_END
@@ -34,6 +41,9 @@ class RStringIO(object):
         """Copy all the data into the list of characters self.__bigbuffer."""
         if self.__bigbuffer is None:
             self.__bigbuffer = []
+            if self.__string is not None:
+                self.__bigbuffer += self.__string
+                self.__string = None
         if self.__strings is not None:
             self.__bigbuffer += self.__strings.build()
             self.__strings = None
@@ -45,13 +55,22 @@ class RStringIO(object):
             self.__copy_into_bigbuffer()
             return ''.join(self.__bigbuffer)
         if self.__strings is not None:
-            return self.__strings.build()
+            result = self.__strings.build()
+            if self.__string is not None:
+                result = self.__string + result
+            self.__string = result
+            self.__strings = None
+            return result
+        if self.__string is not None:
+            return self.__string
         return ''
 
     def getsize(self):
         result = 0
         if self.__bigbuffer is not None:
             result += len(self.__bigbuffer)
+        elif self.__string is not None:
+            result += len(self.__string)
         if self.__strings is not None:
             result += self.__strings.getlength()
         return result
@@ -66,6 +85,12 @@ class RStringIO(object):
             self.__slow_write(buffer)
 
     def __fast_write(self, buffer):
+        if (self.__strings is None and self.__string is None and
+                self.__bigbuffer is None):
+            # writing into an empty file: keep the string itself
+            assert buffer is not None
+            self.__string = buffer
+            return
         if self.__strings is None:
             self.__strings = StringBuilder()
         self.__strings.append(buffer)
@@ -125,6 +150,17 @@ class RStringIO(object):
         assert result >= 0
         return result
 
+    def __string_covers(self, stop):
+        """Can we read the data up to 'stop' (or to the end if stop < 0)
+        from self.__string alone?  Then we don't have to join it with the
+        strings written since, which would copy all the data again after
+        every write()."""
+        if self.__bigbuffer is not None:
+            return False
+        if self.__strings is None:
+            return True
+        return self.__string is not None and 0 <= stop <= len(self.__string)
+
     def read(self, size=-1):
         p = self.__pos
         if p == 0 and size < 0:
@@ -133,6 +169,25 @@ class RStringIO(object):
         if p == AT_END or size == 0:
             return ''
         assert p >= 0
+        if size < 0:
+            stop = -1
+        else:
+            stop = p + size
+        if self.__string_covers(stop):
+            # no list of characters: slice the string
+            s = self.__string
+            if s is None:
+                return ''
+            count = len(s) - p
+            if size >= 0:
+                count = min(size, count)
+            if count <= 0:
+                return ''
+            if p == 0 and count == len(s) and self.__strings is None:
+                self.__pos = AT_END
+                return s
+            self.__pos = p + count
+            return s[p:p+count]
         self.__copy_into_bigbuffer()
         mysize = len(self.__bigbuffer)
         count = mysize - p
@@ -152,6 +207,23 @@ class RStringIO(object):
         if p == AT_END or size == 0:
             return ''
         assert p >= 0
+        s = self.__string
+        if self.__bigbuffer is None and s is not None:
+            # look for the end of the line in the string first
+            end = len(s)
+            if size >= 0 and size < end - p:
+                end = p + size
+            if p < end:
+                i = s.find('\n', p, end)
+                if i >= 0 or end < len(s) or self.__strings is None:
+                    if i < 0:
+                        i = end
+                    else:
+                        i += 1
+                    self.__pos = i
+                    return s[p:i]
+        if self.__string_covers(-1):
+            return ''
         self.__copy_into_bigbuffer()
         end = len(self.__bigbuffer)
         if size >= 0 and size < end - p:
@@ -173,9 +245,14 @@ class RStringIO(object):
         assert size >= 0
         if size == 0:
             self.__bigbuffer = None
+            self.__string = None
             self.__strings = None
+        elif self.__bigbuffer is None:
+            s = self.getvalue()
+            if size < len(s):
+                self.__string = s[:size]
         else:
-            if self.__bigbuffer is None or size > len(self.__bigbuffer):
+            if size > len(self.__bigbuffer):
                 self.__copy_into_bigbuffer()
             else:
                 # we can drop all extra strings
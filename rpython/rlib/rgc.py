@@ -437,7 +437,14 @@ def cast_gcref_to_int(gcref):
     else:
         return id(gcref._x)
 
-def dump_rpy_heap(fd):
+# Optional argument to dump_rpy_heap(), called instead of write() with
+# the fd and a raw buffer of the given length; it returns 0 or an errno
+# value.  It is called by the GC in the middle of the dump, so it must
+# not allocate GC objects.
+DUMP_WRITE_FUNC = lltype.Ptr(lltype.FuncType(
+    [lltype.Signed, llmemory.Address, lltype.Signed], lltype.Signed))
+
+def dump_rpy_heap(fd, write_func=lltype.nullptr(DUMP_WRITE_FUNC.TO)):
     "NOT_RPYTHON"
     raise NotImplementedError
 
@@ -449,6 +456,27 @@ def get_typeids_list():
     "NOT_RPYTHON"
     raise NotImplementedError
 
+def set_alloc_sampling(interval, ticker=llmemory.NULL):
+    """NOT_RPYTHON: ask the GC to take an allocation sample every
+    'interval' bytes allocated, or to stop if 'interval' is 0.  Only
+    supported by incminimark; other GCs never take samples.  If 'ticker'
+    is not NULL, the GC writes -1 in the Signed at this address whenever
+    it takes a sample, like the C signal handler does.
+    """
+
+def fetch_alloc_samples():
+    """NOT_RPYTHON: return the allocation samples taken since the last
+    call, as a flat list [sample_id, size, sample_id, size, ...].
+    """
+    return []
+
+def fetch_alloc_sample_results():
+    """NOT_RPYTHON: return what became of the sampled objects since
+    the last call: 'sample_id' if the object survived its first minor
+    collection (or was allocated old), and '-sample_id' if it died.
+    """
+    return []
+
 def has_gcflag_extra():
     "NOT_RPYTHON"
     return True
@@ -544,6 +572,17 @@ def s_list_of_gcrefs():
             ListDef(None, s_gcref, mutated=True, resized=False))
     return _cache_s_list_of_gcrefs
 
+_cache_s_list_of_ints = None
+
+def s_list_of_ints():
+    global _cache_s_list_of_ints
+    if _cache_s_list_of_ints is None:
+        from rpython.annotator import model as annmodel
+        from rpython.annotator.listdef import ListDef
+        _cache_s_list_of_ints = annmodel.SomeList(
+            ListDef(None, annmodel.SomeInteger(), mutated=True, resized=False))
+    return _cache_s_list_of_ints
+
 class Entry(ExtRegistryEntry):
     _about_ = get_rpy_roots
     def compute_result_annotation(self):
@@ -628,11 +667,16 @@ class Entry(ExtRegistryEntry):
 
 class Entry(ExtRegistryEntry):
     _about_ = dump_rpy_heap
-    def compute_result_annotation(self, s_fd):
+    def compute_result_annotation(self, s_fd, s_write_func=None):
         from rpython.annotator.model import s_Bool
         return s_Bool
     def specialize_call(self, hop):
-        vlist = hop.inputargs(lltype.Signed)
+        if hop.nb_args == 2:
+            vlist = hop.inputargs(lltype.Signed, hop.args_r[1])
+        else:
+            vlist = [hop.inputarg(lltype.Signed, arg=0),
+                     hop.inputconst(DUMP_WRITE_FUNC,
+                                    lltype.nullptr(DUMP_WRITE_FUNC.TO))]
         hop.exception_is_here()
         return hop.genop('gc_dump_rpy_heap', vlist, resulttype = hop.r_result)
 
@@ -659,6 +703,39 @@ class Entry(ExtRegistryEntry):
         hop.exception_is_here()
         return hop.genop('gc_typeids_list', [], resulttype = hop.r_result)
 
+class Entry(ExtRegistryEntry):
+    _about_ = set_alloc_sampling
+    def compute_result_annotation(self, s_interval, s_ticker=None):
+        from rpython.annotator import model as annmodel
+        return annmodel.s_None
+    def specialize_call(self, hop):
+        if hop.nb_args == 2:
+            vlist = hop.inputargs(lltype.Signed, llmemory.Address)
+        else:
+            vlist = [hop.inputarg(lltype.Signed, arg=0),
+                     hop.inputconst(llmemory.Address, llmemory.NULL)]
+        hop.exception_cannot_occur()
+        return hop.genop('gc_set_alloc_sampling', vlist,
+                         resulttype=lltype.Void)
+
+class Entry(ExtRegistryEntry):
+    _about_ = fetch_alloc_samples
+    def compute_result_annotation(self):
+        return s_list_of_ints()
+    def specialize_call(self, hop):
+        hop.exception_cannot_occur()
+        return hop.genop('gc_fetch_alloc_samples', [],
+                         resulttype=hop.r_result)
+
+class Entry(ExtRegistryEntry):
+    _about_ = fetch_alloc_sample_results
+    def compute_result_annotation(self):
+        return s_list_of_ints()
+    def specialize_call(self, hop):
+        hop.exception_cannot_occur()
+        return hop.genop('gc_fetch_alloc_sample_results', [],
+                         resulttype=hop.r_result)
+
 class Entry(ExtRegistryEntry):
     _about_ = (has_gcflag_extra, get_gcflag_extra, toggle_gcflag_extra)
     def compute_result_annotation(self, s_arg=None):
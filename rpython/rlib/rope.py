@@ -242,6 +242,8 @@ del i
 
 
 class LiteralUnicodeNode(LiteralNode):
+    u = u""    # for the annotator, in case only byte string ropes are used
+
     def __init__(self, u):
         assert isinstance(u, unicode)
         self.u = u
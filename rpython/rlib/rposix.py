@@ -1,6 +1,6 @@
 import os
 from rpython.rtyper.lltypesystem.rffi import CConstant, CExternVariable, INT
-from rpython.rtyper.lltypesystem import ll2ctypes, rffi
+from rpython.rtyper.lltypesystem import ll2ctypes, rffi, lltype
 from rpython.translator.tool.cbuild import ExternalCompilationInfo
 from rpython.rlib.rarithmetic import intmask
 from rpython.rlib.objectmodel import specialize
@@ -175,6 +175,31 @@ def closerange(fd_low, fd_high):
         except OSError:
             pass
 
+if WIN32:
+    # int _write(int fd, const void *buffer, unsigned int count)
+    _WRITE_COUNT_T = rffi.UINT
+    _WRITE_RESULT_T = rffi.INT
+else:
+    _WRITE_COUNT_T = rffi.SIZE_T
+    _WRITE_RESULT_T = rffi.SSIZE_T
+c_write = rffi.llexternal(('_' if WIN32 else '') + 'write',
+                          [rffi.INT, rffi.VOIDP, _WRITE_COUNT_T],
+                          _WRITE_RESULT_T,
+                          save_err=rffi.RFFI_SAVE_ERRNO)
+
+def write_raw(fd, buf, count):
+    """Like os.write(), but writes 'count' bytes from the CCHARP 'buf'."""
+    validate_fd(fd)
+    if WIN32 and count > 0x7fffffff:
+        count = 0x7fffffff     # a partial write, like on CPython
+    written = rffi.cast(lltype.Signed, c_write(rffi.cast(rffi.INT, fd),
+                                               rffi.cast(rffi.VOIDP, buf),
+                                               rffi.cast(_WRITE_COUNT_T,
+                                                         count)))
+    if written < 0:
+        raise OSError(get_saved_errno(), "os_write failed")
+    return written
+
 #___________________________________________________________________
 # Wrappers around posix functions, that accept either strings, or
 # instances with a "as_bytes()" method.
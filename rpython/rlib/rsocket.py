@@ -898,30 +898,39 @@ class RSocket(object):
         until all data is sent.  If an error occurs, it's impossible
         to tell how much data has been sent."""
         with rffi.scoped_nonmovingbuffer(data) as dataptr:
-            remaining = len(data)
-            p = dataptr
-            while remaining > 0:
-                try:
-                    res = self.send_raw(p, remaining, flags)
-                    p = rffi.ptradd(p, res)
-                    remaining -= res
-                except CSocketError, e:
-                    if e.errno != _c.EINTR:
-                        raise
-                if signal_checker is not None:
-                    signal_checker()
+            self.sendall_raw(dataptr, len(data), flags, signal_checker)
+
+    def sendall_raw(self, dataptr, length, flags=0, signal_checker=None):
+        """Send all the data from a CCHARP buffer."""
+        remaining = length
+        p = dataptr
+        while remaining > 0:
+            try:
+                res = self.send_raw(p, remaining, flags)
+                p = rffi.ptradd(p, res)
+                remaining -= res
+            except CSocketError, e:
+                if e.errno != _c.EINTR:
+                    raise
+            if signal_checker is not None:
+                signal_checker()
 
     def sendto(self, data, flags, address):
         """Like send(data, flags) but allows specifying the destination
         address.  (Note that 'flags' is mandatory here.)"""
+        with rffi.scoped_nonmovingbuffer(data) as dataptr:
+            return self.sendto_raw(dataptr, len(data), flags, address)
+
+    def sendto_raw(self, dataptr, length, flags, address):
+        """Like sendto(), but the data comes from a CCHARP buffer."""
         res = -1
         timeout = self._select(True)
         if timeout == 1:
             raise SocketTimeout
         elif timeout == 0:
             addr = address.lock()
-            res = _c.sendto(self.fd, data, len(data), flags,
-                            addr, address.addrlen)
+            res = _c.sendto(self.fd, rffi.cast(rffi.VOIDP, dataptr), length,
+                            flags, addr, address.addrlen)
             address.unlock()
         if res < 0:
             raise self.error_handler()
@@ -26,7 +26,19 @@ def _isspace(char):
 
 
 @specialize.argtype(0, 1)
-def split(value, by=None, maxsplit=-1):
+def _split_piece(factory, value, start, stop):
+    assert start >= 0
+    assert stop >= 0
+    if factory is None:
+        return value[start:stop]
+    return factory.piece(value, start, stop)
+
+
+@specialize.argtype(0, 1, 3)
+def split(value, by=None, maxsplit=-1, factory=None):
+    """If a 'factory' is given (only with a separator 'by'), the items of
+    the result are factory.piece(value, start, stop) instead of the
+    strings value[start:stop]."""
     if by is None:
         length = len(value)
         i = 0
@@ -78,10 +90,10 @@ def split(value, by=None, maxsplit=-1):
         while cnt > 0:
             next = find(value, by, start, len(value))
             assert next >= 0 # cannot fail due to the value.count above
-            res.append(value[start:next])
+            res.append(_split_piece(factory, value, start, next))
             start = next + bylen
             cnt -= 1
-        res.append(value[start:len(value)])
+        res.append(_split_piece(factory, value, start, len(value)))
         return res
 
     if maxsplit > 0:
@@ -94,16 +106,17 @@ def split(value, by=None, maxsplit=-1):
         if next < 0:
             break
         assert start >= 0
-        res.append(value[start:next])
+        res.append(_split_piece(factory, value, start, next))
         start = next + bylen
         maxsplit -= 1   # NB. if it's already < 0, it stays < 0
 
-    res.append(value[start:len(value)])
+    res.append(_split_piece(factory, value, start, len(value)))
     return res
 
 
-@specialize.argtype(0, 1)
-def rsplit(value, by=None, maxsplit=-1):
+@specialize.argtype(0, 1, 3)
+def rsplit(value, by=None, maxsplit=-1, factory=None):
+    """See split() for the 'factory'."""
     if by is None:
         res = []
 
@@ -158,11 +171,11 @@ def rsplit(value, by=None, maxsplit=-1):
         next = rfind(value, by, 0, end)
         if next < 0:
             break
-        res.append(value[next + bylen:end])
+        res.append(_split_piece(factory, value, next + bylen, end))
         end = next
         maxsplit -= 1   # NB. if it's already < 0, it stays < 0
 
-    res.append(value[:end])
+    res.append(_split_piece(factory, value, 0, end))
     res.reverse()
     return res
 
@@ -3,9 +3,7 @@ import sys
 
 from rpython.rlib import rgc
 from rpython.rlib.rstring import StringBuilder
-from rpython.rtyper.annlowlevel import llstr
 from rpython.rtyper.lltypesystem import rffi, lltype
-from rpython.rtyper.lltypesystem.rstr import copy_string_to_raw
 from rpython.rtyper.tool import rffi_platform
 from rpython.translator.platform import platform as compiler, CompilationError
 from rpython.translator.tool.cbuild import ExternalCompilationInfo
@@ -179,8 +177,11 @@ def crc32(string, start=CRC32_DEFAULT_START):
     start value, and return it as a unsigned 32 bit integer.
     """
     with rffi.scoped_nonmovingbuffer(string) as bytes:
-        checksum = _crc32(start, rffi.cast(Bytefp, bytes), len(string))
-    return checksum
+        return crc32_raw(bytes, len(string), start)
+
+def crc32_raw(ptr, length, start=CRC32_DEFAULT_START):
+    """Same as crc32(), for the 'length' bytes at the CCHARP 'ptr'."""
+    return _crc32(start, rffi.cast(Bytefp, ptr), length)
 
 
 ADLER32_DEFAULT_START = 1
@@ -206,8 +207,11 @@ def adler32(string, start=ADLER32_DEFAULT_START):
     start value, and return it as a unsigned 32 bit integer.
     """
     with rffi.scoped_nonmovingbuffer(string) as bytes:
-        checksum = _adler32(start, rffi.cast(Bytefp, bytes), len(string))
-    return checksum
+        return adler32_raw(bytes, len(string), start)
+
+def adler32_raw(ptr, length, start=ADLER32_DEFAULT_START):
+    """Same as adler32(), for the 'length' bytes at the CCHARP 'ptr'."""
+    return _adler32(start, rffi.cast(Bytefp, ptr), length)
 
 def zlibVersion():
     """Return the runtime version of zlib library"""
@@ -321,8 +325,15 @@ def compress(stream, data, flush=Z_NO_FLUSH):
     """
     # Warning, reentrant calls to the zlib with a given stream can cause it
     # to crash.  The caller of rpython.rlib.rzlib should use locks if needed.
-    data, _, avail_in = _operate(stream, data, flush, sys.maxint, _deflate,
-                                 "while compressing")
+    with rffi.scoped_nonmovingbuffer(data) as inbuf:
+        return compress_raw(stream, inbuf, len(data), flush)
+
+def compress_raw(stream, inbuf, length, flush=Z_NO_FLUSH):
+    """Same as compress(), for the 'length' bytes at the CCHARP 'inbuf'.
+    They are not copied, so they must stay alive and unmodified during
+    the call."""
+    data, _, avail_in = _operate(stream, inbuf, length, flush, sys.maxint,
+                                 _deflate, "while compressing")
     assert not avail_in, "not all input consumed by deflate"
     return data
 
@@ -342,7 +353,14 @@ def decompress(stream, data, flush=Z_SYNC_FLUSH, max_length=sys.maxint):
     """
     # Warning, reentrant calls to the zlib with a given stream can cause it
     # to crash.  The caller of rpython.rlib.rzlib should use locks if needed.
-
+    with rffi.scoped_nonmovingbuffer(data) as inbuf:
+        return decompress_raw(stream, inbuf, len(data), flush, max_length)
+
+def decompress_raw(stream, inbuf, length, flush=Z_SYNC_FLUSH,
+                   max_length=sys.maxint):
+    """Same as decompress(), for the 'length' bytes at the CCHARP 'inbuf'.
+    They are not copied, so they must stay alive and unmodified during
+    the call."""
     # _operate() does not support the Z_FINISH method of decompressing.
     # We can use Z_SYNC_FLUSH instead and manually check that we got to
     # the end of the data.
@@ -352,8 +370,8 @@ def decompress(stream, data, flush=Z_SYNC_FLUSH, max_length=sys.maxint):
     else:
         should_finish = False
     while_doing = "while decompressing data"
-    data, err, avail_in = _operate(stream, data, flush, max_length, _inflate,
-                                   while_doing)
+    data, err, avail_in = _operate(stream, inbuf, length, flush, max_length,
+                                   _inflate, while_doing)
     if should_finish:
         # detect incomplete input
         rffi.setintfield(stream, 'c_avail_in', 0)
@@ -364,60 +382,56 @@ def decompress(stream, data, flush=Z_SYNC_FLUSH, max_length=sys.maxint):
     return data, finished, avail_in
 
 
-def _operate(stream, data, flush, max_length, cfunc, while_doing):
+def _operate(stream, inbuf, length, flush, max_length, cfunc, while_doing):
     """Common code for compress() and decompress().
     """
     # Prepare the input buffer for the stream
-    with lltype.scoped_alloc(rffi.CCHARP.TO, len(data)) as inbuf:
-        # XXX (groggi) should be possible to improve this with pinning by
-        # not performing the 'copy_string_to_raw' if non-movable/pinned
-        copy_string_to_raw(llstr(data), inbuf, 0, len(data))
-        stream.c_next_in = rffi.cast(Bytefp, inbuf)
-        rffi.setintfield(stream, 'c_avail_in', len(data))
-
-        # Prepare the output buffer
-        with lltype.scoped_alloc(rffi.CCHARP.TO, OUTPUT_BUFFER_SIZE) as outbuf:
-            # Strategy: we call deflate() to get as much output data as fits in
-            # the buffer, then accumulate all output into a StringBuffer
-            # 'result'.
-            result = StringBuilder()
-
-            while True:
-                stream.c_next_out = rffi.cast(Bytefp, outbuf)
-                bufsize = OUTPUT_BUFFER_SIZE
-                if max_length < bufsize:
-                    if max_length <= 0:
-                        err = Z_OK
-                        break
-                    bufsize = max_length
-                max_length -= bufsize
-                rffi.setintfield(stream, 'c_avail_out', bufsize)
-                err = cfunc(stream, flush)
-                if err == Z_OK or err == Z_STREAM_END:
-                    # accumulate data into 'result'
-                    avail_out = rffi.cast(lltype.Signed, stream.c_avail_out)
-                    result.append_charpsize(outbuf, bufsize - avail_out)
-                    # if the output buffer is full, there might be more data
-                    # so we need to try again.  Otherwise, we're done.
-                    if avail_out > 0:
-                        break
-                    # We're also done if we got a Z_STREAM_END (which should
-                    # only occur when flush == Z_FINISH).
-                    if err == Z_STREAM_END:
-                        break
-                    else:
-                        continue
-                elif err == Z_BUF_ERROR:
-                    avail_out = rffi.cast(lltype.Signed, stream.c_avail_out)
-                    # When compressing, we will only get Z_BUF_ERROR if
-                    # the output buffer was full but there wasn't more
-                    # output when we tried again, so it is not an error
-                    # condition.
-                    if avail_out == bufsize:
-                        break
-
-                # fallback case: report this error
-                raise RZlibError.fromstream(stream, err, while_doing)
+    stream.c_next_in = rffi.cast(Bytefp, inbuf)
+    rffi.setintfield(stream, 'c_avail_in', length)
+
+    # Prepare the output buffer
+    with lltype.scoped_alloc(rffi.CCHARP.TO, OUTPUT_BUFFER_SIZE) as outbuf:
+        # Strategy: we call deflate() to get as much output data as fits in
+        # the buffer, then accumulate all output into a StringBuffer
+        # 'result'.
+        result = StringBuilder()
+
+        while True:
+            stream.c_next_out = rffi.cast(Bytefp, outbuf)
+            bufsize = OUTPUT_BUFFER_SIZE
+            if max_length < bufsize:
+                if max_length <= 0:
+                    err = Z_OK
+                    break
+                bufsize = max_length
+            max_length -= bufsize
+            rffi.setintfield(stream, 'c_avail_out', bufsize)
+            err = cfunc(stream, flush)
+            if err == Z_OK or err == Z_STREAM_END:
+                # accumulate data into 'result'
+                avail_out = rffi.cast(lltype.Signed, stream.c_avail_out)
+                result.append_charpsize(outbuf, bufsize - avail_out)
+                # if the output buffer is full, there might be more data
+                # so we need to try again.  Otherwise, we're done.
+                if avail_out > 0:
+                    break
+                # We're also done if we got a Z_STREAM_END (which should
+                # only occur when flush == Z_FINISH).
+                if err == Z_STREAM_END:
+                    break
+                else:
+                    continue
+            elif err == Z_BUF_ERROR:
+                avail_out = rffi.cast(lltype.Signed, stream.c_avail_out)
+                # When compressing, we will only get Z_BUF_ERROR if
+                # the output buffer was full but there wasn't more
+                # output when we tried again, so it is not an error
+                # condition.
+                if avail_out == bufsize:
+                    break
+
+            # fallback case: report this error
+            raise RZlibError.fromstream(stream, err, while_doing)
 
     # When decompressing, if the compressed stream of data was truncated,
     # then the zlib simply returns Z_OK and waits for more.  If it is
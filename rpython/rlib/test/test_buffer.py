@@ -32,3 +32,63 @@ def test_len_nonneg():
     a = RPythonAnnotator()
     s = a.build_types(func, [int])
     assert s == SomeInteger(nonneg=True)
+
+
+class RawBuffer(Buffer):
+    def __init__(self, s):
+        from rpython.rtyper.lltypesystem import rffi
+        self.raw = rffi.str2charp(s)
+        self.size = len(s)
+
+    def getlength(self):
+        return self.size
+
+    def as_str(self):
+        raise AssertionError("should not be called")
+
+    def get_raw_address(self):
+        return self.raw
+
+class ExportedRawBuffer(RawBuffer):
+    exports = 0
+
+    def export_raw_address(self):
+        self.exports += 1
+        return self.raw
+
+    def release_raw_address(self):
+        self.exports -= 1
+
+def test_scoped_rawbuffer():
+    from rpython.rtyper.lltypesystem import rffi
+    buf = StringBuffer('hello')
+    with scoped_rawbuffer(buf) as ptr:
+        assert rffi.charpsize2str(ptr, buf.getlength()) == 'hello'
+    buf = ExportedRawBuffer('world')
+    with scoped_rawbuffer(buf) as ptr:
+        assert ptr == buf.raw
+        assert buf.exports == 1
+    assert buf.exports == 0
+    rffi.free_charp(buf.raw)
+
+def test_scoped_rawbuffer_copies_unexported():
+    from rpython.rtyper.lltypesystem import rffi
+    # a raw address that is not exportable may be freed while in use
+    buf = RawBuffer('world')
+    buf.as_str = lambda: 'world'
+    with scoped_rawbuffer(buf) as ptr:
+        assert ptr != buf.raw
+        assert rffi.charpsize2str(ptr, buf.getlength()) == 'world'
+    rffi.free_charp(buf.raw)
+
+def test_scoped_rawbuffer_translated():
+    from rpython.rtyper.lltypesystem import rffi
+    from rpython.rtyper.test.test_llinterp import interpret
+    def f(n):
+        buf = StringBuffer('abcdef')
+        if n > 0:
+            buf = SubBuffer(buf, n, 2)
+        with scoped_rawbuffer(buf) as ptr:
+            return ord(ptr[0])
+    assert interpret(f, [0]) == ord('a')
+    assert interpret(f, [3]) == ord('d')
@@ -169,3 +169,67 @@ def test_stress():
             assert f.getvalue() == expected.getvalue()
     assert f.getvalue() == expected.getvalue()
     assert f.tell() == expected.tell()
+
+def test_no_copy():
+    s = 'hello world' * 10
+    f = RStringIO()
+    f.write(s)
+    assert f.getvalue() is s
+    f.seek(0)
+    assert f.read() is s
+    f.seek(0)
+    assert f.read(-1) is s
+    f.write('!')
+    value = f.getvalue()
+    assert value == s + '!'
+    assert f.getvalue() is value
+    f.seek(0)
+    assert f.read(len(value)) is value
+
+def test_read_readline_string():
+    f = RStringIO()
+    f.write('ab\ncd\n')
+    f.write('ef')
+    f.seek(1)
+    assert f.readline() == 'b\n'
+    assert f.readline(1) == 'c'
+    assert f.readline() == 'd\n'
+    assert f.readline() == 'ef'
+    assert f.readline() == ''
+    f.seek(2)
+    assert f.read(3) == '\ncd'
+    assert f.tell() == 5
+    f.seek(20)
+    assert f.read() == ''
+    assert f.readline() == ''
+    assert f.tell() == 20
+    f.write('X')
+    assert f.getvalue() == 'ab\ncd\nef' + '\x00' * 12 + 'X'
+
+def test_truncate_string():
+    f = RStringIO()
+    f.write('0123')
+    f.write('456')
+    f.truncate(5)
+    assert f.getvalue() == '01234'
+    assert f.tell() == 5
+    f.write('X')
+    f.truncate(10)
+    assert f.getvalue() == '01234X'
+
+def test_interleaved_write_read():
+    f = RStringIO()
+    f.write('x' * 100)
+    def getvalue():
+        raise AssertionError("should not join all the data again")
+    f.getvalue = getvalue
+    for i in range(10):
+        f.write('%d\n' % i)
+        f.seek(-2, 2)
+        assert f.read(1) == str(i)
+        assert f.readline() == '\n'
+    f.seek(50)
+    assert f.read(10) == 'x' * 10
+    assert f.readline() == 'x' * 40 + '0\n'
+    del f.getvalue
+    assert f.getvalue() == 'x' * 100 + ''.join(['%d\n' % i for i in range(10)])
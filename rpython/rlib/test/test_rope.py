@@ -859,3 +859,13 @@ def test_decode_utf8():
 def test_multiply_result_needs_no_rebalancing():
     r1 = multiply(LiteralStringNode("s"), 2**31 - 2)
     assert r1.rebalance() is r1
+
+def test_translate_byte_string_ropes_only():
+    from rpython.rtyper.test.test_llinterp import interpret
+    def f(n):
+        a = LiteralStringNode("x" * n)
+        b = concatenate(a, LiteralStringNode("yz"))
+        c = multiply(b, 3)
+        d = getslice_one(c, 1, n + 3)
+        return len(d.flatten_string()) * 1000 + c.length()
+    assert interpret(f, [40]) == 42126
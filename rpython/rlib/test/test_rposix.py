@@ -169,3 +169,21 @@ class TestPosixUnicode(BasePosixUnicodeOrAscii):
     def _get_filename(self):
         return (unicode(udir.join('test_open')) +
                 u'\u65e5\u672c.txt') # "Japan"
+
+def test_write_raw():
+    from rpython.rtyper.lltypesystem import rffi
+    filename = str(udir.join('test_write_raw.txt'))
+    def f():
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0777)
+        buf = rffi.str2charp("hello world")
+        try:
+            n = rposix.write_raw(fd, buf, 5)
+        finally:
+            rffi.free_charp(buf)
+            os.close(fd)
+        return n
+    assert f() == 5
+    assert open(filename).read() == 'hello'
+    assert interpret(f, []) == 5
+    assert open(filename).read() == 'hello'
+    py.test.raises(OSError, rposix.write_raw, -1, rffi.cast(rffi.CCHARP, 0), 0)
@@ -119,6 +119,19 @@ def test_socketpair():
     s1.close()
     s2.close()
 
+def test_socketpair_sendall_raw():
+    if sys.platform == "win32":
+        py.test.skip('No socketpair on Windows')
+    s1, s2 = socketpair()
+    buf = rffi.str2charp('hello')
+    try:
+        s1.sendall_raw(buf, 5)
+    finally:
+        rffi.free_charp(buf)
+    assert s2.recv(100) == 'hello'
+    s1.close()
+    s2.close()
+
 def test_socketpair_recvinto():
     class Buffer:
         def setslice(self, start, string):
@@ -62,6 +62,19 @@ def test_rsplit():
     check_rsplit('endcase test', 'test', res=['endcase ', ''])
     py.test.raises(ValueError, rsplit, "abc", '')
 
+class BoundsFactory(object):
+    def piece(self, value, start, stop):
+        return (start, stop)
+
+def test_split_rsplit_factory():
+    factory = BoundsFactory()
+    assert split('a|bc|d', '|', -1, factory) == [(0, 1), (2, 4), (5, 6)]
+    assert split('a//bc//d', '//', 1, factory) == [(0, 1), (3, 8)]
+    assert rsplit('a|bc|d', '|', -1, factory) == [(0, 1), (2, 4), (5, 6)]
+    assert rsplit('a//bc//d', '//', 1, factory) == [(0, 5), (7, 8)]
+    assert split('abc', 'x', -1, factory) == [(0, 3)]
+    assert rsplit('abc', 'x', -1, factory) == [(0, 3)]
+
 def test_rsplit_None():
     assert rsplit("") == []
     assert rsplit(' a\ta\na b') == ['a', 'a', 'a', 'b']
@@ -251,6 +264,21 @@ class TestTranslates(BaseRtypingTest):
         res = self.interpret(fn, [])
         assert res
 
+    def test_split_rsplit_factory(self):
+        def fn():
+            factory = BoundsFactory()
+            res = True
+            res = res and split('a|bc|d', '|', -1, factory) == [
+                (0, 1), (2, 4), (5, 6)]
+            res = res and split('a//bc//d', '//', 1, factory) == [
+                (0, 1), (3, 8)]
+            res = res and rsplit('a//bc//d', '//', -1, factory) == [
+                (0, 1), (3, 5), (7, 8)]
+            res = res and split('a|b', '|') == ['a', 'b']
+            return res
+        res = self.interpret(fn, [])
+        assert res
+
     def test_buffer_parameter(self):
         def fn():
             res = True
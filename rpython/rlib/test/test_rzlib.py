@@ -140,6 +140,37 @@ def test_compression_lots_of_data():
     assert bytes == compressed
 
 
+def test_compression_raw():
+    """
+    rzlib.compress_raw() and rzlib.decompress_raw() work on raw memory,
+    and so do rzlib.crc32_raw() and rzlib.adler32_raw().
+    """
+    from rpython.rtyper.lltypesystem import rffi
+    inbuf = rffi.str2charp(expanded)
+    try:
+        stream = rzlib.deflateInit()
+        bytes = rzlib.compress_raw(stream, inbuf, len(expanded),
+                                   rzlib.Z_FINISH)
+        rzlib.deflateEnd(stream)
+        assert bytes == compressed
+        assert rzlib.crc32_raw(inbuf, len(expanded)) == rzlib.crc32(expanded)
+        assert rzlib.adler32_raw(inbuf, 4, 42) == rzlib.adler32(expanded[:4],
+                                                                42)
+    finally:
+        rffi.free_charp(inbuf)
+    inbuf = rffi.str2charp(compressed + 'tail')
+    try:
+        stream = rzlib.inflateInit()
+        bytes, finished, unused = rzlib.decompress_raw(
+            stream, inbuf, len(compressed) + 4, rzlib.Z_FINISH)
+        rzlib.inflateEnd(stream)
+        assert bytes == expanded
+        assert finished is True
+        assert unused == 4
+    finally:
+        rffi.free_charp(inbuf)
+
+
 def test_inflate_init_end():
     """
     inflateInit() followed by inflateEnd() should work and do nothing.
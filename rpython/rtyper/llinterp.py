@@ -921,6 +921,15 @@ class LLFrame(object):
     def op_gc_gcflag_extra(self, subopnum, *args):
         return self.heap.gcflag_extra(subopnum, *args)
 
+    def op_gc_set_alloc_sampling(self):
+        raise NotImplementedError("gc_set_alloc_sampling")
+
+    def op_gc_fetch_alloc_samples(self):
+        raise NotImplementedError("gc_fetch_alloc_samples")
+
+    def op_gc_fetch_alloc_sample_results(self):
+        raise NotImplementedError("gc_fetch_alloc_sample_results")
+
     def op_do_malloc_fixedsize(self):
         raise NotImplementedError("do_malloc_fixedsize")
     def op_do_malloc_fixedsize_clear(self):
@@ -929,6 +938,10 @@ class LLFrame(object):
         raise NotImplementedError("do_malloc_varsize")
     def op_do_malloc_varsize_clear(self):
         raise NotImplementedError("do_malloc_varsize_clear")
+    def op_do_malloc_fixedsize_old(self):
+        raise NotImplementedError("do_malloc_fixedsize_old")
+    def op_gc_should_pretenure(self):
+        raise NotImplementedError("gc_should_pretenure")
 
     def op_get_write_barrier_failing_case(self):
         raise NotImplementedError("get_write_barrier_failing_case")
@@ -385,6 +385,13 @@ def arena_protect(arena_addr, size, inaccessible):
     assert size == arena_addr.arena.nbytes
     arena_addr.arena.set_protect(inaccessible)
 
+def arena_release(arena_addr, size):
+    """Tell the OS that the range of memory is not needed for now, if
+    possible.  It must not contain any object.  Only the whole OS pages
+    inside the range are released; they read as zeroes afterwards.
+    """
+    arena_reset(arena_addr, size, 1)
+
 # ____________________________________________________________
 #
 # Translation support: the functions above turn into the code below.
@@ -412,13 +419,17 @@ if os.name == 'posix':
             self.pagesize = 0
     posixpagesize = PosixPageSize()
 
-    def clear_large_memory_chunk(baseaddr, size):
-        from rpython.rlib import rmmap
-
+    def get_posix_page_size():
         pagesize = posixpagesize.pagesize
         if pagesize == 0:
             pagesize = rffi.cast(lltype.Signed, legacy_getpagesize())
             posixpagesize.pagesize = pagesize
+        return pagesize
+
+    def clear_large_memory_chunk(baseaddr, size):
+        from rpython.rlib import rmmap
+
+        pagesize = get_posix_page_size()
 
         if size > 2 * pagesize:
             lowbits = rffi.cast(lltype.Signed, baseaddr) & (pagesize - 1)
@@ -480,6 +491,22 @@ elif os.name == 'nt':
 else:
     has_protect = False
 
+if sys.platform.startswith('linux'):
+    raw_madvise = rffi.llexternal('madvise',
+                                  [llmemory.Address, rffi.SIZE_T, rffi.INT],
+                                  rffi.INT,
+                                  sandboxsafe=True, _nowrapper=True,
+                                  compilation_info=_eci)
+    MADV_DONTNEED = 4
+    def llimpl_release(addr, size):
+        raw_madvise(addr, rffi.cast(rffi.SIZE_T, size),
+                    rffi.cast(rffi.INT, MADV_DONTNEED))
+        # ignore potential errors
+    has_release = True
+
+else:
+    has_release = False
+
 
 llimpl_malloc = rffi.llexternal('malloc', [lltype.Signed], llmemory.Address,
                                 sandboxsafe=True, _nowrapper=True)
@@ -563,6 +590,21 @@ register_external(arena_protect, [llmemory.Address, lltype.Signed,
                   'll_arena.arena_protect', llimpl=llimpl_arena_protect,
                   llfakeimpl=arena_protect, sandboxsafe=True)
 
+def llimpl_arena_release(addr, size):
+    if has_release:
+        # only release the whole pages
+        pagesize = get_posix_page_size()
+        start = rffi.cast(lltype.Signed, addr)
+        end = start + size
+        start = (start + pagesize - 1) & -pagesize
+        end = end & -pagesize
+        if end > start:
+            llimpl_release(rffi.cast(llmemory.Address, start), end-start)
+register_external(arena_release, [llmemory.Address, lltype.Signed],
+                  lltype.Void,
+                  'll_arena.arena_release', llimpl=llimpl_arena_release,
+                  llfakeimpl=arena_release, sandboxsafe=True)
+
 def llimpl_getfakearenaaddress(addr):
     return addr
 register_external(getfakearenaaddress, [llmemory.Address], llmemory.Address,
@@ -458,6 +458,8 @@ LL_OPERATIONS = {
     'do_malloc_fixedsize_clear': LLOp(canmallocgc=True),
     'do_malloc_varsize':  LLOp(canmallocgc=True),
     'do_malloc_varsize_clear':  LLOp(canmallocgc=True),
+    'do_malloc_fixedsize_old':  LLOp(canmallocgc=True),
+    'gc_should_pretenure':      LLOp(),
     'get_write_barrier_failing_case': LLOp(sideeffects=False),
     'get_write_barrier_from_array_failing_case': LLOp(sideeffects=False),
     'gc_get_type_info_group': LLOp(sideeffects=False),
@@ -499,6 +501,9 @@ LL_OPERATIONS = {
     'gc_typeids_z'        : LLOp(),
     'gc_typeids_list'     : LLOp(),
     'gc_gcflag_extra'     : LLOp(),
+    'gc_set_alloc_sampling': LLOp(),
+    'gc_fetch_alloc_samples': LLOp(),
+    'gc_fetch_alloc_sample_results': LLOp(),
     'gc_add_memory_pressure': LLOp(),
 
     # ------- JIT & GC interaction, only for some GCs ----------
@@ -3,7 +3,8 @@ import py
 from rpython.rtyper.lltypesystem import lltype, llmemory
 from rpython.rtyper.lltypesystem.llarena import (arena_malloc, arena_reset,
     arena_reserve, arena_free, round_up_for_allocation, ArenaError,
-    arena_new_view, arena_shrink_obj, arena_protect, has_protect)
+    arena_new_view, arena_shrink_obj, arena_protect, has_protect,
+    arena_release)
 from rpython.rtyper.lltypesystem.llmemory import cast_adr_to_ptr
 from rpython.translator.c.test import test_genc, test_standalone
 
@@ -299,6 +300,19 @@ def test_arena_protect():
     p.x = 125
     assert p.x == 125
 
+def test_arena_release():
+    a = arena_malloc(100, False)
+    S = lltype.Struct('S', ('x', lltype.Signed))
+    arena_reserve(a, llmemory.sizeof(S))
+    p = llmemory.cast_adr_to_ptr(a, lltype.Ptr(S))
+    p.x = 123
+    b = a + llmemory.sizeof(S)
+    arena_reserve(b, llmemory.sizeof(S))
+    arena_release(b, 100 - llmemory.raw_malloc_usage(llmemory.sizeof(S)))
+    assert p.x == 123
+    # the released part is empty again
+    arena_reserve(b, llmemory.sizeof(S))
+
 
 class TestStandalone(test_standalone.StandaloneTests):
     def test_compiled_arena_protect(self):
@@ -338,3 +352,23 @@ class TestStandalone(test_standalone.StandaloneTests):
             cbuilder.cmdexec('2', expect_crash=True)
             if sys.platform.startswith('win'):
                 ctypes.windll.kernel32.SetErrorMode(old_err_mode)
+
+    def test_compiled_arena_release(self):
+        S = lltype.Struct('S', ('x', lltype.Signed))
+        #
+        def fn(argv):
+            a = arena_malloc(65536, False)
+            arena_reserve(a, llmemory.sizeof(S))
+            p = llmemory.cast_adr_to_ptr(a, lltype.Ptr(S))
+            p.x = 123
+            b = a + llmemory.sizeof(S)
+            arena_release(b, 65536 - llmemory.sizeof(S))
+            arena_reserve(b + 23432, llmemory.sizeof(S))
+            q = llmemory.cast_adr_to_ptr(b + 23432, lltype.Ptr(S))
+            q.x = 42
+            print p.x + q.x
+            return 0
+        #
+        t, cbuilder = self.compile(fn)
+        data = cbuilder.cmdexec('')
+        assert data == '165\n'
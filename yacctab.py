@@ -0,0 +1,286 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '"\xce\xf2\x9e\xca\x17\xf7\xe0\x81\x1f\r\xc4\x0b+;\x87'
+    
+_lr_action_items = {'VOID':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[6,6,-61,-72,-71,-58,-54,-55,-33,-29,-59,6,-34,-53,-68,-63,-52,6,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,6,-67,6,-70,-74,6,-57,-84,-255,-83,6,-111,-110,-30,6,-100,-99,6,6,-45,-46,6,-113,6,6,6,6,-90,6,6,6,6,-36,6,-47,6,6,-85,-91,-256,6,-114,6,6,-115,-117,-116,6,-101,-37,-39,-42,-38,-40,6,-152,-151,-43,-153,-41,-87,-86,-92,-93,6,-103,-102,-171,-170,6,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'LBRACKET':([1,2,3,5,6,9,10,13,14,17,18,19,21,23,24,25,27,28,29,30,32,33,35,37,39,40,42,43,44,45,46,49,50,51,52,54,55,56,58,60,64,65,67,68,69,70,74,78,81,83,84,86,90,94,96,97,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,136,145,146,150,154,163,164,171,173,174,175,176,177,197,200,201,203,207,213,217,238,239,249,252,253,257,263,264,265,293,295,296,305,306,307,308,311,315,319,320,343,344,347,350,352,354,355,356,377,378,384,386,411,412,419,],[-257,-61,-72,-71,-58,-54,-55,-59,-257,-53,-68,-63,-52,-56,-174,62,-66,-257,-69,72,-73,-112,-64,-60,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-255,-83,-49,62,-100,-99,-26,-118,-120,-25,72,72,161,-48,-51,72,-113,-257,-257,72,-239,-249,-253,-250,-247,-237,-238,205,-246,-224,-243,-251,-244,-236,-248,-245,72,-121,-119,161,259,72,72,-85,-256,-21,-82,-22,-81,-254,-252,-233,-232,-114,-115,72,-117,-116,-101,-146,-148,-136,259,-150,-144,-243,-87,-86,-231,-230,-229,-228,-227,-240,72,72,-103,-102,-139,259,-137,-145,-147,-149,-225,-226,259,-138,259,-234,-235,]),'WCHAR_CONST':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,103,103,103,-45,-223,103,-221,103,-220,103,-219,103,103,-218,-222,-219,103,-257,-219,103,103,-256,103,-180,-183,-181,-177,-178,-182,-184,103,-186,-187,-179,-185,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-12,103,103,-11,-219,-39,-42,-38,103,-40,103,103,-152,-151,-43,-153,103,-41,103,103,103,-257,-135,-171,-170,103,-168,103,103,-154,103,-167,-155,103,103,103,103,-257,103,103,-166,-169,103,-158,103,-156,103,103,-157,103,103,103,-257,103,-162,-161,-159,103,103,103,-163,-160,103,-165,-164,]),'FLOAT_CONST':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,104,104,104,-45,-223,104,-221,104,-220,104,-219,104,104,-218,-222,-219,104,-257,-219,104,104,-256,104,-180,-183,-181,-177,-178,-182,-184,104,-186,-187,-179,-185,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-12,104,104,-11,-219,-39,-42,-38,104,-40,104,104,-152,-151,-43,-153,104,-41,104,104,104,-257,-135,-171,-170,104,-168,104,104,-154,104,-167,-155,104,104,104,104,-257,104,104,-166,-169,104,-158,104,-156,104,104,-157,104,104,104,-257,104,-162,-161,-159,104,104,104,-163,-160,104,-165,-164,]),'MINUS':([55,62,72,77,82,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,205,206,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,302,305,306,307,308,311,315,316,317,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,350,353,358,359,361,362,363,364,367,368,369,371,372,373,376,377,378,379,380,383,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[-255,107,107,107,-45,-223,-210,-239,-249,-253,-250,-247,-237,107,-221,-238,-212,-191,107,-220,107,-246,-219,-224,107,107,-243,-251,-218,-244,-236,222,-248,-245,-222,-219,107,-257,-219,107,107,-256,107,-180,-183,-181,-177,-178,-182,-184,107,-186,-187,-179,-185,-254,107,-216,-252,-233,-232,107,107,107,-210,-215,107,-213,-214,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-12,107,107,-11,-219,-39,-42,-38,107,-40,107,107,-152,-151,-43,-153,107,-41,-243,107,-231,-230,-229,-228,-227,-240,107,107,222,222,222,-196,222,222,222,-195,222,222,-193,-192,222,222,222,222,222,-194,-257,-135,-171,-170,107,-168,107,107,-154,107,-167,-155,107,107,-217,-225,-226,107,107,-211,-257,107,107,-166,-169,107,-158,107,-156,107,107,-157,107,107,107,-257,-234,107,-162,-161,-159,-235,107,107,107,-163,-160,107,-165,-164,]),'RPAREN':([1,2,3,5,6,9,10,13,14,17,18,19,21,23,24,25,27,28,29,32,33,35,37,39,40,42,43,44,45,46,49,50,51,52,53,54,56,58,59,60,63,64,65,67,68,69,70,74,78,81,83,84,90,94,96,99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,130,132,133,134,135,136,137,138,139,145,146,150,157,158,159,160,162,163,164,171,173,174,175,176,177,197,199,200,201,203,206,207,209,210,212,213,214,215,216,217,218,238,239,240,241,242,243,249,252,253,264,265,268,278,295,296,303,304,305,306,307,308,310,311,312,313,314,315,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,340,341,342,343,344,354,355,356,366,376,377,378,382,383,394,396,399,400,402,412,414,417,419,420,421,424,],[-257,-61,-72,-71,-58,-54,-55,-59,-257,-53,-68,-63,-52,-56,-174,-109,-66,-257,-69,-73,-112,-64,-60,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,90,-84,-83,-49,-111,-110,-257,-100,-99,-26,-118,-120,-25,-141,-257,-143,-48,-51,-113,-257,-257,-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,-189,-248,-245,-175,238,-15,239,-124,-257,-16,-122,-128,-121,-119,-142,-19,-20,264,265,-257,-141,-257,-85,-256,-21,-82,-22,-81,-254,-216,-252,-233,-232,311,-114,-210,-215,-213,-115,315,317,-172,-257,-214,-117,-116,-127,-2,-126,-1,-101,-146,-148,-150,-144,356,-14,-87,-86,-176,376,-231,-230,-229,-228,-241,-227,378,380,381,-240,-140,-257,-141,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-129,-123,-125,-103,-102,-145,-147,-149,-13,-217,-225,-226,-173,-211,406,408,410,-242,-190,-234,-257,422,-235,-257,425,428,]),'LONG':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[19,19,-61,-72,-71,-58,-54,-55,-33,-29,-59,19,-34,-53,-68,-63,-52,19,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,19,-67,19,-70,-74,19,-57,-84,-255,-83,19,-111,-110,-30,19,-100,-99,19,19,-45,-46,19,-113,19,19,19,19,-90,19,19,19,19,-36,19,-47,19,19,-85,-91,-256,19,-114,19,19,-115,-117,-116,19,-101,-37,-39,-42,-38,-40,19,-152,-151,-43,-153,-41,-87,-86,-92,-93,19,-103,-102,-171,-170,19,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'PLUS':([55,62,72,77,82,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,205,206,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,302,305,306,307,308,311,315,316,317,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,350,353,358,359,361,362,363,364,367,368,369,371,372,373,376,377,378,379,380,383,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[-255,113,113,113,-45,-223,-210,-239,-249,-253,-250,-247,-237,113,-221,-238,-212,-191,113,-220,113,-246,-219,-224,113,113,-243,-251,-218,-244,-236,226,-248,-245,-222,-219,113,-257,-219,113,113,-256,113,-180,-183,-181,-177,-178,-182,-184,113,-186,-187,-179,-185,-254,113,-216,-252,-233,-232,113,113,113,-210,-215,113,-213,-214,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-12,113,113,-11,-219,-39,-42,-38,113,-40,113,113,-152,-151,-43,-153,113,-41,-243,113,-231,-230,-229,-228,-227,-240,113,113,226,226,226,-196,226,226,226,-195,226,226,-193,-192,226,226,226,226,226,-194,-257,-135,-171,-170,113,-168,113,113,-154,113,-167,-155,113,113,-217,-225,-226,113,113,-211,-257,113,113,-166,-169,113,-158,113,-156,113,113,-157,113,113,113,-257,-234,113,-162,-161,-159,-235,113,113,113,-163,-160,113,-165,-164,]),'ELLIPSIS':([245,],[341,]),'GT':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,227,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,227,-198,-196,-200,227,-199,-195,-202,227,-193,-192,-201,227,227,227,227,-194,-217,-225,-226,-211,-234,-235,]),'GOTO':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,271,-256,-39,-42,-38,-40,271,-152,-151,-43,-153,271,-41,-171,-170,-168,271,-154,-167,-155,271,-166,-169,-158,271,-156,271,-157,271,271,-162,-161,-159,271,271,-163,-160,271,-165,-164,]),'ENUM':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[26,26,-61,-72,-71,-58,-54,-55,-33,-29,-59,26,-34,-53,-68,-63,-52,26,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,26,-67,26,-70,-74,26,-57,-84,-255,-83,26,-111,-110,-30,26,-100,-99,26,26,-45,-46,26,-113,26,26,26,26,-90,26,26,26,26,-36,26,-47,26,26,-85,-91,-256,26,-114,26,26,-115,-117,-116,26,-101,-37,-39,-42,-38,-40,26,-152,-151,-43,-153,-41,-87,-86,-92,-93,26,-103,-102,-171,-170,26,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'PERIOD':([55,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,154,173,197,200,201,203,257,263,293,305,306,307,308,311,315,347,350,352,377,378,384,386,411,412,419,],[-255,-239,-249,-253,-250,-247,-237,-238,204,-246,-224,-243,-251,-244,-236,-248,-245,258,-256,-254,-252,-233,-232,-136,258,-243,-231,-230,-229,-228,-227,-240,-139,258,-137,-225,-226,258,-138,258,-234,-235,]),'GE':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,231,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,231,-198,-196,-200,231,-199,-195,-202,231,-193,-192,-201,231,231,231,231,-194,-217,-225,-226,-211,-234,-235,]),'INT_CONST_DEC':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,124,124,124,-45,-223,124,-221,124,-220,124,-219,124,124,-218,-222,-219,124,-257,-219,124,124,-256,124,-180,-183,-181,-177,-178,-182,-184,124,-186,-187,-179,-185,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-12,124,124,-11,-219,-39,-42,-38,124,-40,124,124,-152,-151,-43,-153,124,-41,124,124,124,-257,-135,-171,-170,124,-168,124,124,-154,124,-167,-155,124,124,124,124,-257,124,124,-166,-169,124,-158,124,-156,124,124,-157,124,124,124,-257,124,-162,-161,-159,124,124,124,-163,-160,124,-165,-164,]),'ARROW':([100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,200,201,203,293,305,306,307,308,311,315,377,378,412,419,],[-239,-249,-253,-250,-247,-237,-238,202,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-252,-233,-232,-243,-231,-230,-229,-228,-227,-240,-225,-226,-234,-235,]),'HEX_FLOAT_CONST':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,127,127,127,-45,-223,127,-221,127,-220,127,-219,127,127,-218,-222,-219,127,-257,-219,127,127,-256,127,-180,-183,-181,-177,-178,-182,-184,127,-186,-187,-179,-185,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-12,127,127,-11,-219,-39,-42,-38,127,-40,127,127,-152,-151,-43,-153,127,-41,127,127,127,-257,-135,-171,-170,127,-168,127,127,-154,127,-167,-155,127,127,127,127,-257,127,127,-166,-169,127,-158,127,-156,127,127,-157,127,127,127,-257,127,-162,-161,-159,127,127,127,-163,-160,127,-165,-164,]),'DOUBLE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[40,40,-61,-72,-71,-58,-54,-55,-33,-29,-59,40,-34,-53,-68,-63,-52,40,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,40,-67,40,-70,-74,40,-57,-84,-255,-83,40,-111,-110,-30,40,-100,-99,40,40,-45,-46,40,-113,40,40,40,40,-90,40,40,40,40,-36,40,-47,40,40,-85,-91,-256,40,-114,40,40,-115,-117,-116,40,-101,-37,-39,-42,-38,-40,40,-152,-151,-43,-153,-41,-87,-86,-92,-93,40,-103,-102,-171,-170,40,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'MINUSEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[186,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'INT_CONST_OCT':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,128,128,128,-45,-223,128,-221,128,-220,128,-219,128,128,-218,-222,-219,128,-257,-219,128,128,-256,128,-180,-183,-181,-177,-178,-182,-184,128,-186,-187,-179,-185,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,-12,128,128,-11,-219,-39,-42,-38,128,-40,128,128,-152,-151,-43,-153,128,-41,128,128,128,-257,-135,-171,-170,128,-168,128,128,-154,128,-167,-155,128,128,128,128,-257,128,128,-166,-169,128,-158,128,-156,128,128,-157,128,128,128,-257,128,-162,-161,-159,128,128,128,-163,-160,128,-165,-164,]),'TIMESEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[195,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'OR':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,236,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,236,-203,-205,-206,-194,-217,-225,-226,-211,-234,-235,]),'SHORT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[2,2,-61,-72,-71,-58,-54,-55,-33,-29,-59,2,-34,-53,-68,-63,-52,2,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,2,-67,2,-70,-74,2,-57,-84,-255,-83,2,-111,-110,-30,2,-100,-99,2,2,-45,-46,2,-113,2,2,2,2,-90,2,2,2,2,-36,2,-47,2,2,-85,-91,-256,2,-114,2,2,-115,-117,-116,2,-101,-37,-39,-42,-38,-40,2,-152,-151,-43,-153,-41,-87,-86,-92,-93,2,-103,-102,-171,-170,2,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'RETURN':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,274,-256,-39,-42,-38,-40,274,-152,-151,-43,-153,274,-41,-171,-170,-168,274,-154,-167,-155,274,-166,-169,-158,274,-156,274,-157,274,274,-162,-161,-159,274,274,-163,-160,274,-165,-164,]),'RSHIFTEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[196,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'RESTRICT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,28,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,67,69,76,78,82,87,89,90,91,92,93,94,95,96,119,145,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[32,32,-61,-72,-71,-58,-54,-55,-33,-29,-59,32,-34,-53,-68,-63,-52,32,-56,-174,-109,-66,32,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,32,-67,32,-70,-74,32,-57,-84,-255,-83,32,-111,-110,-30,32,-100,-99,32,-120,32,32,-45,-46,32,-113,32,32,32,32,-90,32,32,-121,32,32,-36,32,-47,32,32,-85,-91,-256,32,-114,32,32,-115,-117,-116,32,-101,-37,-39,-42,-38,-40,32,-152,-151,-43,-153,-41,-87,-86,-92,-93,32,-103,-102,-171,-170,32,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'STATIC':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[9,9,-61,-72,-71,-58,-54,-55,-33,-29,-59,9,-34,-53,-68,-63,-52,9,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,9,-67,9,-70,-74,9,-57,-84,-255,-83,-111,-110,-30,9,-100,-99,9,9,-45,-46,9,-113,9,9,-36,9,-47,-85,-256,-114,-115,-117,-116,9,-101,-37,-39,-42,-38,-40,9,-152,-151,-43,-153,-41,-87,-86,9,-103,-102,-171,-170,9,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'SIZEOF':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,106,106,106,-45,-223,106,-221,106,-220,106,-219,106,106,-218,-222,-219,106,-257,-219,106,106,-256,106,-180,-183,-181,-177,-178,-182,-184,106,-186,-187,-179,-185,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-12,106,106,-11,-219,-39,-42,-38,106,-40,106,106,-152,-151,-43,-153,106,-41,106,106,106,-257,-135,-171,-170,106,-168,106,106,-154,106,-167,-155,106,106,106,106,-257,106,106,-166,-169,106,-158,106,-156,106,106,-157,106,106,106,-257,106,-162,-161,-159,106,106,106,-163,-160,106,-165,-164,]),'UNSIGNED':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[18,18,-61,-72,-71,-58,-54,-55,-33,-29,-59,18,-34,-53,-68,-63,-52,18,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,18,-67,18,-70,-74,18,-57,-84,-255,-83,18,-111,-110,-30,18,-100,-99,18,18,-45,-46,18,-113,18,18,18,18,-90,18,18,18,18,-36,18,-47,18,18,-85,-91,-256,18,-114,18,18,-115,-117,-116,18,-101,-37,-39,-42,-38,-40,18,-152,-151,-43,-153,-41,-87,-86,-92,-93,18,-103,-102,-171,-170,18,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'UNION':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[20,20,-61,-72,-71,-58,-54,-55,-33,-29,-59,20,-34,-53,-68,-63,-52,20,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,20,-67,20,-70,-74,20,-57,-84,-255,-83,20,-111,-110,-30,20,-100,-99,20,20,-45,-46,20,-113,20,20,20,20,-90,20,20,20,20,-36,20,-47,20,20,-85,-91,-256,20,-114,20,20,-115,-117,-116,20,-101,-37,-39,-42,-38,-40,20,-152,-151,-43,-153,-41,-87,-86,-92,-93,20,-103,-102,-171,-170,20,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'COLON':([2,3,5,6,13,18,19,24,25,27,29,32,33,35,37,39,40,43,45,46,54,56,59,60,64,65,90,94,96,97,99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,130,171,173,174,175,176,177,184,197,199,200,201,203,207,209,210,212,213,216,218,238,239,249,279,293,295,296,298,299,303,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,343,344,365,376,377,378,382,383,402,412,419,],[-61,-72,-71,-58,-59,-68,-63,-174,-109,-66,-69,-73,-112,-64,-60,-62,-65,-67,-70,-74,-84,-83,-111,-110,-100,-99,-113,-257,-257,178,-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,-189,-248,-245,-175,-85,-256,-21,-82,-22,-81,302,-254,-216,-252,-233,-232,-114,-210,-215,-213,-115,-172,-214,-117,-116,-101,363,372,-87,-86,-188,178,-176,-231,-230,-229,-228,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,385,-206,-194,-103,-102,395,-217,-225,-226,-173,-211,-190,-234,-235,]),'$end':([0,8,11,12,15,22,31,36,38,47,61,82,166,173,255,371,],[-257,0,-33,-29,-34,-27,-32,-31,-35,-28,-30,-45,-36,-256,-37,-155,]),'WSTRING_LITERAL':([55,62,72,77,82,98,100,102,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,102,102,102,-45,-223,197,-253,102,-221,102,-220,102,-219,102,102,-218,-222,-219,102,-257,-219,102,102,-256,102,-180,-183,-181,-177,-178,-182,-184,102,-186,-187,-179,-185,-254,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-12,102,102,-11,-219,-39,-42,-38,102,-40,102,102,-152,-151,-43,-153,102,-41,102,102,102,-257,-135,-171,-170,102,-168,102,102,-154,102,-167,-155,102,102,102,102,-257,102,102,-166,-169,102,-158,102,-156,102,102,-157,102,102,102,-257,102,-162,-161,-159,102,102,102,-163,-160,102,-165,-164,]),'DIVIDE':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,229,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,229,229,229,229,229,229,229,229,229,229,-193,-192,229,229,229,229,229,-194,-217,-225,-226,-211,-234,-235,]),'FOR':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,276,-256,-39,-42,-38,-40,276,-152,-151,-43,-153,276,-41,-171,-170,-168,276,-154,-167,-155,276,-166,-169,-158,276,-156,276,-157,276,276,-162,-161,-159,276,276,-163,-160,276,-165,-164,]),'PLUSPLUS':([55,62,72,77,82,98,100,101,102,103,104,105,106,107,108,109,112,113,115,116,117,118,119,120,121,122,123,124,125,127,128,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,201,203,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,302,305,306,307,308,311,315,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,377,378,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[-255,115,115,115,-45,-223,-239,-249,-253,-250,-247,-237,115,-221,-238,203,115,-220,115,-246,-219,-224,115,115,-243,-251,-218,-244,-236,-248,-245,-222,-219,115,-257,-219,115,115,-256,115,-180,-183,-181,-177,-178,-182,-184,115,-186,-187,-179,-185,-254,115,-252,-233,-232,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-12,115,115,-11,-219,-39,-42,-38,115,-40,115,115,-152,-151,-43,-153,115,-41,-243,115,-231,-230,-229,-228,-227,-240,115,115,-257,-135,-171,-170,115,-168,115,115,-154,115,-167,-155,115,115,-225,-226,115,115,-257,115,115,-166,-169,115,-158,115,-156,115,115,-157,115,115,115,-257,-234,115,-162,-161,-159,-235,115,115,115,-163,-160,115,-165,-164,]),'EQUALS':([1,2,3,5,6,9,10,13,14,17,18,19,21,23,24,25,27,29,30,32,33,35,37,39,40,42,43,44,45,46,49,50,51,52,54,56,58,59,60,64,65,76,83,84,86,90,99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,144,165,171,173,197,199,200,201,203,207,209,210,212,213,218,238,239,249,257,263,293,295,296,305,306,307,308,311,315,343,344,347,352,376,377,378,383,386,412,419,],[-257,-61,-72,-71,-58,-54,-55,-59,-257,-53,-68,-63,-52,-56,-174,-109,-66,-69,77,-73,-112,-64,-60,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-83,-49,-111,-110,-100,-99,151,-48,-51,77,-113,188,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,250,151,-85,-256,-254,-216,-252,-233,-232,-114,-210,-215,-213,-115,-214,-117,-116,-101,-136,353,-243,-87,-86,-231,-230,-229,-228,-227,-240,-103,-102,-139,-137,-217,-225,-226,-211,-138,-234,-235,]),'ELSE':([173,269,270,273,275,286,291,358,359,362,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[-256,-39,-42,-38,-40,-43,-41,-171,-170,-168,-167,-155,-166,-169,-158,-156,-157,-162,-161,423,-163,-160,-165,-164,]),'ANDEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[193,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'EQ':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,233,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,233,-198,-196,-200,-204,-199,-195,-202,233,-193,-192,-201,233,-203,233,233,-194,-217,-225,-226,-211,-234,-235,]),'AND':([55,62,72,77,82,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,205,206,208,209,210,211,212,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,302,305,306,307,308,311,315,316,317,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,350,353,358,359,361,362,363,364,367,368,369,371,372,373,376,377,378,379,380,383,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[-255,123,123,123,-45,-223,-210,-239,-249,-253,-250,-247,-237,123,-221,-238,-212,-191,123,-220,123,-246,-219,-224,123,123,-243,-251,-218,-244,-236,234,-248,-245,-222,-219,123,-257,-219,123,123,-256,123,-180,-183,-181,-177,-178,-182,-184,123,-186,-187,-179,-185,-254,123,-216,-252,-233,-232,123,123,123,-210,-215,123,-213,-214,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-12,123,123,-11,-219,-39,-42,-38,123,-40,123,123,-152,-151,-43,-153,123,-41,-243,123,-231,-230,-229,-228,-227,-240,123,123,-197,234,-198,-196,-200,-204,-199,-195,-202,234,-193,-192,-201,234,-203,-205,234,-194,-257,-135,-171,-170,123,-168,123,123,-154,123,-167,-155,123,123,-217,-225,-226,123,123,-211,-257,123,123,-166,-169,123,-158,123,-156,123,123,-157,123,123,123,-257,-234,123,-162,-161,-159,-235,123,123,123,-163,-160,123,-165,-164,]),'TYPEID':([0,1,2,3,5,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,31,32,33,34,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,67,68,69,70,74,76,78,82,87,89,90,91,92,93,94,95,96,119,145,146,162,163,164,166,167,168,169,170,171,172,173,198,202,204,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[24,24,-61,-72,-71,-58,54,-54,-55,-33,-29,-59,24,-34,59,-53,-68,-63,-89,-52,24,-56,-174,-109,64,-66,-257,-69,-32,-73,-112,-88,-64,-31,-60,-35,-62,-65,24,-67,24,-70,-74,24,-57,-84,-255,-83,24,-111,-110,-30,24,-100,-99,-26,-118,-120,-25,59,24,24,-45,-46,24,-113,24,24,24,24,-90,24,24,-121,-119,24,59,24,-36,24,-47,24,24,-85,-91,-256,24,305,307,-114,24,24,-115,-117,-116,24,-101,-37,-39,-42,-38,-40,24,-152,-151,-43,-153,-41,-87,-86,-92,-93,24,-103,-102,-171,-170,24,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'LBRACE':([7,20,25,26,33,34,48,54,55,56,59,60,64,65,76,77,82,85,87,88,89,90,151,152,154,167,168,173,207,213,238,239,256,260,261,269,270,273,275,282,284,285,286,288,290,291,317,350,353,358,359,362,363,367,369,371,372,376,380,381,384,387,389,390,393,395,398,406,407,408,410,411,415,416,418,423,425,426,427,428,429,430,],[55,-89,-109,55,-112,-88,-257,55,-255,55,-111,-110,55,55,-257,55,-45,-7,-46,55,-8,-113,55,55,-257,55,-47,-256,-114,-115,-117,-116,-12,55,-11,-39,-42,-38,-40,55,-152,-151,-43,-153,55,-41,55,-257,-135,-171,-170,-168,55,-154,-167,-155,55,55,55,55,-257,55,-166,-169,-158,55,-156,55,-157,55,55,-257,-162,-161,-159,55,55,-163,-160,55,-165,-164,]),'PPHASH':([0,11,12,15,22,31,36,38,61,82,166,173,255,371,],[38,-33,-29,-34,38,-32,-31,-35,-30,-45,-36,-256,-37,-155,]),'INT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[39,39,-61,-72,-71,-58,-54,-55,-33,-29,-59,39,-34,-53,-68,-63,-52,39,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,39,-67,39,-70,-74,39,-57,-84,-255,-83,39,-111,-110,-30,39,-100,-99,39,39,-45,-46,39,-113,39,39,39,39,-90,39,39,39,39,-36,39,-47,39,39,-85,-91,-256,39,-114,39,39,-115,-117,-116,39,-101,-37,-39,-42,-38,-40,39,-152,-151,-43,-153,-41,-87,-86,-92,-93,39,-103,-102,-171,-170,39,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'SIGNED':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[43,43,-61,-72,-71,-58,-54,-55,-33,-29,-59,43,-34,-53,-68,-63,-52,43,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,43,-67,43,-70,-74,43,-57,-84,-255,-83,43,-111,-110,-30,43,-100,-99,43,43,-45,-46,43,-113,43,43,43,43,-90,43,43,43,43,-36,43,-47,43,43,-85,-91,-256,43,-114,43,43,-115,-117,-116,43,-101,-37,-39,-42,-38,-40,43,-152,-151,-43,-153,-41,-87,-86,-92,-93,43,-103,-102,-171,-170,43,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'CONTINUE':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,277,-256,-39,-42,-38,-40,277,-152,-151,-43,-153,277,-41,-171,-170,-168,277,-154,-167,-155,277,-166,-169,-158,277,-156,277,-157,277,277,-162,-161,-159,277,277,-163,-160,277,-165,-164,]),'NOT':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,131,131,131,-45,-223,131,-221,131,-220,131,-219,131,131,-218,-222,-219,131,-257,-219,131,131,-256,131,-180,-183,-181,-177,-178,-182,-184,131,-186,-187,-179,-185,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,-12,131,131,-11,-219,-39,-42,-38,131,-40,131,131,-152,-151,-43,-153,131,-41,131,131,131,-257,-135,-171,-170,131,-168,131,131,-154,131,-167,-155,131,131,131,131,-257,131,131,-166,-169,131,-158,131,-156,131,131,-157,131,131,131,-257,131,-162,-161,-159,131,131,131,-163,-160,131,-165,-164,]),'OREQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[194,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'MOD':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,237,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,237,237,237,237,237,237,237,237,237,237,-193,-192,237,237,237,237,237,-194,-217,-225,-226,-211,-234,-235,]),'RSHIFT':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,219,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,219,-198,-196,219,219,219,-195,219,219,-193,-192,219,219,219,219,219,-194,-217,-225,-226,-211,-234,-235,]),'DEFAULT':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,279,-256,-39,-42,-38,-40,279,-152,-151,-43,-153,279,-41,-171,-170,-168,279,-154,-167,-155,279,-166,-169,-158,279,-156,279,-157,279,279,-162,-161,-159,279,279,-163,-160,279,-165,-164,]),'CHAR':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[37,37,-61,-72,-71,-58,-54,-55,-33,-29,-59,37,-34,-53,-68,-63,-52,37,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,37,-67,37,-70,-74,37,-57,-84,-255,-83,37,-111,-110,-30,37,-100,-99,37,37,-45,-46,37,-113,37,37,37,37,-90,37,37,37,37,-36,37,-47,37,37,-85,-91,-256,37,-114,37,37,-115,-117,-116,37,-101,-37,-39,-42,-38,-40,37,-152,-151,-43,-153,-41,-87,-86,-92,-93,37,-103,-102,-171,-170,37,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'WHILE':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,370,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,280,-256,-39,-42,-38,-40,280,-152,-151,-43,-153,280,-41,-171,-170,-168,280,-154,-167,397,-155,280,-166,-169,-158,280,-156,280,-157,280,280,-162,-161,-159,280,280,-163,-160,280,-165,-164,]),'DIVEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[185,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'EXTERN':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[10,10,-61,-72,-71,-58,-54,-55,-33,-29,-59,10,-34,-53,-68,-63,-52,10,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,10,-67,10,-70,-74,10,-57,-84,-255,-83,-111,-110,-30,10,-100,-99,10,10,-45,-46,10,-113,10,10,-36,10,-47,-85,-256,-114,-115,-117,-116,10,-101,-37,-39,-42,-38,-40,10,-152,-151,-43,-153,-41,-87,-86,10,-103,-102,-171,-170,10,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'CASE':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,281,-256,-39,-42,-38,-40,281,-152,-151,-43,-153,281,-41,-171,-170,-168,281,-154,-167,-155,281,-166,-169,-158,281,-156,281,-157,281,281,-162,-161,-159,281,281,-163,-160,281,-165,-164,]),'LAND':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,232,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,232,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-217,-225,-226,-211,-234,-235,]),'REGISTER':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[17,17,-61,-72,-71,-58,-54,-55,-33,-29,-59,17,-34,-53,-68,-63,-52,17,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,17,-67,17,-70,-74,17,-57,-84,-255,-83,-111,-110,-30,17,-100,-99,17,17,-45,-46,17,-113,17,17,-36,17,-47,-85,-256,-114,-115,-117,-116,17,-101,-37,-39,-42,-38,-40,17,-152,-151,-43,-153,-41,-87,-86,17,-103,-102,-171,-170,17,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'MODEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[187,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'NE':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,224,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,224,-198,-196,-200,-204,-199,-195,-202,224,-193,-192,-201,224,-203,224,224,-194,-217,-225,-226,-211,-234,-235,]),'SWITCH':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,283,-256,-39,-42,-38,-40,283,-152,-151,-43,-153,283,-41,-171,-170,-168,283,-154,-167,-155,283,-166,-169,-158,283,-156,283,-157,283,283,-162,-161,-159,283,283,-163,-160,283,-165,-164,]),'INT_CONST_HEX':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,116,116,116,-45,-223,116,-221,116,-220,116,-219,116,116,-218,-222,-219,116,-257,-219,116,116,-256,116,-180,-183,-181,-177,-178,-182,-184,116,-186,-187,-179,-185,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-12,116,116,-11,-219,-39,-42,-38,116,-40,116,116,-152,-151,-43,-153,116,-41,116,116,116,-257,-135,-171,-170,116,-168,116,116,-154,116,-167,-155,116,116,116,116,-257,116,116,-166,-169,116,-158,116,-156,116,116,-157,116,116,116,-257,116,-162,-161,-159,116,116,116,-163,-160,116,-165,-164,]),'_COMPLEX':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[27,27,-61,-72,-71,-58,-54,-55,-33,-29,-59,27,-34,-53,-68,-63,-52,27,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,27,-67,27,-70,-74,27,-57,-84,-255,-83,27,-111,-110,-30,27,-100,-99,27,27,-45,-46,27,-113,27,27,27,27,-90,27,27,27,27,-36,27,-47,27,27,-85,-91,-256,27,-114,27,27,-115,-117,-116,27,-101,-37,-39,-42,-38,-40,27,-152,-151,-43,-153,-41,-87,-86,-92,-93,27,-103,-102,-171,-170,27,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'PLUSEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[190,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'STRUCT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[34,34,-61,-72,-71,-58,-54,-55,-33,-29,-59,34,-34,-53,-68,-63,-52,34,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,34,-67,34,-70,-74,34,-57,-84,-255,-83,34,-111,-110,-30,34,-100,-99,34,34,-45,-46,34,-113,34,34,34,34,-90,34,34,34,34,-36,34,-47,34,34,-85,-91,-256,34,-114,34,34,-115,-117,-116,34,-101,-37,-39,-42,-38,-40,34,-152,-151,-43,-153,-41,-87,-86,-92,-93,34,-103,-102,-171,-170,34,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'CONDOP':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,235,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-217,-225,-226,-211,-234,-235,]),'BREAK':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,287,-256,-39,-42,-38,-40,287,-152,-151,-43,-153,287,-41,-171,-170,-168,287,-154,-167,-155,287,-166,-169,-158,287,-156,287,-157,287,287,-162,-161,-159,287,287,-163,-160,287,-165,-164,]),'VOLATILE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,28,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,67,69,76,78,82,87,89,90,91,92,93,94,95,96,119,145,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[46,46,-61,-72,-71,-58,-54,-55,-33,-29,-59,46,-34,-53,-68,-63,-52,46,-56,-174,-109,-66,46,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,46,-67,46,-70,-74,46,-57,-84,-255,-83,46,-111,-110,-30,46,-100,-99,46,-120,46,46,-45,-46,46,-113,46,46,46,46,-90,46,46,-121,46,46,-36,46,-47,46,46,-85,-91,-256,46,-114,46,46,-115,-117,-116,46,-101,-37,-39,-42,-38,-40,46,-152,-151,-43,-153,-41,-87,-86,-92,-93,46,-103,-102,-171,-170,46,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'INLINE':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[49,49,-61,-72,-71,-58,-54,-55,-33,-29,-59,49,-34,-53,-68,-63,-52,49,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,49,-67,49,-70,-74,49,-57,-84,-255,-83,-111,-110,-30,49,-100,-99,49,49,-45,-46,49,-113,49,49,-36,49,-47,-85,-256,-114,-115,-117,-116,49,-101,-37,-39,-42,-38,-40,49,-152,-151,-43,-153,-41,-87,-86,49,-103,-102,-171,-170,49,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'DO':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,290,-256,-39,-42,-38,-40,290,-152,-151,-43,-153,290,-41,-171,-170,-168,290,-154,-167,-155,290,-166,-169,-158,290,-156,290,-157,290,290,-162,-161,-159,290,290,-163,-160,290,-165,-164,]),'LNOT':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,98,98,98,-45,-223,98,-221,98,-220,98,-219,98,98,-218,-222,-219,98,-257,-219,98,98,-256,98,-180,-183,-181,-177,-178,-182,-184,98,-186,-187,-179,-185,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-12,98,98,-11,-219,-39,-42,-38,98,-40,98,98,-152,-151,-43,-153,98,-41,98,98,98,-257,-135,-171,-170,98,-168,98,98,-154,98,-167,-155,98,98,98,98,-257,98,98,-166,-169,98,-158,98,-156,98,98,-157,98,98,98,-257,98,-162,-161,-159,98,98,98,-163,-160,98,-165,-164,]),'CONST':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,28,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,67,69,76,78,82,87,89,90,91,92,93,94,95,96,119,145,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[3,3,-61,-72,-71,-58,-54,-55,-33,-29,-59,3,-34,-53,-68,-63,-52,3,-56,-174,-109,-66,3,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,3,-67,3,-70,-74,3,-57,-84,-255,-83,3,-111,-110,-30,3,-100,-99,3,-120,3,3,-45,-46,3,-113,3,3,3,3,-90,3,3,-121,3,3,-36,3,-47,3,3,-85,-91,-256,3,-114,3,3,-115,-117,-116,3,-101,-37,-39,-42,-38,-40,3,-152,-151,-43,-153,-41,-87,-86,-92,-93,3,-103,-102,-171,-170,3,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'LOR':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,220,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-217,-225,-226,-211,-234,-235,]),'CHAR_CONST':([55,62,72,77,82,98,106,107,112,113,115,117,119,120,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,101,101,101,-45,-223,101,-221,101,-220,101,-219,101,101,-218,-222,-219,101,-257,-219,101,101,-256,101,-180,-183,-181,-177,-178,-182,-184,101,-186,-187,-179,-185,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-12,101,101,-11,-219,-39,-42,-38,101,-40,101,101,-152,-151,-43,-153,101,-41,101,101,101,-257,-135,-171,-170,101,-168,101,101,-154,101,-167,-155,101,101,101,101,-257,101,101,-166,-169,101,-158,101,-156,101,101,-157,101,101,101,-257,101,-162,-161,-159,101,101,101,-163,-160,101,-165,-164,]),'LSHIFT':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,221,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,221,-198,-196,221,221,221,-195,221,221,-193,-192,221,221,221,221,221,-194,-217,-225,-226,-211,-234,-235,]),'RBRACE':([55,82,93,95,99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,130,142,143,144,155,167,169,170,172,173,197,199,200,201,203,209,210,212,218,246,247,248,262,269,270,273,275,282,284,285,286,288,289,291,292,298,300,301,303,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,345,346,349,350,351,358,359,362,367,369,371,376,377,378,383,388,389,390,393,398,401,402,403,407,411,412,415,416,418,419,426,427,429,430,],[-255,-45,173,-90,-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,-189,-248,-245,-175,-104,173,-107,-130,-257,173,173,-91,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,173,173,-105,173,-39,-42,-38,-40,-6,-152,-151,-43,-153,-5,-41,173,-188,-92,-93,-176,-231,-230,-229,-228,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-106,-108,-133,173,-131,-171,-170,-168,-154,-167,-155,-217,-225,-226,-211,-132,-166,-169,-158,-156,173,-190,-134,-157,173,-234,-162,-161,-159,-235,-163,-160,-165,-164,]),'_BOOL':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[13,13,-61,-72,-71,-58,-54,-55,-33,-29,-59,13,-34,-53,-68,-63,-52,13,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,13,-67,13,-70,-74,13,-57,-84,-255,-83,13,-111,-110,-30,13,-100,-99,13,13,-45,-46,13,-113,13,13,13,13,-90,13,13,13,13,-36,13,-47,13,13,-85,-91,-256,13,-114,13,13,-115,-117,-116,13,-101,-37,-39,-42,-38,-40,13,-152,-151,-43,-153,-41,-87,-86,-92,-93,13,-103,-102,-171,-170,13,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'LE':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,223,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,223,-198,-196,-200,223,-199,-195,-202,223,-193,-192,-201,223,223,223,223,-194,-217,-225,-226,-211,-234,-235,]),'SEMI':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,28,29,30,31,32,33,35,36,37,38,39,40,41,42,43,44,45,46,49,50,51,52,54,55,56,58,59,60,61,64,65,67,68,69,70,71,73,74,75,76,79,80,81,82,83,84,86,90,94,96,97,99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,130,145,146,150,153,155,163,165,166,167,171,173,174,175,176,177,179,180,181,182,183,184,197,199,200,201,203,207,209,210,212,213,216,218,238,239,249,251,252,253,254,255,264,265,269,270,272,273,274,275,277,278,282,284,285,286,287,288,289,290,291,293,295,296,297,298,303,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,343,344,351,354,355,356,357,358,359,360,361,362,363,366,367,369,371,372,374,375,376,377,378,382,383,388,389,390,391,392,393,395,398,402,404,405,406,407,408,410,412,413,415,416,418,419,422,423,425,426,427,428,429,430,],[15,-257,-61,-72,-71,-58,-54,-55,-33,-29,-59,-257,-34,-53,-68,-63,-52,15,-56,-174,-109,-66,-257,-69,-257,-32,-73,-112,-64,-31,-60,-35,-62,-65,82,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-255,-83,-49,-111,-110,-30,-100,-99,-26,-118,-120,-25,-18,-44,-141,-17,-79,-78,-75,-143,-45,-48,-51,-257,-113,-257,-257,-257,-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,-189,-248,-245,-175,-121,-119,-142,-77,-130,-141,-79,-36,-257,-85,-256,-21,-82,-22,-81,-24,300,-94,301,-23,-96,-254,-216,-252,-233,-232,-114,-210,-215,-213,-115,-172,-214,-117,-116,-101,-76,-146,-148,-80,-37,-150,-144,-39,-42,358,-38,359,-40,362,-14,-257,-152,-151,-43,369,-153,-13,-257,-41,-243,-87,-86,-98,-188,-176,-231,-230,-229,-228,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,-103,-102,-131,-145,-147,-149,389,-171,-170,390,-257,-168,-257,-13,-154,-167,-155,-257,-95,-97,-217,-225,-226,-173,-211,-132,-166,-169,404,-257,-158,-257,-156,-190,-257,414,-257,-157,-257,-257,-234,420,-162,-161,-159,-235,426,-257,-257,-163,-160,-257,-165,-164,]),'LT':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,225,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,225,-198,-196,-200,225,-199,-195,-202,225,-193,-192,-201,225,225,225,225,-194,-217,-225,-226,-211,-234,-235,]),'COMMA':([1,2,3,5,6,9,10,13,14,17,18,19,21,23,24,25,27,28,29,32,33,35,37,39,40,42,43,44,45,46,49,50,51,52,54,56,58,59,60,64,65,67,68,69,70,71,74,76,79,80,81,83,84,90,99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,130,135,136,137,138,139,142,143,144,145,146,150,153,155,163,165,171,173,179,181,184,197,199,200,201,203,207,209,210,212,213,214,216,218,238,239,240,241,242,243,246,247,248,249,251,252,253,254,262,264,265,278,293,295,296,297,298,303,305,306,307,308,309,310,311,312,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,342,343,344,345,346,349,351,354,355,356,360,374,375,376,377,378,382,383,388,394,396,399,400,401,402,403,412,417,419,],[-257,-61,-72,-71,-58,-54,-55,-59,-257,-53,-68,-63,-52,-56,-174,-109,-66,-257,-69,-73,-112,-64,-60,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-83,-49,-111,-110,-100,-99,-26,-118,-120,-25,147,-141,-79,-78,-75,-143,-48,-51,-113,-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,-189,-248,-245,-175,-124,-257,244,245,-128,-104,248,-107,-121,-119,-142,-77,-130,-141,-79,-85,-256,299,-94,-96,-254,-216,-252,-233,-232,-114,-210,-215,-213,-115,316,-172,-214,-117,-116,-127,-2,-126,-1,248,248,-105,-101,-76,-146,-148,-80,350,-150,-144,316,-243,-87,-86,-98,-188,-176,-231,-230,-229,-228,316,-241,-227,379,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,316,-206,-194,-129,-125,-103,-102,-106,-108,-133,-131,-145,-147,-149,316,-95,-97,-217,-225,-226,-173,-211,-132,316,316,316,-242,411,-190,-134,-234,316,-235,]),'TYPEDEF':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[23,23,-61,-72,-71,-58,-54,-55,-33,-29,-59,23,-34,-53,-68,-63,-52,23,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,23,-67,23,-70,-74,23,-57,-84,-255,-83,-111,-110,-30,23,-100,-99,23,23,-45,-46,23,-113,23,23,-36,23,-47,-85,-256,-114,-115,-117,-116,23,-101,-37,-39,-42,-38,-40,23,-152,-151,-43,-153,-41,-87,-86,23,-103,-102,-171,-170,23,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'XOR':([99,100,101,102,103,104,105,108,109,111,116,118,121,122,124,125,126,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,376,377,378,383,412,419,],[-210,-239,-249,-253,-250,-247,-237,-238,-212,-191,-246,-224,-243,-251,-244,-236,228,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-197,228,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,228,-203,-205,228,-194,-217,-225,-226,-211,-234,-235,]),'AUTO':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,59,60,61,63,64,65,76,78,82,87,89,90,162,164,166,167,168,171,173,207,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[21,21,-61,-72,-71,-58,-54,-55,-33,-29,-59,21,-34,-53,-68,-63,-52,21,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,21,-67,21,-70,-74,21,-57,-84,-255,-83,-111,-110,-30,21,-100,-99,21,21,-45,-46,21,-113,21,21,-36,21,-47,-85,-256,-114,-115,-117,-116,21,-101,-37,-39,-42,-38,-40,21,-152,-151,-43,-153,-41,-87,-86,21,-103,-102,-171,-170,21,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'TIMES':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,27,28,29,30,31,32,35,36,37,38,39,40,42,43,44,45,46,49,50,51,52,54,55,56,58,61,62,64,65,67,68,69,70,72,77,78,82,83,84,86,94,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,136,145,147,149,151,154,156,161,164,166,167,171,173,174,175,176,177,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,205,206,208,209,210,211,212,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,249,250,255,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,295,296,299,302,305,306,307,308,311,315,316,317,319,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,343,344,350,353,358,359,361,362,363,364,367,368,369,371,372,373,376,377,378,379,380,383,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[28,-257,-61,-72,28,-71,-58,-54,-55,-33,-29,-59,-257,-34,-53,-68,-63,-52,28,-56,-174,-66,-257,-69,28,-32,-73,-64,-31,-60,-35,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-255,-83,-49,-30,117,-100,-99,-26,28,-120,-25,149,156,28,-45,-48,-51,28,-257,-257,28,-223,-210,-239,-249,-253,-250,-247,-237,156,-221,-238,-212,-191,156,-220,156,-246,-219,-224,156,156,-243,-251,-218,-244,-236,230,-248,-245,-222,28,-121,28,-219,156,-257,-219,267,28,-36,156,-85,-256,-21,-82,-22,-81,156,-180,-183,-181,-177,-178,-182,-184,156,-186,-187,-179,-185,-254,156,-216,-252,-233,-232,156,156,156,-210,-215,156,-213,28,-214,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,-101,156,-37,-12,156,156,-11,-219,-39,-42,-38,156,-40,156,156,-152,-151,-43,-153,156,-41,-243,-87,-86,28,156,-231,-230,-229,-228,-227,-240,156,156,28,230,230,230,230,230,230,230,230,230,230,-193,-192,230,230,230,230,230,-194,-103,-102,-257,-135,-171,-170,156,-168,156,156,-154,156,-167,-155,156,156,-217,-225,-226,156,156,-211,-257,156,156,-166,-169,156,-158,156,-156,156,156,-157,156,156,156,-257,-234,156,-162,-161,-159,-235,156,156,156,-163,-160,156,-165,-164,]),'LPAREN':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,27,28,29,30,31,32,33,35,36,37,38,39,40,42,43,44,45,46,49,50,51,52,54,55,56,58,60,61,62,64,65,67,68,69,70,72,74,77,78,81,82,83,84,86,90,94,96,97,98,100,101,102,103,104,105,106,107,108,109,112,113,115,116,117,118,119,120,121,122,123,124,125,127,128,131,136,145,146,147,149,150,151,154,156,161,163,164,166,167,171,173,174,175,176,177,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,201,203,205,206,207,208,211,213,217,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,249,250,252,253,255,256,259,260,261,264,265,267,269,270,273,274,275,276,280,281,282,283,284,285,286,288,290,291,293,294,295,296,299,302,305,306,307,308,311,315,316,317,319,320,343,344,350,353,354,355,356,358,359,361,362,363,364,367,368,369,371,372,373,377,378,379,380,384,385,387,389,390,392,393,395,397,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[4,-257,-61,-72,4,-71,-58,-54,-55,-33,-29,-59,-257,-34,4,-53,-68,-63,-52,4,-56,-174,63,-66,-257,-69,78,-32,-73,-112,-64,-31,-60,-35,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-255,-83,-49,63,-30,119,-100,-99,-26,-118,-120,-25,119,78,119,78,162,-45,-48,-51,164,-113,-257,-257,164,-223,-239,-249,-253,-250,-247,-237,198,-221,-238,206,208,-220,211,-246,-219,-224,119,211,-243,-251,-218,-244,-236,-248,-245,-222,78,-121,-119,4,-219,162,119,-257,-219,119,164,164,-36,119,-85,-256,-21,-82,-22,-81,208,-180,-183,-181,-177,-178,-182,-184,119,-186,-187,-179,-185,-254,119,-252,-233,-232,119,119,-114,119,119,-115,319,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,119,208,208,-117,-116,-101,208,-146,-148,-37,-12,208,119,-11,-150,-144,-219,-39,-42,-38,119,-40,361,364,208,119,368,-152,-151,-43,-153,119,-41,-243,373,-87,-86,4,208,-231,-230,-229,-228,-227,-240,119,208,319,319,-103,-102,-257,-135,-145,-147,-149,-171,-170,119,-168,119,119,-154,119,-167,-155,119,119,-225,-226,119,208,-257,208,119,-166,-169,119,-158,119,409,-156,119,119,-157,119,119,119,-257,-234,119,-162,-161,-159,-235,119,119,119,-163,-160,119,-165,-164,]),'MINUSMINUS':([55,62,72,77,82,98,100,101,102,103,104,105,106,107,108,109,112,113,115,116,117,118,119,120,121,122,123,124,125,127,128,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,201,203,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,293,302,305,306,307,308,311,315,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,377,378,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,412,414,415,416,418,419,420,423,425,426,427,428,429,430,],[-255,120,120,120,-45,-223,-239,-249,-253,-250,-247,-237,120,-221,-238,201,120,-220,120,-246,-219,-224,120,120,-243,-251,-218,-244,-236,-248,-245,-222,-219,120,-257,-219,120,120,-256,120,-180,-183,-181,-177,-178,-182,-184,120,-186,-187,-179,-185,-254,120,-252,-233,-232,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,-12,120,120,-11,-219,-39,-42,-38,120,-40,120,120,-152,-151,-43,-153,120,-41,-243,120,-231,-230,-229,-228,-227,-240,120,120,-257,-135,-171,-170,120,-168,120,120,-154,120,-167,-155,120,120,-225,-226,120,120,-257,120,120,-166,-169,120,-158,120,-156,120,120,-157,120,120,120,-257,-234,120,-162,-161,-159,-235,120,120,120,-163,-160,120,-165,-164,]),'ID':([0,1,2,3,4,5,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,34,35,36,37,38,39,40,42,43,44,45,46,49,50,51,52,54,55,56,58,61,62,63,64,65,66,67,68,69,70,72,74,77,78,82,83,84,86,94,96,97,98,106,107,112,113,115,117,119,120,123,131,136,140,141,145,146,147,149,151,154,156,161,163,164,166,167,171,173,174,175,176,177,178,185,186,187,188,189,190,191,192,193,194,195,196,198,202,204,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,244,248,249,250,255,256,258,259,260,261,267,269,270,271,273,274,275,281,282,284,285,286,288,290,291,295,296,299,302,316,317,343,344,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[33,-257,-61,-72,33,-71,-58,56,-54,-55,-33,-29,-59,-257,-34,33,-53,-68,-63,-89,-52,33,-56,-174,65,-66,-257,-69,33,-32,-73,-88,-64,-31,-60,-35,-62,-65,-257,-67,-257,-70,-74,-57,-50,-9,-10,-84,-255,-83,-49,-30,121,121,-100,-99,144,-26,-118,-120,-25,121,33,121,33,-45,-48,-51,33,-257,-257,33,-223,121,-221,121,-220,121,-219,121,121,-218,-222,33,144,144,-121,-119,33,-219,121,-257,-219,121,33,33,-36,293,-85,-256,-21,-82,-22,-81,121,-180,-183,-181,-177,-178,-182,-184,121,-186,-187,-179,-185,121,306,308,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,144,-101,121,-37,-12,121,121,121,-11,-219,-39,-42,357,-38,121,-40,121,293,-152,-151,-43,-153,293,-41,-87,-86,33,121,121,121,-103,-102,-257,-135,-171,-170,121,-168,293,121,-154,121,-167,-155,293,121,121,121,-257,121,121,-166,-169,121,-158,293,-156,121,293,-157,293,121,293,-257,121,-162,-161,-159,121,293,293,-163,-160,293,-165,-164,]),'IF':([55,82,167,173,269,270,273,275,282,284,285,286,288,290,291,358,359,362,363,367,369,371,372,389,390,393,395,398,406,407,408,410,415,416,418,423,425,426,427,428,429,430,],[-255,-45,294,-256,-39,-42,-38,-40,294,-152,-151,-43,-153,294,-41,-171,-170,-168,294,-154,-167,-155,294,-166,-169,-158,294,-156,294,-157,294,294,-162,-161,-159,294,294,-163,-160,294,-165,-164,]),'STRING_LITERAL':([55,62,72,77,82,98,106,107,108,112,113,115,117,119,120,122,123,131,149,151,154,156,161,167,173,178,185,186,187,188,189,190,191,192,193,194,195,196,198,200,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,256,259,260,261,267,269,270,273,274,275,281,282,284,285,286,288,290,291,302,316,317,350,353,358,359,361,362,363,364,367,368,369,371,372,373,379,380,384,385,387,389,390,392,393,395,398,404,406,407,408,409,410,411,414,415,416,418,420,423,425,426,427,428,429,430,],[-255,122,122,122,-45,-223,122,-221,200,122,-220,122,-219,122,122,-251,-218,-222,-219,122,-257,-219,122,122,-256,122,-180,-183,-181,-177,-178,-182,-184,122,-186,-187,-179,-185,122,-252,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-12,122,122,-11,-219,-39,-42,-38,122,-40,122,122,-152,-151,-43,-153,122,-41,122,122,122,-257,-135,-171,-170,122,-168,122,122,-154,122,-167,-155,122,122,122,122,-257,122,122,-166,-169,122,-158,122,-156,122,122,-157,122,122,122,-257,122,-162,-161,-159,122,122,122,-163,-160,122,-165,-164,]),'FLOAT':([0,1,2,3,5,6,9,10,11,12,13,14,15,17,18,19,21,22,23,24,25,27,29,31,32,33,35,36,37,38,39,40,42,43,44,45,46,48,49,54,55,56,57,59,60,61,63,64,65,76,78,82,87,89,90,91,92,93,94,95,96,119,162,164,166,167,168,169,170,171,172,173,198,207,208,211,213,238,239,245,249,255,269,270,273,275,282,284,285,286,288,291,295,296,300,301,319,343,344,358,359,361,362,367,369,371,389,390,393,398,407,415,416,418,426,427,429,430,],[35,35,-61,-72,-71,-58,-54,-55,-33,-29,-59,35,-34,-53,-68,-63,-52,35,-56,-174,-109,-66,-69,-32,-73,-112,-64,-31,-60,-35,-62,-65,35,-67,35,-70,-74,35,-57,-84,-255,-83,35,-111,-110,-30,35,-100,-99,35,35,-45,-46,35,-113,35,35,35,35,-90,35,35,35,35,-36,35,-47,35,35,-85,-91,-256,35,-114,35,35,-115,-117,-116,35,-101,-37,-39,-42,-38,-40,35,-152,-151,-43,-153,-41,-87,-86,-92,-93,35,-103,-102,-171,-170,35,-168,-154,-167,-155,-166,-169,-158,-156,-157,-162,-161,-159,-163,-160,-165,-164,]),'XOREQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[189,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'LSHIFTEQUAL':([99,100,101,102,103,104,105,108,109,116,118,121,122,124,125,127,128,173,197,199,200,201,203,209,210,212,218,293,305,306,307,308,311,315,376,377,378,383,412,419,],[191,-239,-249,-253,-250,-247,-237,-238,-212,-246,-224,-243,-251,-244,-236,-248,-245,-256,-254,-216,-252,-233,-232,-210,-215,-213,-214,-243,-231,-230,-229,-228,-227,-240,-217,-225,-226,-211,-234,-235,]),'RBRACKET':([62,72,99,100,101,102,103,104,105,108,109,110,111,114,116,117,118,121,122,124,125,126,127,128,129,130,148,149,161,173,197,199,200,201,203,209,210,212,216,218,266,267,298,303,305,306,307,308,309,311,315,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,338,339,348,376,377,378,382,383,402,412,419,],[-257,-257,-210,-239,-249,-253,-250,-247,-237,-238,-212,207,-191,-4,-246,213,-224,-243,-251,-244,-236,-189,-248,-245,-3,-175,252,253,-257,-256,-254,-216,-252,-233,-232,-210,-215,-213,-172,-214,354,355,-188,-176,-231,-230,-229,-228,377,-227,-240,-197,-209,-198,-196,-200,-204,-199,-195,-202,-207,-193,-192,-201,-208,-203,-205,-206,-194,386,-217,-225,-226,-173,-211,-190,-234,-235,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'storage_class_specifier':([0,1,14,22,42,44,48,63,76,78,89,162,164,167,245,282,319,361,],[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'identifier_list_opt':([63,],[132,]),'parameter_declaration':([63,78,162,164,245,319,],[135,135,135,135,342,135,]),'selection_statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[291,291,291,291,291,291,291,291,291,291,291,291,]),'constant':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'unary_expression':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[99,99,99,199,209,212,99,218,99,99,99,209,99,99,99,99,99,99,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,99,209,209,209,209,99,99,209,99,99,209,99,209,99,99,99,99,99,99,99,209,209,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'conditional_expression':([62,72,77,119,151,161,167,178,192,198,205,206,208,211,235,250,259,260,274,281,282,290,302,316,361,363,364,368,372,373,379,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[130,130,130,130,130,130,130,298,130,130,130,130,130,130,130,298,298,130,130,298,130,130,298,130,130,130,130,130,130,130,130,402,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'brace_close':([93,143,169,170,246,247,262,292,350,401,411,],[171,249,295,296,343,344,351,371,388,412,419,]),'struct_or_union_specifier':([0,1,14,22,42,44,48,57,63,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'unified_wstring_literal':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'abstract_declarator_opt':([136,217,],[240,318,]),'iteration_statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[270,270,270,270,270,270,270,270,270,270,270,270,]),'init_declarator_list':([30,86,],[71,71,]),'translation_unit_or_empty':([0,],[8,]),'struct_declaration_list':([57,91,92,],[93,169,170,]),'block_item_list_opt':([167,],[292,]),'enumerator':([66,140,141,248,],[142,142,142,345,]),'pp_directive':([0,22,],[11,11,]),'abstract_declarator':([30,78,86,97,136,164,217,319,],[79,160,79,182,241,160,241,160,]),'declaration_specifiers_opt':([1,14,42,44,],[50,58,83,84,]),'external_declaration':([0,22,],[12,61,]),'type_specifier':([0,1,14,22,42,44,48,57,63,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[14,14,14,14,14,14,14,94,14,14,14,14,94,94,94,94,94,94,14,14,14,94,94,94,94,94,14,14,14,14,]),'designation':([154,350,384,411,],[256,256,256,256,]),'compound_statement':([88,152,167,282,290,363,372,395,406,408,410,423,425,428,],[166,255,275,275,275,275,275,275,275,275,275,275,275,275,]),'pointer':([0,4,22,30,68,78,86,97,136,147,164,217,299,319,],[16,16,16,74,146,74,163,163,74,16,163,320,16,320,]),'type_name':([119,198,208,211,],[215,304,313,314,]),'unified_string_literal':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'postfix_expression':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'assignment_expression_opt':([62,72,161,],[110,148,266,]),'designation_opt':([154,350,384,411,],[260,387,260,387,]),'expression_statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[269,269,269,269,269,269,269,269,269,269,269,269,]),'unary_operator':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'cast_expression':([62,72,77,112,119,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[111,111,111,210,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,383,111,111,111,111,111,111,111,383,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'init_declarator':([30,86,147,],[80,80,251,]),'struct_declarator_list':([97,],[179,]),'brace_open':([7,26,54,56,64,65,77,88,151,152,167,260,282,290,317,363,372,376,380,381,387,395,406,408,410,423,425,428,],[57,66,91,92,140,141,154,167,154,167,167,154,167,167,384,167,167,384,384,384,154,167,167,167,167,167,167,167,]),'assignment_operator':([99,],[192,]),'struct_or_union':([0,1,14,22,42,44,48,57,63,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'identifier':([62,63,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,244,250,258,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[125,139,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,340,125,347,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,]),'struct_declaration':([57,91,92,93,169,170,],[95,95,95,172,172,172,]),'assignment_expression':([62,72,77,119,151,161,167,192,198,205,206,208,211,235,260,274,282,290,316,361,363,364,368,372,373,379,387,392,395,404,406,408,409,410,414,420,423,425,428,],[114,114,155,216,155,114,216,303,216,216,310,216,216,216,155,216,216,216,382,216,216,216,216,216,216,400,155,216,216,216,216,216,216,216,216,216,216,216,216,]),'parameter_type_list':([63,78,162,164,319,],[134,158,158,158,158,]),'type_qualifier_list_opt':([28,],[68,]),'direct_declarator':([0,4,16,22,30,74,78,86,97,136,147,163,164,299,],[25,25,60,25,25,60,25,25,25,25,25,60,25,25,]),'type_qualifier_list':([28,],[67,]),'designator':([154,263,350,384,411,],[257,352,257,257,257,]),'argument_expression_list':([206,],[312,]),'initializer':([77,151,260,387,],[153,254,349,403,]),'specifier_qualifier_list_opt':([94,96,],[175,177,]),'constant_expression':([178,250,259,281,302,],[297,346,348,365,375,]),'expression_opt':([167,282,290,361,363,372,392,395,404,406,408,410,414,420,423,425,428,],[272,272,272,391,272,272,405,272,413,272,272,272,421,424,272,272,272,]),'primary_expression':([62,72,77,106,112,115,119,120,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,317,361,363,364,368,372,373,379,380,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'declaration_specifiers':([0,1,14,22,42,44,48,63,76,78,89,162,164,167,245,282,319,361,],[30,52,52,30,52,52,86,136,86,136,86,136,136,86,136,86,136,86,]),'declaration':([0,22,48,76,89,167,282,361,],[31,31,87,87,168,285,285,392,]),'struct_declarator_list_opt':([97,],[180,]),'identifier_list':([63,],[137,]),'typedef_name':([0,1,14,22,42,44,48,57,63,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'parameter_type_list_opt':([78,162,164,319,],[159,268,159,159,]),'jump_statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[286,286,286,286,286,286,286,286,286,286,286,286,]),'declaration_list_opt':([48,76,],[88,152,]),'struct_declarator':([97,299,],[181,374,]),'function_definition':([0,22,],[36,36,]),'binary_expression':([62,72,77,119,151,161,167,178,192,198,205,206,208,211,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,250,259,260,274,281,282,290,302,316,361,363,364,368,372,373,379,385,387,392,395,404,406,408,409,410,414,420,423,425,428,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,126,338,339,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'parameter_list':([63,78,162,164,319,],[138,138,138,138,138,]),'init_declarator_list_opt':([30,86,],[73,73,]),'enum_specifier':([0,1,14,22,42,44,48,57,63,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'decl_body':([0,22,48,76,89,167,282,361,],[41,41,41,41,41,41,41,41,]),'type_qualifier':([0,1,14,22,28,42,44,48,57,63,67,76,78,89,91,92,93,94,96,119,162,164,167,169,170,198,208,211,245,282,319,361,],[42,42,42,42,69,42,42,42,96,42,145,42,42,42,96,96,96,96,96,96,42,42,42,96,96,96,96,96,42,42,42,42,]),'statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[284,284,370,393,398,407,415,416,418,427,429,430,]),'enumerator_list':([66,140,141,],[143,246,247,]),'labeled_statement':([167,282,290,363,372,395,406,408,410,423,425,428,],[273,273,273,273,273,273,273,273,273,273,273,273,]),'function_specifier':([0,1,14,22,42,44,48,63,76,78,89,162,164,167,245,282,319,361,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'specifier_qualifier_list':([57,91,92,93,94,96,119,169,170,198,208,211,],[97,97,97,97,176,176,217,97,97,217,217,217,]),'block_item':([167,282,],[288,367,]),'block_item_list':([167,],[282,]),'empty':([0,1,14,28,30,42,44,48,62,63,72,76,78,86,94,96,97,136,154,161,162,164,167,217,282,290,319,350,361,363,372,384,392,395,404,406,408,410,411,414,420,423,425,428,],[47,51,51,70,75,51,51,85,129,133,129,85,157,75,174,174,183,243,261,129,157,157,289,243,366,366,157,261,366,366,366,261,366,366,366,366,366,366,261,366,366,366,366,366,]),'translation_unit':([0,],[22,]),'initializer_list':([154,384,],[262,401,]),'declarator':([0,4,22,30,78,86,97,136,147,164,299,],[48,53,48,76,53,165,184,242,165,53,184,]),'direct_abstract_declarator':([30,74,78,86,97,136,163,164,217,319,320,],[81,150,81,81,81,81,150,81,81,81,150,]),'designator_list':([154,350,384,411,],[263,263,263,263,]),'declaration_list':([48,76,],[89,89,]),'expression':([119,167,198,205,208,211,235,274,282,290,361,363,364,368,372,373,392,395,404,406,408,409,410,414,420,423,425,428,],[214,278,214,309,214,214,337,360,278,278,278,278,394,396,278,399,278,278,278,278,278,417,278,278,278,278,278,278,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit_or_empty","S'",1,None,None,None),
+  ('abstract_declarator_opt -> empty','abstract_declarator_opt',1,'p_abstract_declarator_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('abstract_declarator_opt -> abstract_declarator','abstract_declarator_opt',1,'p_abstract_declarator_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('assignment_expression_opt -> empty','assignment_expression_opt',1,'p_assignment_expression_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('assignment_expression_opt -> assignment_expression','assignment_expression_opt',1,'p_assignment_expression_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('declaration_specifiers_opt -> empty','declaration_specifiers_opt',1,'p_declaration_specifiers_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('declaration_specifiers_opt -> declaration_specifiers','declaration_specifiers_opt',1,'p_declaration_specifiers_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('designation_opt -> empty','designation_opt',1,'p_designation_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('designation_opt -> designation','designation_opt',1,'p_designation_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('parameter_type_list_opt -> empty','parameter_type_list_opt',1,'p_parameter_type_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('parameter_type_list_opt -> parameter_type_list','parameter_type_list_opt',1,'p_parameter_type_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('specifier_qualifier_list_opt -> empty','specifier_qualifier_list_opt',1,'p_specifier_qualifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('specifier_qualifier_list_opt -> specifier_qualifier_list','specifier_qualifier_list_opt',1,'p_specifier_qualifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('struct_declarator_list_opt -> empty','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('struct_declarator_list_opt -> struct_declarator_list','struct_declarator_list_opt',1,'p_struct_declarator_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('type_qualifier_list_opt -> empty','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',41),
+  ('type_qualifier_list_opt -> type_qualifier_list','type_qualifier_list_opt',1,'p_type_qualifier_list_opt','/root/package/lib_pypy/cffi/_pycparser/plyparser.py',42),
+  ('translation_unit_or_empty -> translation_unit','translation_unit_or_empty',1,'p_translation_unit_or_empty','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',496),
+  ('translation_unit_or_empty -> empty','translation_unit_or_empty',1,'p_translation_unit_or_empty','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',497),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',505),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',512),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',524),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',529),
+  ('external_declaration -> pp_directive','external_declaration',1,'p_external_declaration_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',534),
+  ('external_declaration -> SEMI','external_declaration',1,'p_external_declaration_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',539),
+  ('pp_directive -> PPHASH','pp_directive',1,'p_pp_directive','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',544),
+  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',553),
+  ('function_definition -> declaration_specifiers declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',570),
+  ('statement -> labeled_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',581),
+  ('statement -> expression_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',582),
+  ('statement -> compound_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',583),
+  ('statement -> selection_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',584),
+  ('statement -> iteration_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',585),
+  ('statement -> jump_statement','statement',1,'p_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',586),
+  ('decl_body -> declaration_specifiers init_declarator_list_opt','decl_body',2,'p_decl_body','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',600),
+  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',659),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',668),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',669),
+  ('declaration_specifiers -> type_qualifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',674),
+  ('declaration_specifiers -> type_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',679),
+  ('declaration_specifiers -> storage_class_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',684),
+  ('declaration_specifiers -> function_specifier declaration_specifiers_opt','declaration_specifiers',2,'p_declaration_specifiers_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',689),
+  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',694),
+  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',695),
+  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',696),
+  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',697),
+  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',698),
+  ('function_specifier -> INLINE','function_specifier',1,'p_function_specifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',703),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',708),
+  ('type_specifier -> _BOOL','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',709),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',710),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',711),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',712),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',713),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',714),
+  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',715),
+  ('type_specifier -> _COMPLEX','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',716),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',717),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',718),
+  ('type_specifier -> typedef_name','type_specifier',1,'p_type_specifier_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',723),
+  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',724),
+  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',725),
+  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',730),
+  ('type_qualifier -> RESTRICT','type_qualifier',1,'p_type_qualifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',731),
+  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',732),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',737),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',738),
+  ('init_declarator_list -> EQUALS initializer','init_declarator_list',2,'p_init_declarator_list_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',748),
+  ('init_declarator_list -> abstract_declarator','init_declarator_list',1,'p_init_declarator_list_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',756),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',764),
+  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',765),
+  ('specifier_qualifier_list -> type_qualifier specifier_qualifier_list_opt','specifier_qualifier_list',2,'p_specifier_qualifier_list_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',770),
+  ('specifier_qualifier_list -> type_specifier specifier_qualifier_list_opt','specifier_qualifier_list',2,'p_specifier_qualifier_list_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',775),
+  ('struct_or_union_specifier -> struct_or_union ID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',783),
+  ('struct_or_union_specifier -> struct_or_union TYPEID','struct_or_union_specifier',2,'p_struct_or_union_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',784),
+  ('struct_or_union_specifier -> struct_or_union brace_open struct_declaration_list brace_close','struct_or_union_specifier',4,'p_struct_or_union_specifier_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',793),
+  ('struct_or_union_specifier -> struct_or_union ID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',802),
+  ('struct_or_union_specifier -> struct_or_union TYPEID brace_open struct_declaration_list brace_close','struct_or_union_specifier',5,'p_struct_or_union_specifier_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',803),
+  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',812),
+  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',813),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',820),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',821),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list_opt SEMI','struct_declaration',3,'p_struct_declaration_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',826),
+  ('struct_declaration -> specifier_qualifier_list abstract_declarator SEMI','struct_declaration',3,'p_struct_declaration_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',864),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',878),
+  ('struct_declarator_list -> struct_declarator_list COMMA struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',879),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',887),
+  ('struct_declarator -> declarator COLON constant_expression','struct_declarator',3,'p_struct_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',892),
+  ('struct_declarator -> COLON constant_expression','struct_declarator',2,'p_struct_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',893),
+  ('enum_specifier -> ENUM ID','enum_specifier',2,'p_enum_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',901),
+  ('enum_specifier -> ENUM TYPEID','enum_specifier',2,'p_enum_specifier_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',902),
+  ('enum_specifier -> ENUM brace_open enumerator_list brace_close','enum_specifier',4,'p_enum_specifier_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',907),
+  ('enum_specifier -> ENUM ID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',912),
+  ('enum_specifier -> ENUM TYPEID brace_open enumerator_list brace_close','enum_specifier',5,'p_enum_specifier_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',913),
+  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',918),
+  ('enumerator_list -> enumerator_list COMMA','enumerator_list',2,'p_enumerator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',919),
+  ('enumerator_list -> enumerator_list COMMA enumerator','enumerator_list',3,'p_enumerator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',920),
+  ('enumerator -> ID','enumerator',1,'p_enumerator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',931),
+  ('enumerator -> ID EQUALS constant_expression','enumerator',3,'p_enumerator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',932),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',947),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',952),
+  ('declarator -> pointer TYPEID','declarator',2,'p_declarator_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',961),
+  ('direct_declarator -> ID','direct_declarator',1,'p_direct_declarator_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',972),
+  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',981),
+  ('direct_declarator -> direct_declarator LBRACKET assignment_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',986),
+  ('direct_declarator -> direct_declarator LBRACKET TIMES RBRACKET','direct_declarator',4,'p_direct_declarator_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',998),
+  ('direct_declarator -> direct_declarator LPAREN parameter_type_list RPAREN','direct_declarator',4,'p_direct_declarator_5','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1008),
+  ('direct_declarator -> direct_declarator LPAREN identifier_list_opt RPAREN','direct_declarator',4,'p_direct_declarator_5','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1009),
+  ('pointer -> TIMES type_qualifier_list_opt','pointer',2,'p_pointer','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1036),
+  ('pointer -> TIMES type_qualifier_list_opt pointer','pointer',3,'p_pointer','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1037),
+  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1047),
+  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1048),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1053),
+  ('parameter_type_list -> parameter_list COMMA ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1054),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1062),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1063),
+  ('parameter_declaration -> declaration_specifiers declarator','parameter_declaration',2,'p_parameter_declaration_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1072),
+  ('parameter_declaration -> declaration_specifiers abstract_declarator_opt','parameter_declaration',2,'p_parameter_declaration_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1083),
+  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1113),
+  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1114),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1123),
+  ('initializer -> brace_open initializer_list brace_close','initializer',3,'p_initializer_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1128),
+  ('initializer -> brace_open initializer_list COMMA brace_close','initializer',4,'p_initializer_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1129),
+  ('initializer_list -> designation_opt initializer','initializer_list',2,'p_initializer_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1134),
+  ('initializer_list -> initializer_list COMMA designation_opt initializer','initializer_list',4,'p_initializer_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1135),
+  ('designation -> designator_list EQUALS','designation',2,'p_designation','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1146),
+  ('designator_list -> designator','designator_list',1,'p_designator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1154),
+  ('designator_list -> designator_list designator','designator_list',2,'p_designator_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1155),
+  ('designator -> LBRACKET constant_expression RBRACKET','designator',3,'p_designator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1160),
+  ('designator -> PERIOD identifier','designator',2,'p_designator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1161),
+  ('type_name -> specifier_qualifier_list abstract_declarator_opt','type_name',2,'p_type_name','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1166),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1182),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1190),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1195),
+  ('direct_abstract_declarator -> LPAREN abstract_declarator RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1205),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1209),
+  ('direct_abstract_declarator -> LBRACKET assignment_expression_opt RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1219),
+  ('direct_abstract_declarator -> direct_abstract_declarator LBRACKET TIMES RBRACKET','direct_abstract_declarator',4,'p_direct_abstract_declarator_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1227),
+  ('direct_abstract_declarator -> LBRACKET TIMES RBRACKET','direct_abstract_declarator',3,'p_direct_abstract_declarator_5','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1237),
+  ('direct_abstract_declarator -> direct_abstract_declarator LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',4,'p_direct_abstract_declarator_6','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1245),
+  ('direct_abstract_declarator -> LPAREN parameter_type_list_opt RPAREN','direct_abstract_declarator',3,'p_direct_abstract_declarator_7','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1255),
+  ('block_item -> declaration','block_item',1,'p_block_item','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1266),
+  ('block_item -> statement','block_item',1,'p_block_item','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1267),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1274),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1275),
+  ('compound_statement -> brace_open block_item_list_opt brace_close','compound_statement',3,'p_compound_statement_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1281),
+  ('labeled_statement -> ID COLON statement','labeled_statement',3,'p_labeled_statement_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1287),
+  ('labeled_statement -> CASE constant_expression COLON statement','labeled_statement',4,'p_labeled_statement_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1291),
+  ('labeled_statement -> DEFAULT COLON statement','labeled_statement',3,'p_labeled_statement_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1295),
+  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1299),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1303),
+  ('selection_statement -> SWITCH LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1307),
+  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1312),
+  ('iteration_statement -> DO statement WHILE LPAREN expression RPAREN SEMI','iteration_statement',7,'p_iteration_statement_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1316),
+  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1320),
+  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','iteration_statement',8,'p_iteration_statement_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1324),
+  ('jump_statement -> GOTO ID SEMI','jump_statement',3,'p_jump_statement_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1328),
+  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1332),
+  ('jump_statement -> CONTINUE SEMI','jump_statement',2,'p_jump_statement_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1336),
+  ('jump_statement -> RETURN expression SEMI','jump_statement',3,'p_jump_statement_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1340),
+  ('jump_statement -> RETURN SEMI','jump_statement',2,'p_jump_statement_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1341),
+  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1346),
+  ('expression -> assignment_expression','expression',1,'p_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1353),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1354),
+  ('typedef_name -> TYPEID','typedef_name',1,'p_typedef_name','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1366),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1370),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1371),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1384),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1385),
+  ('assignment_operator -> TIMESEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1386),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1387),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1388),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1389),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1390),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1391),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1392),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1393),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1394),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1399),
+  ('conditional_expression -> binary_expression','conditional_expression',1,'p_conditional_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1403),
+  ('conditional_expression -> binary_expression CONDOP expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1404),
+  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1412),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1413),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1414),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1415),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1416),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1417),
+  ('binary_expression -> binary_expression RSHIFT binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1418),
+  ('binary_expression -> binary_expression LSHIFT binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1419),
+  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1420),
+  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1421),
+  ('binary_expression -> binary_expression GE binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1422),
+  ('binary_expression -> binary_expression GT binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1423),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1424),
+  ('binary_expression -> binary_expression NE binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1425),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1426),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1427),
+  ('binary_expression -> binary_expression XOR binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1428),
+  ('binary_expression -> binary_expression LAND binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1429),
+  ('binary_expression -> binary_expression LOR binary_expression','binary_expression',3,'p_binary_expression','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1430),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1438),
+  ('cast_expression -> LPAREN type_name RPAREN cast_expression','cast_expression',4,'p_cast_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1442),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1446),
+  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1450),
+  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1451),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1452),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1457),
+  ('unary_expression -> SIZEOF LPAREN type_name RPAREN','unary_expression',4,'p_unary_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1458),
+  ('unary_operator -> AND','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1466),
+  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1467),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1468),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1469),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1470),
+  ('unary_operator -> LNOT','unary_operator',1,'p_unary_operator','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1471),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1476),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1480),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression_list RPAREN','postfix_expression',4,'p_postfix_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1484),
+  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1485),
+  ('postfix_expression -> postfix_expression PERIOD ID','postfix_expression',3,'p_postfix_expression_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1490),
+  ('postfix_expression -> postfix_expression PERIOD TYPEID','postfix_expression',3,'p_postfix_expression_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1491),
+  ('postfix_expression -> postfix_expression ARROW ID','postfix_expression',3,'p_postfix_expression_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1492),
+  ('postfix_expression -> postfix_expression ARROW TYPEID','postfix_expression',3,'p_postfix_expression_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1493),
+  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression_5','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1499),
+  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression_5','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1500),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list brace_close','postfix_expression',6,'p_postfix_expression_6','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1505),
+  ('postfix_expression -> LPAREN type_name RPAREN brace_open initializer_list COMMA brace_close','postfix_expression',7,'p_postfix_expression_6','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1506),
+  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1511),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1515),
+  ('primary_expression -> unified_string_literal','primary_expression',1,'p_primary_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1519),
+  ('primary_expression -> unified_wstring_literal','primary_expression',1,'p_primary_expression_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1520),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_4','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1525),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1529),
+  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1530),
+  ('identifier -> ID','identifier',1,'p_identifier','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1539),
+  ('constant -> INT_CONST_DEC','constant',1,'p_constant_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1543),
+  ('constant -> INT_CONST_OCT','constant',1,'p_constant_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1544),
+  ('constant -> INT_CONST_HEX','constant',1,'p_constant_1','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1545),
+  ('constant -> FLOAT_CONST','constant',1,'p_constant_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1551),
+  ('constant -> HEX_FLOAT_CONST','constant',1,'p_constant_2','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1552),
+  ('constant -> CHAR_CONST','constant',1,'p_constant_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1558),
+  ('constant -> WCHAR_CONST','constant',1,'p_constant_3','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1559),
+  ('unified_string_literal -> STRING_LITERAL','unified_string_literal',1,'p_unified_string_literal','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1570),
+  ('unified_string_literal -> unified_string_literal STRING_LITERAL','unified_string_literal',2,'p_unified_string_literal','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1571),
+  ('unified_wstring_literal -> WSTRING_LITERAL','unified_wstring_literal',1,'p_unified_wstring_literal','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1581),
+  ('unified_wstring_literal -> unified_wstring_literal WSTRING_LITERAL','unified_wstring_literal',2,'p_unified_wstring_literal','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1582),
+  ('brace_open -> LBRACE','brace_open',1,'p_brace_open','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1592),
+  ('brace_close -> RBRACE','brace_close',1,'p_brace_close','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1597),
+  ('empty -> <empty>','empty',0,'p_empty','/root/package/lib_pypy/cffi/_pycparser/c_parser.py',1602),
+]